@@ -0,0 +1,21 @@
+# install numpy - `pip install numpy`
+
+from agno.agent import Agent
+from agno.knowledge.pdf_url import PDFUrlKnowledgeBase
+from agno.vectordb.numpydb import Ivf, NumpyDb
+
+# Vectors are stored in a memory-mapped file and documents in a SQLite file, in the given directory.
+# The IVF index is built once the collection has `min_rows` documents. Smaller collections are searched exactly.
+vector_db = NumpyDb(path="tmp/numpydb", index=Ivf(lists=256, probes=8))
+
+# Create knowledge base
+knowledge_base = PDFUrlKnowledgeBase(
+    urls=["https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf"],
+    vector_db=vector_db,
+)
+
+knowledge_base.load(recreate=False)  # Comment out after first run
+
+# Create and use the agent
+agent = Agent(knowledge=knowledge_base, show_tool_calls=True)
+agent.print_response("Show me how to make Tom Kha Gai", markdown=True)
@@ -0,0 +1,62 @@
+"""Compare the serialization of a RunResponse with `dataclasses.asdict` and the shallow serializer.
+
+Run `pip install agno` to install dependencies. Install `orjson` to also use it for the JSON encoding.
+"""
+
+import json
+from dataclasses import asdict
+
+from agno.eval.performance import PerformanceEval
+from agno.models.message import Message
+from agno.models.response import ToolExecution
+from agno.run.response import RunResponse, RunResponseDelta
+
+messages = []
+for i in range(20):
+    messages.append(Message(role="user", content=f"What is the weather in city {i}? " * 10))
+    messages.append(Message(role="assistant", content=f"The weather in city {i} is sunny. " * 20))
+
+run_response = RunResponse(
+    content="The weather is sunny everywhere. " * 50,
+    messages=messages,
+    metrics={"input_tokens": [120] * 20, "output_tokens": [300] * 20},
+    tools=[ToolExecution(tool_call_id=f"call-{i}", tool_name="get_weather", result="sunny") for i in range(10)],
+    run_id="run-1",
+    agent_id="agent-1",
+    session_id="session-1",
+)
+delta = RunResponseDelta(content="sunny", run_id="run-1", agent_id="agent-1", session_id="session-1")
+
+
+def asdict_to_json(response: RunResponse) -> str:
+    """The serialization with a deep copy of every field, pretty-printed"""
+    _dict = {
+        k: v
+        for k, v in asdict(response).items()
+        if v is not None
+        and k not in ["messages", "tools", "extra_data", "images", "videos", "audio", "response_audio", "citations"]
+    }
+    if response.messages is not None:
+        _dict["messages"] = [m.to_dict() for m in response.messages]
+    if response.tools is not None:
+        _dict["tools"] = [tool.to_dict() for tool in response.tools]
+    return json.dumps(_dict, indent=2)
+
+
+asdict_perf = PerformanceEval(
+    name="asdict", func=lambda: asdict_to_json(run_response), num_iterations=500, measure_memory=False
+)
+shallow_perf = PerformanceEval(
+    name="shallow", func=lambda: run_response.to_json(indent=None), num_iterations=500, measure_memory=False
+)
+streamed_chunk_perf = PerformanceEval(
+    name="streamed chunk",
+    func=lambda: delta.to_json(indent=None, include=("content", "event", "run_id", "created_at")),
+    num_iterations=5000,
+    measure_memory=False,
+)
+
+if __name__ == "__main__":
+    asdict_perf.run(print_summary=True)
+    shallow_perf.run(print_summary=True)
+    streamed_chunk_perf.run(print_summary=True)
@@ -8,6 +8,7 @@ from agno.agent.agent import (
     Message,
     RunEvent,
     RunResponse,
+    RunResponseDelta,
     Storage,
     Toolkit,
 )
@@ -21,6 +22,7 @@ __all__ = [
     "Message",
     "RunEvent",
     "RunResponse",
+    "RunResponseDelta",
     "Storage",
     "Toolkit",
 ]
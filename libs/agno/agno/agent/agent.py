@@ -5,7 +5,6 @@ from collections import ChainMap, defaultdict, deque
 from dataclasses import asdict, dataclass
 from os import getenv
 from textwrap import dedent
-from threading import Thread
 from typing import (
     Any,
     AsyncIterator,
@@ -36,8 +35,9 @@ from agno.models.base import Model
 from agno.models.message import Citations, Message, MessageMetrics, MessageReferences
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
+from agno.run.context import ContextBudget
 from agno.run.messages import RunMessages
-from agno.run.response import RunEvent, RunResponse, RunResponseExtraData
+from agno.run.response import RunEvent, RunResponse, RunResponseDelta, RunResponseExtraData
 from agno.run.team import TeamRunResponse
 from agno.storage.base import Storage
 from agno.storage.session.agent import AgentSession
@@ -56,8 +56,10 @@ from agno.utils.message import get_text_from_message
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.response import create_panel, escape_markdown_tags, format_tool_calls
 from agno.utils.safe_formatter import SafeFormatter
+from agno.utils.stream import StreamAccumulator
 from agno.utils.string import parse_response_model_str
 from agno.utils.timer import Timer
+from agno.utils.tools import copy_tools_for_run
 
 
 @dataclass(init=False)
@@ -114,6 +116,9 @@ class Agent:
     num_history_responses: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # Token budget for the messages sent to the Model. History is selected and truncated to fit the budget,
+    # and the token accounting is recorded on the run response.
+    context_budget: Optional[ContextBudget] = None
 
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
@@ -136,6 +141,9 @@ class Agent:
 
     # --- Agent Storage ---
     storage: Optional[Storage] = None
+    # If True, async runs save the session to storage in a background task after the response is returned.
+    # Use `await storage.aflush()` to wait for the pending writes, e.g. before shutting down.
+    storage_write_behind: bool = False
     # Extra data stored with this agent
     extra_data: Optional[Dict[str, Any]] = None
 
@@ -147,6 +155,10 @@ class Agent:
     show_tool_calls: bool = True
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls from one model response that run at the same time.
+    # If > 1, sync runs execute the tool calls in a thread pool. If None, sync runs execute them one at a time
+    # and async runs execute them all concurrently.
+    tool_call_concurrency: Optional[int] = None
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -249,6 +261,10 @@ class Agent:
     stream: Optional[bool] = None
     # Stream the intermediate steps from the Agent
     stream_intermediate_steps: bool = False
+    # By default, streamed chunks are yielded as RunResponseDelta events carrying only the new content, and the
+    # run_response is updated from the accumulated stream when a tool call starts or completes and when the stream ends.
+    # If True, update the run_response on every chunk and yield full RunResponse objects.
+    stream_snapshots: bool = False
 
     # --- Agent Team ---
     # The team of agents that this agent can transfer tasks to.
@@ -314,6 +330,7 @@ class Agent:
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
+        context_budget: Optional[ContextBudget] = None,
         knowledge: Optional[AgentKnowledge] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         enable_agentic_knowledge_filters: Optional[bool] = None,
@@ -321,10 +338,12 @@ class Agent:
         retriever: Optional[Callable[..., Optional[List[Dict]]]] = None,
         references_format: Literal["json", "yaml"] = "json",
         storage: Optional[Storage] = None,
+        storage_write_behind: bool = False,
         extra_data: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         reasoning: bool = False,
@@ -364,6 +383,7 @@ class Agent:
         save_response_to_file: Optional[str] = None,
         stream: Optional[bool] = None,
         stream_intermediate_steps: bool = False,
+        stream_snapshots: bool = False,
         team: Optional[List[Agent]] = None,
         team_data: Optional[Dict[str, Any]] = None,
         role: Optional[str] = None,
@@ -400,6 +420,7 @@ class Agent:
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
         self.num_history_runs = num_history_runs
+        self.context_budget = context_budget
 
         self.knowledge = knowledge
         self.knowledge_filters = knowledge_filters
@@ -409,11 +430,13 @@ class Agent:
         self.references_format = references_format
 
         self.storage = storage
+        self.storage_write_behind = storage_write_behind
         self.extra_data = extra_data
 
         self.tools = tools
         self.show_tool_calls = show_tool_calls
         self.tool_call_limit = tool_call_limit
+        self.tool_call_concurrency = tool_call_concurrency
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
 
@@ -462,6 +485,7 @@ class Agent:
 
         self.stream = stream
         self.stream_intermediate_steps = stream_intermediate_steps
+        self.stream_snapshots = stream_snapshots
 
         self.team = team
 
@@ -645,6 +669,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -947,8 +972,7 @@ class Agent:
         run_id = str(uuid4())
 
         # Register Agent
-        thread = Thread(target=self.register_agent)
-        thread.start()
+        self.register_agent()
 
         for attempt in range(num_attempts):
             try:
@@ -1085,6 +1109,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -1116,7 +1141,7 @@ class Agent:
         self._set_session_metrics(run_messages)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message, session_id=session_id)
@@ -1214,7 +1239,7 @@ class Agent:
             )
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message, session_id=session_id)
@@ -1320,7 +1345,7 @@ class Agent:
         log_debug(f"Session ID: {session_id}", center=True)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Read existing session from storage
         if self.context is not None:
@@ -1351,7 +1376,7 @@ class Agent:
         run_id = str(uuid4())
 
         # Register Agent
-        asyncio.create_task(self._aregister_agent())
+        await self._aregister_agent()
 
         for attempt in range(num_attempts):
             try:
@@ -1757,6 +1782,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -1996,7 +2022,7 @@ class Agent:
         log_debug(f"Session ID: {session_id}", center=True)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Run can be continued from previous run response or from passed run_response context
         if run_response is not None:
@@ -2182,6 +2208,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -2213,7 +2240,7 @@ class Agent:
         self._set_session_metrics(run_messages)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message, session_id=session_id)
@@ -2313,7 +2340,7 @@ class Agent:
             )
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message, session_id=session_id)
@@ -2920,7 +2947,7 @@ class Agent:
             "reasoning_started": False,
             "reasoning_time_taken": 0.0,
         }
-        model_response = ModelResponse(content="")
+        stream = StreamAccumulator()
 
         for model_response_chunk in self.model.response_stream(
             messages=run_messages.messages,
@@ -2929,11 +2956,12 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         ):
             yield from self._handle_model_response_chunk(
                 run_response=run_response,
                 session_id=session_id,
-                model_response=model_response,
+                stream=stream,
                 model_response_chunk=model_response_chunk,
                 stream_intermediate_steps=stream_intermediate_steps,
                 reasoning_state=reasoning_state,
@@ -2961,9 +2989,8 @@ class Agent:
         # Update the RunResponse metrics
         run_response.metrics = self.aggregate_metrics_from_messages(messages_for_run_response)
 
-        # Update the run_response audio if streaming
-        if model_response.audio is not None:
-            run_response.response_audio = model_response.audio
+        # Update the run_response content, thinking and audio from the stream
+        self._update_run_response_from_stream(run_response, stream)
 
     async def _ahandle_model_response_stream(
         self,
@@ -2979,7 +3006,7 @@ class Agent:
             "reasoning_started": False,
             "reasoning_time_taken": 0.0,
         }
-        model_response = ModelResponse(content="")
+        stream = StreamAccumulator()
 
         model_response_stream = self.model.aresponse_stream(
             messages=run_messages.messages,
@@ -2988,13 +3015,14 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         )  # type: ignore
 
         async for model_response_chunk in model_response_stream:  # type: ignore
             for chunk in self._handle_model_response_chunk(
                 run_response=run_response,
                 session_id=session_id,
-                model_response=model_response,
+                stream=stream,
                 model_response_chunk=model_response_chunk,
                 stream_intermediate_steps=stream_intermediate_steps,
                 reasoning_state=reasoning_state,
@@ -3022,37 +3050,56 @@ class Agent:
         # Update the RunResponse metrics
         run_response.metrics = self.aggregate_metrics_from_messages(messages_for_run_response)
 
-        # Update the run_response audio if streaming
-        if model_response.audio is not None:
-            run_response.response_audio = model_response.audio
+        # Update the run_response content, thinking and audio from the stream
+        self._update_run_response_from_stream(run_response, stream)
 
     def _handle_model_response_chunk(
         self,
         run_response: RunResponse,
         session_id: str,
-        model_response: ModelResponse,
+        stream: StreamAccumulator,
         model_response_chunk: ModelResponse,
         reasoning_state: Dict[str, Any],
         stream_intermediate_steps: bool = False,
     ) -> Iterator[RunResponse]:
         # If the model response is an assistant_response, yield a RunResponse
         if model_response_chunk.event == ModelResponseEvent.assistant_response.value:
+            has_delta = stream.add(model_response_chunk)
+
+            if not self.stream_snapshots:
+                # Only yield the new content of the chunk, the run_response is updated from the stream later
+                if has_delta:
+                    thinking_combined = (model_response_chunk.thinking or "") + (
+                        model_response_chunk.redacted_thinking or ""
+                    )
+                    yield RunResponseDelta(
+                        content=model_response_chunk.content,
+                        thinking=thinking_combined if thinking_combined else None,
+                        response_audio=model_response_chunk.audio,
+                        citations=model_response_chunk.citations,
+                        run_id=self.run_id,
+                        agent_id=self.agent_id,
+                        session_id=session_id,
+                        created_at=model_response_chunk.created_at,
+                    )
+
+                if model_response_chunk.image is not None:
+                    self.add_image(model_response_chunk.image)
+                    self._update_run_response_from_stream(run_response, stream)
+
+                    yield run_response
+                return
+
             # Process content and thinking
             if model_response_chunk.content is not None:
-                model_response.content = (model_response.content or "") + model_response_chunk.content
-                run_response.content = model_response.content
+                run_response.content = stream.content.getvalue()
 
             if model_response_chunk.thinking is not None:
-                model_response.thinking = (model_response.thinking or "") + model_response_chunk.thinking
-                run_response.thinking = model_response.thinking
+                run_response.thinking = stream.thinking.getvalue()
 
             if model_response_chunk.redacted_thinking is not None:
-                model_response.redacted_thinking = (
-                    model_response.redacted_thinking or ""
-                ) + model_response_chunk.redacted_thinking
-
                 # We only have thinking on response
-                run_response.thinking = model_response.redacted_thinking
+                run_response.thinking = stream.redacted_thinking.getvalue()
 
             if model_response_chunk.citations is not None:
                 # We get citations in one chunk
@@ -3076,22 +3123,6 @@ class Agent:
 
             # Process audio
             if model_response_chunk.audio is not None:
-                if model_response.audio is None:
-                    model_response.audio = AudioResponse(id=str(uuid4()), content="", transcript="")
-
-                if model_response_chunk.audio.id is not None:
-                    model_response.audio.id = model_response_chunk.audio.id  # type: ignore
-                if model_response_chunk.audio.content is not None:
-                    model_response.audio.content += model_response_chunk.audio.content  # type: ignore
-                if model_response_chunk.audio.transcript is not None:
-                    model_response.audio.transcript += model_response_chunk.audio.transcript  # type: ignore
-                if model_response_chunk.audio.expires_at is not None:
-                    model_response.audio.expires_at = model_response_chunk.audio.expires_at  # type: ignore
-                if model_response_chunk.audio.mime_type is not None:
-                    model_response.audio.mime_type = model_response_chunk.audio.mime_type  # type: ignore
-                model_response.audio.sample_rate = model_response_chunk.audio.sample_rate
-                model_response.audio.channels = model_response_chunk.audio.channels
-
                 # Yield the audio and transcript bit by bit
                 run_response.response_audio = AudioResponse(
                     id=model_response_chunk.audio.id,
@@ -3139,6 +3170,9 @@ class Agent:
                 # Format tool calls whenever new ones are added during streaming
                 run_response.formatted_tool_calls = format_tool_calls(run_response.tools)
 
+            if not self.stream_snapshots:
+                self._update_run_response_from_stream(run_response, stream)
+
             # Yield a RunResponse with the tool_call_started event
             yield self.create_run_response(
                 content=model_response_chunk.content,
@@ -3199,6 +3233,9 @@ class Agent:
                         reasoning_content=run_response.reasoning_content,
                     )
 
+            if not self.stream_snapshots:
+                self._update_run_response_from_stream(run_response, stream)
+
             # Yield a RunResponse with the tool_call_completed event
             yield self.create_run_response(
                 content=model_response_chunk.content,
@@ -3208,6 +3245,19 @@ class Agent:
                 run_response=run_response,
             )
 
+    def _update_run_response_from_stream(self, run_response: RunResponse, stream: StreamAccumulator) -> None:
+        """Set the content, thinking, citations and audio accumulated from the model stream on the run_response."""
+        if stream.content:
+            run_response.content = stream.content.getvalue()
+        if stream.redacted_thinking:
+            run_response.thinking = stream.redacted_thinking.getvalue()
+        elif stream.thinking:
+            run_response.thinking = stream.thinking.getvalue()
+        if stream.citations is not None:
+            run_response.citations = stream.citations
+        if stream.audio is not None:
+            run_response.response_audio = stream.get_audio()
+
     def create_run_response(
         self,
         content: Optional[Any] = None,
@@ -3281,6 +3331,51 @@ class Agent:
         if session_id is not None:
             self.session_state["current_session_id"] = session_id
 
+    def _parse_messages_for_memory(self, messages: List[Union[Message, Dict]]) -> List[Message]:
+        parsed_messages = []
+        for _im in messages:
+            if isinstance(_im, Message):
+                parsed_messages.append(_im)
+            elif isinstance(_im, dict):
+                try:
+                    parsed_messages.append(Message(**_im))
+                except Exception as e:
+                    log_warning(f"Failed to validate message during memory update: {e}")
+            else:
+                log_warning(f"Unsupported message type: {type(_im)}")
+        return parsed_messages
+
+    def _defer_memories_and_summaries(
+        self,
+        run_messages: RunMessages,
+        session_id: str,
+        user_id: Optional[str] = None,
+        messages: Optional[List[Message]] = None,
+    ) -> None:
+        """Queue the memory and summary updates of the run on the job queue of the memory, without waiting for them"""
+        self.memory = cast(Memory, self.memory)
+
+        try:
+            if self.enable_user_memories and run_messages.user_message is not None:
+                log_debug("Queueing user memories.")
+                self.memory.defer_user_memories(message=run_messages.user_message.get_content_string(), user_id=user_id)
+
+            if messages is not None and len(messages) > 0:
+                parsed_messages = self._parse_messages_for_memory(messages)
+                if len(parsed_messages) > 0:
+                    self.memory.defer_user_memories(messages=parsed_messages, user_id=user_id)
+                else:
+                    log_warning("Unable to add messages to memory")
+
+            if self.enable_session_summaries:
+                # Deferred summaries are saved to the session in storage by the job queue
+                if self.storage is not None and self.memory.job_queue.storage is None:  # type: ignore
+                    self.memory.job_queue.storage = self.storage  # type: ignore
+                log_debug("Queueing session summary.")
+                self.memory.defer_session_summary(session_id=session_id, user_id=user_id)
+        except Exception as e:
+            log_warning(f"Error in memory/summary operation: {str(e)}")
+
     def _make_memories_and_summaries(
         self,
         run_messages: RunMessages,
@@ -3292,6 +3387,10 @@ class Agent:
 
         self.memory = cast(Memory, self.memory)
 
+        if self.memory.job_queue is not None:
+            self._defer_memories_and_summaries(run_messages, session_id, user_id, messages)
+            return
+
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
 
@@ -3308,19 +3407,7 @@ class Agent:
 
             # Parse messages if provided
             if messages is not None and len(messages) > 0:
-                parsed_messages = []
-                for _im in messages:
-                    if isinstance(_im, Message):
-                        parsed_messages.append(_im)
-                    elif isinstance(_im, dict):
-                        try:
-                            parsed_messages.append(Message(**_im))
-                        except Exception as e:
-                            log_warning(f"Failed to validate message during memory update: {e}")
-                    else:
-                        log_warning(f"Unsupported message type: {type(_im)}")
-                        continue
-
+                parsed_messages = self._parse_messages_for_memory(messages)
                 if len(parsed_messages) > 0:
                     futures.append(
                         executor.submit(self.memory.create_user_memories, messages=parsed_messages, user_id=user_id)
@@ -3350,6 +3437,11 @@ class Agent:
         messages: Optional[List[Message]] = None,
     ) -> None:
         self.memory = cast(Memory, self.memory)
+
+        if self.memory.job_queue is not None:
+            self._defer_memories_and_summaries(run_messages, session_id, user_id, messages)
+            return
+
         tasks = []
 
         # Create user memories from single message
@@ -3363,19 +3455,7 @@ class Agent:
 
         # Parse messages if provided
         if messages is not None and len(messages) > 0:
-            parsed_messages = []
-            for _im in messages:
-                if isinstance(_im, Message):
-                    parsed_messages.append(_im)
-                elif isinstance(_im, dict):
-                    try:
-                        parsed_messages.append(Message(**_im))
-                    except Exception as e:
-                        log_warning(f"Failed to validate message during memory update: {e}")
-                else:
-                    log_warning(f"Unsupported message type: {type(_im)}")
-                    continue
-
+            parsed_messages = self._parse_messages_for_memory(messages)
             if len(parsed_messages) > 0:
                 tasks.append(self.memory.acreate_user_memories(messages=parsed_messages, user_id=user_id))
             else:
@@ -3915,16 +3995,8 @@ class Agent:
                     except Exception as e:
                         log_warning(f"Failed to load user memories: {e}")
                 if "summaries" in session.memory:
-                    from agno.memory.v2.memory import SessionSummary as SessionSummaryV2
-
                     try:
-                        self.memory.summaries = {
-                            user_id: {
-                                session_id: SessionSummaryV2.from_dict(summary)
-                                for session_id, summary in user_session_summaries.items()
-                            }
-                            for user_id, user_session_summaries in session.memory["summaries"].items()
-                        }
+                        self.memory.load_session_summaries(session.memory["summaries"])
                     except Exception as e:
                         log_warning(f"Failed to load session summaries: {e}")
         log_debug(f"-*- AgentSession loaded: {session.session_id}")
@@ -3962,6 +4034,32 @@ class Agent:
             )
         return self.agent_session
 
+    async def aread_from_storage(self, session_id: str) -> Optional[AgentSession]:
+        """Load the AgentSession from storage without blocking the event loop
+
+        Waits for the pending background writes of the session first, so the latest state is read.
+        """
+        if self.storage is not None:
+            await self.storage.aflush(session_id=session_id)
+            self.agent_session = cast(AgentSession, await self.storage.aread(session_id=session_id))
+            if self.agent_session is not None:
+                self.load_agent_session(session=self.agent_session)
+        return self.agent_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """Save the AgentSession to storage without blocking the event loop
+
+        If storage_write_behind is True, the session is saved in a background task and this returns immediately.
+        """
+        if self.storage is not None:
+            agent_session = self.get_agent_session(session_id=session_id, user_id=user_id)
+            if self.storage_write_behind:
+                self.storage.upsert_in_background(agent_session)
+                self.agent_session = agent_session
+            else:
+                self.agent_session = cast(AgentSession, await self.storage.aupsert(session=agent_session))
+        return self.agent_session
+
     def add_introduction(self, introduction: str) -> None:
         """Add an introduction to the chat history"""
 
@@ -4446,7 +4544,10 @@ class Agent:
         ):
             user_msg_content += "\n\nUse the following references from the knowledge base if it helps:\n"
             user_msg_content += "<references>\n"
-            user_msg_content += self.convert_documents_to_string(references.references) + "\n"
+            references_str = self.convert_documents_to_string(references.references)
+            if self.context_budget is not None:
+                references_str = self.context_budget.truncate_references(references_str)
+            user_msg_content += references_str + "\n"
             user_msg_content += "</references>"
         # 4.2 Add context to user message
         if self.add_context and self.context is not None:
@@ -4544,8 +4645,6 @@ class Agent:
 
         # 3. Add history to run_messages
         if self.add_history_to_messages:
-            from copy import deepcopy
-
             history: List[Message] = []
             if isinstance(self.memory, AgentMemory):
                 history = self.memory.get_messages_from_last_n_runs(
@@ -4557,8 +4656,9 @@ class Agent:
                 )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
+                # Copy the history messages to avoid modifying the original messages.
+                # A shallow copy is enough, as only top-level fields of the copies are changed.
+                history_copy = [msg.model_copy() for msg in history]
 
                 # Tag each message as coming from history
                 for _msg in history_copy:
@@ -4606,6 +4706,9 @@ class Agent:
                     except Exception as e:
                         log_warning(f"Failed to validate message: {e}")
 
+        # 6. Fit the messages to the context budget
+        self._fit_to_context_budget(run_messages)
+
         return run_messages
 
     def get_continue_run_messages(
@@ -4668,8 +4771,6 @@ class Agent:
 
         # 3. Add history to run_messages
         if self.add_history_to_messages:
-            from copy import deepcopy
-
             history: List[Message] = []
             if isinstance(self.memory, AgentMemory):
                 history = self.memory.get_messages_from_last_n_runs(
@@ -4680,8 +4781,9 @@ class Agent:
                     session_id=session_id, last_n=self.num_history_runs, skip_role=self.system_message_role
                 )
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
+                # Copy the history messages to avoid modifying the original messages.
+                # A shallow copy is enough, as only top-level fields of the copies are changed.
+                history_copy = [msg.model_copy() for msg in history]
 
                 # Tag each message as coming from history
                 for _msg in history_copy:
@@ -4724,8 +4826,23 @@ class Agent:
                     except Exception as e:
                         log_warning(f"Failed to validate message: {e}")
 
+        # 6. Fit the messages to the context budget
+        self._fit_to_context_budget(run_messages)
+
         return run_messages
 
+    def _fit_to_context_budget(self, run_messages: RunMessages) -> None:
+        """Fit the run messages to the context budget and record the token accounting on the run response"""
+        if self.context_budget is None:
+            return
+        usage = self.context_budget.fit(run_messages, user_message_role=self.user_message_role)
+        log_debug(f"Context usage: {usage.total_tokens} tokens")
+        if self.run_response is None:
+            return
+        if self.run_response.extra_data is None:
+            self.run_response.extra_data = RunResponseExtraData()
+        self.run_response.extra_data.context_usage = usage.to_dict()
+
     def get_session_summary(self, session_id: Optional[str] = None, user_id: Optional[str] = None):
         """Get the session summary for the given session ID and user ID."""
         if self.memory is None:
@@ -4791,6 +4908,48 @@ class Agent:
         log_debug(f"Created new {self.__class__.__name__}")
         return new_agent
 
+    def copy_for_run(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
+        """Create a lightweight copy of this Agent to run one request, e.g. in a server handling concurrent sessions.
+
+        Runs keep their state (run response, messages, session, tools bound to the agent...) on the Agent.
+        The copy has its own run and session state, but shares the configuration and the heavy resources of
+        this Agent: its model clients, knowledge, storage and memory. Unlike deep_copy(), nothing is
+        serialized or deep copied except the initial session state and the legacy AgentMemory.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields to set on the copy.
+
+        Returns:
+            Agent: A copy of this Agent that can run concurrently with this Agent and its other copies.
+        """
+        from copy import copy, deepcopy
+
+        new_agent = copy(self)
+        new_agent.reset_run_state()
+        new_agent.reset_session_state()
+        # The initial session state and extra data are updated by runs
+        new_agent.session_state = deepcopy(self.session_state)
+        new_agent.team_session_state = deepcopy(self.team_session_state)
+        new_agent.extra_data = deepcopy(self.extra_data)
+        # AgentMemory holds the messages of a single session, Memory is shared by all sessions
+        if isinstance(self.memory, AgentMemory):
+            new_agent.memory = self.memory.deep_copy()
+        # Models are configured by runs, and tools are bound to the agent running them
+        new_agent.model = copy(self.model)
+        new_agent.tools = copy_tools_for_run(self.tools)
+        new_agent._tool_instructions = None
+        new_agent._tools_for_model = None
+        new_agent._functions_for_model = None
+        if self.team is not None:
+            new_agent.team = [member.copy_for_run() for member in self.team]
+        if self.reasoning_agent is not None:
+            new_agent.reasoning_agent = self.reasoning_agent.copy_for_run()
+
+        if update:
+            for key, value in update.items():
+                setattr(new_agent, key, value)
+        return new_agent
+
     def _deep_copy_field(self, field_name: str, field_value: Any) -> Any:
         """Helper method to deep copy a field based on its type."""
         from copy import copy, deepcopy
@@ -5226,6 +5385,15 @@ class Agent:
                         continue
                     if v is not None:
                         aggregated_metrics[k].append(v)
+            # Tool call results that were looked up in a tool result cache
+            elif (
+                m.metrics is not None
+                and m.metrics.additional_metrics
+                and "tool_cache_hits" in m.metrics.additional_metrics
+                and m.from_history is False
+            ):
+                for k in ("tool_cache_hits", "tool_cache_misses"):
+                    aggregated_metrics[k].append(m.metrics.additional_metrics[k])
         if aggregated_metrics is not None:
             aggregated_metrics = dict(aggregated_metrics)
         return aggregated_metrics
@@ -6236,7 +6404,7 @@ class Agent:
             create_agent_session(
                 session=AgentSessionCreate(
                     session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
+                    agent_data=agent_session.monitoring_data() if self.monitoring else agent_session.telemetry_data(),
                 ),
                 monitor=self.monitoring,
             )
@@ -6342,7 +6510,7 @@ class Agent:
                     run_id=self.run_id,
                     run_data=run_data,
                     session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
+                    agent_data=agent_session.monitoring_data() if self.monitoring else agent_session.telemetry_data(),
                     team_session_id=agent_session.team_session_id,
                 ),
                 monitor=self.monitoring,
@@ -6369,7 +6537,7 @@ class Agent:
                     run_id=self.run_id,
                     run_data=run_data,
                     session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
+                    agent_data=agent_session.monitoring_data() if self.monitoring else agent_session.telemetry_data(),
                     team_session_id=agent_session.team_session_id,
                 ),
                 monitor=self.monitoring,
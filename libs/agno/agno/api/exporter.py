@@ -0,0 +1,165 @@
+import asyncio
+import atexit
+import os
+import threading
+import time
+from dataclasses import dataclass
+from queue import Empty, Full, Queue
+from typing import Any, Dict, List, Optional
+
+from httpx import Client as HttpxClient
+
+from agno.api.api import api
+from agno.utils.log import log_debug
+
+
+@dataclass
+class ApiEvent:
+    """A request to the Agno API, sent by the exporter"""
+
+    route: str
+    payload: Dict[str, Any]
+
+
+class _FlushMarker:
+    """Put on the queue by `flush`. Set once every event queued before it was sent."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class ApiExporter:
+    """Sends telemetry and monitoring events to the Agno API from a single background thread.
+
+    Events are put on a bounded queue and never block the caller: when the queue is full, the event is dropped.
+    The worker thread sends events in batches, over one persistent client, when a batch is full or every
+    `flush_interval` seconds. Queued events are flushed when the process exits.
+    """
+
+    def __init__(self, max_queue_size: int = 1000, batch_size: int = 50, flush_interval: float = 1.0):
+        # Maximum number of queued events. Further events are dropped.
+        self.max_queue_size = max_queue_size
+        # Maximum number of events sent in one batch
+        self.batch_size = batch_size
+        # Seconds to wait for a batch to fill before sending it
+        self.flush_interval = flush_interval
+        # Number of events dropped because the queue was full
+        self.dropped_events: int = 0
+        # Number of events sent, including events the API rejected
+        self.sent_events: int = 0
+
+        self._queue: Queue = Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._client: Optional[HttpxClient] = None
+        self._exit_hook_registered = False
+
+    def submit(self, route: str, payload: Dict[str, Any]) -> bool:
+        """Queue an event to be sent in the background.
+
+        Returns:
+            bool: False if the event was dropped because the queue is full.
+        """
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(ApiEvent(route=route, payload=payload))
+            return True
+        except Full:
+            with self._lock:
+                self.dropped_events += 1
+            log_debug(f"Telemetry queue is full, dropped event for {route}")
+            return False
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until the events queued so far are sent.
+
+        Returns:
+            bool: False if the events were not sent within `timeout` seconds.
+        """
+        if self._worker is None or not self._worker.is_alive():
+            return self._queue.empty()
+        marker = _FlushMarker()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except Full:
+            return False
+        return marker.done.wait(timeout)
+
+    async def aflush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Async version of flush"""
+        return await asyncio.to_thread(self.flush, timeout)
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush the queued events and close the client"""
+        self.flush(timeout=timeout)
+        with self._lock:
+            if self._client is not None:
+                try:
+                    self._client.close()
+                except Exception as e:
+                    log_debug(f"Could not close API client: {e}")
+                self._client = None
+
+    def _ensure_worker(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid and self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._worker is not None and self._worker.is_alive():
+                return
+            if self._pid is not None and self._pid != pid:
+                # Forked process: the worker and client of the parent are not usable here
+                self._queue = Queue(maxsize=self.max_queue_size)
+                self._client = None
+            self._pid = pid
+            self._worker = threading.Thread(target=self._run, name="agno-api-exporter", daemon=True)
+            self._worker.start()
+            if not self._exit_hook_registered:
+                atexit.register(self.shutdown)
+                self._exit_hook_registered = True
+
+    def _get_client(self) -> HttpxClient:
+        if self._client is None:
+            self._client = api.AuthenticatedClient()
+        return self._client
+
+    def _run(self) -> None:
+        while True:
+            batch: List[ApiEvent] = []
+            markers: List[_FlushMarker] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, _FlushMarker):
+                    # Send what is queued before the marker now
+                    markers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except Empty:
+                    break
+            self._send(batch)
+            for marker in markers:
+                marker.done.set()
+
+    def _send(self, batch: List[ApiEvent]) -> None:
+        if not batch:
+            return
+        log_debug(f"Sending {len(batch)} telemetry events")
+        for event in batch:
+            try:
+                self._get_client().post(event.route, json=event.payload)
+            except Exception as e:
+                log_debug(f"Could not send event to {event.route}: {e}")
+        with self._lock:
+            self.sent_events += len(batch)
+
+
+api_exporter = ApiExporter()
@@ -37,13 +37,13 @@ async def agent_chat_response_streamer(
         )
         async for run_response_chunk in run_response:
             run_response_chunk = cast(RunResponse, run_response_chunk)
-            yield run_response_chunk.to_json()
+            yield run_response_chunk.to_json(indent=None)
     except Exception as e:
         error_response = RunResponse(
             content=str(e),
             event=RunEvent.run_error,
         )
-        yield error_response.to_json()
+        yield error_response.to_json(indent=None)
         return
 
 
@@ -71,13 +71,13 @@ async def team_chat_response_streamer(
         )
         async for run_response_chunk in run_response:
             run_response_chunk = cast(TeamRunResponse, run_response_chunk)
-            yield run_response_chunk.to_json()
+            yield run_response_chunk.to_json(indent=None)
     except Exception as e:
         error_response = TeamRunResponse(
             content=str(e),
             event=RunEvent.run_error,
         )
-        yield error_response.to_json()
+        yield error_response.to_json(indent=None)
         return
 
 
@@ -254,38 +254,42 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
         user_id: Optional[str] = Form(None),
         files: Optional[List[UploadFile]] = File(None),
     ):
+        # Runs keep their state on the agent or team, so each request runs on its own lightweight copy
+        run_agent = agent.copy_for_run() if agent else None
+        run_team = team.copy_for_run() if team else None
+
         if session_id is not None and session_id != "":
             logger.debug(f"Continuing session: {session_id}")
         else:
             logger.debug("Creating new session")
             session_id = str(uuid4())
 
-        if agent:
+        if run_agent:
             if monitor:
-                agent.monitoring = True
+                run_agent.monitoring = True
             else:
-                agent.monitoring = False
-        elif team:
+                run_agent.monitoring = False
+        elif run_team:
             if monitor:
-                team.monitoring = True
+                run_team.monitoring = True
             else:
-                team.monitoring = False
+                run_team.monitoring = False
 
         base64_images: List[Image] = []
         base64_audios: List[Audio] = []
         base64_videos: List[Video] = []
         document_files: List[FileMedia] = []
         if files:
-            if agent:
-                base64_images, base64_audios, base64_videos = await agent_process_file(files, agent)
-            elif team:
+            if run_agent:
+                base64_images, base64_audios, base64_videos = await agent_process_file(files, run_agent)
+            elif run_team:
                 base64_images, base64_audios, base64_videos, document_files = await team_process_file(files)
 
         if stream:
-            if agent:
+            if run_agent:
                 return StreamingResponse(
                     agent_chat_response_streamer(
-                        agent,
+                        run_agent,
                         message,
                         session_id=session_id,
                         user_id=user_id,
@@ -295,10 +299,10 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                     ),
                     media_type="text/event-stream",
                 )
-            elif team:
+            elif run_team:
                 return StreamingResponse(
                     team_chat_response_streamer(
-                        team,
+                        run_team,
                         message,
                         session_id=session_id,
                         user_id=user_id,
@@ -310,10 +314,10 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                     media_type="text/event-stream",
                 )
         else:
-            if agent:
+            if run_agent:
                 run_response = cast(
                     RunResponse,
-                    await agent.arun(
+                    await run_agent.arun(
                         message=message,
                         session_id=session_id,
                         user_id=user_id,
@@ -324,8 +328,8 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                     ),
                 )
                 return run_response.to_dict()
-            elif team:
-                team_run_response = await team.arun(
+            elif run_team:
+                team_run_response = await run_team.arun(
                     message=message,
                     session_id=session_id,
                     user_id=user_id,
@@ -4,13 +4,14 @@ from io import BytesIO
 from typing import Any, AsyncGenerator, Dict, List, Optional, cast
 from uuid import uuid4
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.operator import (
     format_tools,
     get_agent_by_id,
+    get_session_from_listing,
     get_session_title,
     get_session_title_from_team_session,
     get_session_title_from_workflow_session,
@@ -69,7 +70,7 @@ async def chat_response_streamer(
         )
         async for run_response_chunk in run_response:
             run_response_chunk = cast(RunResponse, run_response_chunk)
-            yield run_response_chunk.to_json()
+            yield run_response_chunk.to_json(indent=None)
     except Exception as e:
         import traceback
 
@@ -78,7 +79,7 @@ async def chat_response_streamer(
             content=str(e),
             event=RunEvent.run_error,
         )
-        yield error_response.to_json()
+        yield error_response.to_json(indent=None)
         return
 
 
@@ -106,7 +107,7 @@ async def team_chat_response_streamer(
         )
         async for run_response_chunk in run_response:
             run_response_chunk = cast(TeamRunResponse, run_response_chunk)
-            yield run_response_chunk.to_json()
+            yield run_response_chunk.to_json(indent=None)
     except Exception as e:
         import traceback
 
@@ -115,7 +116,7 @@ async def team_chat_response_streamer(
             content=str(e),
             event=RunEvent.run_error,
         )
-        yield error_response.to_json()
+        yield error_response.to_json(indent=None)
         return
 
 
@@ -229,6 +230,8 @@ def get_async_playground_router(
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
+        # Runs keep their state on the agent, so each request runs on its own lightweight copy
+        agent = agent.copy_for_run()
 
         if session_id is not None and session_id != "":
             logger.debug(f"Continuing session: {session_id}")
@@ -364,7 +367,13 @@ def get_async_playground_router(
             return run_response.to_dict()
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    async def get_all_agent_sessions(agent_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    async def get_all_agent_sessions(
+        agent_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -373,9 +382,21 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
+        # Only the session data and first run of the sessions are read, for their titles
+        try:
+            page = await agent.storage.alist_sessions(
+                user_id=user_id, entity_id=agent_id, limit=limit, cursor=cursor, fields=["session_data", "first_run"]
+            )
+        except ValueError as e:
+            return JSONResponse(status_code=400, content=str(e))
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
+        for listed_session in page.sessions:
+            session = get_session_from_listing(listed_session, AgentSession)
+            if session is None:
+                continue
             title = get_session_title(session)
             agent_sessions.append(
                 AgentSessionsResponse(
@@ -435,11 +456,10 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed session {session.session_id}"})
+        session: Optional[AgentSession] = await agent.storage.aread(session_id, body.user_id)  # type: ignore
+        if session is not None and session.agent_id == agent_id:
+            agent.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed session {session.session_id}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -452,11 +472,10 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted session {session_id}"})
+        session: Optional[AgentSession] = await agent.storage.aread(session_id, user_id)  # type: ignore
+        if session is not None and session.agent_id == agent_id:
+            agent.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted session {session_id}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -539,7 +558,13 @@ def get_async_playground_router(
             raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.get("/workflows/{workflow_id}/sessions", response_model=List[WorkflowSessionResponse])
-    async def get_all_workflow_sessions(workflow_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    async def get_all_workflow_sessions(
+        workflow_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -549,13 +574,24 @@ def get_async_playground_router(
         if not workflow.storage:
             raise HTTPException(status_code=404, detail="Workflow does not have storage enabled")
 
-        # Retrieve all sessions for the given workflow and user
+        # Retrieve a page of sessions for the given workflow and user, with their first run for their titles
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, entity_id=workflow_id
-            )  # type: ignore
+            page = await workflow.storage.alist_sessions(
+                user_id=user_id, entity_id=workflow_id, limit=limit, cursor=cursor, fields=["session_data", "first_run"]
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        all_workflow_sessions = [
+            session
+            for session in (
+                get_session_from_listing(listed_session, WorkflowSession) for listed_session in page.sessions
+            )
+            if session is not None
+        ]
 
         # Return the sessions
         return [
@@ -640,6 +676,8 @@ def get_async_playground_router(
         team = get_team_by_id(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
+        # Runs keep their state on the team, so each request runs on its own lightweight copy
+        team = team.copy_for_run()
 
         if session_id is not None and session_id != "":
             logger.debug(f"Continuing session: {session_id}")
@@ -733,7 +771,13 @@ def get_async_playground_router(
             return run_response.to_dict()
 
     @playground_router.get("/teams/{team_id}/sessions", response_model=List[TeamSessionResponse])
-    async def get_all_team_sessions(team_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    async def get_all_team_sessions(
+        team_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         team = get_team_by_id(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
@@ -741,13 +785,23 @@ def get_async_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
+        # Only the session data and first run of the sessions are read, for their titles
         try:
-            all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
+            page = await team.storage.alist_sessions(
+                user_id=user_id, entity_id=team_id, limit=limit, cursor=cursor, fields=["session_data", "first_run"]
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
 
         team_sessions: List[TeamSessionResponse] = []
-        for session in all_team_sessions:
+        for listed_session in page.sessions:
+            session = get_session_from_listing(listed_session, TeamSession)
+            if session is None:
+                continue
             title = get_session_title_from_team_session(session)
             team_sessions.append(
                 TeamSessionResponse(
@@ -810,11 +864,10 @@ def get_async_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=body.user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
+        session: Optional[TeamSession] = await team.storage.aread(session_id, body.user_id)  # type: ignore
+        if session is not None and session.team_id == team_id:
+            team.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -827,11 +880,10 @@ def get_async_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
+        session: Optional[TeamSession] = await team.storage.aread(session_id, user_id)  # type: ignore
+        if session is not None and session.team_id == team_id:
+            team.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
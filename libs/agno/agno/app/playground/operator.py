@@ -1,8 +1,9 @@
-from typing import Any, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
 from agno.agent.agent import Agent, AgentRun, Function, Toolkit
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
+from agno.storage.listing import FIRST_RUN_FIELD
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
@@ -10,6 +11,8 @@ from agno.team.team import Team
 from agno.utils.log import logger
 from agno.workflow.workflow import Workflow
 
+SessionT = TypeVar("SessionT", AgentSession, TeamSession, WorkflowSession)
+
 
 def format_tools(agent_tools):
     formatted_tools = []
@@ -40,6 +43,17 @@ def get_agent_by_id(agent_id: str, agents: Optional[List[Agent]] = None) -> Opti
     return None
 
 
+def get_session_from_listing(listed_session: Dict[str, Any], session_type: Type[SessionT]) -> Optional[SessionT]:
+    """Session from a session listed by Storage.list_sessions(), with its first run as its only run.
+
+    Enough to get the title of the session without reading all its runs.
+    """
+    data = {key: value for key, value in listed_session.items() if key != FIRST_RUN_FIELD}
+    first_run = listed_session.get(FIRST_RUN_FIELD)
+    data["memory"] = {"runs": [first_run]} if first_run is not None else None
+    return session_type.from_dict(data)  # type: ignore
+
+
 def get_session_title(session: Union[AgentSession, TeamSession]) -> str:
     if session is None:
         return "Unnamed session"
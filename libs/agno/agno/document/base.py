@@ -26,6 +26,37 @@ class Document:
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    async def async_embed(self, embedder: Optional[Embedder] = None) -> None:
+        """Embed the document asynchronously using the provided embedder"""
+
+        _embedder = embedder or self.embedder
+        if _embedder is None:
+            raise ValueError("No embedder provided")
+
+        self.embedding, self.usage = await _embedder.async_get_embedding_and_usage(self.content)
+
+    @classmethod
+    def embed_batch(cls, documents: List["Document"], embedder: Embedder) -> None:
+        """Embed a list of documents, sending as few requests to the embedder as possible"""
+        if not documents:
+            return
+
+        embeddings, usage = embedder.get_embeddings_batch_and_usage([document.content for document in documents])
+        for document, embedding, document_usage in zip(documents, embeddings, usage):
+            document.embedding, document.usage = embedding, document_usage
+
+    @classmethod
+    async def async_embed_batch(cls, documents: List["Document"], embedder: Embedder) -> None:
+        """Embed a list of documents asynchronously, embedding batches concurrently"""
+        if not documents:
+            return
+
+        embeddings, usage = await embedder.async_get_embeddings_batch_and_usage(
+            [document.content for document in documents]
+        )
+        for document, embedding, document_usage in zip(documents, embeddings, usage):
+            document.embedding, document.usage = embedding, document_usage
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
         fields = {"name", "meta_data", "content"}
@@ -1,6 +1,9 @@
 import asyncio
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Iterator, List, Optional, Union
 from uuid import uuid4
 
 from agno.document.base import Document
@@ -15,32 +18,65 @@ except ImportError:
     raise ImportError("`pypdf` not installed. Please install it via `pip install pypdf`.")
 
 
-def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
-    try:
-        import rapidocr_onnxruntime as rapidocr
-    except ImportError:
-        raise ImportError(
-            "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
-        )
-    ocr = rapidocr.RapidOCR()
-    page_text = page.extract_text() or ""
-    images_text_list = []
+# One OCR engine per process, loaded on first use. Loading the OCR models is much slower than running them on a page.
+_ocr_engine: Optional[Any] = None
+# Worker pool used for OCR, shared by all readers of the process and shut down when the process exits
+_ocr_pool: Optional[ProcessPoolExecutor] = None
+_ocr_pool_lock = threading.Lock()
 
-    # Extract and process images
-    for image_object in page.images:
-        image_data = image_object.data
 
-        # Perform OCR on the image
-        ocr_result, elapse = ocr(image_data)
-
-        # Extract text from OCR result
+def get_ocr_engine() -> Any:
+    """Return the OCR engine of the current process, creating it on first use"""
+    global _ocr_engine
+    if _ocr_engine is None:
+        try:
+            import rapidocr_onnxruntime as rapidocr
+        except ImportError:
+            raise ImportError(
+                "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
+            )
+        _ocr_engine = rapidocr.RapidOCR()
+    return _ocr_engine
+
+
+def get_ocr_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared pool of OCR worker processes, each loading the OCR engine once when it starts.
+
+    The pool is created with `workers` processes on first use and reused afterwards, whatever the number of workers.
+    """
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ProcessPoolExecutor(max_workers=workers, initializer=get_ocr_engine)
+            atexit.register(shutdown_ocr_pool)
+        return _ocr_pool
+
+
+def shutdown_ocr_pool() -> None:
+    """Stop the OCR worker processes. A new pool is created if OCR runs again."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        pool, _ocr_pool = _ocr_pool, None
+    if pool is not None:
+        atexit.unregister(shutdown_ocr_pool)
+        pool.shutdown(wait=True)
+
+
+def ocr_images(images: List[bytes]) -> List[str]:
+    """Run OCR on images and return the recognized text lines"""
+    ocr = get_ocr_engine()
+    images_text_list: List[str] = []
+    for image_data in images:
+        ocr_result, _ = ocr(image_data)
         if ocr_result:
             images_text_list += [item[1] for item in ocr_result]
+    return images_text_list
+
 
+def _image_page_document(doc_name: str, page_number: int, page_text: str, images_text_list: List[str]) -> Document:
     images_text = "\n".join(images_text_list)
     content = page_text + "\n" + images_text
 
-    # Append the document
     return Document(
         name=doc_name,
         id=str(uuid4()),
@@ -49,38 +85,61 @@ def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
     )
 
 
-async def async_process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
-    try:
-        import rapidocr_onnxruntime as rapidocr
-    except ImportError:
-        raise ImportError(
-            "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
-        )
-    ocr = rapidocr.RapidOCR()
-
+def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
     page_text = page.extract_text() or ""
-    images_text_list: List = []
-
-    # Process images in parallel
-    async def process_image(image_data: bytes) -> List[str]:
-        ocr_result, _ = ocr(image_data)
-        return [item[1] for item in ocr_result] if ocr_result else []
+    images_text_list = ocr_images([image_object.data for image_object in page.images])
+    return _image_page_document(doc_name, page_number, page_text, images_text_list)
 
-    image_tasks = [process_image(image.data) for image in page.images]
-    images_results = await asyncio.gather(*image_tasks)
 
-    for result in images_results:
-        images_text_list.extend(result)
-
-    images_text = "\n".join(images_text_list)
-    content = page_text + "\n" + images_text
+async def async_process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
+    """Process a page in a thread, so OCR does not block the event loop"""
+    return await asyncio.to_thread(process_image_page, doc_name, page_number, page)
+
+
+def process_image_pages(doc_name: str, pages: List[Any], ocr_workers: int = 0) -> Iterator[Document]:
+    """Process pages with OCR, in a pool of `ocr_workers` processes when ocr_workers > 1.
+
+    Page text and images are extracted in this process, only the image bytes are sent to the workers.
+    Documents are yielded in page order as soon as they are ready.
+    """
+    if ocr_workers <= 1:
+        for page_number, page in enumerate(pages, start=1):
+            yield process_image_page(doc_name, page_number, page)
+        return
+
+    pool = get_ocr_pool(ocr_workers)
+    page_texts = [page.extract_text() or "" for page in pages]
+    page_images = [[image_object.data for image_object in page.images] for page in pages]
+    for page_number, (page_text, images_text_list) in enumerate(
+        zip(page_texts, pool.map(ocr_images, page_images)), start=1
+    ):
+        yield _image_page_document(doc_name, page_number, page_text, images_text_list)
+
+
+async def async_process_image_pages(doc_name: str, pages: List[Any], ocr_workers: int = 0) -> List[Document]:
+    """Process pages with OCR without blocking the event loop.
+    Runs OCR in a pool of `ocr_workers` processes when ocr_workers > 1, otherwise in threads.
+    """
+    if ocr_workers <= 1:
+        return list(
+            await asyncio.gather(
+                *[
+                    async_process_image_page(doc_name, page_number, page)
+                    for page_number, page in enumerate(pages, start=1)
+                ]
+            )
+        )
 
-    return Document(
-        name=doc_name,
-        id=str(uuid4()),
-        meta_data={"page": page_number},
-        content=content,
+    loop = asyncio.get_running_loop()
+    pool = get_ocr_pool(ocr_workers)
+    page_texts = [page.extract_text() or "" for page in pages]
+    images_results = await asyncio.gather(
+        *[loop.run_in_executor(pool, ocr_images, [image_object.data for image_object in page.images]) for page in pages]
     )
+    return [
+        _image_page_document(doc_name, page_number, page_text, images_text_list)
+        for page_number, (page_text, images_text_list) in enumerate(zip(page_texts, images_results), start=1)
+    ]
 
 
 class BasePDFReader(Reader):
@@ -239,6 +298,11 @@ class PDFUrlReader(BasePDFReader):
 class PDFImageReader(BasePDFReader):
     """Reader for PDF files with text and images extraction"""
 
+    def __init__(self, ocr_workers: int = 0, **kwargs):
+        super().__init__(**kwargs)
+        # Number of processes that run OCR on pages in parallel. Values <= 1 run OCR in the calling process
+        self.ocr_workers = ocr_workers
+
     def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
         if not pdf:
             raise ValueError("No pdf provided")
@@ -254,9 +318,7 @@ class PDFImageReader(BasePDFReader):
         log_info(f"Reading: {doc_name}")
         doc_reader = DocumentReader(pdf)
 
-        documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
-            documents.append(process_image_page(doc_name, page_number, page))
+        documents = list(process_image_pages(doc_name, list(doc_reader.pages), ocr_workers=self.ocr_workers))
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -278,12 +340,7 @@ class PDFImageReader(BasePDFReader):
         log_info(f"Reading: {doc_name}")
         doc_reader = DocumentReader(pdf)
 
-        documents = await asyncio.gather(
-            *[
-                async_process_image_page(doc_name, page_number, page)
-                for page_number, page in enumerate(doc_reader.pages, start=1)
-            ]
-        )
+        documents = await async_process_image_pages(doc_name, list(doc_reader.pages), ocr_workers=self.ocr_workers)
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -293,9 +350,11 @@ class PDFImageReader(BasePDFReader):
 class PDFUrlImageReader(BasePDFReader):
     """Reader for PDF files from URL with text and images extraction"""
 
-    def __init__(self, proxy: Optional[str] = None, **kwargs):
+    def __init__(self, proxy: Optional[str] = None, ocr_workers: int = 0, **kwargs):
         super().__init__(**kwargs)
         self.proxy = proxy
+        # Number of processes that run OCR on pages in parallel. Values <= 1 run OCR in the calling process
+        self.ocr_workers = ocr_workers
 
     def read(self, url: str) -> List[Document]:
         if not url:
@@ -312,9 +371,7 @@ class PDFUrlImageReader(BasePDFReader):
         doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
         doc_reader = DocumentReader(BytesIO(response.content))
 
-        documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
-            documents.append(process_image_page(doc_name, page_number, page))
+        documents = list(process_image_pages(doc_name, list(doc_reader.pages), ocr_workers=self.ocr_workers))
 
         # Optionally chunk documents
         if self.chunk:
@@ -340,12 +397,7 @@ class PDFUrlImageReader(BasePDFReader):
         doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
         doc_reader = DocumentReader(BytesIO(response.content))
 
-        documents = await asyncio.gather(
-            *[
-                async_process_image_page(doc_name, page_number, page)
-                for page_number, page in enumerate(doc_reader.pages, start=1)
-            ]
-        )
+        documents = await async_process_image_pages(doc_name, list(doc_reader.pages), ocr_workers=self.ocr_workers)
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from os import getenv
 from typing import Any, Dict, List, Optional, Tuple
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, batch_usage
 from agno.exceptions import AgnoError, ModelProviderError
 from agno.utils.log import log_error, logger
 
@@ -48,6 +48,8 @@ class AwsBedrockEmbedder(Embedder):
     id: str = "cohere.embed-multilingual-v3"
     dimensions: int = 1024  # Cohere models have 1024 dimensions by default
     input_type: str = "search_query"
+    # Cohere embeds at most 96 texts per request
+    batch_size: int = 96
     truncate: Optional[str] = None  # 'NONE', 'START', or 'END'
     # 'float', 'int8', 'uint8', etc.
     embedding_types: Optional[List[str]] = None
@@ -94,18 +96,19 @@ class AwsBedrockEmbedder(Embedder):
         )
         return self.client
 
-    def _format_request_body(self, text: str) -> str:
+    def _format_request_body(self, text: Optional[str] = None, texts: Optional[List[str]] = None) -> str:
         """
         Format the request body for the embedder.
 
         Args:
-            text (str): The text to embed.
+            text (Optional[str]): The text to embed.
+            texts (Optional[List[str]]): A batch of texts to embed. Takes precedence over `text`.
 
         Returns:
             str: The formatted request body as a JSON string.
         """
         request_body = {
-            "texts": [text],
+            "texts": texts if texts is not None else [text],
             "input_type": self.input_type,
         }
 
@@ -121,18 +124,19 @@ class AwsBedrockEmbedder(Embedder):
 
         return json.dumps(request_body)
 
-    def response(self, text: str) -> Dict[str, Any]:
+    def response(self, text: Optional[str] = None, texts: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get embeddings from AWS Bedrock for the given text.
 
         Args:
-            text (str): The text to embed.
+            text (Optional[str]): The text to embed.
+            texts (Optional[List[str]]): A batch of texts to embed. Takes precedence over `text`.
 
         Returns:
             Dict[str, Any]: The response from the API.
         """
         try:
-            body = self._format_request_body(text)
+            body = self._format_request_body(text=text, texts=texts)
             response = self.get_client().invoke_model(
                 modelId=self.id,
                 body=body,
@@ -210,3 +214,33 @@ class AwsBedrockEmbedder(Embedder):
             usage = response["usage"]
 
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        """
+        Get embeddings and usage information for a batch of texts in a single request.
+
+        Args:
+            texts (List[str]): The texts to embed.
+
+        Returns:
+            Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]: The embedding vectors and usage information.
+        """
+        response = self.response(texts=texts)
+
+        embeddings: List[List[float]] = []
+        if "embeddings" in response:
+            if isinstance(response["embeddings"], list):
+                embeddings = response["embeddings"]
+            elif isinstance(response["embeddings"], dict):
+                if "float" in response["embeddings"]:
+                    embeddings = response["embeddings"]["float"]
+                # Fallback to the first available embedding type
+                else:
+                    for embedding_type in response["embeddings"]:
+                        embeddings = response["embeddings"][embedding_type]
+                        break
+
+        usage = response.get("usage")
+        return embeddings, batch_usage(usage, len(texts))
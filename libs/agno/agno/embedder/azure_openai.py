@@ -1,13 +1,14 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, batch_usage
 from agno.utils.log import logger
 
 try:
+    from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
     from openai import AzureOpenAI as AzureOpenAIClient
     from openai.types.create_embedding_response import CreateEmbeddingResponse
 except ImportError:
@@ -32,12 +33,9 @@ class AzureOpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[AzureOpenAIClient] = None
+    async_openai_client: Optional[AsyncAzureOpenAIClient] = None
 
-    @property
-    def client(self) -> AzureOpenAIClient:
-        if self.openai_client:
-            return self.openai_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {}
         if self.api_key:
             _client_params["api_key"] = self.api_key
@@ -58,10 +56,24 @@ class AzureOpenAIEmbedder(Embedder):
 
         if self.client_params:
             _client_params.update(self.client_params)
+        return _client_params
 
-        return AzureOpenAIClient(**_client_params)
+    @property
+    def client(self) -> AzureOpenAIClient:
+        if self.openai_client:
+            return self.openai_client
+
+        return AzureOpenAIClient(**self._get_client_params())
+
+    @property
+    def async_client(self) -> AsyncAzureOpenAIClient:
+        if self.async_openai_client:
+            return self.async_openai_client
 
-    def _response(self, text: str) -> CreateEmbeddingResponse:
+        self.async_openai_client = AsyncAzureOpenAIClient(**self._get_client_params())
+        return self.async_openai_client
+
+    def _get_request_params(self, text: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -73,8 +85,13 @@ class AzureOpenAIEmbedder(Embedder):
             _request_params["dimensions"] = self.dimensions
         if self.request_params:
             _request_params.update(self.request_params)
+        return _request_params
+
+    def _response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return self.client.embeddings.create(**self._get_request_params(text))
 
-        return self.client.embeddings.create(**_request_params)
+    async def _async_response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return await self.async_client.embeddings.create(**self._get_request_params(text))
 
     def get_embedding(self, text: str) -> List[float]:
         response: CreateEmbeddingResponse = self._response(text=text)
@@ -90,3 +107,34 @@ class AzureOpenAIEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: CreateEmbeddingResponse = self._response(text=texts)
+
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda data: data.index)]
+        usage = response.usage.model_dump() if response.usage else None
+        return embeddings, batch_usage(usage, len(texts))
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        response: CreateEmbeddingResponse = await self._async_response(text=text)
+        try:
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(e)
+            return []
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        response: CreateEmbeddingResponse = await self._async_response(text=text)
+
+        embedding = response.data[0].embedding
+        usage = response.usage
+        return embedding, usage.model_dump()
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: CreateEmbeddingResponse = await self._async_response(text=texts)
+
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda data: data.index)]
+        usage = response.usage.model_dump() if response.usage else None
+        return embeddings, batch_usage(usage, len(texts))
@@ -1,15 +1,137 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
+from agno.embedder.query_cache import QueryEmbeddingCache
+
+
+def batch_usage(usage: Optional[Dict], count: int) -> List[Optional[Dict]]:
+    """The usage of each text of a batch embedded with a single request.
+
+    The usage of the request is returned for the first text only, so summing the usage of the texts gives the usage
+    of the requests.
+    """
+    return [usage] + [None] * (count - 1) if count > 0 else []
+
 
 @dataclass
 class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of texts to send to the provider in a single request
+    batch_size: int = 100
+    # Maximum (approximate) number of tokens to send to the provider in a single request
+    batch_max_tokens: Optional[int] = None
+    # Maximum number of batches embedded concurrently by the async methods
+    max_concurrent_batches: int = 4
+    # Cache the embeddings of search queries, so repeated queries skip the request to the provider
+    cache_query_embeddings: bool = True
+    # Cache of search query embeddings. Defaults to a cache shared by all embedders in the process.
+    query_cache: Optional[QueryEmbeddingCache] = None
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for a list of texts, in the same order as the input"""
+        return self.get_embeddings_batch_and_usage(texts)[0]
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Get embeddings and usage for a list of texts, in the same order as the input.
+
+        The texts are split into batches that respect `batch_size` and `batch_max_tokens`, and every
+        batch is embedded with a single request. The usage reported for a batch is returned for its first text.
+        """
+        embeddings: List[List[float]] = []
+        usage: List[Optional[Dict]] = []
+        for batch in self.split_batches(texts):
+            batch_embeddings, batch_usage = self._get_batch_embeddings_and_usage(batch)
+            if len(batch_embeddings) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(batch_embeddings)}")
+            embeddings.extend(batch_embeddings)
+            usage.extend(batch_usage)
+        return embeddings, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a single batch of texts. Providers that accept a list of inputs should override this method.
+
+        The default implementation sends one request per text. Providers that only report usage for the
+        whole request return that usage for the first text of the batch, see `batch_usage`.
+        """
+        embeddings: List[List[float]] = []
+        usage: List[Optional[Dict]] = []
+        for text in texts:
+            embedding, text_usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            usage.append(text_usage)
+        return embeddings, usage
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        """Providers with an async client should override this method. Runs the sync method in a thread by default"""
+        return await asyncio.to_thread(self.get_embedding, text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        """Providers with an async client should override this method. Runs the sync method in a thread by default"""
+        return await asyncio.to_thread(self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for a list of texts asynchronously, in the same order as the input"""
+        return (await self.async_get_embeddings_batch_and_usage(texts))[0]
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Get embeddings and usage for a list of texts asynchronously, in the same order as the input.
+
+        Batches are embedded concurrently, with at most `max_concurrent_batches` requests in flight.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_batches))
+
+        async def _embed_batch(batch: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+            async with semaphore:
+                batch_embeddings, batch_usage = await self._async_get_batch_embeddings_and_usage(batch)
+            if len(batch_embeddings) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(batch_embeddings)}")
+            return batch_embeddings, batch_usage
+
+        embeddings: List[List[float]] = []
+        usage: List[Optional[Dict]] = []
+        for batch_embeddings, batch_usage in await asyncio.gather(
+            *[_embed_batch(batch) for batch in self.split_batches(texts)]
+        ):
+            embeddings.extend(batch_embeddings)
+            usage.extend(batch_usage)
+        return embeddings, usage
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a single batch of texts asynchronously. Runs the sync batch method in a thread by default"""
+        return await asyncio.to_thread(self._get_batch_embeddings_and_usage, texts)
+
+    def split_batches(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into batches that respect `batch_size` and `batch_max_tokens`.
+
+        Tokens are estimated as 4 characters per token, which is close enough to keep requests under provider limits.
+        """
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        batch_size = max(1, self.batch_size)
+        for text in texts:
+            tokens = len(text) // 4 + 1
+            if current and (
+                len(current) >= batch_size
+                or (self.batch_max_tokens is not None and current_tokens + tokens > self.batch_max_tokens)
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
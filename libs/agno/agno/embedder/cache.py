@@ -0,0 +1,272 @@
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from agno.embedder.base import Embedder
+from agno.embedder.query_cache import embedder_scope, embedding_cache_key
+from agno.utils.log import log_debug, logger
+
+# Number of writes between recounts of the size of the cache
+_RECOUNT_EVERY = 100
+
+
+def _as_float32(embedding: List[float]) -> List[float]:
+    """Round an embedding the way the cache stores it, so misses and hits return the same values"""
+    return array("f", embedding).tolist()
+
+
+@dataclass
+class EmbeddingCache:
+    """Content-addressed embedding cache, persisted to a local SQLite file.
+
+    Embeddings are stored as float32 blobs keyed by a hash of the embedder and the content.
+    When the cache grows past `max_size_mb`, the least recently used entries are evicted.
+    """
+
+    # Path to the SQLite file. Defaults to <tempdir>/agno_cache/embeddings.db
+    db_file: Optional[Path] = None
+    # Maximum size of the stored embeddings, in megabytes. None for no limit.
+    max_size_mb: Optional[float] = 1024
+    # Fraction of `max_size_mb` to keep after an eviction, so eviction does not run on every write
+    evict_to_ratio: float = 0.9
+    # Seconds before a hit refreshes the access time of an entry, so reads rarely write to the file
+    touch_interval: float = 60
+
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    # Running total of the stored sizes, so writes don't sum the table. Other processes writing to the same file
+    # make it drift, so it is recounted every `_RECOUNT_EVERY` writes and before evicting.
+    _total_size: Optional[int] = field(default=None, init=False, repr=False)
+    _writes: int = field(default=0, init=False, repr=False)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        if self.db_file is None:
+            from tempfile import gettempdir
+
+            self.db_file = Path(gettempdir()) / "agno_cache" / "embeddings.db"
+        self.db_file = Path(self.db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, embedding BLOB NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_accessed_at ON embeddings (accessed_at)")
+        connection.commit()
+        self._connection = connection
+        return self._connection
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the cached embeddings for the given keys. Missing keys are not included in the result."""
+        if not keys:
+            return {}
+
+        hits: Dict[str, List[float]] = {}
+        stale_keys: List[str] = []
+        unique_keys = list(dict.fromkeys(keys))
+        now = time.time()
+        with self._lock:
+            connection = self.connection
+            # Stay well below SQLite's limit on the number of bound parameters
+            for i in range(0, len(unique_keys), 500):
+                chunk = unique_keys[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = connection.execute(
+                    f"SELECT key, embedding, accessed_at FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob, accessed_at in rows:
+                    hits[key] = array("f", blob).tolist()
+                    if accessed_at < now - self.touch_interval:
+                        stale_keys.append(key)
+            # Eviction only needs a coarse access order, so recently touched entries are not updated again
+            if stale_keys:
+                connection.executemany(
+                    "UPDATE embeddings SET accessed_at = ? WHERE key = ?", [(now, key) for key in stale_keys]
+                )
+                connection.commit()
+        return hits
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        """Store embeddings in the cache, evicting the least recently used entries if needed."""
+        if not embeddings:
+            return
+
+        now = time.time()
+        rows: List[Tuple[str, bytes, int, float]] = []
+        for key, embedding in embeddings.items():
+            blob = array("f", embedding).tobytes()
+            rows.append((key, blob, len(blob), now))
+
+        with self._lock:
+            connection = self.connection
+            if self.max_size_mb is not None:
+                if self._total_size is None or self._writes % _RECOUNT_EVERY == 0:
+                    self._total_size = self._count_size()
+                self._writes += 1
+                # Replaced entries free their previous size
+                replaced = 0
+                for i in range(0, len(rows), 500):
+                    chunk = [row[0] for row in rows[i : i + 500]]
+                    placeholders = ",".join("?" * len(chunk))
+                    replaced += connection.execute(
+                        f"SELECT COALESCE(SUM(size), 0) FROM embeddings WHERE key IN ({placeholders})", chunk
+                    ).fetchone()[0]
+                self._total_size += sum(row[2] for row in rows) - replaced
+            connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding, size, accessed_at) VALUES (?, ?, ?, ?)", rows
+            )
+            connection.commit()
+            self._evict()
+
+    def _count_size(self) -> int:
+        return self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+
+    def _evict(self) -> None:
+        if self.max_size_mb is None:
+            return
+
+        max_size = int(self.max_size_mb * 1024 * 1024)
+        if self._total_size is not None and self._total_size <= max_size:
+            return
+        connection = self.connection
+        total_size = self._total_size = self._count_size()
+        if total_size <= max_size:
+            return
+
+        # Delete the least recently used entries until the cache is back under the target size
+        target_size = int(max_size * self.evict_to_ratio)
+        to_free = total_size - target_size
+        freed = 0
+        keys_to_delete: List[str] = []
+        for key, size in connection.execute("SELECT key, size FROM embeddings ORDER BY accessed_at ASC"):
+            keys_to_delete.append(key)
+            freed += size
+            if freed >= to_free:
+                break
+        connection.executemany("DELETE FROM embeddings WHERE key = ?", [(key,) for key in keys_to_delete])
+        connection.commit()
+        self._total_size = total_size - freed
+        log_debug(f"Evicted {len(keys_to_delete)} embeddings from the cache")
+
+    def clear(self) -> None:
+        """Remove all embeddings from the cache."""
+        with self._lock:
+            self.connection.execute("DELETE FROM embeddings")
+            self.connection.commit()
+            self._total_size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._total_size = None
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Embedder that serves embeddings from an EmbeddingCache and only sends cache misses to the wrapped embedder.
+
+    Cache hits report no usage, since no request was made to the provider.
+    """
+
+    embedder: Optional[Embedder] = None
+    cache: Optional[EmbeddingCache] = None
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("CachedEmbedder requires an embedder")
+        if self.cache is None:
+            self.cache = EmbeddingCache()
+        self.dimensions = self.embedder.dimensions
+
+    @property
+    def _embedder(self) -> Embedder:
+        assert self.embedder is not None
+        return self.embedder
+
+    @property
+    def _cache(self) -> EmbeddingCache:
+        assert self.cache is not None
+        return self.cache
+
+    def cache_key(self, text: str) -> str:
+        """Key for a text, scoped to the wrapped embedder and the settings that change its embeddings"""
+        return embedding_cache_key(self._embedder, text)
+
+    def _cache_keys(self, texts: List[str]) -> List[str]:
+        scope = embedder_scope(self._embedder)
+        return [embedding_cache_key(self._embedder, text, scope=scope) for text in texts]
+
+    def _get_cached(self, keys: List[str]) -> Dict[str, List[float]]:
+        try:
+            return self._cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Error reading from the embedding cache: {e}")
+            return {}
+
+    def _set_cached(self, embeddings: Dict[str, List[float]]) -> None:
+        try:
+            self._cache.set_many({key: embedding for key, embedding in embeddings.items() if embedding})
+        except Exception as e:
+            logger.warning(f"Error writing to the embedding cache: {e}")
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        embeddings, usage = self.get_embeddings_batch_and_usage([text])
+        return embeddings[0], usage[0]
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys = self._cache_keys(texts)
+        cached = self._get_cached(keys)
+        misses = [i for i, key in enumerate(keys) if key not in cached]
+        log_debug(f"Embedding cache: {len(texts) - len(misses)} hits, {len(misses)} misses")
+
+        usage: List[Optional[Dict]] = [None] * len(texts)
+        if misses:
+            miss_embeddings, miss_usage = self._embedder.get_embeddings_batch_and_usage([texts[i] for i in misses])
+            for i, embedding, embedding_usage in zip(misses, miss_embeddings, miss_usage):
+                cached[keys[i]] = _as_float32(embedding)
+                usage[i] = embedding_usage
+            self._set_cached({keys[i]: cached[keys[i]] for i in misses})
+        return [cached[key] for key in keys], usage
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return (await self.async_get_embedding_and_usage(text))[0]
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        embeddings, usage = await self.async_get_embeddings_batch_and_usage([text])
+        return embeddings[0], usage[0]
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        import asyncio
+
+        keys = self._cache_keys(texts)
+        cached = await asyncio.to_thread(self._get_cached, keys)
+        misses = [i for i, key in enumerate(keys) if key not in cached]
+        log_debug(f"Embedding cache: {len(texts) - len(misses)} hits, {len(misses)} misses")
+
+        usage: List[Optional[Dict]] = [None] * len(texts)
+        if misses:
+            miss_embeddings, miss_usage = await self._embedder.async_get_embeddings_batch_and_usage(
+                [texts[i] for i in misses]
+            )
+            for i, embedding, embedding_usage in zip(misses, miss_embeddings, miss_usage):
+                cached[keys[i]] = _as_float32(embedding)
+                usage[i] = embedding_usage
+            await asyncio.to_thread(self._set_cached, {keys[i]: cached[keys[i]] for i in misses})
+        return [cached[key] for key in keys], usage
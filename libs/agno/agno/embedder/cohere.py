@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, batch_usage
 from agno.utils.log import logger
 
 try:
+    from cohere import AsyncClient as AsyncCohereClient
     from cohere import Client as CohereClient
     from cohere.types.embed_response import EmbeddingsByTypeEmbedResponse, EmbeddingsFloatsEmbedResponse
 except ImportError:
@@ -15,11 +16,14 @@ except ImportError:
 class CohereEmbedder(Embedder):
     id: str = "embed-english-v3.0"
     input_type: str = "search_query"
+    # Cohere embeds at most 96 texts per request
+    batch_size: int = 96
     embedding_types: Optional[List[str]] = None
     api_key: Optional[str] = None
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     cohere_client: Optional[CohereClient] = None
+    async_cohere_client: Optional[AsyncCohereClient] = None
 
     @property
     def client(self) -> CohereClient:
@@ -31,7 +35,17 @@ class CohereEmbedder(Embedder):
         self.cohere_client = CohereClient(**client_params)
         return self.cohere_client
 
-    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+    @property
+    def async_client(self) -> AsyncCohereClient:
+        if self.async_cohere_client:
+            return self.async_cohere_client
+        client_params: Dict[str, Any] = {}
+        if self.api_key:
+            client_params["api_key"] = self.api_key
+        self.async_cohere_client = AsyncCohereClient(**client_params)
+        return self.async_cohere_client
+
+    def _get_request_params(self) -> Dict[str, Any]:
         request_params: Dict[str, Any] = {}
 
         if self.id:
@@ -42,7 +56,17 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        return request_params
+
+    def response(
+        self, text: Optional[str] = None, texts: Optional[List[str]] = None
+    ) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+        return self.client.embed(texts=texts if texts is not None else [text], **self._get_request_params())
+
+    async def async_response(
+        self, text: Optional[str] = None, texts: Optional[List[str]] = None
+    ) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+        return await self.async_client.embed(texts=texts if texts is not None else [text], **self._get_request_params())
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -71,3 +95,55 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(texts=texts)
+
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = response.embeddings
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            embeddings = response.embeddings.float_ or []
+
+        billed_units = response.meta.billed_units if response.meta else None
+        usage = billed_units.model_dump() if billed_units else None
+        return embeddings, batch_usage(usage, len(texts))
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = await self.async_response(
+            text=text
+        )
+        try:
+            if isinstance(response, EmbeddingsFloatsEmbedResponse):
+                return response.embeddings[0]
+            elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+                return response.embeddings.float_[0] if response.embeddings.float_ else []
+            else:
+                logger.warning("No embeddings found")
+                return []
+        except Exception as e:
+            logger.warning(e)
+            return []
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict[str, Any]]]:
+        embeddings, usage = await self._async_get_batch_embeddings_and_usage([text])
+        return (embeddings[0] if embeddings else []), usage[0]
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = await self.async_response(
+            texts=texts
+        )
+
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = response.embeddings
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            embeddings = response.embeddings.float_ or []
+
+        billed_units = response.meta.billed_units if response.meta else None
+        usage = billed_units.model_dump() if billed_units else None
+        return embeddings, batch_usage(usage, len(texts))
@@ -35,3 +35,8 @@ class FastEmbedEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        model = TextEmbedding(model_name=self.id)
+        embeddings = [list(embedding) for embedding in model.embed(texts, batch_size=len(texts))]
+        return embeddings, [None] * len(texts)
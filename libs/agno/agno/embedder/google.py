@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, batch_usage
 from agno.utils.log import log_error, log_info
 
 try:
@@ -44,7 +44,7 @@ class GeminiEmbedder(Embedder):
 
         return self.gemini_client
 
-    def _response(self, text: str) -> EmbedContentResponse:
+    def _get_request_params(self, text: Union[str, List[str]]) -> Dict[str, Any]:
         # If a user provides a model id with the `models/` prefix, we need to remove it
         _id = self.id
         if _id.startswith("models/"):
@@ -62,7 +62,13 @@ class GeminiEmbedder(Embedder):
 
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.models.embed_content(**_request_params)
+        return _request_params
+
+    def _response(self, text: Union[str, List[str]]) -> EmbedContentResponse:
+        return self.client.models.embed_content(**self._get_request_params(text))
+
+    async def _async_response(self, text: Union[str, List[str]]) -> EmbedContentResponse:
+        return await self.client.aio.models.embed_content(**self._get_request_params(text))
 
     def get_embedding(self, text: str) -> List[float]:
         response = self._response(text=text)
@@ -93,3 +99,45 @@ class GeminiEmbedder(Embedder):
         except Exception as e:
             log_error(f"Error extracting embeddings: {e}")
             return [], usage
+
+    def _get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        response = self._response(text=texts)
+        usage = None
+        if response.metadata and hasattr(response.metadata, "billable_character_count"):
+            usage = {"billable_character_count": response.metadata.billable_character_count}
+
+        embeddings: List[List[float]] = [embedding.values or [] for embedding in response.embeddings or []]
+        return embeddings, batch_usage(usage, len(texts))
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return (await self.async_get_embedding_and_usage(text=text))[0]
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict[str, Any]]]:
+        response = await self._async_response(text=text)
+        usage = None
+        if response.metadata and hasattr(response.metadata, "billable_character_count"):
+            usage = {"billable_character_count": response.metadata.billable_character_count}
+
+        try:
+            if response.embeddings and len(response.embeddings) > 0:
+                values = response.embeddings[0].values
+                if values is not None:
+                    return values, usage
+            log_info("No embeddings found in response")
+            return [], usage
+        except Exception as e:
+            log_error(f"Error extracting embeddings: {e}")
+            return [], usage
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        response = await self._async_response(text=texts)
+        usage = None
+        if response.metadata and hasattr(response.metadata, "billable_character_count"):
+            usage = {"billable_character_count": response.metadata.billable_character_count}
+
+        embeddings: List[List[float]] = [embedding.values or [] for embedding in response.embeddings or []]
+        return embeddings, batch_usage(usage, len(texts))
@@ -7,6 +7,7 @@ from agno.utils.log import logger
 try:
     import importlib.metadata as metadata
 
+    from ollama import AsyncClient as AsyncOllamaClient
     from ollama import Client as OllamaClient
     from packaging import version
 
@@ -42,12 +43,9 @@ class OllamaEmbedder(Embedder):
     options: Optional[Any] = None
     client_kwargs: Optional[Dict[str, Any]] = None
     ollama_client: Optional[OllamaClient] = None
+    async_ollama_client: Optional[AsyncOllamaClient] = None
 
-    @property
-    def client(self) -> OllamaClient:
-        if self.ollama_client:
-            return self.ollama_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _ollama_params: Dict[str, Any] = {
             "host": self.host,
             "timeout": self.timeout,
@@ -55,15 +53,31 @@ class OllamaEmbedder(Embedder):
         _ollama_params = {k: v for k, v in _ollama_params.items() if v is not None}
         if self.client_kwargs:
             _ollama_params.update(self.client_kwargs)
-        self.ollama_client = OllamaClient(**_ollama_params)
+        return _ollama_params
+
+    @property
+    def client(self) -> OllamaClient:
+        if self.ollama_client:
+            return self.ollama_client
+
+        self.ollama_client = OllamaClient(**self._get_client_params())
         return self.ollama_client
 
-    def _response(self, text: str) -> Dict[str, Any]:
+    @property
+    def async_client(self) -> AsyncOllamaClient:
+        if self.async_ollama_client:
+            return self.async_ollama_client
+
+        self.async_ollama_client = AsyncOllamaClient(**self._get_client_params())
+        return self.async_ollama_client
+
+    def _get_request_kwargs(self) -> Dict[str, Any]:
         kwargs: Dict[str, Any] = {}
         if self.options is not None:
             kwargs["options"] = self.options
+        return kwargs
 
-        response = self.client.embed(input=text, model=self.id, **kwargs)
+    def _parse_response(self, response: Any) -> Dict[str, Any]:
         if response and "embeddings" in response:
             embeddings = response["embeddings"]
             if isinstance(embeddings, list) and len(embeddings) > 0 and isinstance(embeddings[0], list):
@@ -72,14 +86,32 @@ class OllamaEmbedder(Embedder):
                 return {"embeddings": embeddings}  # Return as-is if already flat
         return {"embeddings": []}  # Return an empty list if no valid embedding is found
 
+    def _response(self, text: str) -> Dict[str, Any]:
+        response = self.client.embed(input=text, model=self.id, **self._get_request_kwargs())
+        return self._parse_response(response)
+
+    async def _async_response(self, text: str) -> Dict[str, Any]:
+        response = await self.async_client.embed(input=text, model=self.id, **self._get_request_kwargs())
+        return self._parse_response(response)
+
+    def _check_dimensions(self, embedding: List[float]) -> List[float]:
+        if len(embedding) != self.dimensions:
+            logger.warning(f"Expected embedding dimension {self.dimensions}, but got {len(embedding)}")
+            return []
+        return embedding
+
     def get_embedding(self, text: str) -> List[float]:
         try:
             response = self._response(text=text)
-            embedding = response.get("embeddings", [])
-            if len(embedding) != self.dimensions:
-                logger.warning(f"Expected embedding dimension {self.dimensions}, but got {len(embedding)}")
-                return []
-            return embedding
+            return self._check_dimensions(response.get("embeddings", []))
+        except Exception as e:
+            logger.warning(e)
+            return []
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        try:
+            response = await self._async_response(text=text)
+            return self._check_dimensions(response.get("embeddings", []))
         except Exception as e:
             logger.warning(e)
             return []
@@ -88,3 +120,20 @@ class OllamaEmbedder(Embedder):
         embedding = self.get_embedding(text=text)
         usage = None
         return embedding, usage
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        embedding = await self.async_get_embedding(text=text)
+        usage = None
+        return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response = self.client.embed(input=texts, model=self.id, **self._get_request_kwargs())
+        embeddings: List[List[float]] = list(response["embeddings"]) if response and "embeddings" in response else []
+        return [self._check_dimensions(embedding) for embedding in embeddings], [None] * len(texts)
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response = await self.async_client.embed(input=texts, model=self.id, **self._get_request_kwargs())
+        embeddings: List[List[float]] = list(response["embeddings"]) if response and "embeddings" in response else []
+        return [self._check_dimensions(embedding) for embedding in embeddings], [None] * len(texts)
@@ -0,0 +1,220 @@
+import json
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from hashlib import sha256
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from agno.utils.log import log_debug
+
+if TYPE_CHECKING:
+    from agno.embedder.base import Embedder
+
+
+class _InFlight:
+    """An embedding being computed, waited on by identical concurrent queries"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.embedding: Optional[List[float]] = None
+        self.error: Optional[BaseException] = None
+
+
+class QueryEmbeddingCache:
+    """Bounded in-process LRU cache of search query embeddings, with a time to live.
+
+    Identical queries embedded concurrently are coalesced: the first one calls the embedder and the others
+    wait for its embedding. A single cache can be shared by many embedders, as keys are scoped to the model.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 3600):
+        # Maximum number of cached embeddings. The least recently used are evicted first.
+        self.max_size: int = max_size
+        # Seconds an embedding stays cached. None to keep embeddings until they are evicted.
+        self.ttl: Optional[float] = ttl
+        # Number of queries served from the cache, embedded, and coalesced with an identical query in flight
+        self.hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+
+        # key -> (expiry time, embedding). Embeddings are stored as float32 arrays, a quarter of the size of a list.
+        self._entries: "OrderedDict[str, Tuple[Optional[float], array]]" = OrderedDict()
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, embedding = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return embedding.tolist()
+
+    def _set(self, key: str, embedding: List[float]) -> None:
+        expires_at = monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, array("f", embedding))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get_or_embed(self, key: str, embed: Callable[[], List[float]]) -> List[float]:
+        """Return the cached embedding for `key`, calling `embed` on a miss.
+
+        Errors raised by `embed` are raised to every caller waiting on the same key, and nothing is cached.
+        """
+        with self._lock:
+            embedding = self._get(key)
+            if embedding is not None:
+                self.hits += 1
+                return embedding
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                in_flight = self._in_flight[key] = _InFlight()
+                self.misses += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.embedding  # type: ignore
+
+        try:
+            embedding = embed()
+            in_flight.embedding = embedding
+            if embedding:
+                with self._lock:
+                    self._set(key, embedding)
+            return embedding
+        except BaseException as e:
+            in_flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            in_flight.done.set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __deepcopy__(self, memo):
+        # The cache is meant to be shared by copies of an embedder
+        return self
+
+
+# Cache used by embedders that don't set their own `query_cache`
+default_query_cache = QueryEmbeddingCache()
+
+
+# Embedder settings that change how texts are sent, not the embeddings
+_NON_SCOPE_FIELDS = {
+    "batch_size",
+    "batch_max_tokens",
+    "max_concurrent_batches",
+    "cache_query_embeddings",
+    "query_cache",
+}
+# Settings holding credentials are left out of the scope, so rotating a key keeps the cached embeddings
+_SECRET_MARKERS = ("api_key", "access_key", "secret", "token", "password")
+
+
+def _scope_value(value: Any) -> Any:
+    """The value of a setting in the scope, or None for values that can't be compared across processes"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        items = [_scope_value(item) for item in value]
+        return items if all(item is not None for item in items) else None
+    if isinstance(value, dict):
+        return {
+            str(k): _scope_value(v)
+            for k, v in value.items()
+            if not any(marker in str(k).lower() for marker in _SECRET_MARKERS) and _scope_value(v) is not None
+        }
+    return None
+
+
+def embedder_scope(embedder: "Embedder") -> str:
+    """Identifies the embeddings an embedder produces: its class and the settings that can change the vectors,
+    e.g. the model id, dimensions, task or input type, request params and base URL.
+
+    The settings are the compared dataclass fields with a plain value. Clients, credentials and fields declared with
+    `field(compare=False)` are left out.
+    """
+    from agno.embedder.base import Embedder
+
+    # Wrappers, such as CachedEmbedder, are scoped to the embedder they wrap
+    while isinstance(getattr(embedder, "embedder", None), Embedder):
+        embedder = embedder.embedder  # type: ignore
+
+    settings: Dict[str, Any] = {"id": getattr(embedder, "id", ""), "dimensions": embedder.dimensions}
+    if is_dataclass(embedder):
+        for f in fields(embedder):
+            name = f.name
+            if (
+                not f.compare
+                or name.startswith("_")
+                or name in _NON_SCOPE_FIELDS
+                or name.endswith("client")
+                or any(marker in name for marker in _SECRET_MARKERS)
+            ):
+                continue
+            value = _scope_value(getattr(embedder, name, None))
+            if value is not None:
+                settings[name] = value
+    return f"{embedder.__class__.__name__}:{json.dumps(settings, sort_keys=True)}"
+
+
+def embedding_cache_key(embedder: "Embedder", text: str, scope: Optional[str] = None) -> str:
+    """Key for the embedding of a text, scoped to the embedder that produces it.
+    Pass the `embedder_scope` of the embedder to key many texts without computing it for each one.
+    """
+    if scope is None:
+        scope = embedder_scope(embedder)
+    return sha256(f"{scope}\n{text}".encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def query_cache_key(embedder: "Embedder", query: str) -> str:
+    """Key for a query in the query cache"""
+    return embedding_cache_key(embedder, query)
+
+
+def embed_query(embedder: "Embedder", query: str) -> List[float]:
+    """Embed a search query, using the embedder's query cache.
+
+    Vector dbs use this instead of `embedder.get_embedding` to embed queries, so repeated queries skip the
+    request to the provider. Objects that are not configured like an Embedder are called directly.
+    """
+    if getattr(embedder, "cache_query_embeddings", False) is not True:
+        return embedder.get_embedding(query)
+    cache = getattr(embedder, "query_cache", None)
+    if not isinstance(cache, QueryEmbeddingCache):
+        cache = default_query_cache
+    key = query_cache_key(embedder, query)
+    embedding = cache.get_or_embed(key, lambda: embedder.get_embedding(query))
+    log_debug(f"Query embedding cache: {cache.hits} hits, {cache.misses} misses, {cache.coalesced} coalesced")
+    return embedding
@@ -36,3 +36,8 @@ class SentenceTransformerEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        model = SentenceTransformer(model_name_or_path=self.id)
+        embeddings = model.encode(texts, batch_size=len(texts))
+        return embeddings.tolist(), [None] * len(texts)
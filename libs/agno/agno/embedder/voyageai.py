@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, batch_usage
 from agno.utils.log import logger
 
 try:
+    from voyageai import AsyncClient as AsyncVoyageClient
     from voyageai import Client as VoyageClient
     from voyageai.object import EmbeddingsObject
 except ImportError:
@@ -22,12 +23,9 @@ class VoyageAIEmbedder(Embedder):
     timeout: Optional[float] = None
     client_params: Optional[Dict[str, Any]] = None
     voyage_client: Optional[VoyageClient] = None
+    async_voyage_client: Optional[AsyncVoyageClient] = None
 
-    @property
-    def client(self) -> VoyageClient:
-        if self.voyage_client:
-            return self.voyage_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params = {
             "api_key": self.api_key,
             "max_retries": self.max_retries,
@@ -36,17 +34,38 @@ class VoyageAIEmbedder(Embedder):
         _client_params = {k: v for k, v in _client_params.items() if v is not None}
         if self.client_params:
             _client_params.update(self.client_params)
-        self.voyage_client = VoyageClient(**_client_params)
+        return _client_params
+
+    @property
+    def client(self) -> VoyageClient:
+        if self.voyage_client:
+            return self.voyage_client
+
+        self.voyage_client = VoyageClient(**self._get_client_params())
         return self.voyage_client
 
-    def _response(self, text: str) -> EmbeddingsObject:
+    @property
+    def async_client(self) -> AsyncVoyageClient:
+        if self.async_voyage_client:
+            return self.async_voyage_client
+
+        self.async_voyage_client = AsyncVoyageClient(**self._get_client_params())
+        return self.async_voyage_client
+
+    def _get_request_params(self, text: Optional[str] = None, texts: Optional[List[str]] = None) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": texts if texts is not None else [text],
             "model": self.id,
         }
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embed(**_request_params)
+        return _request_params
+
+    def _response(self, text: Optional[str] = None, texts: Optional[List[str]] = None) -> EmbeddingsObject:
+        return self.client.embed(**self._get_request_params(text=text, texts=texts))
+
+    async def _async_response(self, text: Optional[str] = None, texts: Optional[List[str]] = None) -> EmbeddingsObject:
+        return await self.async_client.embed(**self._get_request_params(text=text, texts=texts))
 
     def get_embedding(self, text: str) -> List[float]:
         response: EmbeddingsObject = self._response(text=text)
@@ -62,3 +81,32 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: EmbeddingsObject = self._response(texts=texts)
+
+        usage: Dict[str, Any] = {"total_tokens": response.total_tokens}
+        return response.embeddings, batch_usage(usage, len(texts))
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        response: EmbeddingsObject = await self._async_response(text=text)
+        try:
+            return response.embeddings[0]
+        except Exception as e:
+            logger.warning(e)
+            return []
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        response: EmbeddingsObject = await self._async_response(text=text)
+
+        embedding = response.embeddings[0]
+        usage = {"total_tokens": response.total_tokens}
+        return embedding, usage
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: EmbeddingsObject = await self._async_response(texts=texts)
+
+        usage: Dict[str, Any] = {"total_tokens": response.total_tokens}
+        return response.embeddings, batch_usage(usage, len(texts))
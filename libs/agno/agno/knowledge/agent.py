@@ -1,6 +1,9 @@
 import asyncio
+import json
+import time
+from hashlib import md5, sha256
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -8,9 +11,58 @@ from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
+from agno.knowledge.manifest import KnowledgeSource, SourceManifest
+from agno.knowledge.pipeline import async_read_sources, read_sources
+from agno.tools.cache.base import ToolCache
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb import VectorDb
 
+# Attributes of vector dbs that identify their collection or table, used to namespace cached search results
+_VECTOR_DB_IDENTITY_ATTRIBUTES = (
+    "db_url",
+    "uri",
+    "url",
+    "host",
+    "path",
+    "schema",
+    "table_name",
+    "collection",
+    "collection_name",
+    "name",
+    "namespace",
+)
+
+
+class DocumentBatcher:
+    """Groups documents by the filters of their source into batches of at most `batch_size` documents.
+
+    The metadata of each document, e.g. its chunk number, stays on the document and does not split batches.
+    Documents with the same content in a batch are collapsed, keeping the last one, so a batch never
+    writes the same row twice.
+    """
+
+    def __init__(self, batch_size: int = 100):
+        self.batch_size = max(1, batch_size)
+        self._groups: Dict[str, Tuple[Optional[Dict[str, Any]], Dict[str, Document]]] = {}
+
+    def add(
+        self, document: Document, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple[Optional[Dict[str, Any]], List[Document]]]:
+        """Add a document, returning (filters, documents) when its batch is full"""
+        key = json.dumps(filters or {}, sort_keys=True, default=str)
+        _, batch = self._groups.setdefault(key, (filters or None, {}))
+        batch[document.content] = document
+        if len(batch) >= self.batch_size:
+            del self._groups[key]
+            return filters or None, list(batch.values())
+        return None
+
+    def flush(self) -> List[Tuple[Optional[Dict[str, Any]], List[Document]]]:
+        """Return the remaining partial batches and reset the batcher"""
+        batches = [(filters, list(batch.values())) for filters, batch in self._groups.values()]
+        self._groups = {}
+        return batches
+
 
 class AgentKnowledge(BaseModel):
     """Base class for Agent knowledge"""
@@ -23,6 +75,21 @@ class AgentKnowledge(BaseModel):
     num_documents: int = 5
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
+    # Number of documents written to the vector db in a single call by load() and aload()
+    load_batch_size: int = 100
+    # Path to a manifest of the loaded sources. When set, load() and aload() only read new or changed sources
+    # and delete the documents of changed or removed sources. Requires a knowledge base that implements get_sources()
+    manifest_path: Optional[Union[str, Path]] = None
+    # Number of processes that read and chunk sources in load() and aload(). Values <= 1 read in the calling process.
+    # Requires a knowledge base that implements get_sources()
+    read_workers: int = 0
+    # Maximum number of sources read ahead of the embedding and vector db writes
+    read_queue_size: int = 8
+    # Cache of search results, keyed by the vector db, query, filters and number of documents. Can be shared with
+    # tool results and other knowledge bases: loading documents only clears the results of this vector db.
+    search_cache: Optional[ToolCache] = None
+    # Seconds a search result stays in the search cache
+    search_cache_ttl: int = 300
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
@@ -50,6 +117,12 @@ class AgentKnowledge(BaseModel):
         """
         raise NotImplementedError
 
+    def get_sources(self) -> Optional[List[KnowledgeSource]]:
+        """Returns the sources of the knowledge base, used to sync only new or changed sources.
+        Returns None if the knowledge base does not support incremental syncs.
+        """
+        return None
+
     def search(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
@@ -61,7 +134,19 @@ class AgentKnowledge(BaseModel):
 
             _num_documents = num_documents or self.num_documents
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            if self.search_cache is None:
+                return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+
+            key = self._search_cache_key(query, _num_documents, filters)
+            cached = self.search_cache.lookup(key)
+            if cached is not None:
+                log_debug("Found search results in the search cache")
+                return [Document(**document) for document in cached]
+            documents = self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            # Empty results are not cached, so documents loaded by another process are found on the next search
+            if documents:
+                self.search_cache.store(key, self._documents_to_cache(documents), self.search_cache_ttl)
+            return documents
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -77,15 +162,64 @@ class AgentKnowledge(BaseModel):
 
             _num_documents = num_documents or self.num_documents
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
+            key = None
+            if self.search_cache is not None:
+                key = self._search_cache_key(query, _num_documents, filters)
+                cached = await self.search_cache.alookup(key)
+                if cached is not None:
+                    log_debug("Found search results in the search cache")
+                    return [Document(**document) for document in cached]
             try:
-                return await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
+                documents = await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
             except NotImplementedError:
                 logger.info("Vector db does not support async search")
-                return self.search(query=query, num_documents=_num_documents, filters=filters)
+                documents = self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            if self.search_cache is not None and key is not None and documents:
+                await self.search_cache.astore(key, self._documents_to_cache(documents), self.search_cache_ttl)
+            return documents
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
 
+    def _search_cache_namespace(self) -> str:
+        """Namespace of the cached search results of the vector db, e.g. of its collection or table"""
+        identity = {"vector_db": type(self.vector_db).__name__}
+        for attribute in _VECTOR_DB_IDENTITY_ATTRIBUTES:
+            value = getattr(self.vector_db, attribute, None)
+            if isinstance(value, (str, Path)):
+                identity[attribute] = str(value)
+        digest = sha256(json.dumps(identity, sort_keys=True).encode("utf-8", errors="surrogatepass")).hexdigest()
+        return f"knowledge_search_{digest[:16]}"
+
+    def _search_cache_key(self, query: str, num_documents: int, filters: Optional[Dict[str, Any]]) -> str:
+        key = json.dumps(
+            {"query": query, "num_documents": num_documents, "filters": filters}, sort_keys=True, default=str
+        )
+        return f"{self._search_cache_namespace()}:{sha256(key.encode('utf-8', errors='surrogatepass')).hexdigest()}"
+
+    @staticmethod
+    def _documents_to_cache(documents: List[Document]) -> List[Dict[str, Any]]:
+        # Embeddings are not needed to use the results, and would make every entry large
+        return [
+            {
+                "content": document.content,
+                "id": document.id,
+                "name": document.name,
+                "meta_data": document.meta_data,
+                "reranking_score": document.reranking_score,
+            }
+            for document in documents
+        ]
+
+    def clear_search_cache(self) -> None:
+        """Clear the cached search results, as they may be stale once documents are added or removed"""
+        if self.search_cache is None:
+            return
+        try:
+            self.search_cache.clear_namespace(self._search_cache_namespace())
+        except Exception as e:
+            logger.warning(f"Error clearing search cache: {e}")
+
     def load(
         self,
         recreate: bool = False,
@@ -112,32 +246,41 @@ class AgentKnowledge(BaseModel):
             self.vector_db.create()
 
         log_info("Loading knowledge base")
+        use_upsert = upsert and self.vector_db.upsert_available()
+        batcher = DocumentBatcher(batch_size=self.load_batch_size)
+        seen_content: Set[bytes] = set()
         num_documents = 0
-        for document_list in self.document_lists:
-            documents_to_load = document_list
-
-            # Track metadata for filtering capabilities
-            for doc in document_list:
-                if doc.meta_data:
-                    self._track_metadata_structure(doc.meta_data)
-
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
-                for doc in document_list:
-                    self.vector_db.upsert(documents=[doc], filters=doc.meta_data)
-            # Insert documents
+        start_time = time.perf_counter()
+
+        def _write_batch(filters: Optional[Dict[str, Any]], batch: List[Document]) -> None:
+            nonlocal num_documents
+            if use_upsert:
+                self.vector_db.upsert(documents=batch, filters=filters)  # type: ignore
             else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    log_debug("Filtering out existing documents before insertion.")
-                    documents_to_load = self.filter_existing_documents(document_list)
+                self.vector_db.insert(documents=batch, filters=filters)  # type: ignore
+            num_documents += len(batch)
+            self._log_load_progress(num_documents, start_time)
+
+        sources, manifest = self._prepare_sources(recreate)
+        if sources is None:
+            document_lists: Iterator[Tuple[Optional[Dict[str, Any]], List[Document]]] = (
+                (None, document_list) for document_list in self.document_lists
+            )
+        else:
+            document_lists = self._source_document_lists(sources, manifest)
+        for filters, document_list in document_lists:
+            for document in self._prepare_documents_to_load(document_list, use_upsert, skip_existing, seen_content):
+                full_batch = batcher.add(document, filters)
+                if full_batch is not None:
+                    _write_batch(*full_batch)
 
-                if documents_to_load:
-                    for doc in documents_to_load:
-                        self.vector_db.insert(documents=[doc], filters=doc.meta_data)
+        for filters, batch in batcher.flush():
+            _write_batch(filters, batch)
 
-            num_documents += len(documents_to_load)
-            log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+        if manifest is not None:
+            self._finish_sync(manifest)
+        self.clear_search_cache()
+        self._log_load_summary(num_documents, start_time)
 
     async def aload(
         self,
@@ -166,32 +309,157 @@ class AgentKnowledge(BaseModel):
             await self.vector_db.async_create()
 
         log_info("Loading knowledge base")
+        use_upsert = upsert and self.vector_db.upsert_available()
+        batcher = DocumentBatcher(batch_size=self.load_batch_size)
+        seen_content: Set[bytes] = set()
         num_documents = 0
-        document_iterator = await self.async_document_lists
-        async for document_list in document_iterator:
-            documents_to_load = document_list
-            # Track metadata for filtering capabilities
-            for doc in document_list:
-                if doc.meta_data:
-                    self._track_metadata_structure(doc.meta_data)
-
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
-                for doc in document_list:
-                    await self.vector_db.async_upsert(documents=[doc], filters=doc.meta_data)
-            # Insert documents
+        start_time = time.perf_counter()
+
+        async def _write_batch(filters: Optional[Dict[str, Any]], batch: List[Document]) -> None:
+            nonlocal num_documents
+            if use_upsert:
+                await self.vector_db.async_upsert(documents=batch, filters=filters)  # type: ignore
             else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    log_debug("Filtering out existing documents before insertion.")
-                    documents_to_load = self.filter_existing_documents(document_list)
+                await self.vector_db.async_insert(documents=batch, filters=filters)  # type: ignore
+            num_documents += len(batch)
+            self._log_load_progress(num_documents, start_time)
 
-                if documents_to_load:
-                    for doc in documents_to_load:
-                        await self.vector_db.async_insert(documents=[doc], filters=doc.meta_data)
+        sources, manifest = self._prepare_sources(recreate)
+        if sources is None:
+            document_iterator = self._with_no_filters(await self.async_document_lists)
+        else:
+            document_iterator = self._async_source_document_lists(sources, manifest)
+        async for filters, document_list in document_iterator:
+            for document in self._prepare_documents_to_load(document_list, use_upsert, skip_existing, seen_content):
+                full_batch = batcher.add(document, filters)
+                if full_batch is not None:
+                    await _write_batch(*full_batch)
+
+        for filters, batch in batcher.flush():
+            await _write_batch(filters, batch)
+
+        if manifest is not None:
+            await asyncio.to_thread(self._finish_sync, manifest)
+        await asyncio.to_thread(self.clear_search_cache)
+        self._log_load_summary(num_documents, start_time)
+
+    def _prepare_documents_to_load(
+        self, document_list: List[Document], upsert: bool, skip_existing: bool, seen_content: Set[bytes]
+    ) -> List[Document]:
+        """Track metadata and drop documents that should not be written when loading the knowledge base
+
+        Args:
+            document_list (List[Document]): Documents yielded by the knowledge base
+            upsert (bool): If True, documents are upserted and nothing is filtered out
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting
+            seen_content (Set[bytes]): Digests of the content queued earlier in this load, used to skip duplicates
+                across lists without keeping the text of every document
+        """
+        # Track metadata for filtering capabilities
+        for doc in document_list:
+            if doc.meta_data:
+                self._track_metadata_structure(doc.meta_data)
+
+        if upsert or not skip_existing:
+            return document_list
+
+        # Filter out documents which already exist in the vector db, or are already queued for insertion
+        log_debug("Filtering out existing documents before insertion.")
+        documents_to_load = []
+        for doc in self.filter_existing_documents(document_list):
+            digest = md5(doc.content.encode("utf-8", errors="surrogatepass")).digest()
+            if digest not in seen_content:
+                seen_content.add(digest)
+                documents_to_load.append(doc)
+        return documents_to_load
+
+    def _prepare_sources(self, recreate: bool) -> Tuple[Optional[List[KnowledgeSource]], Optional[SourceManifest]]:
+        """List the sources and load the manifest if incremental syncs or parallel reading are enabled.
+        Returns no sources if neither is enabled, or the knowledge base does not support them.
+        """
+        if self.manifest_path is None and self.read_workers <= 1:
+            return None, None
+
+        sources = self.get_sources()
+        if sources is None:
+            logger.warning(
+                f"{self.__class__.__name__} does not support incremental syncs or parallel reading, loading all sources"
+            )
+            return None, None
+
+        if self.manifest_path is None:
+            return sources, None
+
+        manifest_path = Path(self.manifest_path)
+        manifest = SourceManifest(path=manifest_path) if recreate else SourceManifest.load(manifest_path)
+        manifest.remove_missing({source.key for source in sources})
+        changed_sources = []
+        for source in sources:
+            if manifest.is_unchanged(source):
+                log_debug(f"Skipping unchanged source: {source.key}")
+            else:
+                changed_sources.append(source)
+        log_info(f"Syncing {len(changed_sources)} new or changed sources out of {len(sources)}")
+        return changed_sources, manifest
 
-            num_documents += len(documents_to_load)
-            log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+    def _record_source(
+        self, source: KnowledgeSource, documents: List[Document], manifest: Optional[SourceManifest]
+    ) -> None:
+        if source.metadata:
+            for doc in documents:
+                doc.meta_data.update(source.metadata)
+        if manifest is not None:
+            manifest.record(source, documents)
+
+    def _source_document_lists(
+        self, sources: List[KnowledgeSource], manifest: Optional[SourceManifest]
+    ) -> Iterator[Tuple[Optional[Dict[str, Any]], List[Document]]]:
+        """Read the sources, in worker processes if read_workers > 1, and yield their filters and documents"""
+        for source, documents in read_sources(sources, workers=self.read_workers, queue_size=self.read_queue_size):
+            self._record_source(source, documents, manifest)
+            yield source.metadata, documents
+
+    async def _async_source_document_lists(
+        self, sources: List[KnowledgeSource], manifest: Optional[SourceManifest]
+    ) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], List[Document]]]:
+        """Read the sources asynchronously, in worker processes if read_workers > 1, and yield their filters and
+        documents"""
+        async for source, documents in async_read_sources(
+            sources, workers=self.read_workers, queue_size=self.read_queue_size
+        ):
+            self._record_source(source, documents, manifest)
+            yield source.metadata, documents
+
+    @staticmethod
+    async def _with_no_filters(
+        document_lists: AsyncIterator[List[Document]],
+    ) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], List[Document]]]:
+        async for document_list in document_lists:
+            yield None, document_list
+
+    def _finish_sync(self, manifest: SourceManifest) -> None:
+        """Delete the documents no source produces anymore and save the manifest"""
+        stale_ids = manifest.unreferenced_stale_ids()
+        if stale_ids and self.vector_db is not None:
+            log_info(f"Deleting {len(stale_ids)} documents from changed or removed sources")
+            try:
+                self.vector_db.delete_by_content_hash(list(stale_ids))
+            except NotImplementedError:
+                logger.warning(
+                    f"{self.vector_db.__class__.__name__} does not support deleting documents by content hash, "
+                    "documents from changed or removed sources were kept"
+                )
+        manifest.save()
+
+    def _log_load_progress(self, num_documents: int, start_time: float) -> None:
+        elapsed = time.perf_counter() - start_time
+        rate = num_documents / elapsed if elapsed > 0 else 0.0
+        log_debug(f"Loaded {num_documents} documents ({rate:.1f} documents/s)")
+
+    def _log_load_summary(self, num_documents: int, start_time: float) -> None:
+        elapsed = time.perf_counter() - start_time
+        rate = num_documents / elapsed if elapsed > 0 else 0.0
+        log_info(f"Added {num_documents} documents to knowledge base in {elapsed:.2f}s ({rate:.1f} documents/s)")
 
     def load_documents(
         self,
@@ -220,11 +488,12 @@ class AgentKnowledge(BaseModel):
         # Upsert documents if upsert is True
         if upsert and self.vector_db.upsert_available():
             self.vector_db.upsert(documents=documents, filters=filters)
+            self.clear_search_cache()
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
             documents_to_load = (
-                [document for document in documents if not self.vector_db.doc_exists(document)]
+                [document for document, exists in zip(documents, self.vector_db.docs_exist(documents)) if not exists]
                 if skip_existing
                 else documents
             )
@@ -232,6 +501,7 @@ class AgentKnowledge(BaseModel):
             # Insert documents
             if len(documents_to_load) > 0:
                 self.vector_db.insert(documents=documents_to_load, filters=filters)
+                self.clear_search_cache()
                 log_info(f"Loaded {len(documents_to_load)} documents to knowledge base")
             else:
                 log_info("No new documents to load")
@@ -270,24 +540,17 @@ class AgentKnowledge(BaseModel):
             except NotImplementedError:
                 logger.warning("Vector db does not support async upsert")
                 self.vector_db.upsert(documents=documents, filters=filters)
+            await asyncio.to_thread(self.clear_search_cache)
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
             if skip_existing:
                 try:
-                    # Parallelize existence checks using asyncio.gather
-                    existence_checks = await asyncio.gather(
-                        *[self.vector_db.async_doc_exists(document) for document in documents], return_exceptions=True
-                    )
-
-                    documents_to_load = [
-                        doc
-                        for doc, exists in zip(documents, existence_checks)
-                        if not (isinstance(exists, bool) and exists)
-                    ]
+                    existence_checks = await self.vector_db.async_docs_exist(documents)
                 except NotImplementedError:
                     logger.warning("Vector db does not support async doc_exists")
-                    documents_to_load = [document for document in documents if not self.vector_db.doc_exists(document)]
+                    existence_checks = self.vector_db.docs_exist(documents)
+                documents_to_load = [doc for doc, exists in zip(documents, existence_checks) if not exists]
             else:
                 documents_to_load = documents
 
@@ -298,6 +561,7 @@ class AgentKnowledge(BaseModel):
                 except NotImplementedError:
                     logger.warning("Vector db does not support async insert")
                     self.vector_db.insert(documents=documents_to_load, filters=filters)
+                await asyncio.to_thread(self.clear_search_cache)
                 log_info(f"Loaded {len(documents_to_load)} documents to knowledge base")
             else:
                 log_info("No new documents to load")
@@ -400,7 +664,9 @@ class AgentKnowledge(BaseModel):
             logger.warning("No vector db available")
             return True
 
-        return self.vector_db.delete()
+        deleted = self.vector_db.delete()
+        self.clear_search_cache()
+        return deleted
 
     def filter_existing_documents(self, documents: List[Document]) -> List[Document]:
         """Filter out documents that already exist in the vector database.
@@ -423,16 +689,21 @@ class AgentKnowledge(BaseModel):
         # Use set for O(1) lookups
         seen_content = set()
         original_count = len(documents)
-        filtered_documents = []
-
+        unique_documents = []
         for doc in documents:
-            # Check hash and existence in DB
-            content_hash = doc.content  # Assuming doc.content is reliable hash key
-            if content_hash not in seen_content and not self.vector_db.doc_exists(doc):
-                seen_content.add(content_hash)
+            if doc.content not in seen_content:
+                seen_content.add(doc.content)
+                unique_documents.append(doc)
+            else:
+                log_debug(f"Skipping duplicate document: {doc.name}")
+
+        # Check existence in DB for all unique documents at once
+        filtered_documents = []
+        for doc, exists in zip(unique_documents, self.vector_db.docs_exist(unique_documents)):
+            if not exists:
                 filtered_documents.append(doc)
             else:
-                log_debug(f"Skipping existing document: {doc.name} (or duplicate content)")
+                log_debug(f"Skipping existing document: {doc.name}")
 
         if len(filtered_documents) < original_count:
             log_info(f"Skipped {original_count - len(filtered_documents)} existing/duplicate documents.")
@@ -622,6 +893,7 @@ class AgentKnowledge(BaseModel):
             else:
                 log_info("No new documents to insert after filtering.")
 
+        self.clear_search_cache()
         log_info(f"Finished loading documents from {source_info}.")
 
     async def aprocess_documents(
@@ -663,4 +935,5 @@ class AgentKnowledge(BaseModel):
             else:
                 log_info("No new documents to insert after filtering.")
 
+        self.clear_search_cache()
         log_info(f"Finished loading documents from {source_info}.")
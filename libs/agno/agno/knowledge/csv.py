@@ -1,11 +1,13 @@
+from functools import partial
 from pathlib import Path
-from typing import AsyncIterator, Iterator, List, Union
+from typing import AsyncIterator, Iterator, List, Optional, Union
 
 from pydantic import Field
 
 from agno.document import Document
 from agno.document.reader.csv_reader import CSVReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest import KnowledgeSource
 
 
 class CSVKnowledgeBase(AgentKnowledge):
@@ -47,3 +49,20 @@ class CSVKnowledgeBase(AgentKnowledge):
             if _csv_path.name in self.exclude_files:
                 return
             yield await self.reader.async_read(file=_csv_path)
+
+    def get_sources(self) -> Optional[List[KnowledgeSource]]:
+        """List the CSVs of the knowledge base, used to sync only new or changed files."""
+        _csv_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
+
+        _csv_files: List[Path] = []
+        if _csv_path.exists() and _csv_path.is_dir():
+            _csv_files = [_csv for _csv in _csv_path.glob("**/*.csv") if _csv.name not in self.exclude_files]
+        elif _csv_path.exists() and _csv_path.is_file() and _csv_path.suffix == ".csv":
+            if _csv_path.name not in self.exclude_files:
+                _csv_files = [_csv_path]
+        return [self._csv_source(_csv) for _csv in _csv_files]
+
+    def _csv_source(self, path: Path) -> KnowledgeSource:
+        return KnowledgeSource.from_file(
+            path, read=partial(self.reader.read, file=path), async_read=partial(self.reader.async_read, file=path)
+        )
@@ -0,0 +1,161 @@
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from hashlib import md5, sha256
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from agno.document import Document
+from agno.utils.log import log_debug, logger
+
+
+def document_content_hash(document: Document) -> str:
+    """The md5 hash of a document's cleaned content, which vector dbs use as the document id"""
+    return md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest()
+
+
+def file_hash(path: Path) -> str:
+    """sha256 hash of a file, read in chunks"""
+    digest = sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class KnowledgeSource:
+    """A file, URL or object that a knowledge base reads documents from"""
+
+    # Unique key for the source, e.g. the file path, URL or S3 key
+    key: str
+    # Size of the source in bytes
+    size: Optional[int]
+    # Last modification marker, e.g. the file mtime or S3 ETag
+    modified: Optional[str]
+    # Reads and chunks the source and returns its documents.
+    # Must be picklable (e.g. a functools.partial of a reader method) to be read in a worker process.
+    read: Callable[[], List[Document]]
+    # Reads the source asynchronously. Falls back to `read` if not provided
+    async_read: Optional[Callable[[], Awaitable[List[Document]]]] = None
+    # Metadata added to every document read from the source
+    metadata: Optional[Dict[str, Any]] = None
+    # Computes a hash of the source content, used when the size or modification marker changed.
+    # If not provided, a changed size or modification marker always means the source changed.
+    hash_content: Optional[Callable[[], str]] = None
+
+    _content_hash: Optional[str] = field(default=None, init=False, repr=False)
+
+    def content_hash(self) -> Optional[str]:
+        if self._content_hash is None and self.hash_content is not None:
+            self._content_hash = self.hash_content()
+        return self._content_hash
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Path,
+        read: Callable[[], List[Document]],
+        async_read: Optional[Callable[[], Awaitable[List[Document]]]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "KnowledgeSource":
+        stat = path.stat()
+        return cls(
+            key=str(path.resolve()),
+            size=stat.st_size,
+            modified=str(stat.st_mtime_ns),
+            read=read,
+            async_read=async_read,
+            metadata=metadata,
+            hash_content=partial(file_hash, path),
+        )
+
+
+@dataclass
+class ManifestEntry:
+    """What the manifest remembers about a source from the last sync"""
+
+    size: Optional[int] = None
+    modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    # Content hashes of the documents the source produced
+    document_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SourceManifest:
+    """Record of the sources loaded into a knowledge base, persisted as a JSON file.
+
+    Used by AgentKnowledge.load() to only read new or changed sources, and to delete the documents of
+    sources that changed or were removed.
+    """
+
+    path: Path
+    entries: Dict[str, ManifestEntry] = field(default_factory=dict)
+    # Ids of documents that changed or removed sources no longer produce. Not persisted.
+    stale_ids: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def load(cls, path: Path) -> "SourceManifest":
+        path = Path(path)
+        if not path.exists():
+            return cls(path=path)
+        try:
+            data = json.loads(path.read_text())
+            entries = {key: ManifestEntry(**entry) for key, entry in data.get("sources", {}).items()}
+            return cls(path=path, entries=entries)
+        except Exception as e:
+            logger.warning(f"Could not read knowledge manifest {path}, starting a full sync: {e}")
+            return cls(path=path)
+
+    def save(self) -> None:
+        """Write the manifest atomically, so an interrupted sync never leaves a corrupt file"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data: Dict[str, Any] = {"sources": {key: asdict(entry) for key, entry in self.entries.items()}}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, self.path)
+        log_debug(f"Saved knowledge manifest with {len(self.entries)} sources to {self.path}")
+
+    def is_unchanged(self, source: KnowledgeSource) -> bool:
+        """Check if a source is unchanged since the last sync.
+
+        The content is only hashed if the size or modification marker changed.
+        """
+        entry = self.entries.get(source.key)
+        if entry is None:
+            return False
+        if entry.size == source.size and entry.modified == source.modified:
+            return True
+        if entry.content_hash is None or source.content_hash() is None:
+            return False
+        if source.content_hash() == entry.content_hash:
+            # Only the modification marker changed, e.g. the file was touched
+            entry.size, entry.modified = source.size, source.modified
+            return True
+        return False
+
+    def record(self, source: KnowledgeSource, documents: List[Document]) -> None:
+        """Record the documents produced by a source, marking the document ids it no longer produces as stale"""
+        previous = self.entries.get(source.key)
+        document_ids = list(dict.fromkeys(document_content_hash(document) for document in documents))
+        self.entries[source.key] = ManifestEntry(
+            size=source.size,
+            modified=source.modified,
+            content_hash=source.content_hash(),
+            document_ids=document_ids,
+        )
+        if previous is not None:
+            self.stale_ids.update(set(previous.document_ids) - set(document_ids))
+
+    def remove_missing(self, keys: Set[str]) -> None:
+        """Forget the sources that are not in `keys`, marking the document ids they produced as stale"""
+        for key in [key for key in self.entries if key not in keys]:
+            log_debug(f"Source removed: {key}")
+            self.stale_ids.update(self.entries.pop(key).document_ids)
+
+    def unreferenced_stale_ids(self) -> Set[str]:
+        """Stale document ids that no source in the manifest produces, since several sources can share content"""
+        referenced = {document_id for entry in self.entries.values() for document_id in entry.document_ids}
+        return self.stale_ids - referenced
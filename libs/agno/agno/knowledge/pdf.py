@@ -1,3 +1,4 @@
+from functools import partial
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
@@ -6,6 +7,7 @@ from pydantic import Field
 from agno.document import Document
 from agno.document.reader.pdf_reader import PDFImageReader, PDFReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -45,6 +47,36 @@ class PDFKnowledgeBase(AgentKnowledge):
             elif self._is_valid_pdf(_pdf_path):
                 yield self.reader.read(pdf=_pdf_path)
 
+    def get_sources(self) -> Optional[List[KnowledgeSource]]:
+        """List the PDFs of the knowledge base, used to sync only new or changed files."""
+        if self.path is None:
+            raise ValueError("Path is not set")
+
+        sources: List[KnowledgeSource] = []
+        if isinstance(self.path, list):
+            for item in self.path:
+                if isinstance(item, dict) and "path" in item:
+                    _pdf_path = Path(item["path"])  # type: ignore
+                    if self._is_valid_pdf(_pdf_path):
+                        sources.append(self._pdf_source(_pdf_path, item.get("metadata", {})))  # type: ignore
+        else:
+            _pdf_path = Path(self.path)
+            if _pdf_path.is_dir():
+                for _pdf in _pdf_path.glob("**/*.pdf"):
+                    if _pdf.name not in self.exclude_files:
+                        sources.append(self._pdf_source(_pdf))
+            elif self._is_valid_pdf(_pdf_path):
+                sources.append(self._pdf_source(_pdf_path))
+        return sources
+
+    def _pdf_source(self, path: Path, metadata: Optional[Dict[str, Any]] = None) -> KnowledgeSource:
+        return KnowledgeSource.from_file(
+            path,
+            read=partial(self.reader.read, pdf=path),
+            async_read=partial(self.reader.async_read, pdf=path),
+            metadata=metadata,
+        )
+
     def _is_valid_pdf(self, path: Path) -> bool:
         """Helper to check if path is a valid PDF file."""
         return path.exists() and path.is_file() and path.suffix == ".pdf" and path.name not in self.exclude_files
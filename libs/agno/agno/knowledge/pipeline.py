@@ -0,0 +1,136 @@
+import asyncio
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Deque, Iterator, List, Optional, Tuple
+
+from agno.document import Document
+from agno.knowledge.manifest import KnowledgeSource
+from agno.utils.log import log_debug, logger
+
+
+def _can_pickle(source: KnowledgeSource) -> bool:
+    """Whether the reader of a source can be sent to a worker process"""
+    try:
+        pickle.dumps(source.read)
+        return True
+    except Exception as e:
+        # Unpicklable objects raise PicklingError, TypeError or AttributeError depending on the object
+        logger.warning(f"Could not send {source.key} to a worker process, reading it in the main process: {e}")
+        return False
+
+
+def _submit(executor: ProcessPoolExecutor, source: KnowledgeSource) -> "Optional[Future[List[Document]]]":
+    if not _can_pickle(source):
+        return None
+    try:
+        return executor.submit(source.read)
+    except BrokenProcessPool:
+        return None
+
+
+def _read_in_process(source: KnowledgeSource, future: "Optional[Future[List[Document]]]") -> List[Document]:
+    """Result of a source read in a worker process. Errors of the reader are raised."""
+    if future is None:
+        return source.read()
+    try:
+        return future.result()
+    except BrokenProcessPool as e:
+        logger.warning(f"Worker process reading {source.key} exited, reading it in the main process: {e}")
+        return source.read()
+
+
+def read_sources(
+    sources: List[KnowledgeSource], workers: int = 0, queue_size: int = 8
+) -> Iterator[Tuple[KnowledgeSource, List[Document]]]:
+    """Read and chunk sources, in a pool of `workers` processes when workers > 1.
+
+    Sources are yielded in order with their documents. At most `queue_size` sources are read ahead of the
+    consumer, so a slow consumer (embedding and writing to the vector db) applies backpressure to the readers.
+    """
+    if workers <= 1 or len(sources) <= 1:
+        for source in sources:
+            yield source, source.read()
+        return
+
+    log_debug(f"Reading {len(sources)} sources with {workers} worker processes")
+    source_iterator = iter(sources)
+    pending: Deque[Tuple[KnowledgeSource, "Optional[Future[List[Document]]]"]] = deque()
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for source in source_iterator:
+            pending.append((source, _submit(executor, source)))
+            if len(pending) >= max(queue_size, workers):
+                break
+
+        while pending:
+            source, future = pending.popleft()
+            documents = _read_in_process(source, future)
+            next_source = next(source_iterator, None)
+            if next_source is not None:
+                pending.append((next_source, _submit(executor, next_source)))
+            yield source, documents
+    finally:
+        # Stop reading ahead if the consumer stopped early
+        for _, future in pending:
+            if future is not None:
+                future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def async_read_sources(
+    sources: List[KnowledgeSource], workers: int = 0, queue_size: int = 8
+) -> AsyncIterator[Tuple[KnowledgeSource, List[Document]]]:
+    """Read and chunk sources asynchronously, in a pool of `workers` processes when workers > 1.
+
+    Without workers, sources are read with their async reader, or in a thread.
+    """
+    if workers <= 1 or len(sources) <= 1:
+        for source in sources:
+            if source.async_read is not None:
+                yield source, await source.async_read()
+            else:
+                yield source, await asyncio.to_thread(source.read)
+        return
+
+    log_debug(f"Reading {len(sources)} sources with {workers} worker processes")
+    loop = asyncio.get_running_loop()
+    source_iterator = iter(sources)
+    pending: Deque[Tuple[KnowledgeSource, "Optional[asyncio.Future[List[Document]]]"]] = deque()
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    def submit(source: KnowledgeSource) -> "Optional[asyncio.Future[List[Document]]]":
+        if not _can_pickle(source):
+            return None
+        try:
+            return loop.run_in_executor(executor, source.read)
+        except BrokenProcessPool:
+            return None
+
+    try:
+        for source in source_iterator:
+            pending.append((source, submit(source)))
+            if len(pending) >= max(queue_size, workers):
+                break
+
+        while pending:
+            source, future = pending.popleft()
+            if future is None:
+                documents = await asyncio.to_thread(source.read)
+            else:
+                try:
+                    documents = await future
+                except BrokenProcessPool as e:
+                    logger.warning(f"Worker process reading {source.key} exited, reading it in a thread: {e}")
+                    documents = await asyncio.to_thread(source.read)
+            next_source = next(source_iterator, None)
+            if next_source is not None:
+                pending.append((next_source, submit(next_source)))
+            yield source, documents
+    finally:
+        for _, future in pending:
+            if future is not None:
+                future.cancel()
+        # Do not block the event loop while the worker processes exit
+        executor.shutdown(wait=False)
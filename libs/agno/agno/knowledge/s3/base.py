@@ -1,9 +1,11 @@
+from functools import partial
 from typing import AsyncIterator, Iterator, List, Optional
 
 from agno.aws.resource.s3.bucket import S3Bucket  # type: ignore
 from agno.aws.resource.s3.object import S3Object  # type: ignore
 from agno.document import Document
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest import KnowledgeSource
 
 
 class S3KnowledgeBase(AgentKnowledge):
@@ -62,3 +64,16 @@ class S3KnowledgeBase(AgentKnowledge):
                 s3_objects_to_read.extend(self.bucket.get_objects())
 
         return s3_objects_to_read
+
+    def _s3_source(self, s3_object: S3Object) -> KnowledgeSource:
+        """Source for an S3 object, using its ETag to detect changes"""
+        object_resource = s3_object.get_resource()
+        e_tag = object_resource.e_tag.strip('"')
+        return KnowledgeSource(
+            key=s3_object.uri,
+            size=object_resource.content_length,
+            modified=e_tag,
+            read=partial(self.reader.read, s3_object=s3_object),  # type: ignore
+            async_read=partial(self.reader.async_read, s3_object=s3_object),  # type: ignore
+            hash_content=partial(str, e_tag),
+        )
@@ -1,7 +1,8 @@
-from typing import AsyncIterator, Iterator, List
+from typing import AsyncIterator, Iterator, List, Optional
 
 from agno.document import Document
 from agno.document.reader.s3.pdf_reader import S3PDFReader
+from agno.knowledge.manifest import KnowledgeSource
 from agno.knowledge.s3.base import S3KnowledgeBase
 
 
@@ -31,3 +32,7 @@ class S3PDFKnowledgeBase(S3KnowledgeBase):
         for s3_object in self.s3_objects:
             if s3_object.name.endswith(".pdf"):
                 yield await self.reader.async_read(s3_object=s3_object)
+
+    def get_sources(self) -> Optional[List[KnowledgeSource]]:
+        """List the PDFs in the s3 bucket, used to sync only new or changed objects."""
+        return [self._s3_source(s3_object) for s3_object in self.s3_objects if s3_object.name.endswith(".pdf")]
@@ -1,9 +1,11 @@
+from functools import partial
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from agno.document import Document
 from agno.document.reader.text_reader import TextReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -42,6 +44,36 @@ class TextKnowledgeBase(AgentKnowledge):
             elif self._is_valid_text(_file_path):
                 yield self.reader.read(file=_file_path)
 
+    def get_sources(self) -> Optional[List[KnowledgeSource]]:
+        """List the text files of the knowledge base, used to sync only new or changed files."""
+        if self.path is None:
+            raise ValueError("Path is not set")
+
+        sources: List[KnowledgeSource] = []
+        if isinstance(self.path, list):
+            for item in self.path:
+                if isinstance(item, dict) and "path" in item:
+                    _file_path = Path(item["path"])  # type: ignore
+                    if self._is_valid_text(_file_path):
+                        sources.append(self._text_source(_file_path, item.get("metadata", {})))  # type: ignore
+        else:
+            _file_path = Path(self.path)
+            if _file_path.is_dir():
+                for _file in _file_path.glob("**/*"):
+                    if self._is_valid_text(_file):
+                        sources.append(self._text_source(_file))
+            elif self._is_valid_text(_file_path):
+                sources.append(self._text_source(_file_path))
+        return sources
+
+    def _text_source(self, path: Path, metadata: Optional[Dict[str, Any]] = None) -> KnowledgeSource:
+        return KnowledgeSource.from_file(
+            path,
+            read=partial(self.reader.read, file=path),
+            async_read=partial(self.reader.async_read, file=path),
+            metadata=metadata,
+        )
+
     def _is_valid_text(self, path: Path) -> bool:
         """Helper to check if path is a valid text file."""
         return path.exists() and path.is_file() and path.suffix in self.formats
@@ -90,7 +90,8 @@ class WebsiteKnowledgeBase(AgentKnowledge):
             if document_list := self.reader.read(url=url):
                 # Filter out documents which already exist in the vector db
                 if not recreate:
-                    document_list = [document for document in document_list if not self.vector_db.doc_exists(document)]
+                    existing = self.vector_db.docs_exist(document_list)
+                    document_list = [document for document, exists in zip(document_list, existing) if not exists]
                     if not document_list:
                         continue
                 if upsert and self.vector_db.upsert_available():
@@ -148,11 +149,8 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                 document_list = await reader.async_read(url=url)
 
                 if not recreate:
-                    filtered_documents = []
-                    for document in document_list:
-                        if not await vector_db.async_doc_exists(document):
-                            filtered_documents.append(document)
-                    document_list = filtered_documents
+                    existing = await vector_db.async_docs_exist(document_list)
+                    document_list = [document for document, exists in zip(document_list, existing) if not exists]
 
                 return document_list
             except Exception as e:
@@ -1,2 +1,3 @@
+from agno.memory.v2.jobs import MemoryJobQueue
 from agno.memory.v2.memory import Memory, MemoryManager, MemoryRow, SessionSummarizer
 from agno.memory.v2.schema import SessionSummary, UserMemory
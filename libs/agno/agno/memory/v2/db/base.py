@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
+from agno.embedder.base import Embedder
 from agno.memory.v2.db.schema import MemoryRow
 
 
 class MemoryDb(ABC):
     """Base class for the Memory Database."""
 
+    # Embeds the memories when they are written, for semantic search. Set by the databases that support it.
+    embedder: Optional[Embedder] = None
+
     @abstractmethod
     def create(self) -> None:
         raise NotImplementedError
@@ -40,3 +44,17 @@ class MemoryDb(ABC):
     @abstractmethod
     def clear(self) -> bool:
         raise NotImplementedError
+
+    def search_memories(
+        self, query_embedding: List[float], user_id: Optional[str] = None, limit: int = 5
+    ) -> List[MemoryRow]:
+        """Return the memories of the user most similar to the query embedding, the most similar first.
+
+        Only available on the databases that embed memories, when they are created with an embedder.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support semantic search")
+
+    @staticmethod
+    def get_memory_text(memory: MemoryRow) -> str:
+        """The text of a memory that is embedded for semantic search"""
+        return str(memory.memory.get("memory", ""))
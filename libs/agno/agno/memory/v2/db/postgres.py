@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -6,14 +6,15 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import delete, select, text
+    from sqlalchemy.sql.expression import delete, select, text, update
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed.  Please install using `pip install sqlalchemy 'psycopg[binary]'`")
 
+from agno.embedder.base import Embedder
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
-from agno.utils.log import log_debug, log_info, logger
+from agno.utils.log import log_debug, log_info, log_warning, logger
 
 
 class PostgresMemoryDb(MemoryDb):
@@ -23,6 +24,7 @@ class PostgresMemoryDb(MemoryDb):
         schema: Optional[str] = "ai",
         db_url: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        embedder: Optional[Embedder] = None,
     ):
         """
         This class provides a memory store backed by a postgres table.
@@ -36,6 +38,8 @@ class PostgresMemoryDb(MemoryDb):
             schema (Optional[str]): The schema to store the table in. Defaults to "ai".
             db_url (Optional[str]): The database URL to connect to. Defaults to None.
             db_engine (Optional[Engine]): The database engine to use. Defaults to None.
+            embedder (Optional[Embedder]): Embeds the memories when they are written, for semantic search.
+                The embeddings are stored in a pgvector column. Defaults to None.
         """
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -51,7 +55,12 @@ class PostgresMemoryDb(MemoryDb):
         self.inspector = inspect(self.db_engine)
         self.metadata: MetaData = MetaData(schema=self.schema)
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        self.embedder: Optional[Embedder] = embedder
+        # Users whose memories stored without an embedding were embedded by this db
+        self._backfilled_users: Set[Optional[str]] = set()
         self.table: Table = self.get_table()
+        if self.embedder is not None:
+            self.add_embedding_column()
 
     def __dict__(self) -> Dict[str, Any]:
         return {
@@ -61,16 +70,40 @@ class PostgresMemoryDb(MemoryDb):
         }
 
     def get_table(self) -> Table:
-        return Table(
-            self.table_name,
-            self.metadata,
+        columns = [
             Column("id", String, primary_key=True),
             Column("user_id", String, index=True),
             Column("memory", postgresql.JSONB, server_default=text("'{}'::jsonb")),
             Column("created_at", DateTime(timezone=True), server_default=text("now()")),
             Column("updated_at", DateTime(timezone=True), onupdate=text("now()")),
-            extend_existing=True,
-        )
+        ]
+        if self.embedder is not None:
+            try:
+                from pgvector.sqlalchemy import Vector
+            except ImportError:
+                raise ImportError("`pgvector` not installed. Please install using `pip install pgvector`")
+
+            # Embedding of the memory, for semantic search
+            columns.append(Column("embedding", Vector(self.embedder.dimensions)))
+        return Table(self.table_name, self.metadata, *columns, extend_existing=True)
+
+    def add_embedding_column(self) -> None:
+        """Add the embedding column to a table created without an embedder"""
+        if not self.table_exists():
+            return
+        columns = [
+            column["name"] for column in inspect(self.db_engine).get_columns(self.table_name, schema=self.schema)
+        ]
+        if "embedding" not in columns:
+            log_debug(f"Adding embedding column to table: {self.table.fullname}")
+            with self.Session() as sess, sess.begin():
+                sess.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+                sess.execute(
+                    text(
+                        f"ALTER TABLE {self.table.fullname} ADD COLUMN IF NOT EXISTS embedding "
+                        f"vector({self.embedder.dimensions});"  # type: ignore
+                    )
+                )
 
     def create(self) -> None:
         if not self.table_exists():
@@ -79,6 +112,8 @@ class PostgresMemoryDb(MemoryDb):
                     if self.schema is not None:
                         log_debug(f"Creating schema: {self.schema}")
                         sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
+                    if self.embedder is not None:
+                        sess.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
                 log_debug(f"Creating table: {self.table_name}")
                 self.table.create(self.db_engine, checkfirst=True)
             except Exception as e:
@@ -123,24 +158,26 @@ class PostgresMemoryDb(MemoryDb):
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Create a new memory if it does not exist, otherwise update the existing memory"""
 
+        values: Dict[str, Any] = {"id": memory.id, "user_id": memory.user_id, "memory": memory.memory}
+        if self.embedder is not None:
+            values["embedding"] = self._embed_memory(memory)
+            if values["embedding"] is None:
+                # Retry embedding the memory on the next search of the user
+                self._backfilled_users.discard(memory.user_id)
         try:
             with self.Session() as sess, sess.begin():
                 # Create an insert statement
-                stmt = postgresql.insert(self.table).values(
-                    id=memory.id,
-                    user_id=memory.user_id,
-                    memory=memory.memory,
-                )
+                stmt = postgresql.insert(self.table).values(**values)
 
                 # Define the upsert if the memory already exists
                 # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["id"],
-                    set_=dict(
-                        user_id=stmt.excluded.user_id,
-                        memory=stmt.excluded.memory,
-                    ),
+                set_ = dict(
+                    user_id=stmt.excluded.user_id,
+                    memory=stmt.excluded.memory,
                 )
+                if self.embedder is not None:
+                    set_["embedding"] = stmt.excluded.embedding
+                stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=set_)
 
                 sess.execute(stmt)
         except Exception as e:
@@ -157,6 +194,73 @@ class PostgresMemoryDb(MemoryDb):
             stmt = delete(self.table).where(self.table.c.id == memory_id)
             sess.execute(stmt)
 
+    def search_memories(
+        self, query_embedding: List[float], user_id: Optional[str] = None, limit: int = 5
+    ) -> List[MemoryRow]:
+        if self.embedder is None:
+            raise ValueError("PostgresMemoryDb needs an embedder for semantic search")
+
+        if not query_embedding:
+            return []
+        if user_id not in self._backfilled_users:
+            self._embed_missing_memories(user_id)
+            self._backfilled_users.add(user_id)
+
+        memories: List[MemoryRow] = []
+        try:
+            with self.Session() as sess, sess.begin():
+                user_filter = self.table.c.user_id == user_id if user_id is not None else self.table.c.user_id.is_(None)
+                columns = [self.table.c[name] for name in ("id", "user_id", "memory", "created_at", "updated_at")]
+                stmt = (
+                    select(*columns)
+                    .where(user_filter, self.table.c.embedding.isnot(None))
+                    .order_by(self.table.c.embedding.cosine_distance(query_embedding))
+                    .limit(limit)
+                )
+                for row in sess.execute(stmt).fetchall():
+                    memories.append(MemoryRow.model_validate(row))
+        except Exception as e:
+            log_debug(f"Exception searching table: {e}")
+        return memories
+
+    def _embed_memory(self, memory: MemoryRow) -> Optional[List[float]]:
+        if self.embedder is None:
+            return None
+        try:
+            embedding = self.embedder.get_embedding(self.get_memory_text(memory))
+        except Exception as e:
+            # The memory is embedded on the next search instead
+            log_warning(f"Error embedding memory {memory.id}: {e}")
+            return None
+        # Embedders return an empty embedding when the request failed
+        if not embedding:
+            log_warning(f"Could not embed memory {memory.id}")
+            return None
+        return embedding
+
+    def _embed_missing_memories(self, user_id: Optional[str]) -> None:
+        """Embed the memories of a user stored without an embedding, e.g. before the embedder was set.
+
+        Runs on the first search of a user, and again after a write of the user failed to embed its memory. Memories
+        that fail to embed are not retried on every search.
+        """
+        embedder: Embedder = self.embedder  # type: ignore
+        try:
+            with self.Session() as sess, sess.begin():
+                user_filter = self.table.c.user_id == user_id if user_id is not None else self.table.c.user_id.is_(None)
+                stmt = select(self.table.c.id, self.table.c.memory).where(user_filter, self.table.c.embedding.is_(None))
+                missing = [MemoryRow(id=row.id, user_id=user_id, memory=row.memory) for row in sess.execute(stmt)]
+                if not missing:
+                    return
+                log_debug(f"Embedding {len(missing)} memories of user {user_id}")
+                embeddings = embedder.get_embeddings_batch([self.get_memory_text(m) for m in missing])
+                for memory, embedding in zip(missing, embeddings):
+                    if not embedding:
+                        continue
+                    sess.execute(update(self.table).where(self.table.c.id == memory.id).values(embedding=embedding))
+        except Exception as e:
+            log_warning(f"Error embedding the memories of user {user_id}: {e}")
+
     def drop_table(self) -> None:
         if self.table_exists():
             log_debug(f"Deleting table: {self.table_name}")
@@ -1,28 +1,34 @@
+from array import array
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy import (
         Column,
         DateTime,
         Engine,
+        LargeBinary,
         MetaData,
         String,
         Table,
         create_engine,
         delete,
+        func,
         inspect,
         select,
         text,
+        update,
     )
     from sqlalchemy.exc import SQLAlchemyError
-    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.orm import Session, scoped_session, sessionmaker
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it with `pip install sqlalchemy`")
 
+from agno.embedder.base import Embedder
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
-from agno.utils.log import log_debug, log_info, logger
+from agno.memory.v2.db.vector_index import MemoryVectorIndex
+from agno.utils.log import log_debug, log_info, log_warning, logger
 
 
 class SqliteMemoryDb(MemoryDb):
@@ -32,6 +38,7 @@ class SqliteMemoryDb(MemoryDb):
         db_url: Optional[str] = None,
         db_file: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        embedder: Optional[Embedder] = None,
     ):
         """
         This class provides a memory store backed by a SQLite table.
@@ -47,6 +54,9 @@ class SqliteMemoryDb(MemoryDb):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The database engine to use.
+            embedder: Embeds the memories when they are written, for semantic search. The embeddings are stored in
+                the table and searched in an in-process index per user. A user's index is reloaded when their rows
+                were changed by another process, detected by the count and latest timestamps of the rows.
         """
         self.db_file = db_file
         _engine: Optional[Engine] = db_engine
@@ -71,10 +81,16 @@ class SqliteMemoryDb(MemoryDb):
         self.metadata: MetaData = MetaData()
         self.inspector = inspect(self.db_engine)
 
+        # Embedder and index for semantic search
+        self.embedder: Optional[Embedder] = embedder
+        self.vector_index = MemoryVectorIndex()
+
         # Database session
         self.Session = scoped_session(sessionmaker(bind=self.db_engine))
         # Database table for memories
         self.table: Table = self.get_table()
+        if self.embedder is not None:
+            self.add_embedding_column()
 
     def __dict__(self) -> Dict[str, Any]:
         return {
@@ -84,9 +100,7 @@ class SqliteMemoryDb(MemoryDb):
         }
 
     def get_table(self) -> Table:
-        return Table(
-            self.table_name,
-            self.metadata,
+        columns = [
             Column("id", String, primary_key=True),
             Column("user_id", String, index=True),
             Column("memory", String),
@@ -94,8 +108,22 @@ class SqliteMemoryDb(MemoryDb):
             Column(
                 "updated_at", DateTime, server_default=text("CURRENT_TIMESTAMP"), onupdate=text("CURRENT_TIMESTAMP")
             ),
-            extend_existing=True,
-        )
+        ]
+        if self.embedder is not None:
+            # float32 embedding of the memory, for semantic search
+            columns.append(Column("embedding", LargeBinary))
+        return Table(self.table_name, self.metadata, *columns, extend_existing=True)
+
+    def add_embedding_column(self) -> None:
+        """Add the embedding column to a table created without an embedder"""
+        if not self.table_exists():
+            return
+        columns = [column["name"] for column in inspect(self.db_engine).get_columns(self.table_name)]
+        if "embedding" not in columns:
+            log_debug(f"Adding embedding column to table: {self.table_name}")
+            with self.Session() as session:
+                session.execute(text(f"ALTER TABLE {self.table_name} ADD COLUMN embedding BLOB"))
+                session.commit()
 
     def create(self) -> None:
         if not self.table_exists():
@@ -148,24 +176,38 @@ class SqliteMemoryDb(MemoryDb):
         return memories
 
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
+        self._upsert_memory(memory, embedding=self._embed_memory(memory), create_and_retry=create_and_retry)
+
+    def _upsert_memory(self, memory: MemoryRow, embedding: Optional[List[float]], create_and_retry: bool) -> None:
         try:
             with self.Session() as session:
                 # Check if the memory already exists
-                existing = session.execute(select(self.table).where(self.table.c.id == memory.id)).first()
+                existing = session.execute(select(self.table.c.id).where(self.table.c.id == memory.id)).first()
+
+                values: Dict[str, Any] = {"user_id": memory.user_id, "memory": str(memory.memory)}
+                if self.embedder is not None:
+                    values["embedding"] = array("f", embedding).tobytes() if embedding is not None else None
 
                 if existing:
                     # Update existing memory
                     stmt = (
                         self.table.update()
                         .where(self.table.c.id == memory.id)
-                        .values(user_id=memory.user_id, memory=str(memory.memory), updated_at=text("CURRENT_TIMESTAMP"))
+                        .values(**values, updated_at=text("CURRENT_TIMESTAMP"))
                     )
                 else:
                     # Insert new memory
-                    stmt = self.table.insert().values(id=memory.id, user_id=memory.user_id, memory=str(memory.memory))  # type: ignore
+                    stmt = self.table.insert().values(id=memory.id, **values)  # type: ignore
 
                 session.execute(stmt)
+                # Read in the write transaction, so the version does not include writes of other processes
+                version = None
+                if embedding is not None and self.vector_index.is_loaded(memory.user_id):
+                    version = self._get_index_version(session, memory.user_id)
                 session.commit()
+            if embedding is not None:
+                self.vector_index.upsert(memory.user_id, memory.id, embedding)  # type: ignore
+                self.vector_index.set_version(memory.user_id, version)
         except SQLAlchemyError as e:
             logger.error(f"Exception upserting into table: {e}")
             if not self.table_exists():
@@ -173,20 +215,123 @@ class SqliteMemoryDb(MemoryDb):
                 log_info("Creating table for future transactions")
                 self.create()
                 if create_and_retry:
-                    return self.upsert_memory(memory, create_and_retry=False)
+                    return self._upsert_memory(memory, embedding=embedding, create_and_retry=False)
             else:
                 raise
 
     def delete_memory(self, memory_id: str) -> None:
         with self.Session() as session:
+            user_ids = session.execute(select(self.table.c.user_id).where(self.table.c.id == memory_id)).scalars().all()
             stmt = delete(self.table).where(self.table.c.id == memory_id)
             session.execute(stmt)
+            versions = {
+                user_id: self._get_index_version(session, user_id)
+                for user_id in user_ids
+                if self.vector_index.is_loaded(user_id)
+            }
             session.commit()
+        self.vector_index.delete(memory_id)
+        for user_id, version in versions.items():
+            self.vector_index.set_version(user_id, version)
+
+    def search_memories(
+        self, query_embedding: List[float], user_id: Optional[str] = None, limit: int = 5
+    ) -> List[MemoryRow]:
+        if self.embedder is None:
+            raise ValueError("SqliteMemoryDb needs an embedder for semantic search")
+
+        try:
+            with self.Session() as session:
+                version = self._get_index_version(session, user_id)
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading from table: {e}")
+            return []
+        if not query_embedding:
+            return []
+        if not self.vector_index.is_loaded(user_id) or self.vector_index.get_version(user_id) != version:
+            self._load_vector_index(user_id)
+        hits = self.vector_index.search(user_id, query_embedding, limit)
+        if not hits:
+            return []
+
+        memories: Dict[str, MemoryRow] = {}
+        with self.Session() as session:
+            columns = [self.table.c[name] for name in ("id", "user_id", "memory", "created_at", "updated_at")]
+            stmt = select(*columns).where(self.table.c.id.in_([memory_id for memory_id, _ in hits]))
+            for row in session.execute(stmt):
+                memories[row.id] = MemoryRow(
+                    id=row.id,
+                    user_id=row.user_id,
+                    memory=eval(row.memory),
+                    last_updated=row.updated_at or row.created_at,
+                )
+        return [memories[memory_id] for memory_id, _ in hits if memory_id in memories]
+
+    def _embed_memory(self, memory: MemoryRow) -> Optional[List[float]]:
+        if self.embedder is None:
+            return None
+        try:
+            embedding = self.embedder.get_embedding(self.get_memory_text(memory))
+        except Exception as e:
+            # The memory is embedded on the next search instead
+            log_warning(f"Error embedding memory {memory.id}: {e}")
+            return None
+        # Embedders return an empty embedding when the request failed
+        if not embedding:
+            log_warning(f"Could not embed memory {memory.id}")
+            return None
+        return embedding
+
+    def _get_index_version(self, session: Session, user_id: Optional[str]) -> Tuple[Any, ...]:
+        """The number of rows of a user and their latest timestamps, which change when the user's memories change"""
+        user_filter = self.table.c.user_id == user_id if user_id is not None else self.table.c.user_id.is_(None)
+        stmt = select(func.count(), func.max(self.table.c.created_at), func.max(self.table.c.updated_at)).where(
+            user_filter
+        )
+        return tuple(session.execute(stmt).one())
+
+    def _load_vector_index(self, user_id: Optional[str]) -> None:
+        """Load the embeddings of a user into the index, embedding the memories stored without one"""
+        embedder: Embedder = self.embedder  # type: ignore
+        embeddings: Dict[str, List[float]] = {}
+        missing: List[MemoryRow] = []
+        try:
+            with self.Session() as session:
+                version = self._get_index_version(session, user_id)
+                user_filter = self.table.c.user_id == user_id if user_id is not None else self.table.c.user_id.is_(None)
+                stmt = select(self.table.c.id, self.table.c.memory, self.table.c.embedding).where(user_filter)
+                for row in session.execute(stmt):
+                    if row.embedding:
+                        embeddings[row.id] = array("f", row.embedding).tolist()
+                    else:
+                        missing.append(MemoryRow(id=row.id, user_id=user_id, memory=eval(row.memory)))
+
+                if missing:
+                    log_debug(f"Embedding {len(missing)} memories of user {user_id}")
+                    new_embeddings = embedder.get_embeddings_batch([self.get_memory_text(m) for m in missing])
+                    for memory, embedding in zip(missing, new_embeddings):
+                        # Embedders return an empty embedding when the request failed
+                        if not embedding:
+                            continue
+                        embeddings[memory.id] = embedding  # type: ignore
+                        session.execute(
+                            update(self.table)
+                            .where(self.table.c.id == memory.id)
+                            .values(embedding=array("f", embedding).tobytes())
+                        )
+                    # Storing the embeddings updates the timestamps of the rows
+                    version = self._get_index_version(session, user_id)
+                    session.commit()
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading from table: {e}")
+            return
+        self.vector_index.load(user_id, embeddings, version=version)
 
     def drop_table(self) -> None:
         if self.table_exists():
             log_debug(f"Deleting table: {self.table_name}")
             self.table.drop(self.db_engine)
+        self.vector_index.clear()
 
     def table_exists(self) -> bool:
         log_debug(f"Checking if table exists: {self.table.name}")
@@ -202,6 +347,7 @@ class SqliteMemoryDb(MemoryDb):
                 stmt = delete(self.table)
                 session.execute(stmt)
                 session.commit()
+        self.vector_index.clear()
         return True
 
     def __del__(self):
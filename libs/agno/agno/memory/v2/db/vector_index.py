@@ -0,0 +1,116 @@
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+
+def _normalize(embedding: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in embedding))
+    if norm == 0:
+        return list(embedding)
+    return [x / norm for x in embedding]
+
+
+class MemoryVectorIndex:
+    """In-process index of memory embeddings per user, searched by cosine similarity.
+
+    The embeddings of a user are loaded from the memory db on their first search, and kept up to date by the writes
+    of the db. Each user is loaded with a version of their rows in the db, which the db compares on search to reload
+    users written by other processes. Only the most recently searched `max_users` users are kept.
+    Uses numpy when it is installed.
+    """
+
+    def __init__(self, max_users: int = 1000):
+        self.max_users = max_users
+        # user_id -> memory_id -> normalized embedding, least recently used first
+        self._embeddings: "OrderedDict[Optional[str], Dict[str, List[float]]]" = OrderedDict()
+        # user_id -> version of the rows of the user the embeddings were loaded from
+        self._versions: Dict[Optional[str], Any] = {}
+        # user_id -> (memory ids, matrix of embeddings), rebuilt after the embeddings of the user change
+        self._matrices: Dict[Optional[str], Tuple[List[str], "np.ndarray"]] = {}
+        self._lock = threading.Lock()
+
+    def is_loaded(self, user_id: Optional[str]) -> bool:
+        return user_id in self._embeddings
+
+    def get_version(self, user_id: Optional[str]) -> Any:
+        return self._versions.get(user_id)
+
+    def set_version(self, user_id: Optional[str], version: Any) -> None:
+        """Record that the embeddings of a loaded user match a new version of their rows"""
+        with self._lock:
+            if user_id in self._embeddings:
+                self._versions[user_id] = version
+
+    def load(self, user_id: Optional[str], embeddings: Dict[str, List[float]], version: Any = None) -> None:
+        """Set all the embeddings of a user"""
+        with self._lock:
+            self._embeddings[user_id] = {memory_id: _normalize(e) for memory_id, e in embeddings.items() if e}
+            self._embeddings.move_to_end(user_id)
+            self._versions[user_id] = version
+            self._matrices.pop(user_id, None)
+            while len(self._embeddings) > self.max_users:
+                evicted, _ = self._embeddings.popitem(last=False)
+                self._versions.pop(evicted, None)
+                self._matrices.pop(evicted, None)
+
+    def upsert(self, user_id: Optional[str], memory_id: str, embedding: List[float]) -> None:
+        """Add or replace the embedding of a memory. Users that were not loaded yet are loaded on their first search."""
+        with self._lock:
+            # The memory may have moved to another user
+            self._remove(memory_id)
+            if user_id in self._embeddings and embedding:
+                self._embeddings[user_id][memory_id] = _normalize(embedding)
+                self._matrices.pop(user_id, None)
+
+    def delete(self, memory_id: str) -> None:
+        with self._lock:
+            self._remove(memory_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._embeddings.clear()
+            self._versions.clear()
+            self._matrices.clear()
+
+    def search(self, user_id: Optional[str], query_embedding: List[float], limit: int) -> List[Tuple[str, float]]:
+        """Return the ids of the memories of the user most similar to the query, with their cosine similarity"""
+        if not query_embedding:
+            return []
+        query = _normalize(query_embedding)
+        with self._lock:
+            embeddings = self._embeddings.get(user_id)
+            if embeddings is not None:
+                self._embeddings.move_to_end(user_id)
+            if not embeddings:
+                return []
+            if np is None:
+                scores = [
+                    (memory_id, sum(q * e for q, e in zip(query, embedding)))
+                    for memory_id, embedding in embeddings.items()
+                ]
+                scores.sort(key=lambda item: item[1], reverse=True)
+                return scores[:limit]
+
+            if user_id not in self._matrices:
+                ids = list(embeddings.keys())
+                self._matrices[user_id] = (ids, np.array([embeddings[i] for i in ids], dtype=np.float32))
+            ids, matrix = self._matrices[user_id]
+
+        similarities = matrix @ np.asarray(query, dtype=np.float32)
+        if limit < len(ids):
+            top = np.argpartition(-similarities, limit)[:limit]
+        else:
+            top = np.arange(len(ids))
+        top = top[np.argsort(-similarities[top])]
+        return [(ids[i], float(similarities[i])) for i in top]
+
+    def _remove(self, memory_id: str) -> None:
+        for user_id, embeddings in self._embeddings.items():
+            if embeddings.pop(memory_id, None) is not None:
+                self._matrices.pop(user_id, None)
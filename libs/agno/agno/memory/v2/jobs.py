@@ -0,0 +1,358 @@
+import atexit
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.memory.v2.memory import Memory
+    from agno.memory.v2.schema import SessionSummary
+    from agno.storage.base import Storage
+
+USER_MEMORIES = "user_memories"
+SESSION_SUMMARY = "session_summary"
+
+
+@dataclass
+class MemoryJob:
+    """A pending memory or session summary update"""
+
+    id: int
+    kind: str
+    user_id: str
+    session_id: Optional[str]
+    payload: Dict[str, Any]
+    attempts: int
+
+
+@dataclass
+class MemoryJobQueue:
+    """Durable queue of user memory and session summary updates, processed in the background.
+
+    Jobs are stored in a local SQLite file, so the run returns as soon as the job is queued and pending jobs survive a
+    restart. A pool of worker threads processes the jobs. Pending jobs are coalesced: the memory jobs of a user are
+    sent to the memory manager in one call, and only the latest conversation of a session is summarized.
+    Failed jobs are retried with exponential backoff.
+
+    Set it on the Memory to defer the updates of the agents and teams using it:
+    `Memory(job_queue=MemoryJobQueue(db_file="tmp/memory_jobs.db"))`.
+
+    The jobs in a file are applied to the Memory of any queue that opens it, so use a file per app. Several processes
+    of the same app can share a file: a job claimed by a process is only claimed again once its lease expires.
+    Session summaries are saved to the session in `storage`, so a summary made by a process that is not serving the
+    session, or after a restart, is not lost.
+    """
+
+    # Path to the SQLite file. Use a file per app.
+    db_file: Union[str, Path]
+    # Number of worker threads
+    num_workers: int = 2
+    # Number of attempts before a job is marked as failed
+    max_attempts: int = 3
+    # Seconds to wait before the first retry, doubled on every further attempt
+    retry_backoff: float = 2.0
+    # Seconds between checks for jobs that are due for a retry
+    poll_interval: float = 1.0
+    # Seconds a worker holds a claimed job. Jobs still running after their lease, e.g. because the process that
+    # claimed them stopped, are claimed again. Must be longer than the slowest memory or summary update.
+    lease_timeout: float = 300.0
+
+    # The Memory the jobs are applied to. Set by the Memory the queue is given to.
+    memory: Optional["Memory"] = field(default=None, repr=False)
+    # Storage of the sessions that session summaries are saved to. Set by the agent or team queueing the summaries.
+    storage: Optional["Storage"] = field(default=None, repr=False)
+
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _condition: threading.Condition = field(default_factory=threading.Condition, init=False, repr=False)
+    _workers: List[threading.Thread] = field(default_factory=list, init=False, repr=False)
+    # Users and sessions being processed by a worker, so their jobs are not claimed twice
+    _active_keys: set = field(default_factory=set, init=False, repr=False)
+    _stopped: bool = field(default=False, init=False, repr=False)
+    # Identifies the jobs claimed by this queue
+    _owner: str = field(
+        default_factory=lambda: f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}", init=False, repr=False
+    )
+    _exit_hook_registered: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        self.db_file = Path(self.db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS memory_jobs ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, user_id TEXT NOT NULL, session_id TEXT, "
+            "payload TEXT NOT NULL, status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, "
+            "available_at REAL NOT NULL, created_at REAL NOT NULL, error TEXT, owner TEXT, claimed_at REAL)"
+        )
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(memory_jobs)")}
+        for column, column_type in (("owner", "TEXT"), ("claimed_at", "REAL")):
+            if column not in columns:
+                connection.execute(f"ALTER TABLE memory_jobs ADD COLUMN {column} {column_type}")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_memory_jobs_status ON memory_jobs (status, available_at)")
+        connection.commit()
+        self._connection = connection
+        return self._connection
+
+    def enqueue_user_memories(self, messages: List[Message], user_id: Optional[str] = None) -> None:
+        """Queue the creation of user memories from the messages of a run."""
+        payload = {"messages": [{"role": m.role, "content": m.get_content_string()} for m in messages]}
+        self._enqueue(USER_MEMORIES, user_id=user_id or "default", session_id=None, payload=payload)
+
+    def enqueue_session_summary(
+        self, session_id: str, runs: List[List[Message]], user_id: Optional[str] = None
+    ) -> None:
+        """Queue the summary of a session, with a snapshot of the messages of each of its runs."""
+        payload = {"runs": [[m.to_dict() for m in run] for run in runs]}
+        self._enqueue(SESSION_SUMMARY, user_id=user_id or "default", session_id=session_id, payload=payload)
+
+    def pending_count(self) -> int:
+        """Number of jobs waiting to be processed or being processed"""
+        with self._lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM memory_jobs WHERE status IN ('pending', 'running')"
+            ).fetchone()[0]
+
+    def failed_jobs(self) -> List[MemoryJob]:
+        """Jobs that failed `max_attempts` times"""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT id, kind, user_id, session_id, payload, attempts FROM memory_jobs WHERE status = 'failed' "
+                "ORDER BY id"
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the queued jobs are processed.
+
+        Returns:
+            bool: False if jobs are still pending after `timeout` seconds.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while self.pending_count() > 0:
+                if self.memory is not None:
+                    self._ensure_workers()
+                remaining = deadline - time.monotonic() if deadline is not None else self.poll_interval
+                if remaining <= 0:
+                    return False
+                self._condition.wait(min(remaining, self.poll_interval))
+        return True
+
+    async def aflush(self, timeout: Optional[float] = None) -> bool:
+        """Async version of flush"""
+        import asyncio
+
+        return await asyncio.to_thread(self.flush, timeout)
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the workers. Jobs that are still pending are processed when the queue is used again."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _enqueue(self, kind: str, user_id: str, session_id: Optional[str], payload: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                "INSERT INTO memory_jobs (kind, user_id, session_id, payload, status, available_at, created_at) "
+                "VALUES (?, ?, ?, ?, 'pending', ?, ?)",
+                (kind, user_id, session_id, json.dumps(payload), now, now),
+            )
+            self.connection.commit()
+        log_debug(f"Queued {kind} job for user {user_id}")
+        self._ensure_workers()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _ensure_workers(self) -> None:
+        with self._condition:
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+            if self._stopped and not self._workers:
+                self._stopped = False
+            if len(self._workers) >= self.num_workers:
+                return
+            if not self._exit_hook_registered:
+                atexit.register(self.shutdown)
+                self._exit_hook_registered = True
+            for i in range(len(self._workers), self.num_workers):
+                worker = threading.Thread(target=self._run, name=f"agno-memory-jobs-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    @staticmethod
+    def _to_job(row: Tuple) -> MemoryJob:
+        return MemoryJob(
+            id=row[0], kind=row[1], user_id=row[2], session_id=row[3], payload=json.loads(row[4]), attempts=row[5]
+        )
+
+    @staticmethod
+    def _job_key(kind: str, user_id: str, session_id: Optional[str]) -> Tuple[str, str, Optional[str]]:
+        return (kind, user_id, session_id if kind == SESSION_SUMMARY else None)
+
+    def _claim(self) -> List[MemoryJob]:
+        """Claim the pending jobs of the oldest user or session that no worker of any process is processing"""
+        with self._lock:
+            connection = self.connection
+            # Lock the file for writes, so two processes never claim the same jobs
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                jobs = self._claim_in_transaction(connection)
+            except Exception:
+                connection.rollback()
+                raise
+            connection.commit()
+            return jobs
+
+    def _claim_in_transaction(self, connection: sqlite3.Connection) -> List[MemoryJob]:
+        now = time.time()
+        # Jobs whose lease expired, e.g. because the process that claimed them stopped, are processed again
+        expired = connection.execute(
+            "UPDATE memory_jobs SET status = 'pending', owner = NULL, claimed_at = NULL "
+            "WHERE status = 'running' AND claimed_at < ?",
+            (now - self.lease_timeout,),
+        )
+        if expired.rowcount:
+            log_debug(f"Reclaimed {expired.rowcount} memory jobs with an expired lease")
+
+        rows = connection.execute(
+            "SELECT kind, user_id, session_id FROM memory_jobs WHERE status = 'pending' AND available_at <= ? "
+            "ORDER BY id",
+            (now,),
+        ).fetchall()
+        for kind, user_id, session_id in rows:
+            key = self._job_key(kind, user_id, session_id)
+            if key in self._active_keys:
+                continue
+            if kind == SESSION_SUMMARY:
+                where, params = "kind = ? AND user_id = ? AND session_id = ?", (kind, user_id, session_id)
+            else:
+                where, params = "kind = ? AND user_id = ?", (kind, user_id)
+            # The user or session is being processed by another process
+            if connection.execute(f"SELECT 1 FROM memory_jobs WHERE status = 'running' AND {where}", params).fetchone():
+                continue
+            # Jobs waiting for a retry are coalesced too, they are processed with the new job
+            claimed = connection.execute(
+                "SELECT id, kind, user_id, session_id, payload, attempts FROM memory_jobs "
+                f"WHERE status = 'pending' AND {where} ORDER BY id",
+                params,
+            ).fetchall()
+            connection.executemany(
+                "UPDATE memory_jobs SET status = 'running', owner = ?, claimed_at = ? WHERE id = ?",
+                [(self._owner, now, row[0]) for row in claimed],
+            )
+            self._active_keys.add(key)
+            return [self._to_job(row) for row in claimed]
+        return []
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._stopped:
+                    return
+            jobs = self._claim() if self.memory is not None else []
+            if not jobs:
+                with self._condition:
+                    if self._stopped:
+                        return
+                    self._condition.wait(self.poll_interval)
+                continue
+
+            key = self._job_key(jobs[0].kind, jobs[0].user_id, jobs[0].session_id)
+            try:
+                self._process(jobs)
+            except Exception as e:
+                log_warning(f"Error in memory/summary operation: {str(e)}")
+                self._retry(jobs, str(e))
+            else:
+                self._complete(jobs)
+            finally:
+                with self._lock:
+                    self._active_keys.discard(key)
+                with self._condition:
+                    self._condition.notify_all()
+
+    def _process(self, jobs: List[MemoryJob]) -> None:
+        memory = self.memory
+        if memory is None:
+            raise ValueError("MemoryJobQueue is not attached to a Memory")
+
+        first = jobs[0]
+        if first.kind == USER_MEMORIES:
+            messages = [Message(**message) for job in jobs for message in job.payload["messages"]]
+            log_debug(f"Creating user memories from {len(jobs)} queued runs of user {first.user_id}")
+            memory.create_user_memories(messages=messages, user_id=first.user_id)
+        elif first.kind == SESSION_SUMMARY:
+            # The latest snapshot of the session includes the runs of the earlier jobs
+            runs = [[Message.model_validate(message) for message in run] for run in jobs[-1].payload["runs"]]
+            log_debug(f"Creating session summary for session {first.session_id} from {len(jobs)} queued runs")
+            summary = memory.create_session_summary(session_id=first.session_id, user_id=first.user_id, runs=runs)  # type: ignore
+            if summary is not None and self.storage is not None:
+                self._save_session_summary(first.session_id, first.user_id, summary)  # type: ignore
+        else:
+            raise ValueError(f"Unknown memory job: {first.kind}")
+
+    def _save_session_summary(self, session_id: str, user_id: str, summary: "SessionSummary") -> None:
+        """Save a summary to its session in storage, unless the stored summary is more recent"""
+        from agno.memory.v2.memory import Memory
+        from agno.memory.v2.schema import SessionSummary
+
+        session = self.storage.read(session_id=session_id)  # type: ignore
+        if session is None:
+            log_debug(f"Session {session_id} not found in storage, the summary is only kept in memory")
+            return
+        memory_dict = session.memory if session.memory is not None else {}
+        user_summaries = memory_dict.setdefault("summaries", {}).setdefault(user_id, {})
+        stored = user_summaries.get(session_id)
+        if stored is not None and Memory._summary_recency(SessionSummary.from_dict(dict(stored))) > (
+            Memory._summary_recency(summary)
+        ):
+            return
+        user_summaries[session_id] = summary.to_dict()
+        session.memory = memory_dict
+        self.storage.upsert(session)  # type: ignore
+
+    def _complete(self, jobs: List[MemoryJob]) -> None:
+        with self._lock:
+            self.connection.executemany("DELETE FROM memory_jobs WHERE id = ?", [(job.id,) for job in jobs])
+            self.connection.commit()
+
+    def _retry(self, jobs: List[MemoryJob], error: str) -> None:
+        now = time.time()
+        updates = []
+        for job in jobs:
+            attempts = job.attempts + 1
+            if attempts >= self.max_attempts:
+                log_warning(f"Giving up on {job.kind} job {job.id} of user {job.user_id} after {attempts} attempts")
+                updates.append(("failed", attempts, now, error, job.id))
+            else:
+                updates.append(("pending", attempts, now + self.retry_backoff * 2 ** (attempts - 1), error, job.id))
+        with self._lock:
+            self.connection.executemany(
+                "UPDATE memory_jobs SET status = ?, attempts = ?, available_at = ?, error = ?, owner = NULL, "
+                "claimed_at = NULL WHERE id = ?",
+                updates,
+            )
+            self.connection.commit()
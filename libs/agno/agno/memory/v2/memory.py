@@ -3,13 +3,15 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union, cast
 
 from pydantic import BaseModel, Field
 
+from agno.embedder.query_cache import embed_query
 from agno.media import AudioArtifact, ImageArtifact, VideoArtifact
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
+from agno.memory.v2.jobs import MemoryJobQueue
 from agno.memory.v2.manager import MemoryManager
 from agno.memory.v2.schema import SessionSummary, UserMemory
 from agno.memory.v2.summarizer import SessionSummarizer
@@ -21,6 +23,11 @@ from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debu
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
 
+# Number of memories returned by semantic search when no limit is given
+SEMANTIC_SEARCH_LIMIT = 10
+# Minimum number of semantic search results the model picks from in hybrid search
+HYBRID_SEARCH_CANDIDATES = 20
+
 
 class MemorySearchResponse(BaseModel):
     """Model for Memory Search Response."""
@@ -87,6 +94,9 @@ class Memory:
 
     db: Optional[MemoryDb] = None
 
+    # Queue to create memories and summaries in the background, instead of during the run
+    job_queue: Optional[MemoryJobQueue] = None
+
     # runs per session
     runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
 
@@ -113,6 +123,7 @@ class Memory:
         debug_mode: bool = False,
         delete_memories: bool = False,
         clear_memories: bool = False,
+        job_queue: Optional[MemoryJobQueue] = None,
     ):
         self.memories = memories or {}
         self.summaries = summaries or {}
@@ -134,6 +145,10 @@ class Memory:
 
         self.db = db
 
+        self.job_queue = job_queue
+        if self.job_queue is not None and self.job_queue.memory is None:
+            self.job_queue.memory = self
+
         # We are making memories
         if self.model is not None:
             if self.memory_manager is None:
@@ -272,6 +287,26 @@ class Memory:
             return None
         return self.summaries.get(user_id, {}).get(session_id, None)
 
+    def load_session_summaries(self, summaries: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        """Load session summaries read from storage, keeping the summaries in memory that are more recent.
+
+        Summaries made by the job queue are only in memory until the session is saved again, so they must not be
+        replaced by the older copy in storage.
+        """
+        if self.summaries is None:
+            self.summaries = {}
+        for user_id, user_session_summaries in summaries.items():
+            current_summaries = self.summaries.setdefault(user_id, {})
+            for session_id, summary_dict in user_session_summaries.items():
+                stored = SessionSummary.from_dict(dict(summary_dict))
+                current = current_summaries.get(session_id)
+                if current is None or self._summary_recency(stored) >= self._summary_recency(current):
+                    current_summaries[session_id] = stored
+
+    @staticmethod
+    def _summary_recency(summary: SessionSummary) -> Tuple[int, datetime]:
+        return (summary.num_runs or 0, summary.last_updated or datetime.min)
+
     def add_user_memory(
         self,
         memory: UserMemory,
@@ -397,8 +432,42 @@ class Memory:
         return self.runs.get(session_id, [])
 
     # -*- Agent Functions
-    def create_session_summary(self, session_id: str, user_id: Optional[str] = None) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
+    def _prepare_session_summary(
+        self, session_id: str, user_id: str, runs: List[List[Message]]
+    ) -> Optional[Tuple[List[Message], Optional[SessionSummary]]]:
+        """Get the conversation to summarize and the summary to update, or None if the summary is not due for an update.
+
+        The summary records the number of runs it covers. With an incremental summarizer, only the later runs are
+        summarized, together with the previous summary.
+        """
+        summary_manager = cast(SessionSummarizer, self.summary_manager)
+        previous_summary = self.summaries.get(user_id, {}).get(session_id)  # type: ignore
+        num_summarized_runs = 0
+        if previous_summary is not None and previous_summary.num_runs is not None:
+            # The runs were reset since the last summary, e.g. the memory was cleared: summarize them again
+            if previous_summary.num_runs <= len(runs):
+                num_summarized_runs = previous_summary.num_runs
+
+        new_runs = runs[num_summarized_runs:]
+        if previous_summary is not None and not summary_manager.is_update_due(new_runs):
+            log_debug(f"Session summary is up to date, {len(new_runs)} runs since the last summary")
+            return None
+
+        if summary_manager.incremental and previous_summary is not None and num_summarized_runs > 0:
+            log_debug(f"Updating session summary with {len(new_runs)} new runs")
+            return [message for run in new_runs for message in run], previous_summary
+        return [message for run in runs for message in run], None
+
+    def create_session_summary(
+        self, session_id: str, user_id: Optional[str] = None, runs: Optional[List[List[Message]]] = None
+    ) -> Optional[SessionSummary]:
+        """Creates a summary of the session, or updates it with the runs since the last summary
+
+        Args:
+            session_id: The session to summarize.
+            user_id: The user of the session.
+            runs: The messages of each run of the session. Defaults to the session runs in memory.
+        """
 
         if not self.summary_manager:
             raise ValueError("Summarizer not initialized")
@@ -408,18 +477,30 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        summary_response = self.summary_manager.run(conversation=self.get_messages_for_session(session_id=session_id))
+        if runs is None:
+            runs = self.get_messages_per_run(session_id=session_id)
+        summary_input = self._prepare_session_summary(session_id=session_id, user_id=user_id, runs=runs)
+        if summary_input is None:
+            return self.get_session_summary(session_id=session_id, user_id=user_id)
+        conversation, previous_summary = summary_input
+
+        summary_response = self.summary_manager.run(conversation=conversation, previous_summary=previous_summary)
         if summary_response is None:
             return None
         session_summary = SessionSummary(
-            summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
+            summary=summary_response.summary,
+            topics=summary_response.topics,
+            last_updated=datetime.now(),
+            num_runs=len(runs),
         )
         self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
 
         return session_summary
 
-    async def acreate_session_summary(self, session_id: str, user_id: Optional[str] = None) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
+    async def acreate_session_summary(
+        self, session_id: str, user_id: Optional[str] = None, runs: Optional[List[List[Message]]] = None
+    ) -> Optional[SessionSummary]:
+        """Creates a summary of the session, or updates it with the runs since the last summary"""
         if not self.summary_manager:
             raise ValueError("Summarizer not initialized")
 
@@ -428,18 +509,53 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        summary_response = await self.summary_manager.arun(
-            conversation=self.get_messages_for_session(session_id=session_id)
-        )
+        if runs is None:
+            runs = self.get_messages_per_run(session_id=session_id)
+        summary_input = self._prepare_session_summary(session_id=session_id, user_id=user_id, runs=runs)
+        if summary_input is None:
+            return self.get_session_summary(session_id=session_id, user_id=user_id)
+        conversation, previous_summary = summary_input
+
+        summary_response = await self.summary_manager.arun(conversation=conversation, previous_summary=previous_summary)
         if summary_response is None:
             return None
         session_summary = SessionSummary(
-            summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
+            summary=summary_response.summary,
+            topics=summary_response.topics,
+            last_updated=datetime.now(),
+            num_runs=len(runs),
         )
         self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
 
         return session_summary
 
+    def defer_session_summary(self, session_id: str, user_id: Optional[str] = None) -> None:
+        """Queues the summary of the session on the job queue, with a snapshot of the session runs so far"""
+        if self.job_queue is None:
+            raise ValueError("Job queue not initialized")
+        if not self.summary_manager:
+            raise ValueError("Summarizer not initialized")
+
+        runs = self.get_messages_per_run(session_id=session_id)
+        if self._prepare_session_summary(session_id=session_id, user_id=user_id or "default", runs=runs) is None:
+            return
+        self.job_queue.enqueue_session_summary(session_id=session_id, runs=runs, user_id=user_id)
+
+    def defer_user_memories(
+        self,
+        message: Optional[str] = None,
+        messages: Optional[List[Message]] = None,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """Queues the creation of memories from the messages on the job queue"""
+        if self.job_queue is None:
+            raise ValueError("Job queue not initialized")
+        if message:
+            messages = [Message(role="user", content=message)]
+        if not messages:
+            raise ValueError("You must provide either a message or a list of messages")
+        self.job_queue.enqueue_user_memories(messages=messages, user_id=user_id)
+
     def create_user_memories(
         self,
         message: Optional[str] = None,
@@ -637,13 +753,36 @@ class Memory:
         skip_history_messages: bool = True,
     ) -> List[Message]:
         """Returns a list of messages for the session that iterate through user message and assistant response."""
+        return [
+            message
+            for run_messages in self.get_messages_per_run(
+                session_id=session_id,
+                user_role=user_role,
+                assistant_role=assistant_role,
+                skip_history_messages=skip_history_messages,
+            )
+            for message in run_messages
+        ]
+
+    def get_messages_per_run(
+        self,
+        session_id: str,
+        user_role: str = "user",
+        assistant_role: Optional[List[str]] = None,
+        skip_history_messages: bool = True,
+    ) -> List[List[Message]]:
+        """Returns the user message and assistant response of each run of the session.
+
+        Runs without both messages are included as empty lists, so the list is aligned with the session runs.
+        """
 
         if assistant_role is None:
             assistant_role = ["assistant", "model", "CHATBOT"]
 
-        final_messages: List[Message] = []
+        messages_per_run: List[List[Message]] = []
         session_runs = self.runs.get(session_id, []) if self.runs else []
         for run_response in session_runs:
+            run_messages: List[Message] = []
             if run_response and run_response.messages:
                 user_message_from_run = None
                 assistant_message_from_run = None
@@ -665,9 +804,9 @@ class Memory:
                         break
 
                 if user_message_from_run and assistant_message_from_run:
-                    final_messages.append(user_message_from_run)
-                    final_messages.append(assistant_message_from_run)
-        return final_messages
+                    run_messages = [user_message_from_run, assistant_message_from_run]
+            messages_per_run.append(run_messages)
+        return messages_per_run
 
     def add_run(self, session_id: str, run: Union[RunResponse, TeamRunResponse]) -> None:
         """Adds a RunResponse to the runs list."""
@@ -755,19 +894,21 @@ class Memory:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic", "hybrid"]] = None,
         user_id: Optional[str] = None,
         refresh_from_db: bool = True,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic", "semantic" or "hybrid".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
                 - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "semantic": Return memories most similar to the query, using the embeddings of the memory db
+                - "hybrid": Return the memories the model picks among the semantic search results
             user_id: The user to search for. Optional.
 
         Returns:
@@ -797,6 +938,27 @@ class Memory:
 
             return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
 
+        elif retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._search_user_memories_semantic(user_id=user_id, query=query, limit=limit)
+
+        elif retrieval_method == "hybrid":
+            if not query:
+                raise ValueError("Query is required for hybrid search")
+
+            # Only the memories closest to the query are sent to the model
+            candidates = self._search_user_memories_semantic(
+                user_id=user_id, query=query, limit=max((limit or 0) * 4, HYBRID_SEARCH_CANDIDATES)
+            )
+            return self._search_user_memories_agentic(
+                user_id=user_id,
+                query=query,
+                limit=limit,
+                candidates={memory.memory_id: memory for memory in candidates if memory.memory_id is not None},
+            )
+
         elif retrieval_method == "first_n":
             return self._get_first_n_memories(user_id=user_id, limit=limit)
 
@@ -819,9 +981,40 @@ class Memory:
         else:
             return {"type": "json_object"}
 
-    def _search_user_memories_agentic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
-        """Search through user memories using agentic search."""
-        if not self.memories:
+    def _search_user_memories_semantic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
+        """Search through user memories by the similarity of their embedding to the query."""
+        if self.db is None or self.db.embedder is None:
+            raise ValueError("Semantic search needs a memory db with an embedder")
+
+        log_debug("Searching for memories by similarity", center=True)
+        query_embedding = embed_query(self.db.embedder, query)
+        if not query_embedding:
+            log_warning("Could not embed the query, no memories found")
+            return []
+        rows = self.db.search_memories(
+            query_embedding=query_embedding, user_id=user_id, limit=limit or SEMANTIC_SEARCH_LIMIT
+        )
+
+        user_memories = self.memories.get(user_id, {}) if self.memories else {}
+        memories_to_return = []
+        for row in rows:
+            memory = user_memories.get(row.id) if row.id is not None else None
+            memories_to_return.append(memory or UserMemory.from_dict(dict(row.memory)))
+        return memories_to_return
+
+    def _search_user_memories_agentic(
+        self,
+        user_id: str,
+        query: str,
+        limit: Optional[int] = None,
+        candidates: Optional[Dict[str, UserMemory]] = None,
+    ) -> List[UserMemory]:
+        """Search through user memories using agentic search.
+
+        Args:
+            candidates: The memories to pick from. Defaults to all the memories of the user.
+        """
+        if candidates is None and not self.memories:
             return []
 
         model = self.get_model()
@@ -831,7 +1024,9 @@ class Memory:
         log_debug("Searching for memories", center=True)
 
         # Get all memories as a list
-        user_memories: Dict[str, UserMemory] = self.memories[user_id]
+        user_memories: Dict[str, UserMemory] = candidates if candidates is not None else self.memories[user_id]
+        if not user_memories:
+            return []
         system_message_str = "Your task is to search through user memories and return the IDs of the memories that are related to the query.\n"
         system_message_str += "\n<user_memories>\n"
         for memory in user_memories.values():
@@ -884,7 +1079,8 @@ class Memory:
         memories_to_return = []
         if memory_search:
             for memory_id in memory_search.memory_ids:
-                memories_to_return.append(user_memories[memory_id])
+                if memory_id in user_memories:
+                    memories_to_return.append(user_memories[memory_id])
         return memories_to_return[:limit]
 
     def _get_last_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
@@ -969,7 +1165,7 @@ class Memory:
 
         # Manually deepcopy fields that are known to be safe
         for field_name, field_value in self.__dict__.items():
-            if field_name not in ["db", "memory_manager", "summary_manager"]:
+            if field_name not in ["db", "memory_manager", "summary_manager", "job_queue"]:
                 try:
                     setattr(copied_obj, field_name, deepcopy(field_value))
                 except Exception as e:
@@ -979,6 +1175,7 @@ class Memory:
         copied_obj.db = self.db
         copied_obj.memory_manager = self.memory_manager
         copied_obj.summary_manager = self.summary_manager
+        copied_obj.job_queue = self.job_queue
 
         return copied_obj
 
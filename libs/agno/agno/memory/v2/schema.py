@@ -38,12 +38,15 @@ class SessionSummary:
     summary: str
     topics: Optional[List[str]] = None
     last_updated: Optional[datetime] = None
+    # Number of session runs covered by the summary. Later runs are folded in on the next update.
+    num_runs: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
         _dict = {
             "summary": self.summary,
             "topics": self.topics,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
+            "num_runs": self.num_runs,
         }
         return {k: v for k, v in _dict.items() if v is not None}
 
@@ -5,11 +5,13 @@ from typing import Any, Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
+from agno.memory.v2.schema import SessionSummary
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
+from agno.utils.tokens import ApproximateTokenizer, Tokenizer, count_message_tokens
 
 
 class SessionSummaryResponse(BaseModel):
@@ -42,17 +44,57 @@ class SessionSummarizer:
     # Whether the summarizer has created a summary
     summary_updated: bool = False
 
+    # If True, only the runs added since the last summary are sent to the model, with the previous summary to update.
+    # Otherwise the whole conversation is summarized again.
+    incremental: bool = False
+    # Update the summary once this many runs were added since the last summary
+    update_every_n_runs: Optional[int] = None
+    # Update the summary once the runs added since the last summary have this many tokens
+    # If neither is set, the summary is updated after every run.
+    update_every_n_tokens: Optional[int] = None
+    # Counts the tokens for `update_every_n_tokens`. Defaults to an approximate tokenizer.
+    tokenizer: Optional[Tokenizer] = None
+
     def __init__(
         self,
         model: Optional[Model] = None,
         system_message: Optional[str] = None,
         additional_instructions: Optional[str] = None,
+        incremental: bool = False,
+        update_every_n_runs: Optional[int] = None,
+        update_every_n_tokens: Optional[int] = None,
+        tokenizer: Optional[Tokenizer] = None,
     ):
         self.model = model
         if self.model is not None and isinstance(self.model, str):
             raise ValueError("Model must be a Model object, not a string")
         self.system_message = system_message
         self.additional_instructions = additional_instructions
+        self.incremental = incremental
+        self.update_every_n_runs = update_every_n_runs
+        self.update_every_n_tokens = update_every_n_tokens
+        self.tokenizer = tokenizer
+
+    def is_update_due(self, new_runs: List[List[Message]]) -> bool:
+        """Whether the runs added since the last summary are enough to update it
+
+        Args:
+            new_runs: The messages of each run added since the last summary.
+        """
+        new_runs = [run for run in new_runs if run]
+        if not new_runs:
+            return False
+        if self.update_every_n_runs is None and self.update_every_n_tokens is None:
+            return True
+        if self.update_every_n_runs is not None and len(new_runs) >= self.update_every_n_runs:
+            return True
+        if self.update_every_n_tokens is not None:
+            if self.tokenizer is None:
+                self.tokenizer = ApproximateTokenizer()
+            tokens = sum(count_message_tokens(message, self.tokenizer) for run in new_runs for message in run)
+            if tokens >= self.update_every_n_tokens:
+                return True
+        return False
 
     def get_response_format(self, model: Model) -> Union[Dict[str, Any], Type[BaseModel]]:
         if model.supports_native_structured_outputs:
@@ -70,20 +112,38 @@ class SessionSummarizer:
             return {"type": "json_object"}
 
     def get_system_message(
-        self, conversation: List[Message], response_format: Union[Dict[str, Any], Type[BaseModel]]
+        self,
+        conversation: List[Message],
+        response_format: Union[Dict[str, Any], Type[BaseModel]],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Message:
         if self.system_message is not None:
             return Message(role="system", content=self.system_message)
 
         # -*- Return a system message for summarization
-        system_prompt = dedent("""\
-        Analyze the following conversation between a user and an assistant, and extract the following details:
-          - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
-          - Topics (Optional[List[str]]): List the topics discussed in the session.
-        Keep the summary concise and to the point. Only include relevant information.
-
-        <conversation>
-        """)
+        if previous_summary is None:
+            system_prompt = dedent("""\
+            Analyze the following conversation between a user and an assistant, and extract the following details:
+              - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the session.
+            Keep the summary concise and to the point. Only include relevant information.
+
+            <conversation>
+            """)
+        else:
+            system_prompt = dedent("""\
+            Below is the summary of a session between a user and an assistant, and the messages of the session that came after it.
+            Update the summary with the new messages, and extract the following details:
+              - Summary (str): Provide a concise summary of the whole session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the whole session.
+            Keep the summary concise and to the point. Only include relevant information.
+
+            <previous_summary>
+            """)
+            system_prompt += previous_summary.summary
+            if previous_summary.topics:
+                system_prompt += f"\nTopics: {', '.join(previous_summary.topics)}"
+            system_prompt += "\n</previous_summary>\n\n<conversation>\n"
         conversation_messages = []
         for message in conversation:
             if message.role == "user":
@@ -104,6 +164,7 @@ class SessionSummarizer:
     def run(
         self,
         conversation: List[Message],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Optional[SessionSummaryResponse]:
         if self.model is None:
             log_error("No model provided for summary_manager")
@@ -120,7 +181,7 @@ class SessionSummarizer:
 
         # Prepare the List of messages to send to the Model
         messages_for_model: List[Message] = [
-            self.get_system_message(conversation, response_format=response_format),
+            self.get_system_message(conversation, response_format=response_format, previous_summary=previous_summary),
             # For models that require a non-system message
             Message(role="user", content="Provide the summary of the conversation."),
         ]
@@ -161,6 +222,7 @@ class SessionSummarizer:
     async def arun(
         self,
         conversation: List[Message],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Optional[SessionSummaryResponse]:
         if self.model is None:
             log_error("No model provided for summary_manager")
@@ -177,7 +239,7 @@ class SessionSummarizer:
 
         # Prepare the List of messages to send to the Model
         messages_for_model: List[Message] = [
-            self.get_system_message(conversation, response_format=response_format),
+            self.get_system_message(conversation, response_format=response_format, previous_summary=previous_summary),
             # For models that require a non-system message
             Message(role="user", content="Provide the summary of the conversation."),
         ]
@@ -397,7 +397,7 @@ class AwsBedrock(Model):
             stream_data (MessageData): The stream data.
         """
         tool_use: Dict[str, Any] = {}
-        content = []
+        content: List[Dict[str, Any]] = []
         tool_ids = []
 
         for response_delta in self.invoke_stream(
@@ -446,7 +446,7 @@ class AwsBedrock(Model):
                     tool_use = {}
                 else:
                     # Finish collecting text content
-                    content.append({"text": stream_data.response_content})
+                    content.append({"text": stream_data.response_content.getvalue()})
 
             elif "messageStop" in response_delta or "metadata" in response_delta:
                 body = response_delta.get("metadata") or response_delta.get("messageStop") or {}
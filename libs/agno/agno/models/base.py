@@ -1,6 +1,8 @@
 import asyncio
 import collections.abc
+import contextvars
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from types import AsyncGeneratorType, GeneratorType
 from typing import Any, AsyncGenerator, AsyncIterator, Dict, Iterator, List, Literal, Optional, Tuple, Type, Union
@@ -14,6 +16,7 @@ from agno.models.message import Citations, Message, MessageMetrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
 from agno.utils.log import log_debug, log_error, log_warning
+from agno.utils.stream import TextBuffer
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
@@ -21,13 +24,16 @@ from agno.utils.tools import get_function_call_for_tool_call, get_function_call_
 @dataclass
 class MessageData:
     response_role: Optional[Literal["system", "user", "assistant", "tool"]] = None
-    response_content: Any = ""
-    response_thinking: Any = ""
-    response_redacted_thinking: Any = ""
+    # Streamed text is accumulated in buffers and joined once when the stream ends
+    response_content: TextBuffer = field(default_factory=TextBuffer)
+    response_thinking: TextBuffer = field(default_factory=TextBuffer)
+    response_redacted_thinking: TextBuffer = field(default_factory=TextBuffer)
     response_citations: Optional[Citations] = None
     response_tool_calls: List[Dict[str, Any]] = field(default_factory=list)
 
     response_audio: Optional[AudioResponse] = None
+    response_audio_content: TextBuffer = field(default_factory=TextBuffer)
+    response_audio_transcript: TextBuffer = field(default_factory=TextBuffer)
     response_image: Optional[ImageArtifact] = None
 
     # Data from the provider that we might need on subsequent messages
@@ -306,6 +312,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
     ) -> ModelResponse:
         """
         Generate a response from the model.
@@ -346,6 +353,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    function_call_concurrency=tool_call_concurrency,
                 ):
                     if (
                         function_call_response.event
@@ -409,6 +417,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
     ) -> ModelResponse:
         """
         Generate an asynchronous response from the model.
@@ -448,6 +457,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    function_call_concurrency=tool_call_concurrency,
                 ):
                     if (
                         function_call_response.event
@@ -728,6 +738,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
     ) -> Iterator[ModelResponse]:
         """
         Generate a streaming response from the model.
@@ -758,16 +769,18 @@ class Model(ABC):
 
             # Populate assistant message from stream data
             if stream_data.response_content:
-                assistant_message.content = stream_data.response_content
+                assistant_message.content = stream_data.response_content.getvalue()
             if stream_data.response_thinking:
-                assistant_message.thinking = stream_data.response_thinking
+                assistant_message.thinking = stream_data.response_thinking.getvalue()
             if stream_data.response_redacted_thinking:
-                assistant_message.redacted_thinking = stream_data.response_redacted_thinking
+                assistant_message.redacted_thinking = stream_data.response_redacted_thinking.getvalue()
             if stream_data.response_provider_data:
                 assistant_message.provider_data = stream_data.response_provider_data
             if stream_data.response_citations:
                 assistant_message.citations = stream_data.response_citations
             if stream_data.response_audio:
+                stream_data.response_audio.content = stream_data.response_audio_content.getvalue()
+                stream_data.response_audio.transcript = stream_data.response_audio_transcript.getvalue()
                 assistant_message.audio_output = stream_data.response_audio
             if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                 assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
@@ -790,6 +803,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    function_call_concurrency=tool_call_concurrency,
                 ):
                     yield function_call_response
 
@@ -865,6 +879,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
     ) -> AsyncIterator[ModelResponse]:
         """
         Generate an asynchronous streaming response from the model.
@@ -896,14 +911,16 @@ class Model(ABC):
 
             # Populate assistant message from stream data
             if stream_data.response_content:
-                assistant_message.content = stream_data.response_content
+                assistant_message.content = stream_data.response_content.getvalue()
             if stream_data.response_thinking:
-                assistant_message.thinking = stream_data.response_thinking
+                assistant_message.thinking = stream_data.response_thinking.getvalue()
             if stream_data.response_redacted_thinking:
-                assistant_message.redacted_thinking = stream_data.response_redacted_thinking
+                assistant_message.redacted_thinking = stream_data.response_redacted_thinking.getvalue()
             if stream_data.response_provider_data:
                 assistant_message.provider_data = stream_data.response_provider_data
             if stream_data.response_audio:
+                stream_data.response_audio.content = stream_data.response_audio_content.getvalue()
+                stream_data.response_audio.transcript = stream_data.response_audio_transcript.getvalue()
                 assistant_message.audio_output = stream_data.response_audio
             if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                 assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
@@ -926,6 +943,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    function_call_concurrency=tool_call_concurrency,
                 ):
                     yield function_call_response
 
@@ -1019,10 +1037,8 @@ class Model(ABC):
             # Update the stream data with audio information
             if model_response_delta.audio.id is not None:
                 stream_data.response_audio.id = model_response_delta.audio.id  # type: ignore
-            if model_response_delta.audio.content is not None:
-                stream_data.response_audio.content += model_response_delta.audio.content  # type: ignore
-            if model_response_delta.audio.transcript is not None:
-                stream_data.response_audio.transcript += model_response_delta.audio.transcript  # type: ignore
+            stream_data.response_audio_content.append(model_response_delta.audio.content)
+            stream_data.response_audio_transcript.append(model_response_delta.audio.transcript)
             if model_response_delta.audio.expires_at is not None:
                 stream_data.response_audio.expires_at = model_response_delta.audio.expires_at
             if model_response_delta.audio.mime_type is not None:
@@ -1110,6 +1126,11 @@ class Model(ABC):
         kwargs = {}
         if timer is not None:
             kwargs["metrics"] = MessageMetrics(time=timer.elapsed)
+            if function_call.cache_hit is not None:
+                kwargs["metrics"].additional_metrics = {
+                    "tool_cache_hits": int(function_call.cache_hit),
+                    "tool_cache_misses": int(not function_call.cache_hit),
+                }
         return Message(
             role=self.tool_message_role,
             content=output if success else function_call.error,
@@ -1131,17 +1152,8 @@ class Model(ABC):
             tool_call_error=True,
         )
 
-    def run_function_call(
-        self,
-        function_call: FunctionCall,
-        function_call_results: List[Message],
-        additional_messages: Optional[List[Message]] = None,
-    ) -> Iterator[ModelResponse]:
-        # Start function call
-        function_call_timer = Timer()
-        function_call_timer.start()
-        # Yield a tool_call_started event
-        yield ModelResponse(
+    def _create_tool_call_started_response(self, function_call: FunctionCall) -> ModelResponse:
+        return ModelResponse(
             content=function_call.get_call_str(),
             tool_executions=[
                 ToolExecution(
@@ -1153,22 +1165,56 @@ class Model(ABC):
             event=ModelResponseEvent.tool_call_started.value,
         )
 
-        # Run function calls sequentially
-        function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
+    def _execute_in_worker(self, function_call: FunctionCall) -> FunctionExecutionResult:
+        """Execute a sync function call in a worker thread.
+
+        Generator results that are not streamed to the user are consumed in the worker as well, so they
+        don't block the caller.
+        """
+        function_execution_result = function_call.execute()
+        if not function_call.function.show_result and isinstance(
+            function_call.result, (GeneratorType, collections.abc.Iterator)
+        ):
+            function_call.result = iter(list(function_call.result))
+        return function_execution_result
+
+    def _execute_function_call(
+        self, function_call: FunctionCall, in_worker: bool = False
+    ) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
+        """Run a single function call and return its success status, timer, and the FunctionCall object."""
+        function_call_timer = Timer()
+        function_call_timer.start()
+        success: Union[bool, AgentRunException] = False
+
         try:
-            function_execution_result = function_call.execute()
-        except AgentRunException as a_exc:
-            # Update additional messages from function call
-            _handle_agent_exception(a_exc, additional_messages)
-            # Set function call success to False if an exception occurred
+            if in_worker:
+                function_execution_result = self._execute_in_worker(function_call)
+            else:
+                function_execution_result = function_call.execute()
+            success = function_execution_result.status == "success"
+        except AgentRunException as e:
+            success = e
         except Exception as e:
             log_error(f"Error executing function {function_call.function.name}: {e}")
             raise e
 
-        function_call_success = function_execution_result.status == "success"
-
-        # Stop function call timer
         function_call_timer.stop()
+        return success, function_call_timer, function_call
+
+    def _process_function_call_result(
+        self,
+        function_call: FunctionCall,
+        function_call_success: Union[bool, AgentRunException],
+        function_call_timer: Timer,
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+    ) -> Iterator[ModelResponse]:
+        # Handle AgentRunException
+        if isinstance(function_call_success, AgentRunException):
+            # Update additional messages from function call
+            _handle_agent_exception(function_call_success, additional_messages)
+            # Set function call success to False if an exception occurred
+            function_call_success = False
 
         # Process function call output
         function_call_output: str = ""
@@ -1206,6 +1252,57 @@ class Model(ABC):
         # Add function call to function call results
         function_call_results.append(function_call_result)
 
+    def run_function_call(
+        self,
+        function_call: FunctionCall,
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+    ) -> Iterator[ModelResponse]:
+        # Yield a tool_call_started event
+        yield self._create_tool_call_started_response(function_call)
+
+        function_call_success, function_call_timer, _ = self._execute_function_call(function_call)
+
+        yield from self._process_function_call_result(
+            function_call,
+            function_call_success,
+            function_call_timer,
+            function_call_results=function_call_results,
+            additional_messages=additional_messages,
+        )
+
+    def run_function_calls_in_parallel(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+        max_workers: int = 4,
+    ) -> Iterator[ModelResponse]:
+        """Run independent function calls in a thread pool, at most `max_workers` at a time.
+
+        The results are yielded and added to the function call results in the order of the function calls.
+        """
+        for fc in function_calls:
+            yield self._create_tool_call_started_response(fc)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(function_calls)), thread_name_prefix="agno-tool-call"
+        ) as executor:
+            # Tools run with the context variables of the caller, as they do with asyncio.to_thread
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._execute_function_call, fc, True)
+                for fc in function_calls
+            ]
+            for future in futures:
+                function_call_success, function_call_timer, fc = future.result()
+                yield from self._process_function_call_result(
+                    fc,
+                    function_call_success,
+                    function_call_timer,
+                    function_call_results=function_call_results,
+                    additional_messages=additional_messages,
+                )
+
     def run_function_calls(
         self,
         function_calls: List[FunctionCall],
@@ -1213,11 +1310,16 @@ class Model(ABC):
         additional_messages: Optional[List[Message]] = None,
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
+        function_call_concurrency: Optional[int] = None,
     ) -> Iterator[ModelResponse]:
         # Additional messages from function calls that will be added to the function call results
         if additional_messages is None:
             additional_messages = []
 
+        # With a concurrency above 1, the function calls that can run are collected and run in a thread pool
+        run_in_parallel = function_call_concurrency is not None and function_call_concurrency > 1
+        function_calls_to_run: List[FunctionCall] = []
+
         for fc in function_calls:
             if function_call_limit is not None:
                 current_function_call_count += 1
@@ -1301,10 +1403,28 @@ class Model(ABC):
                 # We don't execute the function calls here
                 continue
 
+            if run_in_parallel:
+                function_calls_to_run.append(fc)
+                continue
+
             yield from self.run_function_call(
                 function_call=fc, function_call_results=function_call_results, additional_messages=additional_messages
             )
 
+        if len(function_calls_to_run) > 1:
+            yield from self.run_function_calls_in_parallel(
+                function_calls=function_calls_to_run,
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
+                max_workers=function_call_concurrency or 1,
+            )
+        elif function_calls_to_run:
+            yield from self.run_function_call(
+                function_call=function_calls_to_run[0],
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
+            )
+
         # Add any additional messages at the end
         if additional_messages:
             function_call_results.extend(additional_messages)
@@ -1336,7 +1456,7 @@ class Model(ABC):
                 result = await function_call.aexecute()
                 success = result.status == "success"
             else:
-                result = await asyncio.to_thread(function_call.execute)
+                result = await asyncio.to_thread(self._execute_in_worker, function_call)
                 success = result.status == "success"
         except AgentRunException as e:
             success = e
@@ -1356,6 +1476,7 @@ class Model(ABC):
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
         skip_pause_check: bool = False,
+        function_call_concurrency: Optional[int] = None,
     ) -> AsyncIterator[ModelResponse]:
         # Additional messages from function calls that will be added to the function call results
         if additional_messages is None:
@@ -1480,8 +1601,17 @@ class Model(ABC):
                 )
             ]
 
+        # Limit the number of function calls running at the same time
+        semaphore = asyncio.Semaphore(function_call_concurrency) if function_call_concurrency else None
+
+        async def _arun_function_call(fc: FunctionCall) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
+            if semaphore is None:
+                return await self.arun_function_call(fc)
+            async with semaphore:
+                return await self.arun_function_call(fc)
+
         results = await asyncio.gather(
-            *(self.arun_function_call(fc) for fc in function_calls_to_run), return_exceptions=True
+            *(_arun_function_call(fc) for fc in function_calls_to_run), return_exceptions=True
         )
 
         # Process results
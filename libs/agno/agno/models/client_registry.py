@@ -0,0 +1,194 @@
+import asyncio
+import atexit
+import inspect
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from agno.utils.log import log_debug, log_warning
+
+ClientT = TypeVar("ClientT")
+
+
+@dataclass
+class HttpPoolLimits:
+    """Connection pool settings for the HTTP clients shared by models"""
+
+    # Maximum number of concurrent connections per pool
+    max_connections: int = 1000
+    # Maximum number of idle connections kept open per pool
+    max_keepalive_connections: int = 100
+    # Seconds an idle connection is kept open
+    keepalive_expiry: float = 30.0
+    # Use HTTP/2 when the `h2` package is installed
+    http2: bool = True
+
+    def httpx_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def use_http2(self) -> bool:
+        if not self.http2:
+            return False
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+
+def client_key(provider: str, **params: Any) -> str:
+    """Key for a client, from its provider and client parameters (base URL, credentials, headers...).
+
+    The parameters are hashed, so credentials are not kept in the key.
+    """
+    serialized = json.dumps(params, sort_keys=True, default=repr)
+    return f"{provider}:{sha256(serialized.encode()).hexdigest()}"
+
+
+class ClientRegistry:
+    """Process-wide registry of model provider clients and their HTTP connection pools.
+
+    Clients are created once per key and reused by every model instance with the same provider, base URL and
+    credentials, so model calls reuse open connections instead of paying for a new TCP and TLS handshake.
+
+    At most `max_clients` clients are kept, e.g. when every user brings their own credentials. The least recently
+    used clients are dropped beyond it, and closed unless their connections are shared.
+
+    Async clients are bound to the event loop they are used in, so they are kept per event loop and
+    dropped with their loop.
+    """
+
+    def __init__(self, limits: Optional[HttpPoolLimits] = None, max_clients: int = 128):
+        self.limits: HttpPoolLimits = limits or HttpPoolLimits()
+        self.max_clients: int = max_clients
+        # Reentrant, as client factories get their HTTP client from the registry
+        self._lock = threading.RLock()
+        self._clients: "OrderedDict[str, Any]" = OrderedDict()
+        # Keys of the clients closed when they are dropped
+        self._closed_on_evict: Set[str] = set()
+        # HTTP clients are kept per provider and base URL and shared by their clients, so they are never dropped
+        self._http_clients: Dict[str, httpx.Client] = {}
+        self._async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = WeakKeyDictionary()
+
+    def configure(self, limits: HttpPoolLimits) -> None:
+        """Set the pool limits of the HTTP clients created from now on"""
+        self.limits = limits
+
+    def _loop_clients(self) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        clients = self._async_clients.get(loop)
+        if clients is None:
+            clients = {}
+            self._async_clients[loop] = clients
+        return clients
+
+    def get_client(self, key: str, factory: Callable[[], ClientT], close_on_evict: bool = True) -> ClientT:
+        """Get the client for `key`, creating it with `factory` if needed.
+
+        Set `close_on_evict` to False for clients built on a shared HTTP client, as closing them closes it.
+        """
+        evicted: List[Any] = []
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or _is_closed(client):
+                log_debug(f"Creating shared client: {key.split(':')[0]}")
+                client = factory()
+                self._clients[key] = client
+                if close_on_evict:
+                    self._closed_on_evict.add(key)
+                else:
+                    self._closed_on_evict.discard(key)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.max_clients:
+                evicted_key, evicted_client = self._clients.popitem(last=False)
+                if evicted_key in self._closed_on_evict:
+                    self._closed_on_evict.discard(evicted_key)
+                    evicted.append(evicted_client)
+        for evicted_client in evicted:
+            _close_client(evicted_client)
+        return client
+
+    def get_async_client(self, key: str, factory: Callable[[], ClientT]) -> ClientT:
+        """Get the async client for `key` in the running event loop, creating it with `factory` if needed"""
+        with self._lock:
+            clients = self._loop_clients()
+            client = clients.get(key)
+            if client is None or _is_closed(client):
+                log_debug(f"Creating shared async client: {key.split(':')[0]}")
+                client = factory()
+                clients[key] = client
+            return client
+
+    def get_http_client(self, key: str, **kwargs: Any) -> httpx.Client:
+        """Shared httpx.Client for `key`, with the registry's pool limits. kwargs are passed to httpx.Client."""
+        with self._lock:
+            client = self._http_clients.get(key)
+            if client is None or client.is_closed:
+                log_debug(f"Creating shared HTTP client: {key.split(':')[0]}")
+                client = httpx.Client(limits=self.limits.httpx_limits(), http2=self.limits.use_http2(), **kwargs)
+                self._http_clients[key] = client
+            return client
+
+    def get_async_http_client(self, key: str, **kwargs: Any) -> httpx.AsyncClient:
+        """Shared httpx.AsyncClient for `key` in the running event loop. kwargs are passed to httpx.AsyncClient."""
+        return self.get_async_client(
+            f"httpx:{key}",
+            lambda: httpx.AsyncClient(limits=self.limits.httpx_limits(), http2=self.limits.use_http2(), **kwargs),
+        )
+
+    def close(self) -> None:
+        """Close the sync clients and forget all clients. Registered to run at interpreter exit."""
+        with self._lock:
+            clients = list(self._clients.values()) + list(self._http_clients.values())
+            self._clients = OrderedDict()
+            self._closed_on_evict = set()
+            self._http_clients = {}
+            self._async_clients = WeakKeyDictionary()
+        for client in clients:
+            _close_client(client)
+
+    async def aclose(self) -> None:
+        """Close the async clients of the running event loop, e.g. in the shutdown hook of an async server"""
+        with self._lock:
+            clients = self._async_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            close = getattr(client, "aclose", None) or getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                log_warning(f"Error closing async client: {e}")
+
+
+def _close_client(client: Any) -> None:
+    close = getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception as e:
+        log_warning(f"Error closing client: {e}")
+
+
+def _is_closed(client: Any) -> bool:
+    is_closed = getattr(client, "is_closed", None)
+    if callable(is_closed):
+        return bool(is_closed())
+    return bool(is_closed)
+
+
+client_registry = ClientRegistry()
+atexit.register(client_registry.close)
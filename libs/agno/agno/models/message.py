@@ -1,5 +1,5 @@
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from time import time
 from typing import Any, Dict, List, Optional, Sequence, Union
 
@@ -7,6 +7,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from agno.media import Audio, AudioResponse, File, Image, ImageArtifact, Video
 from agno.utils.log import log_debug, log_error, log_info, log_warning
+from agno.utils.serialize import shallow_asdict
 from agno.utils.timer import Timer
 
 
@@ -74,8 +75,7 @@ class MessageMetrics:
     timer: Optional[Timer] = None
 
     def _to_dict(self) -> Dict[str, Any]:
-        metrics_dict = asdict(self)
-        metrics_dict.pop("timer")
+        metrics_dict = shallow_asdict(self, exclude=("timer",))
         metrics_dict = {
             k: v
             for k, v in metrics_dict.items()
@@ -9,6 +9,7 @@ try:
 except ImportError:
     raise ImportError("`openai` not installed. Please install using `pip install openai`")
 
+from agno.models.client_registry import client_registry
 from agno.models.meta.llama import Message
 from agno.models.openai.like import OpenAILike
 from agno.utils.models.llama import format_message
@@ -61,14 +62,15 @@ class LlamaOpenAI(OpenAILike):
         return format_message(message, openai_like=True)
 
     def get_async_client(self):
-        """Override to provide custom httpx client that properly handles redirects"""
+        """Override to use a shared httpx client with a longer timeout"""
         client_params = self._get_client_params()
 
-        # Llama gives a 307 redirect error, so we need to set up a custom client to allow redirects
-        client_params["http_client"] = httpx.AsyncClient(
-            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
-            follow_redirects=True,
-            timeout=httpx.Timeout(30.0),
-        )
+        # Llama gives a 307 redirect error, so the shared client follows redirects
+        def create_client() -> AsyncOpenAIClient:
+            http_client = client_registry.get_async_http_client(
+                self._http_pool_key(), follow_redirects=True, timeout=httpx.Timeout(30.0)
+            )
+            params: Dict[str, Any] = {**client_params, "http_client": http_client}
+            return AsyncOpenAIClient(**params)
 
-        return AsyncOpenAIClient(**client_params)
+        return client_registry.get_async_client(self._client_key(client_params), create_client)
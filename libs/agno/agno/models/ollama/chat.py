@@ -5,6 +5,7 @@ from typing import Any, Dict, Iterator, List, Mapping, Optional, Type, Union
 from pydantic import BaseModel
 
 from agno.models.base import Model
+from agno.models.client_registry import client_key, client_registry
 from agno.models.message import Message
 from agno.models.response import ModelResponse
 from agno.utils.log import log_debug, log_warning
@@ -82,7 +83,10 @@ class Ollama(Model):
         if self.async_client is not None:
             return self.async_client
 
-        return AsyncOllamaClient(**self._get_client_params())
+        client_params = self._get_client_params()
+        return client_registry.get_async_client(
+            client_key(self.__class__.__name__, **client_params), lambda: AsyncOllamaClient(**client_params)
+        )
 
     def get_request_kwargs(
         self,
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 from agno.exceptions import ModelProviderError
 from agno.media import AudioResponse
 from agno.models.base import Model
+from agno.models.client_registry import client_key, client_registry
 from agno.models.message import Message
 from agno.models.response import ModelResponse
 from agno.utils.log import log_error, log_warning
@@ -114,9 +115,16 @@ class OpenAIChat(Model):
             client_params.update(self.client_params)
         return client_params
 
+    def _client_key(self, client_params: Dict[str, Any]) -> str:
+        return client_key(self.__class__.__name__, **client_params)
+
+    def _http_pool_key(self) -> str:
+        # Connection pools are shared by all clients of a provider and base URL, whatever their credentials
+        return f"{self.__class__.__name__}:{self.base_url or ''}"
+
     def get_client(self) -> OpenAIClient:
         """
-        Returns an OpenAI client.
+        Returns an OpenAI client, shared by all models with the same client parameters.
 
         Returns:
             OpenAIClient: An instance of the OpenAI client.
@@ -124,11 +132,21 @@ class OpenAIChat(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
-        return OpenAIClient(**client_params)
+
+        def create_client() -> OpenAIClient:
+            params = dict(client_params)
+            params.setdefault(
+                "http_client", client_registry.get_http_client(self._http_pool_key(), follow_redirects=True)
+            )
+            return OpenAIClient(**params)
+
+        # The HTTP client is shared with other clients, so an evicted client is dropped without closing it
+        return client_registry.get_client(self._client_key(client_params), create_client, close_on_evict=False)
 
     def get_async_client(self) -> AsyncOpenAIClient:
         """
-        Returns an asynchronous OpenAI client.
+        Returns an asynchronous OpenAI client, shared by all models with the same client parameters
+        in the running event loop.
 
         Returns:
             AsyncOpenAIClient: An instance of the asynchronous OpenAI client.
@@ -136,12 +154,15 @@ class OpenAIChat(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+        def create_client() -> AsyncOpenAIClient:
+            params = dict(client_params)
+            params.setdefault(
+                "http_client", client_registry.get_async_http_client(self._http_pool_key(), follow_redirects=True)
             )
-        return AsyncOpenAIClient(**client_params)
+            return AsyncOpenAIClient(**params)
+
+        return client_registry.get_async_client(self._client_key(client_params), create_client)
 
     def get_request_kwargs(
         self,
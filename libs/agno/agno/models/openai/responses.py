@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from agno.exceptions import ModelProviderError
 from agno.media import File
 from agno.models.base import MessageData, Model, _add_usage_metrics_to_assistant_message
+from agno.models.client_registry import client_key, client_registry
 from agno.models.message import Citations, Message, UrlCitation
 from agno.models.response import ModelResponse
 from agno.utils.log import log_debug, log_error, log_warning
@@ -111,7 +112,7 @@ class OpenAIResponses(Model):
 
     def get_client(self) -> OpenAI:
         """
-        Returns an OpenAI client.
+        Returns an OpenAI client, shared by all models with the same client parameters.
 
         Returns:
             OpenAI: An instance of the OpenAI client.
@@ -123,30 +124,50 @@ class OpenAIResponses(Model):
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
 
-        self.client = OpenAI(**client_params)
+        def create_client() -> OpenAI:
+            params = dict(client_params)
+            params.setdefault(
+                "http_client",
+                client_registry.get_http_client(
+                    f"{self.__class__.__name__}:{self.base_url or ''}", follow_redirects=True
+                ),
+            )
+            return OpenAI(**params)
+
+        # The HTTP client is shared with other clients, so an evicted client is dropped without closing it
+        self.client = client_registry.get_client(
+            client_key(self.__class__.__name__, **client_params), create_client, close_on_evict=False
+        )
         return self.client
 
     def get_async_client(self) -> AsyncOpenAI:
         """
-        Returns an asynchronous OpenAI client.
+        Returns an asynchronous OpenAI client, shared by all models with the same client parameters
+        in the running event loop.
 
         Returns:
             AsyncOpenAI: An instance of the asynchronous OpenAI client.
         """
+        # A client set on the model is used as is. Shared clients are not stored on the model, as they are
+        # bound to the event loop they were created in.
         if self.async_client:
             return self.async_client
 
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+        def create_client() -> AsyncOpenAI:
+            params = dict(client_params)
+            params.setdefault(
+                "http_client",
+                client_registry.get_async_http_client(
+                    f"{self.__class__.__name__}:{self.base_url or ''}", follow_redirects=True
+                ),
             )
+            return AsyncOpenAI(**params)
 
-        self.async_client = AsyncOpenAI(**client_params)
-        return self.async_client
+        return client_registry.get_async_client(client_key(self.__class__.__name__, **client_params), create_client)
 
     def get_request_params(
         self,
@@ -0,0 +1,134 @@
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from agno.models.message import Message
+from agno.run.messages import RunMessages
+from agno.utils.log import log_debug, log_warning
+from agno.utils.tokens import ApproximateTokenizer, Tokenizer, count_message_tokens
+
+
+@dataclass
+class ContextUsage:
+    """Token accounting of the messages sent to the model in a run"""
+
+    # The token budget of the messages, if any
+    max_tokens: Optional[int] = None
+    # Tokens of the system message
+    system_tokens: int = 0
+    # Tokens of the messages added from history
+    history_tokens: int = 0
+    # Tokens of the other messages: the user message and extra messages
+    input_tokens: int = 0
+    # Tokens of all messages
+    total_tokens: int = 0
+    # Number of messages added from history
+    history_messages: int = 0
+    # Number of history messages left out to fit the budget
+    dropped_history_messages: int = 0
+    # Number of messages truncated to fit the budget
+    truncated_messages: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class ContextBudget:
+    """Token budget for the messages sent to the model.
+
+    History is selected from the most recent runs until the budget is used, long tool results in history are
+    truncated, and knowledge references added to the user message are truncated.
+    Tokens are counted locally with `tokenizer`, which defaults to a fast approximate tokenizer.
+    """
+
+    # Maximum number of tokens of the messages sent to the model,
+    # e.g. the context window of the model minus the tokens reserved for its response
+    max_tokens: Optional[int] = None
+    # Maximum number of tokens of each tool result added from history
+    max_tool_result_tokens: Optional[int] = None
+    # Maximum number of tokens of the knowledge references added to the user message
+    max_references_tokens: Optional[int] = None
+    # Counts tokens. Use a tokenizer matching the model, e.g. TiktokenTokenizer, for exact counts.
+    tokenizer: Optional[Tokenizer] = None
+
+    def get_tokenizer(self) -> Tokenizer:
+        if self.tokenizer is None:
+            self.tokenizer = ApproximateTokenizer()
+        return self.tokenizer
+
+    def count(self, message: Message) -> int:
+        return count_message_tokens(message, self.get_tokenizer())
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Truncate `text` to `max_tokens` tokens, noting that it was truncated"""
+        tokenizer = self.get_tokenizer()
+        if tokenizer.count(text) <= max_tokens:
+            return text
+        return tokenizer.truncate(text, max_tokens) + "\n[truncated]"
+
+    def truncate_references(self, references: str) -> str:
+        if self.max_references_tokens is None:
+            return references
+        return self.truncate(references, self.max_references_tokens)
+
+    def _truncate_tool_result(self, message: Message) -> bool:
+        if self.max_tool_result_tokens is None or message.role != "tool" or not isinstance(message.content, str):
+            return False
+        truncated = self.truncate(message.content, self.max_tool_result_tokens)
+        if truncated is message.content:
+            return False
+        message.content = truncated
+        return True
+
+    def fit(self, run_messages: RunMessages, user_message_role: str = "user") -> ContextUsage:
+        """Fit the messages of a run to the budget.
+
+        History messages must be copies, as they are truncated in place. Whole runs are left out of the history,
+        oldest first, so tool calls stay with their results.
+
+        Returns:
+            ContextUsage: The token accounting of the messages.
+        """
+        usage = ContextUsage(max_tokens=self.max_tokens)
+        history: List[Message] = [m for m in run_messages.messages if m.from_history]
+
+        # History tool results are sent again on every turn, so they are truncated.
+        # Tool results of the current run reach the model in full.
+        for message in history:
+            if self._truncate_tool_result(message):
+                usage.truncated_messages += 1
+
+        tokens = {id(message): self.count(message) for message in run_messages.messages}
+        for message in run_messages.messages:
+            if message.from_history:
+                usage.history_tokens += tokens[id(message)]
+            elif message is run_messages.system_message:
+                usage.system_tokens += tokens[id(message)]
+            else:
+                usage.input_tokens += tokens[id(message)]
+
+        if self.max_tokens is not None and history:
+            # Split the history in runs, each starting with a user message
+            runs: List[List[Message]] = []
+            for message in history:
+                if not runs or message.role == user_message_role:
+                    runs.append([])
+                runs[-1].append(message)
+
+            available = self.max_tokens - usage.system_tokens - usage.input_tokens
+            dropped: List[Message] = []
+            while runs and usage.history_tokens > available:
+                for message in runs.pop(0):
+                    dropped.append(message)
+                    usage.history_tokens -= tokens[id(message)]
+            if dropped:
+                dropped_ids = {id(message) for message in dropped}
+                run_messages.messages = [m for m in run_messages.messages if id(m) not in dropped_ids]
+                usage.dropped_history_messages = len(dropped)
+                log_debug(f"Left out {len(dropped)} history messages to fit the budget of {self.max_tokens} tokens")
+
+        usage.history_messages = len(history) - usage.dropped_history_messages
+        usage.total_tokens = usage.system_tokens + usage.history_tokens + usage.input_tokens
+        if self.max_tokens is not None and usage.total_tokens > self.max_tokens:
+            log_warning(f"Messages use {usage.total_tokens} tokens, over the budget of {self.max_tokens} tokens")
+        return usage
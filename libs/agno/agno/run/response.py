@@ -1,7 +1,7 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
 from enum import Enum
 from time import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -10,6 +10,7 @@ from agno.models.message import Citations, Message, MessageReferences
 from agno.models.response import ToolExecution
 from agno.reasoning.step import ReasoningStep
 from agno.utils.log import logger
+from agno.utils.serialize import shallow_asdict, to_json
 
 
 class RunEvent(str, Enum):
@@ -43,9 +44,11 @@ class RunResponseExtraData:
     add_messages: Optional[List[Message]] = None
     reasoning_steps: Optional[List[ReasoningStep]] = None
     reasoning_messages: Optional[List[Message]] = None
+    # Token accounting of the messages sent to the model, when the agent has a context budget
+    context_usage: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {}
+        _dict: Dict[str, Any] = {}
         if self.add_messages is not None:
             _dict["add_messages"] = [m.to_dict() for m in self.add_messages]
         if self.reasoning_messages is not None:
@@ -54,6 +57,8 @@ class RunResponseExtraData:
             _dict["reasoning_steps"] = [rs.model_dump() for rs in self.reasoning_steps]
         if self.references is not None:
             _dict["references"] = [r.model_dump() for r in self.references]
+        if self.context_usage is not None:
+            _dict["context_usage"] = self.context_usage
         return _dict
 
     @classmethod
@@ -77,6 +82,7 @@ class RunResponseExtraData:
             reasoning_steps=reasoning_steps,
             reasoning_messages=reasoning_messages,
             references=references,
+            context_usage=data.pop("context_usage", None),
         )
 
 
@@ -125,80 +131,75 @@ class RunResponse:
     def tools_awaiting_external_execution(self):
         return [t for t in self.tools if t.external_execution_required] if self.tools else []
 
-    def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k not in ["messages", "tools", "extra_data", "images", "videos", "audio", "response_audio", "citations"]
-        }
-        if self.messages is not None:
-            _dict["messages"] = [m.to_dict() for m in self.messages]
-
-        if self.extra_data is not None:
+    def to_dict(self, include: Optional[Collection[str]] = None) -> Dict[str, Any]:
+        """Get the response as a dictionary, leaving out the fields that are None.
+
+        The fields are not deep-copied, only the messages, tools, media and structured content are converted.
+
+        Args:
+            include: Only get these fields, e.g. the fields that change between streamed chunks. Defaults to all fields.
+        """
+        _dict = shallow_asdict(self, include=include, exclude_none=True)
+        if "messages" in _dict:
+            _dict["messages"] = [m.to_dict() for m in self.messages]  # type: ignore
+
+        if "extra_data" in _dict:
             _dict["extra_data"] = (
                 self.extra_data.to_dict() if isinstance(self.extra_data, RunResponseExtraData) else self.extra_data
             )
 
-        if self.images is not None:
-            _dict["images"] = []
-            for img in self.images:
-                if isinstance(img, ImageArtifact):
-                    _dict["images"].append(img.to_dict())
-                else:
-                    _dict["images"].append(img)
-
-        if self.videos is not None:
-            _dict["videos"] = []
-            for vid in self.videos:
-                if isinstance(vid, VideoArtifact):
-                    _dict["videos"].append(vid.to_dict())
-                else:
-                    _dict["videos"].append(vid)
-
-        if self.audio is not None:
-            _dict["audio"] = []
-            for aud in self.audio:
-                if isinstance(aud, AudioArtifact):
-                    _dict["audio"].append(aud.to_dict())
-                else:
-                    _dict["audio"].append(aud)
-
-        if self.response_audio is not None:
-            if isinstance(self.response_audio, AudioResponse):
-                _dict["response_audio"] = self.response_audio.to_dict()
-            else:
-                _dict["response_audio"] = self.response_audio
-
-        if self.citations is not None:
-            if isinstance(self.citations, Citations):
-                _dict["citations"] = self.citations.model_dump(exclude_none=True)
-            else:
-                _dict["citations"] = self.citations
-
-        if self.content and isinstance(self.content, BaseModel):
-            _dict["content"] = self.content.model_dump(exclude_none=True)
-
-        if self.tools is not None:
-            _dict["tools"] = []
-            for tool in self.tools:
-                if isinstance(tool, ToolExecution):
-                    _dict["tools"].append(tool.to_dict())
-                else:
-                    _dict["tools"].append(tool)
+        if "images" in _dict:
+            _dict["images"] = [
+                img.to_dict() if isinstance(img, ImageArtifact) else img
+                for img in self.images  # type: ignore
+            ]
+
+        if "videos" in _dict:
+            _dict["videos"] = [
+                vid.to_dict() if isinstance(vid, VideoArtifact) else vid
+                for vid in self.videos  # type: ignore
+            ]
+
+        if "audio" in _dict:
+            _dict["audio"] = [
+                aud.to_dict() if isinstance(aud, AudioArtifact) else aud
+                for aud in self.audio  # type: ignore
+            ]
+
+        if "response_audio" in _dict and isinstance(self.response_audio, AudioResponse):
+            _dict["response_audio"] = self.response_audio.to_dict()
+
+        if "citations" in _dict and isinstance(self.citations, Citations):
+            _dict["citations"] = self.citations.model_dump(exclude_none=True)
+
+        if "content" in _dict:
+            if isinstance(self.content, BaseModel):
+                _dict["content"] = self.content.model_dump(exclude_none=True)
+            elif is_dataclass(self.content) and not isinstance(self.content, type):
+                _dict["content"] = asdict(self.content)
+
+        if "tools" in _dict:
+            _dict["tools"] = [
+                tool.to_dict() if isinstance(tool, ToolExecution) else tool
+                for tool in self.tools  # type: ignore
+            ]
 
         return _dict
 
-    def to_json(self) -> str:
-        import json
+    def to_json(self, indent: Optional[int] = 2, include: Optional[Collection[str]] = None) -> str:
+        """Get the response as JSON.
 
+        Args:
+            indent: Number of spaces to indent with. Use None for compact JSON, e.g. for streamed chunks.
+            include: Only serialize these fields. Defaults to all fields.
+        """
         try:
-            _dict = self.to_dict()
+            _dict = self.to_dict(include=include)
         except Exception:
             logger.error("Failed to convert response to json", exc_info=True)
             raise
 
-        return json.dumps(_dict, indent=2)
+        return to_json(_dict, indent=indent)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RunResponse":
@@ -219,3 +220,33 @@ class RunResponse:
             return self.content.model_dump_json(exclude_none=True, **kwargs)
         else:
             return json.dumps(self.content, **kwargs)
+
+
+@dataclass(init=False)
+class RunResponseDelta(RunResponse):
+    """A streamed chunk of a run: only carries the new content, thinking, audio or citations and the event metadata.
+
+    The other fields keep their defaults, so a delta is cheap to create for every streamed token.
+    """
+
+    def __init__(
+        self,
+        content: Optional[Any] = None,
+        thinking: Optional[str] = None,
+        response_audio: Optional[AudioResponse] = None,
+        citations: Optional[Citations] = None,
+        event: str = RunEvent.run_response.value,
+        run_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        created_at: Optional[int] = None,
+    ):
+        self.content = content
+        self.thinking = thinking
+        self.response_audio = response_audio
+        self.citations = citations
+        self.event = event
+        self.run_id = run_id
+        self.agent_id = agent_id
+        self.session_id = session_id
+        self.created_at = created_at if created_at is not None else int(time())
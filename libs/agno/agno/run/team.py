@@ -1,6 +1,6 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
 from time import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Collection, Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -8,6 +8,7 @@ from agno.media import AudioArtifact, AudioResponse, ImageArtifact, VideoArtifac
 from agno.models.message import Citations, Message
 from agno.models.response import ToolExecution
 from agno.run.response import RunEvent, RunResponse, RunResponseExtraData
+from agno.utils.serialize import shallow_asdict, to_json
 
 
 @dataclass
@@ -46,59 +47,62 @@ class TeamRunResponse:
     extra_data: Optional[RunResponseExtraData] = None
     created_at: int = field(default_factory=lambda: int(time()))
 
-    def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k not in ["messages", "tools", "extra_data", "images", "videos", "audio", "response_audio", "citations"]
-        }
-        if self.messages is not None:
-            _dict["messages"] = [m.to_dict() for m in self.messages]
+    def to_dict(self, include: Optional[Collection[str]] = None) -> Dict[str, Any]:
+        """Get the response as a dictionary, leaving out the fields that are None.
 
-        if self.extra_data is not None:
-            _dict["extra_data"] = self.extra_data.to_dict()
+        Args:
+            include: Only get these fields. Defaults to all fields.
+        """
+        _dict = shallow_asdict(self, include=include, exclude_none=True)
+        if "messages" in _dict:
+            _dict["messages"] = [m.to_dict() for m in self.messages]  # type: ignore
 
-        if self.images is not None:
-            _dict["images"] = [img.to_dict() for img in self.images]
+        if "extra_data" in _dict:
+            _dict["extra_data"] = self.extra_data.to_dict()  # type: ignore
 
-        if self.videos is not None:
-            _dict["videos"] = [vid.to_dict() for vid in self.videos]
+        if "images" in _dict:
+            _dict["images"] = [img.to_dict() for img in self.images]  # type: ignore
 
-        if self.audio is not None:
-            _dict["audio"] = [aud.to_dict() for aud in self.audio]
+        if "videos" in _dict:
+            _dict["videos"] = [vid.to_dict() for vid in self.videos]  # type: ignore
 
-        if self.response_audio is not None:
-            _dict["response_audio"] = self.response_audio.to_dict()
+        if "audio" in _dict:
+            _dict["audio"] = [aud.to_dict() for aud in self.audio]  # type: ignore
 
-        if self.member_responses:
-            _dict["member_responses"] = [response.to_dict() for response in self.member_responses]
+        if "response_audio" in _dict:
+            _dict["response_audio"] = self.response_audio.to_dict()  # type: ignore
 
-        if self.citations is not None:
-            if isinstance(self.citations, Citations):
-                _dict["citations"] = self.citations.model_dump(exclude_none=True)
+        if "member_responses" in _dict:
+            if self.member_responses:
+                _dict["member_responses"] = [response.to_dict() for response in self.member_responses]
             else:
-                _dict["citations"] = self.citations
+                _dict.pop("member_responses")
 
-        if self.content and isinstance(self.content, BaseModel):
-            _dict["content"] = self.content.model_dump(exclude_none=True)
+        if "citations" in _dict and isinstance(self.citations, Citations):
+            _dict["citations"] = self.citations.model_dump(exclude_none=True)
 
-        if self.tools is not None:
-            _dict["tools"] = []
-            for tool in self.tools:
-                if isinstance(tool, ToolExecution):
-                    _dict["tools"].append(tool.to_dict())
-                else:
-                    _dict["tools"].append(tool)
+        if "content" in _dict:
+            if isinstance(self.content, BaseModel):
+                _dict["content"] = self.content.model_dump(exclude_none=True)
+            elif is_dataclass(self.content) and not isinstance(self.content, type):
+                _dict["content"] = asdict(self.content)
 
-        return _dict
+        if "tools" in _dict:
+            _dict["tools"] = [
+                tool.to_dict() if isinstance(tool, ToolExecution) else tool
+                for tool in self.tools  # type: ignore
+            ]
 
-    def to_json(self) -> str:
-        import json
+        return _dict
 
-        _dict = self.to_dict()
+    def to_json(self, indent: Optional[int] = 2, include: Optional[Collection[str]] = None) -> str:
+        """Get the response as JSON.
 
-        return json.dumps(_dict, indent=2)
+        Args:
+            indent: Number of spaces to indent with. Use None for compact JSON, e.g. for streamed chunks.
+            include: Only serialize these fields. Defaults to all fields.
+        """
+        return to_json(self.to_dict(include=include), indent=indent)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TeamRunResponse":
@@ -171,3 +175,33 @@ class TeamRunResponse:
             if self.audio is None:
                 self.audio = []
             self.audio.extend(run_response.audio)
+
+
+@dataclass(init=False)
+class TeamRunResponseDelta(TeamRunResponse):
+    """A streamed chunk of a team run: only carries the new content, thinking, audio or citations and the event
+    metadata. The other fields keep their defaults.
+    """
+
+    def __init__(
+        self,
+        content: Optional[Any] = None,
+        thinking: Optional[str] = None,
+        response_audio: Optional[AudioResponse] = None,
+        citations: Optional[Citations] = None,
+        event: str = RunEvent.run_response.value,
+        run_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        created_at: Optional[int] = None,
+    ):
+        self.content = content
+        self.thinking = thinking
+        self.response_audio = response_audio
+        self.citations = citations
+        self.event = event
+        self.run_id = run_id
+        self.team_id = team_id
+        self.session_id = session_id
+        self.member_responses = []
+        self.created_at = created_at if created_at is not None else int(time())
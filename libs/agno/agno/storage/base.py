@@ -1,7 +1,12 @@
+import asyncio
+import json
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from copy import deepcopy
+from typing import Dict, List, Literal, Optional, Sequence
 
+from agno.storage.listing import SessionPage, get_listing_fields, paginate, project_session
 from agno.storage.session import Session
+from agno.utils.log import log_debug, logger
 
 
 class Storage(ABC):
@@ -43,6 +48,37 @@ class Storage(ABC):
     ) -> List[Session]:
         raise NotImplementedError
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List sessions newest first, without loading their runs and messages.
+
+        Storages answer it from indexed columns or indexes where they can. This default implementation reads
+        all sessions.
+
+        Args:
+            user_id: Only list the sessions of this user.
+            entity_id: Only list the sessions of this agent, team or workflow.
+            limit: Maximum number of sessions in the page. All sessions are listed if None.
+            cursor: The next_cursor of the previous page.
+            fields: Session fields to list besides session_id, user_id, the entity id, created_at and updated_at,
+                e.g. "session_data", or "first_run" for the first run of the session.
+
+        Returns:
+            SessionPage: The listed sessions, as dicts, and the cursor of the next page.
+        """
+        listing_fields = get_listing_fields(self.mode, fields)
+        sessions = [
+            project_session(session.to_dict(), listing_fields)
+            for session in self.get_all_sessions(user_id=user_id, entity_id=entity_id)
+        ]
+        return paginate(sessions, limit=limit, cursor=cursor)
+
     @abstractmethod
     def upsert(self, session: Session) -> Optional[Session]:
         raise NotImplementedError
@@ -58,3 +94,103 @@ class Storage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    # --- Async API ---
+    # By default the sync methods are run in a thread, so they do not block the event loop.
+    # Storages with an async driver override these methods.
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        return await asyncio.to_thread(self.read, session_id, user_id)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        return await asyncio.to_thread(self.get_all_session_ids, user_id, entity_id)
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        return await asyncio.to_thread(self.get_all_sessions, user_id, entity_id)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        return await asyncio.to_thread(self.get_recent_sessions, user_id, entity_id, limit)
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        return await asyncio.to_thread(self.list_sessions, user_id, entity_id, limit, cursor, fields)
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        return await asyncio.to_thread(self.upsert, session)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        return await asyncio.to_thread(self.delete_session, session_id)
+
+    # --- Write-behind ---
+
+    @property
+    def _pending_writes(self) -> Dict[str, "asyncio.Task[Optional[Session]]"]:
+        # Created lazily, so storages that do not call Storage.__init__() still support write-behind
+        if not hasattr(self, "_pending_writes_by_session"):
+            self._pending_writes_by_session: Dict[str, "asyncio.Task[Optional[Session]]"] = {}
+        return self._pending_writes_by_session
+
+    def upsert_in_background(self, session: Session) -> "asyncio.Task[Optional[Session]]":
+        """Schedule an upsert of the session on the running event loop and return without waiting for it.
+
+        Writes to the same session are applied in the order they were scheduled.
+        Call aflush() before the event loop stops, so pending writes are not lost.
+        """
+        # Take a snapshot, so changes made to the session after this call are not persisted by this write
+        session = self._snapshot_session(session)
+        session_id = session.session_id
+        previous = self._pending_writes.get(session_id)
+        task = asyncio.create_task(self._upsert_after(previous, session))
+        self._pending_writes[session_id] = task
+
+        def _forget(done: "asyncio.Task[Optional[Session]]") -> None:
+            if self._pending_writes.get(session_id) is done:
+                del self._pending_writes[session_id]
+
+        task.add_done_callback(_forget)
+        return task
+
+    @staticmethod
+    def _snapshot_session(session: Session) -> Session:
+        # A JSON round trip copies the session much faster than deepcopy(). Storages persist sessions as JSON,
+        # so it does not change what is written.
+        try:
+            data = json.loads(json.dumps(session.to_dict()))
+        except (TypeError, ValueError):
+            # Values that are not JSON serializable are copied as they are
+            return deepcopy(session)
+        snapshot = type(session).from_dict(data)
+        return snapshot if snapshot is not None else deepcopy(session)
+
+    async def _upsert_after(
+        self, previous: Optional["asyncio.Task[Optional[Session]]"], session: Session
+    ) -> Optional[Session]:
+        if previous is not None:
+            # Errors of the previous write are logged by that write
+            await asyncio.wait([previous])
+        try:
+            return await self.aupsert(session)
+        except Exception as e:
+            logger.error(f"Error writing session {session.session_id} in the background: {e}")
+            return None
+
+    async def aflush(self, session_id: Optional[str] = None) -> None:
+        """Wait for the pending background writes of a session, or of all sessions if session_id is None."""
+        if session_id is not None:
+            pending = [self._pending_writes[session_id]] if session_id in self._pending_writes else []
+        else:
+            pending = list(self._pending_writes.values())
+        if pending:
+            log_debug(f"Waiting for {len(pending)} pending session writes")
+            await asyncio.wait(pending)
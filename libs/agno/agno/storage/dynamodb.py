@@ -1,5 +1,4 @@
 import time
-from dataclasses import asdict
 from decimal import Decimal
 from typing import Any, Dict, List, Literal, Optional
 
@@ -511,7 +510,7 @@ class DynamoDbStorage(Storage):
             Optional[Session]: The upserted Session, or None if operation failed.
         """
         try:
-            item = asdict(session)
+            item = session.to_dict()
 
             # Add timestamps
             current_time = int(time.time())
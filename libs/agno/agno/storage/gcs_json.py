@@ -1,8 +1,9 @@
 import json
 import time
-from typing import Any, List, Literal, Optional
+from typing import Any, List, Literal, Optional, Sequence
 
 from agno.storage.json import JsonStorage, Storage
+from agno.storage.listing import SessionPage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -208,6 +209,19 @@ class GCSJsonStorage(JsonStorage):
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        Lists sessions from the session blobs, as the bucket has no local session index.
+        """
+        return Storage.list_sessions(self, user_id, entity_id, limit, cursor, fields)
+
     def upsert(self, session: Session) -> Optional[Session]:
         """
         Inserts or updates a session JSON blob in the GCS bucket.
@@ -0,0 +1,326 @@
+import base64
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from agno.utils.log import log_debug, logger
+
+try:
+    import fcntl
+
+    def _lock_file(file: IO) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(file: IO) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock_file(file: IO) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore
+
+    def _unlock_file(file: IO) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore
+
+
+# Fields included in every session listed by Storage.list_sessions(), besides the entity id
+LISTING_FIELDS = ("session_id", "user_id", "created_at", "updated_at")
+# Fields holding the id of the agent, team or workflow of a session
+ENTITY_FIELDS = ("agent_id", "team_id", "workflow_id")
+# Fields kept in the session index of file storages
+INDEXED_FIELDS = LISTING_FIELDS + ENTITY_FIELDS
+# Listing field with the first run of the session, e.g. to show its first message as the session title
+FIRST_RUN_FIELD = "first_run"
+# Size of the session index log above which it is compacted into the snapshot on write
+_COMPACT_LOG_BYTES = 1024 * 1024
+
+T = TypeVar("T")
+
+
+@dataclass
+class SessionPage:
+    """A page of sessions returned by Storage.list_sessions()"""
+
+    # The sessions, as dicts with the listed fields
+    sessions: List[Dict[str, Any]] = field(default_factory=list)
+    # Pass as `cursor` to get the next page. None if this is the last page.
+    next_cursor: Optional[str] = None
+
+
+def get_entity_field(mode: Optional[str]) -> str:
+    """The field holding the id of the agent, team or workflow of a session"""
+    if mode == "team":
+        return "team_id"
+    if mode == "workflow":
+        return "workflow_id"
+    return "agent_id"
+
+
+def get_listing_fields(mode: Optional[str], fields: Optional[Sequence[str]] = None) -> List[str]:
+    """The session fields to list: the listing fields, the entity id and the requested fields"""
+    listing_fields = list(LISTING_FIELDS) + [get_entity_field(mode)]
+    for name in fields or []:
+        if name not in listing_fields:
+            listing_fields.append(name)
+    return listing_fields
+
+
+def encode_cursor(session: Dict[str, Any]) -> str:
+    """Cursor pointing after `session` in the (created_at, session_id) descending order of listings"""
+    position = [session.get("created_at") or 0, session["session_id"]]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[int, str]:
+    try:
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(created_at), str(session_id)
+    except Exception:
+        raise ValueError(f"Invalid session cursor: {cursor}")
+
+
+def get_sort_key(session: Dict[str, Any]) -> Tuple[int, str]:
+    return session.get("created_at") or 0, session["session_id"]
+
+
+def get_first_run(memory: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    runs = memory.get("runs") if memory else None
+    return runs[0] if runs else None
+
+
+def get_index_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The indexed fields of a serialized session"""
+    return {name: data.get(name) for name in INDEXED_FIELDS if name in data}
+
+
+def stamp_session(session: Any, created_at: Optional[int] = None) -> Dict[str, Any]:
+    """Set the update time of a session, and its creation time unless it is set, and return the session as a dict.
+
+    Args:
+        session: The session being saved.
+        created_at: The creation time stored for the session when it was saved before.
+    """
+    now = int(time.time())
+    if session.created_at is None:
+        session.created_at = created_at or now
+    session.updated_at = now
+    return session.to_dict()
+
+
+def project_session(data: Dict[str, Any], listing_fields: Iterable[str]) -> Dict[str, Any]:
+    """Only keep the listing fields of a serialized session"""
+    listed = {}
+    for name in listing_fields:
+        if name == FIRST_RUN_FIELD:
+            listed[name] = get_first_run(data.get("memory"))
+        else:
+            listed[name] = data.get(name)
+    return listed
+
+
+def get_read_limit(limit: Optional[int]) -> Optional[int]:
+    """Number of sessions to read for a page of `limit` sessions: one more, to know if there is a next page"""
+    return limit + 1 if limit is not None else None
+
+
+def trim_page(sessions: List[T], limit: Optional[int]) -> Tuple[List[T], bool]:
+    """Trim the sessions read with get_read_limit() to the page, and return whether there is a next page"""
+    if limit is not None and len(sessions) > limit:
+        return sessions[:limit], True
+    return sessions, False
+
+
+def paginate(sessions: List[Dict[str, Any]], limit: Optional[int] = None, cursor: Optional[str] = None) -> SessionPage:
+    """Sort listed sessions by created_at descending and return the page after `cursor`.
+
+    Used by storages that cannot sort and page on the server.
+    """
+    sessions = sorted(sessions, key=get_sort_key, reverse=True)
+    if cursor is not None:
+        after = decode_cursor(cursor)
+        sessions = [session for session in sessions if get_sort_key(session) < after]
+    sessions, has_next_page = trim_page(sessions, limit)
+    return SessionPage(sessions=sessions, next_cursor=encode_cursor(sessions[-1]) if has_next_page else None)
+
+
+class SessionIndex:
+    """Manifest of the sessions stored as files in a directory, used to list sessions without reading every file.
+
+    The manifest is a JSON snapshot mapping each session_id to its listing fields, and a log of the writes since
+    the snapshot, one JSON line per write. Writes only append to the log, so their cost does not grow with the
+    number of sessions. Loading replays the log, brings the entries up to date with the session files in the
+    directory, so sessions written before the manifest existed are still listed, and compacts the log into the
+    snapshot. A lock file serializes the processes sharing the directory.
+    """
+
+    def __init__(self, dir_path: Path, suffix: str, deserialize: Callable[[str], Dict[str, Any]]):
+        self.dir_path = dir_path
+        # Suffix of the session files, e.g. ".json"
+        self.suffix = suffix
+        self.deserialize = deserialize
+        # The manifest files have no session file suffix, so they are not listed as sessions
+        self.path = dir_path / ".sessions_index"
+        self.log_path = dir_path / ".sessions_index.log"
+        self.lock_path = dir_path / ".sessions_index.lock"
+        self._lock = threading.Lock()
+        # Creation time of the sessions in the index, read once and kept up to date by the writes of this process
+        self._created_at: Optional[Dict[str, Optional[int]]] = None
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock, open(self.lock_path, "a") as lock_file:
+            _lock_file(lock_file)
+            try:
+                yield
+            finally:
+                _unlock_file(lock_file)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """The snapshot entries, with the logged writes applied"""
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            entries = {}
+        except Exception as e:
+            logger.warning(f"Rebuilding invalid session index {self.path}: {e}")
+            entries = {}
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as log:
+                for line in log:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A write interrupted midway
+                        continue
+                    if "entry" in record:
+                        entries[record["entry"]["session_id"]] = record["entry"]
+                    else:
+                        entries.pop(record["removed"], None)
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the snapshot and empty the log"""
+        # Write to a temporary file first, so readers never see a partial manifest
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self.log_path.unlink(missing_ok=True)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self._locked():
+            with open(self.log_path, "a", encoding="utf-8") as log:
+                log.write(json.dumps(record, ensure_ascii=False) + "\n")
+                size = log.tell()
+            if size > _COMPACT_LOG_BYTES:
+                log_debug(f"Compacting session index: {self.path}")
+                self._write(self._read())
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """The manifest entries of the sessions in the directory, by session_id"""
+        with self._locked():
+            entries = self._read()
+            changed = self.log_path.exists()
+            session_ids = {file.name[: -len(self.suffix)] for file in self.dir_path.glob(f"*{self.suffix}")}
+            for session_id in [session_id for session_id in entries if session_id not in session_ids]:
+                del entries[session_id]
+                changed = True
+            for session_id in session_ids - entries.keys():
+                try:
+                    data = self.deserialize((self.dir_path / f"{session_id}{self.suffix}").read_text(encoding="utf-8"))
+                except Exception as e:
+                    logger.error(f"Error reading session file {session_id}{self.suffix}: {e}")
+                    continue
+                entries[session_id] = get_index_entry(data)
+                changed = True
+            if changed:
+                log_debug(f"Updating session index: {self.path}")
+                self._write(entries)
+            self._created_at = {session_id: entry.get("created_at") for session_id, entry in entries.items()}
+            return entries
+
+    def get_created_at(self, session_id: str) -> Optional[int]:
+        """The creation time of a session saved before, from the index entry of the session.
+
+        The session file is only read for sessions saved by another process since the index was read.
+        """
+        if self._created_at is None:
+            with self._locked():
+                self._created_at = {session_id: entry.get("created_at") for session_id, entry in self._read().items()}
+        if session_id in self._created_at:
+            return self._created_at[session_id]
+
+        session_file = self.dir_path / f"{session_id}{self.suffix}"
+        if not session_file.exists():
+            return None
+        try:
+            data = self.deserialize(session_file.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Error reading session file {session_id}{self.suffix}: {e}")
+            return None
+        return data.get("created_at") if isinstance(data, dict) else None
+
+    def update(self, data: Dict[str, Any]) -> None:
+        self._append({"entry": get_index_entry(data)})
+        if self._created_at is not None:
+            self._created_at[data["session_id"]] = data.get("created_at")
+
+    def remove(self, session_id: str) -> None:
+        self._append({"removed": session_id})
+        if self._created_at is not None:
+            self._created_at.pop(session_id, None)
+
+    def clear(self) -> None:
+        with self._locked():
+            self.path.unlink(missing_ok=True)
+            self.log_path.unlink(missing_ok=True)
+        self._created_at = None
+
+    def list_sessions(
+        self,
+        mode: Optional[str],
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List sessions newest first from the index, only reading the session files of the page when fields
+        besides the indexed fields are requested."""
+        listing_fields = get_listing_fields(mode, fields)
+        entity_field = get_entity_field(mode)
+        entries = [
+            entry
+            for entry in self.load().values()
+            if (user_id is None or entry.get("user_id") == user_id)
+            and (entity_id is None or entry.get(entity_field) == entity_id)
+        ]
+        page = paginate(entries, limit=limit, cursor=cursor)
+
+        sessions = []
+        read_files = any(name not in INDEXED_FIELDS for name in listing_fields)
+        for entry in page.sessions:
+            data = entry
+            if read_files:
+                try:
+                    data = self.deserialize(
+                        (self.dir_path / f"{entry['session_id']}{self.suffix}").read_text(encoding="utf-8")
+                    )
+                except FileNotFoundError:
+                    # Deleted since the index was loaded
+                    continue
+            sessions.append(project_session(data, listing_fields))
+        page.sessions = sessions
+        return page
+
+    def __deepcopy__(self, memo):
+        return SessionIndex(dir_path=self.dir_path, suffix=self.suffix, deserialize=self.deserialize)
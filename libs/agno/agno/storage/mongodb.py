@@ -1,8 +1,19 @@
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence
 from uuid import UUID
 
 from agno.storage.base import Storage
+from agno.storage.listing import (
+    FIRST_RUN_FIELD,
+    SessionPage,
+    decode_cursor,
+    encode_cursor,
+    get_entity_field,
+    get_listing_fields,
+    get_read_limit,
+    project_session,
+    trim_page,
+)
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -222,6 +233,57 @@ class MongoDbStorage(Storage):
             logger.error(f"Error getting last {limit} sessions: {e}")
             return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List sessions newest first, only reading the listed fields.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page
+            cursor: The next_cursor of the previous page
+            fields: Extra session fields to list, e.g. "session_data" or "first_run"
+
+        Returns:
+            SessionPage: The listed sessions and the cursor of the next page
+        """
+        listing_fields = get_listing_fields(self.mode, fields)
+        query: Dict[str, Any] = {}
+        if user_id is not None:
+            query["user_id"] = user_id
+        if entity_id is not None:
+            query[get_entity_field(self.mode)] = entity_id
+        if cursor is not None:
+            created_at, session_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "session_id": {"$lt": session_id}},
+            ]
+
+        projection: Dict[str, Any] = {name: 1 for name in listing_fields if name != FIRST_RUN_FIELD}
+        projection["_id"] = 0
+        if FIRST_RUN_FIELD in listing_fields:
+            projection["memory.runs"] = {"$slice": 1}
+
+        try:
+            documents = self.collection.find(query, projection).sort([("created_at", -1), ("session_id", -1)])
+            read_limit = get_read_limit(limit)
+            if read_limit is not None:
+                documents = documents.limit(read_limit)
+            sessions = [project_session(doc, listing_fields) for doc in documents]
+        except PyMongoError as e:
+            logger.error(f"Error listing sessions: {e}")
+            return SessionPage()
+
+        sessions, has_next_page = trim_page(sessions, limit)
+        return SessionPage(sessions=sessions, next_cursor=encode_cursor(sessions[-1]) if has_next_page else None)
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """Upsert a session
         Args:
@@ -254,6 +316,9 @@ class MongoDbStorage(Storage):
             doc = self.collection.find_one(query)
             if not doc:
                 update_data["created_at"] = timestamp
+            elif update_data.get("created_at") is None:
+                # Keep the creation time of the stored session
+                update_data.pop("created_at", None)
 
             result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
 
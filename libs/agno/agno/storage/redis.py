@@ -1,15 +1,27 @@
 import json
-import time
-from dataclasses import asdict
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 from uuid import UUID
 
 from agno.storage.base import Storage
+from agno.storage.listing import (
+    ENTITY_FIELDS,
+    INDEXED_FIELDS,
+    SessionPage,
+    decode_cursor,
+    encode_cursor,
+    get_entity_field,
+    get_index_entry,
+    get_listing_fields,
+    get_read_limit,
+    project_session,
+    stamp_session,
+    trim_page,
+)
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
-from agno.utils.log import log_debug, log_info, logger
+from agno.utils.log import log_debug, log_info, log_warning, logger
 
 try:
     from redis import ConnectionError, Redis
@@ -52,7 +64,7 @@ class RedisStorage(Storage):
         super().__init__(mode)
         self.prefix = prefix
         self.expire = expire
-        self.redis_client = Redis(
+        self._connection_kwargs: Dict[str, Any] = dict(
             host=host,
             port=port,
             db=db,
@@ -60,6 +72,9 @@ class RedisStorage(Storage):
             decode_responses=True,  # Automatically decode responses to str
             ssl=ssl,
         )
+        self.redis_client = Redis(**self._connection_kwargs)
+        # Created on first use by the async methods
+        self._async_redis_client: Optional[Any] = None
         log_debug(f"Created RedisStorage with prefix: '{self.prefix}'")
 
     def _get_key(self, session_id: str) -> str:
@@ -74,6 +89,194 @@ class RedisStorage(Storage):
         """Deserialize JSON string to dict."""
         return json.loads(data)
 
+    @property
+    def async_redis_client(self):
+        """Async Redis client used by the async methods, sharing the connection settings of the sync client."""
+        if self._async_redis_client is None:
+            from redis.asyncio import Redis as AsyncRedis
+
+            self._async_redis_client = AsyncRedis(**self._connection_kwargs)
+        return self._async_redis_client
+
+    def _session_from_data(self, data: Optional[str], user_id: Optional[str] = None) -> Optional[Session]:
+        if data is None:
+            return None
+
+        session_data = self.deserialize(data)
+        if user_id and session_data.get("user_id") != user_id:
+            return None
+
+        if self.mode == "agent":
+            return AgentSession.from_dict(session_data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(session_data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(session_data)
+        return None
+
+    # --- Session index ---
+    # Sorted sets of session ids scored by created_at, for all sessions and by user and entity,
+    # and a hash with the indexed fields of each session. Used to list sessions without reading them.
+    # The index keys do not match the `{prefix}:*` pattern of the session keys.
+
+    def _get_index_key(self, *parts: str) -> str:
+        return ":".join([f"{self.prefix}__index", *parts])
+
+    def _get_index_keys(self, entry: Dict[str, Any]) -> List[str]:
+        """The sorted sets listing a session"""
+        keys = [self._get_index_key("all")]
+        user_id = entry.get("user_id")
+        if user_id is not None:
+            keys.append(self._get_index_key("user_id", str(user_id)))
+        for entity_field in ENTITY_FIELDS:
+            entity_id = entry.get(entity_field)
+            if entity_id is None:
+                continue
+            keys.append(self._get_index_key(entity_field, str(entity_id)))
+            if user_id is not None:
+                keys.append(self._get_index_key("user_id", str(user_id), entity_field, str(entity_id)))
+        return keys
+
+    def _get_listing_key(self, user_id: Optional[str], entity_id: Optional[str]) -> str:
+        """The sorted set listing the sessions of a user and/or entity"""
+        entity_field = get_entity_field(self.mode)
+        if user_id is not None and entity_id is not None:
+            return self._get_index_key("user_id", user_id, entity_field, entity_id)
+        if user_id is not None:
+            return self._get_index_key("user_id", user_id)
+        if entity_id is not None:
+            return self._get_index_key(entity_field, entity_id)
+        return self._get_index_key("all")
+
+    def _parse_index_entry(self, entry: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not isinstance(entry, str):
+            return None
+        return self.deserialize(entry)
+
+    def _queue_index_update(self, pipeline: Any, data: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> None:
+        entry = get_index_entry(data)
+        session_id = entry["session_id"]
+        if previous is not None:
+            for key in set(self._get_index_keys(previous)) - set(self._get_index_keys(entry)):
+                pipeline.zrem(key, session_id)
+        pipeline.hset(self._get_index_key("entries"), session_id, self.serialize(entry))
+        for key in self._get_index_keys(entry):
+            pipeline.zadd(key, {session_id: entry.get("created_at") or 0})
+
+    def _queue_index_removal(self, pipeline: Any, session_id: str, previous: Optional[Dict[str, Any]]) -> None:
+        if previous is not None:
+            for key in self._get_index_keys(previous):
+                pipeline.zrem(key, session_id)
+        pipeline.hdel(self._get_index_key("entries"), session_id)
+
+    def _read_index_entry(self, session_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self._parse_index_entry(self.redis_client.hget(self._get_index_key("entries"), session_id))  # type: ignore
+        except Exception as e:
+            log_warning(f"Error reading session index: {e}")
+            return None
+
+    def _update_index(self, data: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> None:
+        try:
+            pipeline = self.redis_client.pipeline()
+            self._queue_index_update(pipeline, data, previous)
+            pipeline.execute()
+        except Exception as e:
+            log_warning(f"Error updating session index: {e}")
+
+    def _remove_from_index(self, session_id: str) -> None:
+        try:
+            pipeline = self.redis_client.pipeline()
+            self._queue_index_removal(pipeline, session_id, self._read_index_entry(session_id))
+            pipeline.execute()
+        except Exception as e:
+            log_warning(f"Error updating session index: {e}")
+
+    def _build_index(self) -> None:
+        """Index the sessions saved before the session index was used"""
+        log_debug(f"Building session index for prefix: '{self.prefix}'")
+        pipeline = self.redis_client.pipeline()
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+            data = self.redis_client.get(key)
+            if data is not None:
+                self._queue_index_update(pipeline, self.deserialize(data), None)  # type: ignore
+        pipeline.set(self._get_index_key("built"), 1)
+        pipeline.execute()
+
+    def _read_listing(
+        self, key: str, limit: Optional[int], after: Optional[Tuple[int, str]], batch_size: int = 100
+    ) -> List[Tuple[str, int]]:
+        """(session_id, created_at) of the sessions listed after the cursor position, newest first"""
+        listed: List[Tuple[str, int]] = []
+        max_score: Any = "+inf" if after is None else after[0]
+        offset = 0
+        while limit is None or len(listed) < limit:
+            batch = self.redis_client.zrevrangebyscore(
+                key, max_score, "-inf", start=offset, num=batch_size, withscores=True
+            )
+            for session_id, score in batch:  # type: ignore
+                # Sessions created in the same second as the cursor session and listed before it are skipped
+                if after is None or (int(score), session_id) < after:
+                    listed.append((str(session_id), int(score)))
+            if len(batch) < batch_size:  # type: ignore
+                break
+            offset += batch_size
+        return listed if limit is None else listed[:limit]
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List sessions newest first from the session index.
+
+        Sessions are only read when fields besides the indexed fields are requested, or when the sessions
+        expire, to skip expired sessions.
+        """
+        listing_fields = get_listing_fields(self.mode, fields)
+        after = decode_cursor(cursor) if cursor is not None else None
+        try:
+            if not self.redis_client.exists(self._get_index_key("built")):
+                self._build_index()
+
+            listed = self._read_listing(self._get_listing_key(user_id, entity_id), get_read_limit(limit), after)
+            listed, has_next_page = trim_page(listed, limit)
+            next_cursor = None
+            if has_next_page:
+                session_id, created_at = listed[-1]
+                next_cursor = encode_cursor({"session_id": session_id, "created_at": created_at})
+            if not listed:
+                return SessionPage()
+
+            session_ids = [session_id for session_id, _ in listed]
+            entries: List[Optional[str]] = self.redis_client.hmget(self._get_index_key("entries"), session_ids)  # type: ignore
+            read_sessions = self.expire is not None or any(name not in INDEXED_FIELDS for name in listing_fields)
+            stored: List[Optional[str]] = (
+                self.redis_client.mget([self._get_key(session_id) for session_id in session_ids])  # type: ignore
+                if read_sessions
+                else [None] * len(session_ids)
+            )
+
+            sessions = []
+            for session_id, entry, session_data in zip(session_ids, entries, stored):
+                data = None if read_sessions else self._parse_index_entry(entry)
+                if data is None:
+                    if not read_sessions:
+                        session_data = self.redis_client.get(self._get_key(session_id))  # type: ignore
+                    if session_data is None:
+                        # Expired, or deleted without updating the index
+                        self._remove_from_index(session_id)
+                        continue
+                    data = self.deserialize(session_data)
+                sessions.append(project_session(data, listing_fields))
+            return SessionPage(sessions=sessions, next_cursor=next_cursor)
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+            return SessionPage()
+
     def create(self) -> None:
         """
         Create storage if it doesn't exist.
@@ -90,21 +293,15 @@ class RedisStorage(Storage):
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """Read a Session from Redis."""
         try:
-            data = self.redis_client.get(self._get_key(session_id))
-            if data is None:
-                return None
-
-            session_data = self.deserialize(data)  # type: ignore
-            if user_id and session_data.get("user_id") != user_id:
-                return None
-
-            if self.mode == "agent":
-                return AgentSession.from_dict(session_data)
-            elif self.mode == "team":
-                return TeamSession.from_dict(session_data)
-            elif self.mode == "workflow":
-                return WorkflowSession.from_dict(session_data)
+            return self._session_from_data(self.redis_client.get(self._get_key(session_id)), user_id)  # type: ignore
+        except Exception as e:
+            logger.error(f"Error reading session: {e}")
+            return None
 
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from Redis without blocking the event loop."""
+        try:
+            return self._session_from_data(await self.async_redis_client.get(self._get_key(session_id)), user_id)
         except Exception as e:
             logger.error(f"Error reading session: {e}")
             return None
@@ -272,16 +469,44 @@ class RedisStorage(Storage):
     def upsert(self, session: Session) -> Optional[Session]:
         """Insert or update a Session in Redis."""
         try:
-            data = asdict(session)
-            data["updated_at"] = int(time.time())
-            if "created_at" not in data:
-                data["created_at"] = data["updated_at"]
-
             key = self._get_key(session.session_id)
+            previous = self._read_index_entry(session.session_id)
+            data = stamp_session(session, created_at=previous.get("created_at") if previous else None)
             if self.expire is not None:
                 self.redis_client.set(key, self.serialize(data), ex=self.expire)
             else:
                 self.redis_client.set(key, self.serialize(data))
+            self._update_index(data, previous)
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    async def _aread_index_entry(self, session_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self._parse_index_entry(
+                await self.async_redis_client.hget(self._get_index_key("entries"), session_id)
+            )
+        except Exception as e:
+            log_warning(f"Error reading session index: {e}")
+            return None
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session in Redis without blocking the event loop."""
+        try:
+            key = self._get_key(session.session_id)
+            previous = await self._aread_index_entry(session.session_id)
+            data = stamp_session(session, created_at=previous.get("created_at") if previous else None)
+            if self.expire is not None:
+                await self.async_redis_client.set(key, self.serialize(data), ex=self.expire)
+            else:
+                await self.async_redis_client.set(key, self.serialize(data))
+            try:
+                pipeline = self.async_redis_client.pipeline()
+                self._queue_index_update(pipeline, data, previous)
+                await pipeline.execute()
+            except Exception as e:
+                log_warning(f"Error updating session index: {e}")
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -294,6 +519,23 @@ class RedisStorage(Storage):
         try:
             key = self._get_key(session_id)
             self.redis_client.delete(key)
+            self._remove_from_index(session_id)
+            log_debug(f"Deleted session: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """Delete a session from Redis without blocking the event loop."""
+        if session_id is None:
+            return
+        try:
+            await self.async_redis_client.delete(self._get_key(session_id))
+            try:
+                pipeline = self.async_redis_client.pipeline()
+                self._queue_index_removal(pipeline, session_id, await self._aread_index_entry(session_id))
+                await pipeline.execute()
+            except Exception as e:
+                log_warning(f"Error updating session index: {e}")
             log_debug(f"Deleted session: {session_id}")
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
@@ -304,6 +546,8 @@ class RedisStorage(Storage):
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
                 self.redis_client.delete(key)
+            for key in self.redis_client.scan_iter(match=self._get_index_key("*")):
+                self.redis_client.delete(key)
             log_info(f"Dropped all sessions with prefix: {self.prefix}")
         except Exception as e:
             logger.error(f"Error dropping sessions: {e}")
@@ -0,0 +1,133 @@
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Tuple
+
+# Run key -> (hash of the stored run, position of the run in the session)
+StoredRuns = Dict[str, Tuple[str, int]]
+
+
+class StoredRunsCache:
+    """The runs known to be stored for the most recently used sessions, so unchanged runs are not written again.
+
+    Bounded, so a long-lived server does not keep every session it ever saved. The runs of a session that is not
+    cached are read back from the runs table.
+    """
+
+    def __init__(self, max_sessions: int = 1000):
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, StoredRuns]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[StoredRuns]:
+        with self._lock:
+            stored = self._sessions.get(session_id)
+            if stored is not None:
+                self._sessions.move_to_end(session_id)
+            return stored
+
+    def set(self, session_id: str, stored: StoredRuns) -> None:
+        with self._lock:
+            self._sessions[session_id] = stored
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def update(self, stored: Dict[str, StoredRuns]) -> None:
+        for session_id, session_stored in stored.items():
+            self.set(session_id, session_stored)
+
+    def pop(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __deepcopy__(self, memo):
+        # Copies of a storage write to the same tables, so they share what is known to be stored
+        return self
+
+
+def split_runs(memory: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], Optional[List[Dict[str, Any]]]]:
+    """Split the runs from a session's memory.
+
+    Returns the memory without its runs, and the runs or None if the memory has no runs.
+    """
+    if memory is None or "runs" not in memory:
+        return memory, None
+    memory_without_runs = {key: value for key, value in memory.items() if key != "runs"}
+    return memory_without_runs, memory.get("runs") or []
+
+
+def join_runs(memory: Optional[Dict[str, Any]], runs: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Add the runs read from the runs table back to a session's memory"""
+    if memory is None and not runs:
+        return None
+    memory = dict(memory or {})
+    # Sessions saved before the runs table was used still hold their runs, which move to the runs table on save
+    if runs or "runs" not in memory:
+        memory["runs"] = runs
+    return memory
+
+
+def get_run_keys(runs: List[Dict[str, Any]]) -> List[str]:
+    """Stable keys for the runs of a session, based on their run_id."""
+    keys: List[str] = []
+    seen: Dict[str, int] = {}
+    for position, run in enumerate(runs):
+        # Runs of AgentMemory and TeamMemory are stored as {"message": ..., "response": {"run_id": ...}}
+        response = run.get("response")
+        run_id = run.get("run_id") or (response.get("run_id") if isinstance(response, dict) else None)
+        key = str(run_id) if run_id is not None else f"#{position}"
+        # A run can be stored more than once, e.g. when a paused run is continued
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        keys.append(key if count == 0 else f"{key}#{count}")
+    return keys
+
+
+def get_run_hash(run: Dict[str, Any]) -> str:
+    return md5(json.dumps(run, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dataclass
+class RunRowsDiff:
+    """The writes needed to bring the stored runs of a session up to date"""
+
+    # (run key, position, run hash, run) of the runs to insert or update
+    upserts: List[Tuple[str, int, str, Dict[str, Any]]] = field(default_factory=list)
+    # Keys of the stored runs that are no longer part of the session
+    deletes: List[str] = field(default_factory=list)
+    # The stored runs once the writes are applied
+    stored: StoredRuns = field(default_factory=dict)
+
+
+def diff_runs(stored: StoredRuns, runs: List[Dict[str, Any]]) -> RunRowsDiff:
+    """Compare the runs of a session with its stored runs.
+
+    Only new and changed runs are written, so the database writes of a save do not grow with the number of runs.
+    Every run is still serialized and hashed to find the changed ones, as a run can be replaced at any position,
+    e.g. by Memory.add_run() with the run_id of an earlier run. New runs are positioned after all stored runs.
+    """
+    diff = RunRowsDiff()
+    next_position = max((position for _, position in stored.values()), default=-1) + 1
+    for key, run in zip(get_run_keys(runs), runs):
+        run_hash = get_run_hash(run)
+        if key in stored:
+            stored_hash, position = stored[key]
+            if stored_hash != run_hash:
+                diff.upserts.append((key, position, run_hash, run))
+        else:
+            position = next_position
+            next_position += 1
+            diff.upserts.append((key, position, run_hash, run))
+        diff.stored[key] = (run_hash, position)
+    diff.deletes = [key for key in stored if key not in diff.stored]
+    return diff
@@ -4,6 +4,7 @@ from dataclasses import asdict, dataclass
 from typing import Any, Dict, Mapping, Optional
 
 from agno.utils.log import logger
+from agno.utils.serialize import shallow_asdict
 
 
 @dataclass
@@ -32,6 +33,9 @@ class TeamSession:
     updated_at: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        return shallow_asdict(self)
+
+    def monitoring_data(self) -> Dict[str, Any]:
         return asdict(self)
 
     def telemetry_data(self) -> Dict[str, Any]:
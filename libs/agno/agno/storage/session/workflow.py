@@ -4,6 +4,7 @@ from dataclasses import asdict, dataclass
 from typing import Any, Dict, Mapping, Optional
 
 from agno.utils.log import logger
+from agno.utils.serialize import shallow_asdict
 
 
 @dataclass
@@ -31,7 +32,7 @@ class WorkflowSession:
     workflow_data: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return shallow_asdict(self)
 
     def monitoring_data(self) -> Dict[str, Any]:
         return asdict(self)
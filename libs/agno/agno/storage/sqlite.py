@@ -1,8 +1,20 @@
 import time
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence
 
 from agno.storage.base import Storage
+from agno.storage.listing import (
+    FIRST_RUN_FIELD,
+    SessionPage,
+    decode_cursor,
+    encode_cursor,
+    get_entity_field,
+    get_first_run,
+    get_listing_fields,
+    get_read_limit,
+    trim_page,
+)
+from agno.storage.run_rows import StoredRuns, StoredRunsCache, diff_runs, join_runs, split_runs
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -16,7 +28,7 @@ try:
     from sqlalchemy.orm import Session as SqlSession
     from sqlalchemy.orm import sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql import text
+    from sqlalchemy.sql import and_, func, or_, text
     from sqlalchemy.sql.expression import select
     from sqlalchemy.types import String
 except ImportError:
@@ -48,6 +60,8 @@ class SqliteStorage(Storage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            schema_version: Version of the schema. Version 2 stores each run of a session in its own row
+                of a `<table_name>_runs` table, so saving a session only writes its new or changed runs.
         """
         super().__init__(mode)
         _engine: Optional[Engine] = db_engine
@@ -82,6 +96,10 @@ class SqliteStorage(Storage):
         self.SqlSession: sessionmaker[SqlSession] = sessionmaker(bind=self.db_engine)
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database table for the runs of each session, only used by schema version 2
+        self.runs_table: Optional[Table] = self.get_runs_table()
+        # The runs known to be stored for each session, so unchanged runs are not written again
+        self._stored_runs = StoredRunsCache()
 
     @property
     def mode(self) -> Optional[Literal["agent", "team", "workflow"]]:
@@ -108,7 +126,7 @@ class SqliteStorage(Storage):
             Column("memory", sqlite.JSON),
             Column("session_data", sqlite.JSON),
             Column("extra_data", sqlite.JSON),
-            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time()), index=True),
             Column("updated_at", sqlite.INTEGER, onupdate=lambda: int(time.time())),
         ]
 
@@ -154,11 +172,33 @@ class SqliteStorage(Storage):
         Raises:
             ValueError: If an unsupported schema version is specified.
         """
-        if self.schema_version == 1:
+        # Version 2 uses the version 1 session table, with the runs moved to the runs table
+        if self.schema_version in (1, 2):
             return self.get_table_v1()
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
+    def get_runs_table(self) -> Optional[Table]:
+        """
+        Define the runs table, which stores each run of a session in its own row.
+
+        Returns:
+            Optional[Table]: SQLAlchemy Table object for the runs, or None if the schema version has no runs table.
+        """
+        if self.schema_version < 2:
+            return None
+        return Table(
+            f"{self.table_name}_runs",
+            self.metadata,
+            Column("session_id", String, primary_key=True),
+            Column("run_key", String, primary_key=True),
+            Column("position", sqlite.INTEGER, nullable=False),
+            Column("run_hash", String, nullable=False),
+            Column("run", sqlite.JSON),
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            extend_existing=True,
+        )
+
     def table_exists(self) -> bool:
         """
         Check if the table exists in the database.
@@ -218,6 +258,79 @@ class SqliteStorage(Storage):
                 logger.error(f"Error creating table: {e}")
                 raise
 
+        if self.runs_table is not None:
+            try:
+                self.runs_table.create(self.db_engine, checkfirst=True)
+            except Exception as e:
+                logger.error(f"Error creating runs table: {e}")
+                raise
+
+    def _read_runs(self, sess: SqlSession, session_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the runs of the given sessions from the runs table, in order"""
+        assert self.runs_table is not None
+        runs: Dict[str, List[Dict[str, Any]]] = {session_id: [] for session_id in session_ids}
+        stored: Dict[str, StoredRuns] = {session_id: {} for session_id in session_ids}
+        # Stay well below SQLite's limit on the number of bound parameters
+        for i in range(0, len(session_ids), 500):
+            stmt = (
+                select(self.runs_table)
+                .where(self.runs_table.c.session_id.in_(session_ids[i : i + 500]))
+                .order_by(self.runs_table.c.session_id, self.runs_table.c.position)
+            )
+            for row in sess.execute(stmt):
+                runs[row.session_id].append(row.run)
+                stored[row.session_id][row.run_key] = (row.run_hash, row.position)
+        self._stored_runs.update(stored)
+        return runs
+
+    def _with_runs(self, sess: SqlSession, rows: Sequence[Any]) -> List[Dict[str, Any]]:
+        """Session rows as dicts, with the runs of each session added to its memory for schema version 2"""
+        sessions = [dict(row._mapping) for row in rows]
+        if self.runs_table is None or len(sessions) == 0:
+            return sessions
+        runs = self._read_runs(sess, [session["session_id"] for session in sessions])
+        for session in sessions:
+            session["memory"] = join_runs(session.get("memory"), runs[session["session_id"]])
+        return sessions
+
+    def _write_runs(self, sess: SqlSession, session_id: str, runs: List[Dict[str, Any]]) -> StoredRuns:
+        """Write the new and changed runs of a session to the runs table, and delete the runs it no longer has"""
+        assert self.runs_table is not None
+        stored = self._stored_runs.get(session_id)
+        if stored is None:
+            # Only read the keys and hashes of the stored runs, not the runs themselves
+            stmt = select(self.runs_table.c.run_key, self.runs_table.c.run_hash, self.runs_table.c.position).where(
+                self.runs_table.c.session_id == session_id
+            )
+            stored = {row.run_key: (row.run_hash, row.position) for row in sess.execute(stmt)}
+
+        diff = diff_runs(stored, runs)
+        if diff.deletes:
+            sess.execute(
+                self.runs_table.delete().where(
+                    self.runs_table.c.session_id == session_id, self.runs_table.c.run_key.in_(diff.deletes)
+                )
+            )
+        if diff.upserts:
+            insert_stmt = sqlite.insert(self.runs_table)
+            upsert_stmt = insert_stmt.on_conflict_do_update(
+                index_elements=["session_id", "run_key"],
+                set_=dict(
+                    position=insert_stmt.excluded.position,
+                    run_hash=insert_stmt.excluded.run_hash,
+                    run=insert_stmt.excluded.run,
+                ),
+            )
+            sess.execute(
+                upsert_stmt,
+                [
+                    dict(session_id=session_id, run_key=run_key, position=position, run_hash=run_hash, run=run)
+                    for run_key, position, run_hash, run in diff.upserts
+                ],
+            )
+        log_debug(f"Wrote {len(diff.upserts)} runs and deleted {len(diff.deletes)} runs of session {session_id}")
+        return diff.stored
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read a Session from the database.
@@ -235,12 +348,15 @@ class SqliteStorage(Storage):
                 if user_id:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 result = sess.execute(stmt).fetchone()
+                if result is None:
+                    return None
+                data = self._with_runs(sess, [result])[0]
                 if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                    return AgentSession.from_dict(data)
                 elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                    return TeamSession.from_dict(data)  # type: ignore
                 elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                    return WorkflowSession.from_dict(data)  # type: ignore
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -315,12 +431,13 @@ class SqliteStorage(Storage):
                 # execute query
                 rows = sess.execute(stmt).fetchall()
                 if rows is not None:
+                    sessions = self._with_runs(sess, rows)
                     if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [AgentSession.from_dict(session) for session in sessions]  # type: ignore
                     elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [TeamSession.from_dict(session) for session in sessions]  # type: ignore
                     elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [WorkflowSession.from_dict(session) for session in sessions]  # type: ignore
                 else:
                     return []
         except Exception as e:
@@ -370,12 +487,13 @@ class SqliteStorage(Storage):
                 # Execute query
                 rows = sess.execute(stmt).fetchall()
                 if rows is not None:
+                    sessions = self._with_runs(sess, rows)
                     if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [AgentSession.from_dict(session) for session in sessions]  # type: ignore
                     elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [TeamSession.from_dict(session) for session in sessions]  # type: ignore
                     elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [WorkflowSession.from_dict(session) for session in sessions]  # type: ignore
                 return []
         except Exception as e:
             if "no such table" in str(e):
@@ -385,6 +503,87 @@ class SqliteStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
         return []
 
+    def _read_first_runs(self, sess: SqlSession, session_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Read the first run of the given sessions, without reading their other runs"""
+        first_runs: Dict[str, Optional[Dict[str, Any]]] = {}
+        for i in range(0, len(session_ids), 500):
+            chunk = session_ids[i : i + 500]
+            if self.runs_table is not None:
+                other_runs = self.runs_table.alias("other_runs")
+                first_position = (
+                    select(func.min(other_runs.c.position))
+                    .where(other_runs.c.session_id == self.runs_table.c.session_id)
+                    .scalar_subquery()
+                )
+                stmt = select(self.runs_table.c.session_id, self.runs_table.c.run).where(
+                    self.runs_table.c.session_id.in_(chunk), self.runs_table.c.position == first_position
+                )
+                first_runs.update({row.session_id: row.run for row in sess.execute(stmt)})
+            # Sessions saved before the runs table was used still hold their runs in their memory
+            missing = [session_id for session_id in chunk if session_id not in first_runs]
+            if missing:
+                stmt = select(self.table.c.session_id, self.table.c.memory).where(self.table.c.session_id.in_(missing))
+                first_runs.update({row.session_id: get_first_run(row.memory) for row in sess.execute(stmt)})
+        return first_runs
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List sessions newest first, only reading the listed columns.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): Maximum number of sessions in the page.
+            cursor (Optional[str]): The next_cursor of the previous page.
+            fields (Optional[Sequence[str]]): Extra session fields to list, e.g. "session_data" or "first_run".
+
+        Returns:
+            SessionPage: The listed sessions and the cursor of the next page.
+        """
+        listing_fields = get_listing_fields(self.mode, fields)
+        after = decode_cursor(cursor) if cursor is not None else None
+        column_names = self.table.c.keys()
+        try:
+            with self.SqlSession() as sess, sess.begin():
+                stmt = select(*[self.table.c[name] for name in listing_fields if name in column_names])
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if entity_id is not None:
+                    stmt = stmt.where(self.table.c[get_entity_field(self.mode)] == entity_id)
+                if after is not None:
+                    created_at, session_id = after
+                    stmt = stmt.where(
+                        or_(
+                            self.table.c.created_at < created_at,
+                            and_(self.table.c.created_at == created_at, self.table.c.session_id < session_id),
+                        )
+                    )
+                stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+                read_limit = get_read_limit(limit)
+                if read_limit is not None:
+                    stmt = stmt.limit(read_limit)
+                sessions, has_next_page = trim_page([dict(row._mapping) for row in sess.execute(stmt)], limit)
+                next_cursor = encode_cursor(sessions[-1]) if has_next_page else None
+                if FIRST_RUN_FIELD in listing_fields:
+                    first_runs = self._read_first_runs(sess, [session["session_id"] for session in sessions])
+                    for session in sessions:
+                        session[FIRST_RUN_FIELD] = first_runs.get(session["session_id"])
+                return SessionPage(sessions=sessions, next_cursor=next_cursor)
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionPage()
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema of the storage table.
@@ -428,6 +627,9 @@ class SqliteStorage(Storage):
         if self.auto_upgrade_schema and not self._schema_up_to_date:
             self.upgrade_schema()
 
+        # With a runs table, the session row only holds the memory without its runs
+        memory, runs = split_runs(session.memory) if self.runs_table is not None else (session.memory, None)
+        stored_runs: Optional[StoredRuns] = None
         try:
             with self.SqlSession() as sess, sess.begin():
                 if self.mode == "agent":
@@ -437,7 +639,7 @@ class SqliteStorage(Storage):
                         agent_id=session.agent_id,  # type: ignore
                         team_session_id=session.team_session_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=session.memory,
+                        memory=memory,
                         agent_data=session.agent_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -451,7 +653,7 @@ class SqliteStorage(Storage):
                             agent_id=session.agent_id,  # type: ignore
                             team_session_id=session.team_session_id,  # type: ignore
                             user_id=session.user_id,
-                            memory=session.memory,
+                            memory=memory,
                             agent_data=session.agent_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -465,7 +667,7 @@ class SqliteStorage(Storage):
                         team_id=session.team_id,  # type: ignore
                         user_id=session.user_id,
                         team_session_id=session.team_session_id,  # type: ignore
-                        memory=session.memory,
+                        memory=memory,
                         team_data=session.team_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -479,7 +681,7 @@ class SqliteStorage(Storage):
                             team_id=session.team_id,  # type: ignore
                             user_id=session.user_id,
                             team_session_id=session.team_session_id,  # type: ignore
-                            memory=session.memory,
+                            memory=memory,
                             team_data=session.team_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -492,7 +694,7 @@ class SqliteStorage(Storage):
                         session_id=session.session_id,
                         workflow_id=session.workflow_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=session.memory,
+                        memory=memory,
                         workflow_data=session.workflow_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -505,7 +707,7 @@ class SqliteStorage(Storage):
                         set_=dict(
                             workflow_id=session.workflow_id,  # type: ignore
                             user_id=session.user_id,
-                            memory=session.memory,
+                            memory=memory,
                             workflow_data=session.workflow_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -513,8 +715,20 @@ class SqliteStorage(Storage):
                         ),  # The updated value for each column
                     )
 
-                sess.execute(stmt)
+                # Return the timestamps instead of reading the session back
+                if getattr(self.db_engine.dialect, "insert_returning", False):
+                    returning_stmt = stmt.returning(self.table.c.created_at, self.table.c.updated_at)
+                    timestamps = sess.execute(returning_stmt).fetchone()
+                    if timestamps is not None:
+                        session.created_at, session.updated_at = timestamps.created_at, timestamps.updated_at
+                else:
+                    sess.execute(stmt)
+
+                if runs is not None:
+                    stored_runs = self._write_runs(sess, session.session_id, runs)
         except Exception as e:
+            # The stored runs of the session are unknown after a failed write
+            self._stored_runs.pop(session.session_id)
             if create_and_retry and not self.table_exists():
                 log_debug(f"Table does not exist: {self.table.name}")
                 log_debug("Creating table and retrying upsert")
@@ -526,7 +740,9 @@ class SqliteStorage(Storage):
                     "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
                 )
                 return None
-        return self.read(session_id=session.session_id)
+        if stored_runs is not None:
+            self._stored_runs.set(session.session_id, stored_runs)
+        return session
 
     def delete_session(self, session_id: Optional[str] = None):
         """
@@ -547,6 +763,9 @@ class SqliteStorage(Storage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.runs_table is not None:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    self._stored_runs.pop(session_id)
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -562,9 +781,13 @@ class SqliteStorage(Storage):
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
             self.table.drop(self.db_engine, checkfirst=True)
+            if self.runs_table is not None:
+                self.runs_table.drop(self.db_engine, checkfirst=True)
+                self._stored_runs.clear()
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData()
             self.table = self.get_table()
+            self.runs_table = self.get_runs_table()
 
     def __deepcopy__(self, memo):
         """
@@ -585,7 +808,7 @@ class SqliteStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
             elif k in {"db_engine", "SqlSession"}:
@@ -597,5 +820,6 @@ class SqliteStorage(Storage):
         copied_obj.metadata = MetaData()
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table()
 
         return copied_obj
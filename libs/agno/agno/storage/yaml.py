@@ -1,11 +1,10 @@
-import time
-from dataclasses import asdict
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import List, Literal, Optional, Sequence, Union
 
 import yaml
 
 from agno.storage.base import Storage
+from agno.storage.listing import SessionIndex, SessionPage, stamp_session
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -18,6 +17,8 @@ class YamlStorage(Storage):
         super().__init__(mode)
         self.dir_path = Path(dir_path)
         self.dir_path.mkdir(parents=True, exist_ok=True)
+        # Listing fields of the sessions, so sessions can be listed without reading every session file
+        self._index = SessionIndex(dir_path=self.dir_path, suffix=".yaml", deserialize=self.deserialize)
 
     def serialize(self, data: dict) -> str:
         return yaml.dump(data, default_flow_style=False)
@@ -187,16 +188,28 @@ class YamlStorage(Storage):
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List sessions newest first from the session index, only reading the session files of the page
+        when fields besides the listing fields are requested."""
+        return self._index.list_sessions(
+            self.mode, user_id=user_id, entity_id=entity_id, limit=limit, cursor=cursor, fields=fields
+        )
+
     def upsert(self, session: Session) -> Optional[Session]:
         """Insert or update an Session in storage."""
         try:
-            data = asdict(session)
-            data["updated_at"] = int(time.time())
-            if "created_at" not in data:
-                data["created_at"] = data["updated_at"]
-
+            created_at = self._index.get_created_at(session.session_id) if session.created_at is None else None
+            data = stamp_session(session, created_at=created_at)
             with open(self.dir_path / f"{session.session_id}.yaml", "w", encoding="utf-8") as f:
                 f.write(self.serialize(data))
+            self._index.update(data)
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -208,6 +221,7 @@ class YamlStorage(Storage):
             return
         try:
             (self.dir_path / f"{session_id}.yaml").unlink(missing_ok=True)
+            self._index.remove(session_id)
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
@@ -215,6 +229,7 @@ class YamlStorage(Storage):
         """Drop all sessions from storage."""
         for file in self.dir_path.glob("*.yaml"):
             file.unlink()
+        self._index.clear()
 
     def upgrade_schema(self) -> None:
         """Upgrade the schema of the storage."""
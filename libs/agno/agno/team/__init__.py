@@ -1,3 +1,3 @@
-from agno.team.team import RunResponse, Team, TeamRunResponse
+from agno.team.team import RunResponse, Team, TeamRunResponse, TeamRunResponseDelta
 
-__all__ = ["Team", "RunResponse", "TeamRunResponse"]
+__all__ = ["Team", "RunResponse", "TeamRunResponse", "TeamRunResponseDelta"]
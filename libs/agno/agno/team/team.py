@@ -1,6 +1,5 @@
 import asyncio
 import json
-import threading
 from collections import ChainMap, defaultdict, deque
 from dataclasses import asdict, dataclass, replace
 from os import getenv
@@ -38,9 +37,10 @@ from agno.models.base import Model
 from agno.models.message import Citations, Message, MessageReferences
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
+from agno.run.context import ContextBudget
 from agno.run.messages import RunMessages
 from agno.run.response import RunEvent, RunResponse, RunResponseExtraData
-from agno.run.team import TeamRunResponse
+from agno.run.team import TeamRunResponse, TeamRunResponseDelta
 from agno.storage.base import Storage
 from agno.storage.session.team import TeamSession
 from agno.tools.function import Function
@@ -66,8 +66,10 @@ from agno.utils.response import (
     update_run_response_with_reasoning,
 )
 from agno.utils.safe_formatter import SafeFormatter
+from agno.utils.stream import StreamAccumulator
 from agno.utils.string import is_valid_uuid, parse_response_model_str, url_safe_string
 from agno.utils.timer import Timer
+from agno.utils.tools import copy_tools_for_run
 
 
 @dataclass(init=False)
@@ -183,6 +185,10 @@ class Team:
     tool_choice: Optional[Union[str, Dict[str, Any]]] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls from one model response that run at the same time.
+    # If > 1, sync runs execute the tool calls in a thread pool. If None, sync runs execute them one at a time
+    # and async runs execute them all concurrently.
+    tool_call_concurrency: Optional[int] = None
     # A list of hooks to be called before and after the tool call
     tool_hooks: Optional[List[Callable]] = None
 
@@ -194,6 +200,12 @@ class Team:
     # If True, parse the response
     parse_response: bool = True
 
+    # --- Team Streaming ---
+    # By default, streamed chunks are yielded as TeamRunResponseDelta events carrying only the new content,
+    # and the run_response is updated from the accumulated stream when the stream ends.
+    # If True, yield full TeamRunResponse objects for every chunk.
+    stream_snapshots: bool = False
+
     # --- History ---
     # Memory for the team
     memory: Optional[Union[TeamMemory, Memory]] = None
@@ -215,9 +227,15 @@ class Team:
     num_of_interactions_from_history: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # Token budget for the messages sent to the Model. History is selected and truncated to fit the budget,
+    # and the token accounting is recorded on the run response.
+    context_budget: Optional[ContextBudget] = None
 
     # --- Team Storage ---
     storage: Optional[Storage] = None
+    # If True, async runs save the session to storage in a background task after the response is returned.
+    # Use `await storage.aflush()` to wait for the pending writes, e.g. before shutting down.
+    storage_write_behind: bool = False
     # Extra data stored with this team
     extra_data: Optional[Dict[str, Any]] = None
 
@@ -275,11 +293,13 @@ class Team:
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         response_model: Optional[Type[BaseModel]] = None,
         use_json_mode: bool = False,
         parse_response: bool = True,
+        stream_snapshots: bool = False,
         memory: Optional[Union[TeamMemory, Memory]] = None,
         enable_agentic_memory: bool = False,
         enable_user_memories: bool = False,
@@ -289,7 +309,9 @@ class Team:
         enable_team_history: bool = False,
         num_of_interactions_from_history: Optional[int] = None,
         num_history_runs: int = 3,
+        context_budget: Optional[ContextBudget] = None,
         storage: Optional[Storage] = None,
+        storage_write_behind: bool = False,
         extra_data: Optional[Dict[str, Any]] = None,
         reasoning: bool = False,
         reasoning_model: Optional[Model] = None,
@@ -344,11 +366,13 @@ class Team:
         self.show_tool_calls = show_tool_calls
         self.tool_choice = tool_choice
         self.tool_call_limit = tool_call_limit
+        self.tool_call_concurrency = tool_call_concurrency
         self.tool_hooks = tool_hooks
 
         self.response_model = response_model
         self.use_json_mode = use_json_mode
         self.parse_response = parse_response
+        self.stream_snapshots = stream_snapshots
 
         self.memory = memory
         self.enable_agentic_memory = enable_agentic_memory
@@ -360,8 +384,10 @@ class Team:
         self.enable_team_history = enable_team_history
         self.num_of_interactions_from_history = num_of_interactions_from_history
         self.num_history_runs = num_history_runs
+        self.context_budget = context_budget
 
         self.storage = storage
+        self.storage_write_behind = storage_write_behind
         self.extra_data = extra_data
 
         self.reasoning = reasoning
@@ -505,6 +531,45 @@ class Team:
         self.run_messages = None
         self.run_response = None
 
+    def copy_for_run(self, *, update: Optional[Dict[str, Any]] = None) -> "Team":
+        """Create a lightweight copy of this Team and its members to run one request concurrently with others.
+
+        The copy has its own run and session state, and shares the configuration, model clients, knowledge,
+        storage and memory of this Team. See Agent.copy_for_run().
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields to set on the copy.
+
+        Returns:
+            Team: A copy of this Team that can run concurrently with this Team and its other copies.
+        """
+        from copy import copy, deepcopy
+
+        new_team = copy(self)
+        new_team._reset_run_state()
+        new_team._reset_session_state()
+        new_team.full_team_session_metrics = None
+        # The initial session state and extra data are updated by runs
+        new_team.session_state = deepcopy(self.session_state)
+        new_team.team_session_state = deepcopy(self.team_session_state)
+        new_team.extra_data = deepcopy(self.extra_data)
+        # TeamMemory holds the messages of a single session, Memory is shared by all sessions
+        if isinstance(self.memory, TeamMemory):
+            new_team.memory = self.memory.deep_copy()
+        # Models are configured by runs (e.g. the tool choice), and tools are bound to the team running them
+        new_team.model = copy(self.model)
+        new_team.tools = copy_tools_for_run(self.tools)
+        new_team._tool_instructions = None
+        new_team._tools_for_model = None
+        new_team._functions_for_model = None
+        new_team._member_response_model = None
+        new_team.members = [member.copy_for_run() for member in self.members]
+
+        if update:
+            for key, value in update.items():
+                setattr(new_team, key, value)
+        return new_team
+
     def initialize_team(self, session_id: Optional[str] = None) -> None:
         self._set_defaults()
         self._set_default_model()
@@ -662,8 +727,7 @@ class Team:
         self._set_default_model()
 
         # Register the team on the platform
-        thread = threading.Thread(target=self.register_team)
-        thread.start()
+        self.register_team()
 
         # Run the team
         last_exception = None
@@ -893,6 +957,7 @@ class Team:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         )
 
         # 3. Update TeamRunResponse
@@ -1115,7 +1180,7 @@ class Team:
             effective_filters = self._get_team_effective_filters(knowledge_filters)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Initialize memory if not yet set
         if self.memory is None:
@@ -1138,7 +1203,7 @@ class Team:
         # Configure the model for runs
         self._set_default_model()
 
-        asyncio.create_task(self._aregister_team())
+        await self._aregister_team()
 
         # Run the team
         last_exception = None
@@ -1348,6 +1413,7 @@ class Team:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         )  # type: ignore
 
         # 3. Update TeamRunResponse
@@ -1363,7 +1429,7 @@ class Team:
         )
 
         # 5. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 6. Parse team response model
         if self.response_model is not None and not isinstance(run_response.content, self.response_model):
@@ -1459,7 +1525,7 @@ class Team:
         )
 
         # 4. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 5. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -1659,7 +1725,7 @@ class Team:
             "reasoning_time_taken": 0.0,
         }
 
-        full_model_response = ModelResponse()
+        stream = StreamAccumulator()
         for model_response_chunk in self.model.response_stream(
             messages=run_messages.messages,
             response_format=response_format,
@@ -1667,26 +1733,20 @@ class Team:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         ):
             yield from self._handle_model_response_chunk(
                 run_response=run_response,
                 session_id=session_id,
-                full_model_response=full_model_response,
+                stream=stream,
                 model_response_chunk=model_response_chunk,
                 stream_intermediate_steps=stream_intermediate_steps,
                 reasoning_state=reasoning_state,
             )
 
         # 3. Update TeamRunResponse
-        run_response.created_at = full_model_response.created_at
-        if full_model_response.content is not None:
-            run_response.content = full_model_response.content
-        if full_model_response.thinking is not None:
-            run_response.thinking = full_model_response.thinking
-        if full_model_response.audio is not None:
-            run_response.response_audio = full_model_response.audio
-        if full_model_response.citations is not None:
-            run_response.citations = full_model_response.citations
+        run_response.created_at = stream.created_at
+        self._update_run_response_from_stream(run_response, stream)
 
         if stream_intermediate_steps and reasoning_state["reasoning_started"]:
             all_reasoning_steps: List[ReasoningStep] = []
@@ -1727,7 +1787,7 @@ class Team:
             "reasoning_started": False,
             "reasoning_time_taken": 0.0,
         }
-        full_model_response = ModelResponse()
+        stream = StreamAccumulator()
         model_stream = self.model.aresponse_stream(
             messages=run_messages.messages,
             response_format=response_format,
@@ -1735,33 +1795,22 @@ class Team:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            tool_call_concurrency=self.tool_call_concurrency,
         )  # type: ignore
         async for model_response_chunk in model_stream:
             for chunk in self._handle_model_response_chunk(
                 run_response=run_response,
                 session_id=session_id,
-                full_model_response=full_model_response,
+                stream=stream,
                 model_response_chunk=model_response_chunk,
                 stream_intermediate_steps=stream_intermediate_steps,
                 reasoning_state=reasoning_state,
             ):
                 yield chunk
 
-        # Handle structured outputs
-        if (self.response_model is not None) and not self.use_json_mode and (full_model_response.parsed is not None):
-            # Update the run_response content with the structured output
-            run_response.content = full_model_response.parsed
-
         # Update TeamRunResponse
-        run_response.created_at = full_model_response.created_at
-        if full_model_response.content is not None:
-            run_response.content = full_model_response.content
-        if full_model_response.thinking is not None:
-            run_response.thinking = full_model_response.thinking
-        if full_model_response.audio is not None:
-            run_response.response_audio = full_model_response.audio
-        if full_model_response.citations is not None:
-            run_response.citations = full_model_response.citations
+        run_response.created_at = stream.created_at
+        self._update_run_response_from_stream(run_response, stream)
 
         # Build a list of messages that should be added to the RunResponse
         messages_for_run_response = [m for m in run_messages.messages if m.add_to_agent_memory]
@@ -1792,68 +1841,35 @@ class Team:
         self,
         run_response: TeamRunResponse,
         session_id: str,
-        full_model_response: ModelResponse,
+        stream: StreamAccumulator,
         model_response_chunk: ModelResponse,
         reasoning_state: Dict[str, Any],
         stream_intermediate_steps: bool = False,
     ) -> Iterator[TeamRunResponse]:
         # If the model response is an assistant_response, yield a RunResponse
         if model_response_chunk.event == ModelResponseEvent.assistant_response.value:
-            should_yield = False
-            # Process content and thinking
-            if model_response_chunk.content is not None:
-                if not full_model_response.content:
-                    full_model_response.content = model_response_chunk.content
-                else:
-                    full_model_response.content += model_response_chunk.content
-                should_yield = True
-
-            # Process thinking
-            if model_response_chunk.thinking is not None:
-                if not full_model_response.thinking:
-                    full_model_response.thinking = model_response_chunk.thinking
-                else:
-                    full_model_response.thinking += model_response_chunk.thinking
-                should_yield = True
-
-            if model_response_chunk.citations is not None:
-                # We get citations in one chunk
-                full_model_response.citations = model_response_chunk.citations
-                should_yield = True
-
-            # Process audio
-            if model_response_chunk.audio is not None:
-                if full_model_response.audio is None:
-                    full_model_response.audio = AudioResponse(id=str(uuid4()), content="", transcript="")
-
-                if model_response_chunk.audio.id is not None:
-                    full_model_response.audio.id = model_response_chunk.audio.id  # type: ignore
-                if model_response_chunk.audio.content is not None:
-                    full_model_response.audio.content += model_response_chunk.audio.content  # type: ignore
-                if model_response_chunk.audio.transcript is not None:
-                    full_model_response.audio.transcript += model_response_chunk.audio.transcript  # type: ignore
-                if model_response_chunk.audio.expires_at is not None:
-                    full_model_response.audio.expires_at = model_response_chunk.audio.expires_at  # type: ignore
-                if model_response_chunk.audio.mime_type is not None:
-                    full_model_response.audio.mime_type = model_response_chunk.audio.mime_type  # type: ignore
-                if model_response_chunk.audio.sample_rate is not None:
-                    full_model_response.audio.sample_rate = model_response_chunk.audio.sample_rate
-                if model_response_chunk.audio.channels is not None:
-                    full_model_response.audio.channels = model_response_chunk.audio.channels
-
-                # Yield the audio and transcript bit by bit
-                should_yield = True
-
             # Only yield the chunk
-            if should_yield:
-                yield self._create_run_response(
-                    content=model_response_chunk.content,
-                    thinking=model_response_chunk.thinking,
-                    response_audio=model_response_chunk.audio,
-                    citations=model_response_chunk.citations,
-                    created_at=model_response_chunk.created_at,
-                    session_id=session_id,
-                )
+            if stream.add(model_response_chunk):
+                if not self.stream_snapshots:
+                    yield TeamRunResponseDelta(
+                        content=model_response_chunk.content,
+                        thinking=model_response_chunk.thinking,
+                        response_audio=model_response_chunk.audio,
+                        citations=model_response_chunk.citations,
+                        run_id=self.run_id,
+                        team_id=self.team_id,
+                        session_id=session_id,
+                        created_at=model_response_chunk.created_at,
+                    )
+                else:
+                    yield self._create_run_response(
+                        content=model_response_chunk.content,
+                        thinking=model_response_chunk.thinking,
+                        response_audio=model_response_chunk.audio,
+                        citations=model_response_chunk.citations,
+                        created_at=model_response_chunk.created_at,
+                        session_id=session_id,
+                    )
 
         # If the model response is a tool_call_started, add the tool call to the run_response
         elif model_response_chunk.event == ModelResponseEvent.tool_call_started.value:
@@ -1958,6 +1974,10 @@ class Team:
 
         self.memory = cast(Memory, self.memory)
 
+        if self.memory.job_queue is not None:
+            self._defer_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         # Create a thread pool with a reasonable number of workers
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
@@ -1985,6 +2005,11 @@ class Team:
         self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
     ) -> None:
         self.memory = cast(Memory, self.memory)
+
+        if self.memory.job_queue is not None:
+            self._defer_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         tasks = []
 
         user_message_str = (
@@ -2004,6 +2029,27 @@ class Team:
             except Exception as e:
                 log_warning(f"Error in memory/summary operation: {str(e)}")
 
+    def _defer_memories_and_summaries(
+        self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
+    ) -> None:
+        """Queue the memory and summary updates of the run on the job queue of the memory, without waiting for them"""
+        self.memory = cast(Memory, self.memory)
+
+        try:
+            user_message_str = (
+                run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
+            )
+            if self.enable_user_memories and user_message_str is not None and user_message_str:
+                self.memory.defer_user_memories(message=user_message_str, user_id=user_id)
+
+            if self.enable_session_summaries:
+                # Deferred summaries are saved to the session in storage by the job queue
+                if self.storage is not None and self.memory.job_queue.storage is None:  # type: ignore
+                    self.memory.job_queue.storage = self.storage  # type: ignore
+                self.memory.defer_session_summary(session_id=session_id, user_id=user_id)
+        except Exception as e:
+            log_warning(f"Error in memory/summary operation: {str(e)}")
+
     def _get_response_format(self) -> Optional[Union[Dict, Type[BaseModel]]]:
         self.model = cast(Model, self.model)
         if self.response_model is None:
@@ -3851,6 +3897,15 @@ class Team:
                         continue
                     if v is not None:
                         aggregated_metrics[k].append(v)
+            # Tool call results that were looked up in a tool result cache
+            elif (
+                m.metrics is not None
+                and m.metrics.additional_metrics
+                and "tool_cache_hits" in m.metrics.additional_metrics
+                and m.from_history is False
+            ):
+                for k in ("tool_cache_hits", "tool_cache_misses"):
+                    aggregated_metrics[k].append(m.metrics.additional_metrics[k])
         if aggregated_metrics is not None:
             aggregated_metrics = dict(aggregated_metrics)
         return aggregated_metrics
@@ -4246,6 +4301,17 @@ class Team:
                     session_id=session_id,
                 )
 
+    def _update_run_response_from_stream(self, run_response: TeamRunResponse, stream: StreamAccumulator) -> None:
+        """Set the content, thinking, citations and audio accumulated from the model stream on the run_response."""
+        if stream.content:
+            run_response.content = stream.content.getvalue()
+        if stream.thinking:
+            run_response.thinking = stream.thinking.getvalue()
+        if stream.citations is not None:
+            run_response.citations = stream.citations
+        if stream.audio is not None:
+            run_response.response_audio = stream.get_audio()
+
     def _create_run_response(
         self,
         session_id: str,
@@ -4723,8 +4789,6 @@ class Team:
 
         # 2. Add history to run_messages
         if self.enable_team_history:
-            from copy import deepcopy
-
             history = []
             if isinstance(self.memory, TeamMemory):
                 history = self.memory.get_messages_from_last_n_runs(last_n=self.num_history_runs, skip_role="system")
@@ -4734,8 +4798,9 @@ class Team:
                 )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
+                # Copy the history messages to avoid modifying the original messages.
+                # A shallow copy is enough, as only top-level fields of the copies are changed.
+                history_copy = [msg.model_copy() for msg in history]
 
                 # Tag each message as coming from history
                 for _msg in history_copy:
@@ -4754,6 +4819,15 @@ class Team:
             run_messages.user_message = user_message
             run_messages.messages.append(user_message)
 
+        # 4. Fit the messages to the context budget
+        if self.context_budget is not None:
+            usage = self.context_budget.fit(run_messages)
+            log_debug(f"Context usage: {usage.total_tokens} tokens")
+            if self.run_response is not None:
+                if self.run_response.extra_data is None:
+                    self.run_response.extra_data = RunResponseExtraData()
+                self.run_response.extra_data.context_usage = usage.to_dict()
+
         return run_messages
 
     def _get_user_message(
@@ -6160,6 +6234,35 @@ class Team:
             )
         return self.team_session
 
+    async def aread_from_storage(self, session_id: str) -> Optional[TeamSession]:
+        """Load the TeamSession from storage without blocking the event loop
+
+        Waits for the pending background writes of the session first, so the latest state is read.
+        """
+        if self.storage is not None and session_id is not None:
+            await self.storage.aflush(session_id=session_id)
+            self.team_session = cast(TeamSession, await self.storage.aread(session_id=session_id))
+            if self.team_session is not None:
+                self.load_team_session(session=self.team_session)
+            else:
+                # New session, just reset the state
+                self.session_name = None
+        return self.team_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
+        """Save the TeamSession to storage without blocking the event loop
+
+        If storage_write_behind is True, the session is saved in a background task and this returns immediately.
+        """
+        if self.storage is not None:
+            team_session = self._get_team_session(session_id=session_id, user_id=user_id)
+            if self.storage_write_behind:
+                self.storage.upsert_in_background(team_session)
+                self.team_session = team_session
+            else:
+                self.team_session = cast(TeamSession, await self.storage.aupsert(session=team_session))
+        return self.team_session
+
     def rename_session(self, session_name: str, session_id: Optional[str] = None) -> None:
         """Rename the current session and save to storage"""
         if self.session_id is None and session_id is None:
@@ -6355,21 +6458,10 @@ class Team:
                         except Exception as e:
                             log_warning(f"Failed to load user memories: {e}")
                 if "summaries" in session.memory:
-                    if self.memory.summaries is not None:
-                        pass
-                    else:
-                        from agno.memory.v2.memory import SessionSummary as SessionSummaryV2
-
-                        try:
-                            self.memory.summaries = {
-                                user_id: {
-                                    session_id: SessionSummaryV2.from_dict(summary)
-                                    for session_id, summary in user_session_summaries.items()
-                                }
-                                for user_id, user_session_summaries in session.memory["summaries"].items()
-                            }
-                        except Exception as e:
-                            log_warning(f"Failed to load session summaries: {e}")
+                    try:
+                        self.memory.load_session_summaries(session.memory["summaries"])
+                    except Exception as e:
+                        log_warning(f"Failed to load session summaries: {e}")
         log_debug(f"-*- TeamSession loaded: {session.session_id}")
 
     def load_session(self, force: bool = False) -> Optional[str]:
@@ -7052,7 +7144,7 @@ class Team:
                     run_data=run_data,
                     team_session_id=team_session.team_session_id,
                     session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
+                    team_data=team_session.monitoring_data() if self.monitoring else team_session.telemetry_data(),
                 ),
                 monitor=self.monitoring,
             )
@@ -7076,7 +7168,7 @@ class Team:
                     run_id=self.run_id,
                     run_data=run_data,
                     session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
+                    team_data=team_session.monitoring_data() if self.monitoring else team_session.telemetry_data(),
                 ),
                 monitor=self.monitoring,
             )
@@ -7096,7 +7188,7 @@ class Team:
             upsert_team_session(
                 session=TeamSessionCreate(
                     session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
+                    team_data=team_session.monitoring_data() if self.monitoring else team_session.telemetry_data(),
                 ),
                 monitor=self.monitoring,
             )
@@ -0,0 +1,3 @@
+from agno.tools.cache.base import ToolCache
+from agno.tools.cache.file import FileToolCache
+from agno.tools.cache.in_memory import InMemoryToolCache
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from agno.utils.log import log_warning
+
+
+class ToolCache(ABC):
+    """Base class for the caches of tool call results, used by functions with `cache_results=True`.
+
+    A cache can be shared by many functions and agents: keys are prefixed with the function name.
+    A result of None is never cached.
+    """
+
+    def __init__(self):
+        # Number of lookups that found a cached result, and that did not
+        self.hits: int = 0
+        self.misses: int = 0
+        self._stats_lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get the cached result for `key`, or None if there is no unexpired result"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Cache `value` for `key` for `ttl` seconds"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def clear_namespace(self, namespace: str) -> None:
+        """Delete the results with keys `<namespace>:<...>`, e.g. the results of a single function.
+
+        Caches that cannot delete by key prefix clear all results.
+        """
+        self.clear()
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: int) -> None:
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    def _record(self, value: Optional[Any]) -> Optional[Any]:
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def lookup(self, key: str) -> Optional[Any]:
+        """Get the cached result for `key`, recording a hit or miss. Errors are logged and count as a miss."""
+        try:
+            value = self.get(key)
+        except Exception as e:
+            log_warning(f"Error reading tool cache: {e}")
+            value = None
+        return self._record(value)
+
+    async def alookup(self, key: str) -> Optional[Any]:
+        try:
+            value = await self.aget(key)
+        except Exception as e:
+            log_warning(f"Error reading tool cache: {e}")
+            value = None
+        return self._record(value)
+
+    def store(self, key: str, value: Any, ttl: int) -> None:
+        """Cache a result, logging errors instead of failing the tool call"""
+        if value is None:
+            return
+        try:
+            self.set(key, value, ttl)
+        except Exception as e:
+            log_warning(f"Error writing tool cache: {e}")
+
+    async def astore(self, key: str, value: Any, ttl: int) -> None:
+        if value is None:
+            return
+        try:
+            await self.aset(key, value, ttl)
+        except Exception as e:
+            log_warning(f"Error writing tool cache: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __deepcopy__(self, memo):
+        # Caches hold connections and locks, and are meant to be shared by copies of an agent
+        return self
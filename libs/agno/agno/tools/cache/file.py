@@ -0,0 +1,62 @@
+import json
+import shutil
+from pathlib import Path
+from tempfile import gettempdir
+from time import time
+from typing import Any, Optional, Set
+
+from agno.tools.cache.base import ToolCache
+
+
+class FileToolCache(ToolCache):
+    """Caches each tool call result in a JSON file, under `<cache_dir>/functions/<function name>/`.
+
+    This is the default cache of functions with `cache_results=True`.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        super().__init__()
+        self.cache_dir: Path = Path(cache_dir) if cache_dir else Path(gettempdir()) / "agno_cache"
+        # Directories known to exist, so they are only created once
+        self._created_dirs: Set[Path] = set()
+
+    def _get_path(self, key: str) -> Path:
+        # Keys are "<function name>:<hash>"
+        function_name, _, key_hash = key.rpartition(":")
+        return self.cache_dir / "functions" / function_name / f"{key_hash}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._get_path(key)
+        try:
+            with path.open("r") as f:
+                cache_data = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if time() <= cache_data.get("expires_at", 0):
+            return cache_data.get("result")
+
+        # Remove expired entry
+        path.unlink(missing_ok=True)
+        return None
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        path = self._get_path(key)
+        if path.parent not in self._created_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path.parent)
+        with path.open("w") as f:
+            now = time()
+            json.dump({"timestamp": now, "expires_at": now + ttl, "result": value}, f)
+
+    def delete(self, key: str) -> None:
+        self._get_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.cache_dir / "functions", ignore_errors=True)
+        self._created_dirs.clear()
+
+    def clear_namespace(self, namespace: str) -> None:
+        directory = self.cache_dir / "functions" / namespace
+        shutil.rmtree(directory, ignore_errors=True)
+        self._created_dirs.discard(directory)
@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Optional, Tuple
+
+from agno.tools.cache.base import ToolCache
+
+
+class InMemoryToolCache(ToolCache):
+    """Bounded in-process LRU cache of tool call results.
+
+    Results are kept as-is, without serialization. Expired results are dropped when read, and the least
+    recently used results are evicted once `max_size` results are cached.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        super().__init__()
+        self.max_size: int = max_size
+        # key -> (expiry time, result)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def clear_namespace(self, namespace: str) -> None:
+        prefix = f"{namespace}:"
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # Lookups don't block, so the async methods don't need a worker thread
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: int) -> None:
+        self.set(key, value, ttl)
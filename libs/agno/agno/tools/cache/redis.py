@@ -0,0 +1,89 @@
+import json
+from typing import Any, Dict, Optional
+
+from agno.tools.cache.base import ToolCache
+from agno.utils.log import log_debug
+
+try:
+    from redis import Redis
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+
+class RedisToolCache(ToolCache):
+    def __init__(
+        self,
+        prefix: str = "agno_tool_cache",
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        ssl: Optional[bool] = False,
+        redis_client: Optional[Redis] = None,
+    ):
+        """
+        Cache of tool call results in Redis, shared by all processes using the same Redis database.
+
+        Results are stored as JSON and expire with Redis key expiry.
+
+        Args:
+            prefix (str): Prefix for Redis keys to namespace the cache
+            host (str): Redis host address
+            port (int): Redis port number
+            db (int): Redis database number
+            password (Optional[str]): Redis password if authentication is required
+            ssl (Optional[bool]): Whether to use SSL for Redis connection
+            redis_client (Optional[Redis]): Redis client to use instead of creating one
+        """
+        super().__init__()
+        self.prefix = prefix
+        self._connection_kwargs: Dict[str, Any] = dict(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=True,
+            ssl=ssl,
+        )
+        self.redis_client = redis_client or Redis(**self._connection_kwargs)
+        # Created on first use by the async methods
+        self._async_redis_client: Optional[Any] = None
+        log_debug(f"Created RedisToolCache with prefix: '{self.prefix}'")
+
+    @property
+    def async_redis_client(self) -> Any:
+        if self._async_redis_client is None:
+            from redis.asyncio import Redis as AsyncRedis
+
+            self._async_redis_client = AsyncRedis(**self._connection_kwargs)
+        return self._async_redis_client
+
+    def _get_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        data = self.redis_client.get(self._get_key(key))
+        return json.loads(data) if data is not None else None  # type: ignore
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self.redis_client.set(self._get_key(key), json.dumps(value), ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self.redis_client.delete(self._get_key(key))
+
+    def clear(self) -> None:
+        keys = list(self.redis_client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self.redis_client.delete(*keys)
+
+    def clear_namespace(self, namespace: str) -> None:
+        keys = list(self.redis_client.scan_iter(match=f"{self._get_key(namespace)}:*"))
+        if keys:
+            self.redis_client.delete(*keys)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        data = await self.async_redis_client.get(self._get_key(key))
+        return json.loads(data) if data is not None else None
+
+    async def aset(self, key: str, value: Any, ttl: int) -> None:
+        await self.async_redis_client.set(self._get_key(key), json.dumps(value), ex=ttl)
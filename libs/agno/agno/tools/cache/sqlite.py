@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+from time import time
+from typing import Any, Optional
+
+try:
+    from sqlalchemy import Column, Engine, Float, MetaData, String, Table, Text, create_engine, delete, select
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.pool import StaticPool
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+from agno.tools.cache.base import ToolCache
+from agno.utils.log import log_debug
+
+
+class SqliteToolCache(ToolCache):
+    def __init__(
+        self,
+        table_name: str = "tool_cache",
+        db_url: Optional[str] = None,
+        db_file: Optional[str] = None,
+        db_engine: Optional[Engine] = None,
+        prune_every: int = 1000,
+    ):
+        """
+        Cache of tool call results in a single SQLite table, shared by all processes using the same database file.
+
+        The following order is used to determine the database connection:
+            1. Use the db_engine if provided
+            2. Use the db_url
+            3. Use the db_file
+            4. Create a new in-memory database
+
+        Args:
+            table_name: The name of the table to store results in.
+            db_url: The database URL to connect to.
+            db_file: The database file to connect to.
+            db_engine: The database engine to use.
+            prune_every: Delete the expired results every `prune_every` writes.
+        """
+        _engine: Optional[Engine] = db_engine
+        if _engine is None and db_url is not None:
+            _engine = create_engine(db_url)
+        elif _engine is None and db_file is not None:
+            db_path = Path(db_file).resolve()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            _engine = create_engine(f"sqlite:///{db_path}")
+        elif _engine is None:
+            # A single connection, so all threads see the same in-memory database
+            _engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+        super().__init__()
+        self.db_engine: Engine = _engine
+        self.prune_every: int = prune_every
+        self._writes: int = 0
+        self.table: Table = Table(
+            table_name,
+            MetaData(),
+            Column("key", String, primary_key=True),
+            Column("result", Text),
+            Column("expires_at", Float, index=True),
+        )
+        self.table.create(self.db_engine, checkfirst=True)
+        log_debug(f"Created SqliteToolCache with table: '{table_name}'")
+
+    def get(self, key: str) -> Optional[Any]:
+        stmt = select(self.table.c.result).where(self.table.c.key == key, self.table.c.expires_at > time())
+        with self.db_engine.connect() as conn:
+            result = conn.execute(stmt).scalar()
+        return json.loads(result) if result is not None else None
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        result = json.dumps(value)
+        expires_at = time() + ttl
+        stmt = sqlite.insert(self.table).values(key=key, result=result, expires_at=expires_at)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"], set_=dict(result=stmt.excluded.result, expires_at=stmt.excluded.expires_at)
+        )
+        with self.db_engine.begin() as conn:
+            conn.execute(stmt)
+
+        self._writes += 1
+        if self.prune_every > 0 and self._writes % self.prune_every == 0:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete the expired results. Returns the number of deleted results."""
+        with self.db_engine.begin() as conn:
+            result = conn.execute(delete(self.table).where(self.table.c.expires_at <= time()))
+        log_debug(f"Pruned {result.rowcount} expired tool results")
+        return result.rowcount
+
+    def delete(self, key: str) -> None:
+        with self.db_engine.begin() as conn:
+            conn.execute(delete(self.table).where(self.table.c.key == key))
+
+    def clear(self) -> None:
+        with self.db_engine.begin() as conn:
+            conn.execute(delete(self.table))
+
+    def clear_namespace(self, namespace: str) -> None:
+        with self.db_engine.begin() as conn:
+            conn.execute(delete(self.table).where(self.table.c.key.startswith(f"{namespace}:", autoescape=True)))
@@ -7,7 +7,9 @@ from pydantic import BaseModel, Field, validate_call
 from pydantic._internal._validate_call import ValidateCallWrapper
 
 from agno.exceptions import AgentRunException
-from agno.utils.log import log_debug, log_error, log_exception, log_warning
+from agno.tools.cache.base import ToolCache
+from agno.tools.cache.file import FileToolCache
+from agno.utils.log import log_debug, log_exception, log_warning
 
 T = TypeVar("T")
 
@@ -116,6 +118,9 @@ class Function(BaseModel):
     cache_results: bool = False
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
+    # The ToolCache results are cached in, e.g. an InMemoryToolCache shared by many functions.
+    # Defaults to a FileToolCache in cache_dir.
+    cache: Optional[Any] = None
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
@@ -354,53 +359,11 @@ class Function(BaseModel):
         key_str = f"{self.name}:{args_str}:{kwargs_str}"
         return md5(key_str.encode()).hexdigest()
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
-        from pathlib import Path
-        from tempfile import gettempdir
-
-        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
-
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
-        """Retrieve cached result if valid."""
-        import json
-        from pathlib import Path
-        from time import time
-
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
-
-        try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
-
-            if time() - timestamp <= self.cache_ttl:
-                return result
-
-            # Remove expired entry
-            cache_path.unlink()
-        except Exception as e:
-            log_error(f"Error reading cache: {e}")
-
-        return None
-
-    def _save_to_cache(self, cache_file: str, result: Any):
-        """Save result to cache."""
-        import json
-        from time import time
-
-        try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
-        except Exception as e:
-            log_error(f"Error writing cache: {e}")
+    def _get_cache(self) -> ToolCache:
+        """Get the cache for the results of this function, creating the default file cache if needed."""
+        if self.cache is None:
+            self.cache = FileToolCache(cache_dir=self.cache_dir)
+        return self.cache
 
 
 class FunctionExecutionResult(BaseModel):
@@ -423,6 +386,12 @@ class FunctionCall(BaseModel):
 
     # Error while parsing arguments or running the function.
     error: Optional[str] = None
+    # True if the result was read from the tool result cache, False if it was not cached. None if caching is off.
+    cache_hit: Optional[bool] = None
+
+    def _get_cache_key(self, entrypoint_args: Dict[str, Any]) -> str:
+        """Key of the call in the function's cache, prefixed with the function name as caches can be shared."""
+        return f"{self.function.name}:{self.function._get_cache_key(entrypoint_args, self.arguments)}"
 
     def get_call_str(self) -> str:
         """Returns a string representation of the function call."""
@@ -577,10 +546,13 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
+        cache: Optional[ToolCache] = None
+        cache_key: Optional[str] = None
         if self.function.cache_results and not isgenerator(self.function.entrypoint):
-            cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cache = self.function._get_cache()
+            cache_key = self._get_cache_key(entrypoint_args)
+            cached_result = cache.lookup(cache_key)
+            self.cache_hit = cached_result is not None
 
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
@@ -605,10 +577,8 @@ class FunctionCall(BaseModel):
             else:
                 self.result = result
                 # Only cache non-generator results
-                if self.function.cache_results:
-                    cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                if cache is not None and cache_key is not None:
+                    cache.store(cache_key, self.result, ttl=self.function.cache_ttl)
 
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
@@ -758,12 +728,15 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
+        cache: Optional[ToolCache] = None
+        cache_key: Optional[str] = None
         if self.function.cache_results and not (
             isasyncgen(self.function.entrypoint) or isgenerator(self.function.entrypoint)
         ):
-            cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cache = self.function._get_cache()
+            cache_key = self._get_cache_key(entrypoint_args)
+            cached_result = await cache.alookup(cache_key)
+            self.cache_hit = cached_result is not None
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
@@ -787,10 +760,12 @@ class FunctionCall(BaseModel):
                     self.result = await result
 
             # Only cache if not a generator
-            if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
-                cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+            if (
+                cache is not None
+                and cache_key is not None
+                and not (isgenerator(self.result) or isasyncgen(self.result))
+            ):
+                await cache.astore(cache_key, self.result, ttl=self.function.cache_ttl)
 
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
@@ -0,0 +1,90 @@
+import json
+from dataclasses import asdict, fields, is_dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Collection, Dict, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def shallow_asdict(
+    obj: Any,
+    include: Optional[Collection[str]] = None,
+    exclude: Collection[str] = (),
+    exclude_none: bool = False,
+) -> Dict[str, Any]:
+    """Get the fields of a dataclass instance as a dictionary, without copying the values.
+
+    Unlike `dataclasses.asdict`, nested dataclasses, lists and dicts are not deep-copied: the dictionary shares its
+    values with `obj`, so it should be serialized or only modified at the top level.
+
+    Args:
+        obj: The dataclass instance.
+        include: Only get these fields. Defaults to all fields.
+        exclude: Fields to leave out.
+        exclude_none: Leave out the fields that are None.
+    """
+    names = _field_names(obj.__class__)
+    if include is not None:
+        names = tuple(name for name in names if name in include)
+    _dict: Dict[str, Any] = {}
+    for name in names:
+        if name in exclude:
+            continue
+        value = getattr(obj, name)
+        if exclude_none and value is None:
+            continue
+        _dict[name] = value
+    return _dict
+
+
+def json_default(o: Any) -> Any:
+    """Convert the values that are not natively JSON serializable."""
+    if isinstance(o, BaseModel):
+        return o.model_dump(exclude_none=True)
+    if is_dataclass(o) and not isinstance(o, type):
+        return asdict(o)
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    if isinstance(o, (Path, UUID)):
+        return str(o)
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def to_json(data: Any, indent: Optional[int] = None) -> str:
+    """Serialize to JSON, with orjson when it is installed.
+
+    Args:
+        data: The data to serialize.
+        indent: Number of spaces to indent with. Defaults to None, for compact JSON.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=json_default, option=option).decode("utf-8")
+    if indent is None:
+        return json.dumps(data, default=json_default, separators=(",", ":"))
+    return json.dumps(data, default=json_default, indent=indent)
+
+
+def to_msgpack(data: Any) -> bytes:
+    """Serialize to MessagePack, a binary format that is smaller and faster to parse than JSON."""
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError("`msgpack` not installed. Please install using `pip install msgpack`")
+
+    return msgpack.packb(data, default=json_default)
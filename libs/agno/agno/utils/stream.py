@@ -0,0 +1,120 @@
+from dataclasses import dataclass, field
+from time import time
+from typing import List, Optional
+from uuid import uuid4
+
+from agno.media import AudioResponse
+from agno.models.message import Citations
+from agno.models.response import ModelResponse
+
+
+class TextBuffer:
+    """Text accumulated from streamed fragments.
+
+    Appending a fragment is amortized O(1) and the fragments are only joined when the text is read, so a stream of
+    n fragments costs O(n) instead of the O(n^2) of `text = text + fragment`.
+    """
+
+    __slots__ = ("_parts", "_length")
+
+    def __init__(self, text: str = "") -> None:
+        self._parts: List[str] = [text] if text else []
+        self._length: int = len(text)
+
+    def append(self, fragment: Optional[str]) -> None:
+        if fragment:
+            self._parts.append(fragment)
+            self._length += len(fragment)
+
+    def __iadd__(self, fragment: Optional[str]) -> "TextBuffer":
+        self.append(fragment)
+        return self
+
+    def getvalue(self) -> str:
+        """Join the fragments, keeping the joined text so the next read only joins the newer fragments."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def __str__(self) -> str:
+        return self.getvalue()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TextBuffer):
+            return self.getvalue() == other.getvalue()
+        if isinstance(other, str):
+            return self.getvalue() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"TextBuffer({self.getvalue()!r})"
+
+
+@dataclass
+class StreamAccumulator:
+    """Accumulates the assistant response chunks of a model stream, the full response is only built when read."""
+
+    content: TextBuffer = field(default_factory=TextBuffer)
+    thinking: TextBuffer = field(default_factory=TextBuffer)
+    redacted_thinking: TextBuffer = field(default_factory=TextBuffer)
+    # Citations are received in one chunk
+    citations: Optional[Citations] = None
+    # Audio metadata, the audio content and transcript are kept in buffers
+    audio: Optional[AudioResponse] = None
+    audio_content: TextBuffer = field(default_factory=TextBuffer)
+    audio_transcript: TextBuffer = field(default_factory=TextBuffer)
+    created_at: int = field(default_factory=lambda: int(time()))
+
+    def add(self, chunk: ModelResponse) -> bool:
+        """Add an assistant response chunk.
+
+        Returns:
+            bool: True if the chunk had content, thinking, citations or audio to stream.
+        """
+        has_delta = False
+        if chunk.content is not None:
+            self.content.append(chunk.content)
+            has_delta = True
+        if chunk.thinking is not None:
+            self.thinking.append(chunk.thinking)
+            has_delta = True
+        if chunk.redacted_thinking is not None:
+            self.redacted_thinking.append(chunk.redacted_thinking)
+            has_delta = True
+        if chunk.citations is not None:
+            self.citations = chunk.citations
+            has_delta = True
+        if chunk.audio is not None:
+            self.add_audio(chunk.audio)
+            has_delta = True
+        return has_delta
+
+    def add_audio(self, audio: AudioResponse) -> None:
+        if self.audio is None:
+            self.audio = AudioResponse(id=str(uuid4()), content="", transcript="")
+
+        if audio.id is not None:
+            self.audio.id = audio.id
+        self.audio_content.append(audio.content)
+        self.audio_transcript.append(audio.transcript)
+        if audio.expires_at is not None:
+            self.audio.expires_at = audio.expires_at
+        if audio.mime_type is not None:
+            self.audio.mime_type = audio.mime_type
+        self.audio.sample_rate = audio.sample_rate
+        self.audio.channels = audio.channels
+
+    def get_audio(self) -> Optional[AudioResponse]:
+        """Get the audio response with the content and transcript received so far."""
+        if self.audio is not None:
+            self.audio.content = self.audio_content.getvalue()
+            self.audio.transcript = self.audio_transcript.getvalue()
+        return self.audio
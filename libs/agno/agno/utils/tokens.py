@@ -0,0 +1,90 @@
+import json
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from agno.models.message import Message
+
+# Tokens added by chat formats around each message (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+# Estimated tokens of an image, audio, video or file attached to a message
+MEDIA_TOKENS = 765
+
+
+class Tokenizer(ABC):
+    """Counts the tokens of a text locally, without calling the model provider"""
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        raise NotImplementedError
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Keep the start of `text`, up to `max_tokens` tokens"""
+        tokens = self.count(text)
+        if tokens <= max_tokens:
+            return text
+        # Cut proportionally, then shorten until the text fits
+        end = int(len(text) * max_tokens / tokens)
+        while end > 0 and self.count(text[:end]) > max_tokens:
+            end = int(end * 0.9)
+        return text[:end]
+
+
+@dataclass
+class ApproximateTokenizer(Tokenizer):
+    """Estimates tokens from the number of characters. Fast, and close enough to budget prompts of English text."""
+
+    chars_per_token: float = 4.0
+
+    def count(self, text: str) -> int:
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return text[: int(max_tokens * self.chars_per_token)]
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Counts tokens with a tiktoken encoding, e.g. for OpenAI models"""
+
+    def __init__(self, model: Optional[str] = None, encoding_name: str = "o200k_base"):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError("`tiktoken` not installed. Please install it using `pip install tiktoken`")
+
+        if model is not None:
+            try:
+                self.encoding = tiktoken.encoding_for_model(model)
+                return
+            except KeyError:
+                pass
+        self.encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        tokens = self.encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self.encoding.decode(tokens[:max_tokens])
+
+
+def _to_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
+
+
+def count_message_tokens(message: Message, tokenizer: Tokenizer) -> int:
+    """Tokens of a message as sent to the model: its content, tool calls and attached media"""
+    tokens = MESSAGE_OVERHEAD_TOKENS
+    if message.content is not None:
+        tokens += tokenizer.count(_to_text(message.content))
+    if message.tool_calls:
+        tokens += tokenizer.count(_to_text(message.tool_calls))
+    for media in (message.images, message.audio, message.videos, message.files):
+        if media:
+            tokens += MEDIA_TOKENS * len(media)
+    return tokens
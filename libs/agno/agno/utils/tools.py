@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 
 from agno.models.response import ToolExecution
 from agno.tools.function import Function, FunctionCall
@@ -100,3 +101,29 @@ def get_function_call_for_tool_execution(
         call_id=_tool_call_id,
         functions=functions,
     )
+
+
+def copy_tools_for_run(tools: Optional[List[Any]]) -> Optional[List[Any]]:
+    """Shallow copies of the Toolkits and Functions in `tools`, for an agent or team copied for a run.
+
+    Agents and teams bind the functions they use to themselves, so functions shared by concurrent runs
+    would see the wrong agent. Entrypoints and other callables are shared.
+    """
+    if tools is None:
+        return None
+
+    from copy import copy
+
+    from agno.tools.toolkit import Toolkit
+
+    tools_copy: List[Any] = []
+    for tool in tools:
+        if isinstance(tool, Toolkit):
+            toolkit = copy(tool)
+            toolkit.functions = OrderedDict((name, function.model_copy()) for name, function in tool.functions.items())
+            tools_copy.append(toolkit)
+        elif isinstance(tool, Function):
+            tools_copy.append(tool.model_copy())
+        else:
+            tools_copy.append(tool)
+    return tools_copy
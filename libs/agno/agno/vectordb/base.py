@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 
@@ -34,6 +35,27 @@ class VectorDb(ABC):
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents already exist, in the same order as the input.
+
+        Backends that can look up many documents with a single query should override this method.
+        """
+        return [self.doc_exists(document) for document in documents]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents already exist asynchronously, in the same order as the input.
+
+        Failed checks are reported as not existing.
+        """
+        results = await asyncio.gather(
+            *[self.async_doc_exists(document) for document in documents], return_exceptions=True
+        )
+        return [exists is True for exists in results]
+
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of ids that exist in the vector db"""
+        return {id for id in ids if self.id_exists(id)}
+
     @abstractmethod
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         raise NotImplementedError
@@ -54,12 +76,27 @@ class VectorDb(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Search the vector db. Documents are returned with their content and metadata.
+
+        Stored embeddings are only read when `include_embeddings` is True, as they are the largest part of
+        each result. They can also be read later with `fetch_embeddings`.
+        """
         raise NotImplementedError
 
     @abstractmethod
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         raise NotImplementedError
 
@@ -94,3 +131,41 @@ class VectorDb(ABC):
     @abstractmethod
     def delete(self) -> bool:
         raise NotImplementedError
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Return the stored embeddings of the documents with the given ids. Missing ids are not included."""
+        raise NotImplementedError
+
+    def fetch_embeddings(self, documents: List[Document]) -> List[Document]:
+        """Set the embeddings of documents returned by a search without them.
+
+        Stored embeddings are read by id. Documents whose embedding can't be read are embedded again, if the
+        vector db has an embedder.
+        """
+        missing = [document for document in documents if document.embedding is None]
+        if not missing:
+            return documents
+
+        ids = [document.id for document in missing if document.id is not None]
+        stored: Dict[str, List[float]] = {}
+        if ids:
+            try:
+                stored = self.get_embeddings(ids)
+            except NotImplementedError:
+                pass
+        for document in missing:
+            if document.id is not None and document.id in stored:
+                document.embedding = stored[document.id]
+
+        to_embed = [document for document in missing if document.embedding is None]
+        embedder = getattr(self, "embedder", None)
+        if to_embed and embedder is not None:
+            Document.embed_batch(to_embed, embedder=embedder)
+        return documents
+
+    async def async_fetch_embeddings(self, documents: List[Document]) -> List[Document]:
+        return await asyncio.to_thread(self.fetch_embeddings, documents)
+
+    def delete_by_content_hash(self, content_hashes: List[str]) -> bool:
+        """Delete the documents with the given content hashes (md5 of the document content)"""
+        raise NotImplementedError
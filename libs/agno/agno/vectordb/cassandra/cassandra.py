@@ -3,6 +3,7 @@ from typing import Any, Dict, Iterable, List, Optional
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.utils.log import log_debug, log_info
 from agno.vectordb.base import VectorDb
 from agno.vectordb.cassandra.index import AgnoMetadataVectorCassandraTable
@@ -55,12 +56,12 @@ class Cassandra(VectorDb):
         """Create the table asynchronously by running in a thread."""
         await asyncio.to_thread(self.create)
 
-    def _row_to_document(self, row: Dict[str, Any]) -> Document:
+    def _row_to_document(self, row: Dict[str, Any], include_embeddings: bool = True) -> Document:
         return Document(
             id=row["row_id"],
             content=row["body_blob"],
             meta_data=row["metadata"],
-            embedding=row["vector"],
+            embedding=row["vector"] if include_embeddings else None,
             name=row["document_name"],
         )
 
@@ -93,8 +94,8 @@ class Cassandra(VectorDb):
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_debug(f"Cassandra VectorDB : Inserting Documents to the table {self.table_name}")
         futures = []
+        Document.embed_batch(documents, embedder=self.embedder)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             metadata = {key: str(value) for key, value in doc.meta_data.items()}
             futures.append(
                 self.table.put_async(
@@ -121,26 +122,37 @@ class Cassandra(VectorDb):
         """Upsert documents asynchronously by running in a thread."""
         await asyncio.to_thread(self.upsert, documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """Keyword-based search on document metadata."""
         log_debug(f"Cassandra VectorDB : Performing Vector Search on {self.table_name} with query {query}")
-        return self.vector_search(query=query, limit=limit)
+        return self.vector_search(query=query, limit=limit, include_embeddings=include_embeddings)
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        return await asyncio.to_thread(self.search, query, limit, filters, include_embeddings)
 
     def _search_to_documents(
         self,
         hits: Iterable[Dict[str, Any]],
+        include_embeddings: bool = True,
     ) -> List[Document]:
-        return [self._row_to_document(row=hit) for hit in hits]
+        return [self._row_to_document(row=hit, include_embeddings=include_embeddings) for hit in hits]
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+    def vector_search(self, query: str, limit: int = 5, include_embeddings: bool = False) -> List[Document]:
         """Vector similarity search implementation."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         hits = list(
             self.table.metric_ann_search(
                 vector=query_embedding,
@@ -148,9 +160,18 @@ class Cassandra(VectorDb):
                 metric="cos",
             )
         )
-        d = self._search_to_documents(hits)
+        # The ANN search of cassio always reads the vectors, they are only kept when requested
+        d = self._search_to_documents(hits, include_embeddings=include_embeddings)
         return d
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Get the stored vectors of the documents with the given ids, with a single query."""
+        if not ids:
+            return {}
+        query = f"SELECT row_id, vector FROM {self.keyspace}.{self.table_name} WHERE row_id IN %s"
+        rows = self.session.execute(query, (tuple(dict.fromkeys(ids)),))
+        return {row[0]: list(row[1]) for row in rows if row[1]}
+
     def drop(self) -> None:
         """Drop the vector table in Cassandra."""
         log_debug(f"Cassandra VectorDB : Dropping Table {self.table_name}")
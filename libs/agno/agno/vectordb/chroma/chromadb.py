@@ -1,6 +1,6 @@
 import asyncio
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -14,6 +14,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -117,6 +118,42 @@ class ChromaDb(VectorDb):
         """Check if a document exists asynchronously."""
         return await asyncio.to_thread(self.doc_exists, document)
 
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of the given ids that exist in the collection.
+        Args:
+            ids (List[str]): Ids to check.
+        Returns:
+            Set[str]: Ids that exist.
+        """
+        if not self.client:
+            logger.warning("Client not initialized")
+            return set()
+        if not ids:
+            return set()
+
+        try:
+            collection: Collection = self.client.get_collection(name=self.collection_name)
+            result: GetResult = collection.get(ids=list(dict.fromkeys(ids)), include=[])
+            return set(result.get("ids", []))
+        except Exception as e:
+            logger.error(f"Error checking existing ids: {e}")
+        return set()
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist in the collection, with a single lookup by id.
+        Args:
+            documents (List[Document]): Documents to check.
+        Returns:
+            List[bool]: For each document, True if it exists, False otherwise.
+        """
+        doc_ids = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        existing = self.existing_ids(doc_ids)
+        return [doc_id in existing for doc_id in doc_ids]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist asynchronously."""
+        return await asyncio.to_thread(self.docs_exist, documents)
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
         Args:
@@ -153,8 +190,8 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -200,8 +237,8 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -221,7 +258,13 @@ class ChromaDb(VectorDb):
         """Upsert documents asynchronously by running in a thread."""
         await asyncio.to_thread(self.upsert, documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """Search the collection for a query.
 
         Args:
@@ -233,10 +276,11 @@ class ChromaDb(VectorDb):
                 - $gt, $gte, $lt, $lte: Numeric comparisons
                 - $in, $nin: List inclusion/exclusion
                 - $and, $or: Logical operators
+            include_embeddings (bool): Whether to return the stored embeddings of the results.
         Returns:
             List[Document]: List of search results.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -251,7 +295,9 @@ class ChromaDb(VectorDb):
             query_embeddings=query_embedding,
             n_results=limit,
             where=where_filter,  # Add where filter
-            include=["metadatas", "documents", "embeddings", "distances", "uris"],
+            include=["metadatas", "documents", "distances", "embeddings"]
+            if include_embeddings
+            else ["metadatas", "documents", "distances"],
         )
 
         # Build search results
@@ -260,8 +306,9 @@ class ChromaDb(VectorDb):
         ids = result.get("ids", [[]])[0]
         metadata = result.get("metadatas", [{}])[0]
         documents = result.get("documents", [[]])[0]
-        embeddings = result.get("embeddings")[0]
-        embeddings = [e.tolist() if hasattr(e, "tolist") else e for e in embeddings]
+        embeddings: List[Optional[List[float]]] = [None] * len(ids)
+        if include_embeddings:
+            embeddings = [e.tolist() if hasattr(e, "tolist") else e for e in result.get("embeddings")[0]]
         distances = result.get("distances", [[]])[0]
 
         for idx, distance in enumerate(distances):
@@ -312,10 +359,34 @@ class ChromaDb(VectorDb):
         return converted
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        return await asyncio.to_thread(self.search, query, limit, filters, include_embeddings)
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Return the stored embeddings of the given ids, with a single lookup.
+        Args:
+            ids (List[str]): Ids of the documents.
+        Returns:
+            Dict[str, List[float]]: Embeddings by id. Missing ids are not included.
+        """
+        if not self.client or not ids:
+            return {}
+
+        collection: Collection = self.client.get_collection(name=self.collection_name)
+        result: GetResult = collection.get(ids=list(dict.fromkeys(ids)), include=["embeddings"])  # type: ignore
+        embeddings = result.get("embeddings")
+        if embeddings is None:
+            return {}
+        return {
+            id_: embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
+            for id_, embedding in zip(result.get("ids", []), embeddings)
+        }
 
     def drop(self) -> None:
         """Delete the collection."""
@@ -360,3 +431,18 @@ class ChromaDb(VectorDb):
         except Exception as e:
             logger.error(f"Error clearing collection: {e}")
             return False
+
+    def delete_by_content_hash(self, content_hashes: List[str]) -> bool:
+        """Delete the documents with the given content hashes, which Chroma uses as ids.
+        Args:
+            content_hashes (List[str]): Content hashes of the documents to delete.
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        try:
+            collection: Collection = self.client.get_collection(name=self.collection_name)
+            collection.delete(ids=list(content_hashes))
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
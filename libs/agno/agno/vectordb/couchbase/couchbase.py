@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Union
 from agno.document import Document
 from agno.embedder import Embedder
 from agno.embedder.openai import OpenAIEmbedder
+from agno.embedder.query_cache import embed_query
 from agno.utils.log import log_debug, logger
 from agno.vectordb.base import VectorDb
 
@@ -303,6 +304,7 @@ class CouchbaseSearch(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
 
         docs_to_insert: Dict[str, Any] = {}
+        self._embed_documents(documents)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -367,6 +369,30 @@ class CouchbaseSearch(VectorDb):
         if errors_occurred:
             logger.warning("Some errors occurred during the insert operation. Please check logs for details.")
 
+    def _embed_documents(self, documents: List[Document]) -> None:
+        """
+        Embed all documents that have content but no embedding yet, in as few requests as possible.
+
+        Args:
+            documents: List of documents to embed
+        """
+        Document.embed_batch(
+            [document for document in documents if document.content and document.embedding is None],
+            embedder=self.embedder,
+        )
+
+    async def _async_embed_documents(self, documents: List[Document]) -> None:
+        """
+        Embed all documents that have content but no embedding yet asynchronously.
+
+        Args:
+            documents: List of documents to embed
+        """
+        await Document.async_embed_batch(
+            [document for document in documents if document.content and document.embedding is None],
+            embedder=self.embedder,
+        )
+
     def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Update existing documents or insert new ones into the Couchbase bucket.
@@ -378,6 +404,7 @@ class CouchbaseSearch(VectorDb):
         logger.info(f"Upserting {len(documents)} documents")
 
         docs_to_upsert: Dict[str, Any] = {}
+        self._embed_documents(documents)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -433,9 +460,15 @@ class CouchbaseSearch(VectorDb):
         if errors_occurred:
             logger.warning("Some errors occurred during the upsert operation. Please check logs for details.")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """Search the Couchbase bucket for documents relevant to the query."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -463,17 +496,18 @@ class CouchbaseSearch(VectorDb):
             else:
                 results = self.scope.search(**search_args)
 
-            return self.__get_doc_from_kv(results)
+            return self.__get_doc_from_kv(results, include_embeddings)
         except Exception as e:
             logger.error(f"Error during search: {e}")
             raise
 
-    def __get_doc_from_kv(self, response: SearchResult) -> List[Document]:
+    def __get_doc_from_kv(self, response: SearchResult, include_embeddings: bool = True) -> List[Document]:
         """
         Convert search results to Document objects by fetching full documents from KV store.
 
         Args:
             response: SearchResult from Couchbase search query
+            include_embeddings: Whether to keep the stored embeddings in the documents
 
         Returns:
             List of Document objects
@@ -505,12 +539,23 @@ class CouchbaseSearch(VectorDb):
                     name=value["name"],
                     content=value["content"],
                     meta_data=value["meta_data"],
-                    embedding=value["embedding"],
+                    embedding=value["embedding"] if include_embeddings else None,
                 )
             )
 
         return documents
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Get the stored embeddings of the documents with the given ids from the KV store."""
+        if not ids:
+            return {}
+        kv_response = self.collection.get_multi(keys=list(dict.fromkeys(ids)))
+        embeddings: Dict[str, List[float]] = {}
+        for doc_id, get_result in kv_response.results.items():
+            if get_result is not None and get_result.success and get_result.value.get("embedding"):
+                embeddings[doc_id] = get_result.value["embedding"]
+        return embeddings
+
     def drop(self) -> None:
         """Delete the collection from the scope."""
         if self.exists():
@@ -841,6 +886,7 @@ class CouchbaseSearch(VectorDb):
         async_collection_instance = await self.get_async_collection()
         all_docs_to_insert: Dict[str, Any] = {}
 
+        await self._async_embed_documents(documents)
         for document in documents:
             try:
                 # User edit: self.prepare_doc is no longer awaited with to_thread
@@ -894,6 +940,7 @@ class CouchbaseSearch(VectorDb):
         async_collection_instance = await self.get_async_collection()
         all_docs_to_upsert: Dict[str, Any] = {}
 
+        await self._async_embed_documents(documents)
         for document in documents:
             try:
                 # Consistent with async_insert, prepare_doc is not awaited with to_thread based on prior user edits
@@ -943,9 +990,13 @@ class CouchbaseSearch(VectorDb):
         logger.info(f"[async] Total successfully upserted: {total_upserted_count}, Total failed: {total_failed_count}.")
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"[async] Failed to generate embedding for query: {query}")
             return []
@@ -974,7 +1025,7 @@ class CouchbaseSearch(VectorDb):
                 async_scope_instance = await self.get_async_scope()
                 results = async_scope_instance.search(**search_args)
 
-            return await self.__async_get_doc_from_kv(results)
+            return await self.__async_get_doc_from_kv(results, include_embeddings)
         except Exception as e:
             logger.error(f"[async] Error during search: {e}")
             raise
@@ -1004,12 +1055,15 @@ class CouchbaseSearch(VectorDb):
         except Exception:
             return False
 
-    async def __async_get_doc_from_kv(self, response: AsyncSearchIndex) -> List[Document]:
+    async def __async_get_doc_from_kv(
+        self, response: AsyncSearchIndex, include_embeddings: bool = True
+    ) -> List[Document]:
         """
         Convert search results to Document objects by fetching full documents from KV store concurrently.
 
         Args:
             response: SearchResult from Couchbase search query
+            include_embeddings: Whether to keep the stored embeddings in the documents
 
         Returns:
             List of Document objects
@@ -1059,7 +1113,7 @@ class CouchbaseSearch(VectorDb):
                             name=value.get("name"),
                             content=value.get("content", ""),
                             meta_data=value.get("meta_data", {}),
-                            embedding=value.get("embedding", []),
+                            embedding=value.get("embedding") if include_embeddings else None,
                         )
                     )
                 except Exception as e:
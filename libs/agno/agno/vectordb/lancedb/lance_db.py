@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import lancedb
@@ -10,6 +10,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -204,6 +205,50 @@ class LanceDb(VectorDb):
             self.table = self.connection.open_table(name=self.table_name)
         return self.doc_exists(document)
 
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """
+        Return the subset of the given ids that exist in the table, using one IN filter per chunk of ids
+
+        Args:
+            ids (List[str]): Ids to check
+        """
+        existing: Set[str] = set()
+        unique_ids = list(dict.fromkeys(ids))
+        try:
+            if self.table is not None:
+                for i in range(0, len(unique_ids), 1000):
+                    chunk = unique_ids[i : i + 1000]
+                    id_list = ", ".join("'" + id.replace("'", "''") + "'" for id in chunk)
+                    query = self.table.search().where(f"{self._id} IN ({id_list})").select([self._id])
+                    result = query.limit(len(chunk)).to_arrow()
+                    existing.update(result.column(self._id).to_pylist())
+        except Exception:
+            # Search sometimes fails with stale cache data, it means the docs don't exist
+            return existing
+        return existing
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Check which documents exist, in the same order as the input
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        doc_ids = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        existing = self.existing_ids(doc_ids)
+        return [doc_id in existing for doc_id in doc_ids]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Asynchronously check which documents exist
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        if self.connection:
+            self.table = self.connection.open_table(name=self.table_name)
+        return self.docs_exist(documents)
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -219,17 +264,16 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         data = []
 
-        for document in documents:
-            if self.doc_exists(document):
-                continue
+        new_documents = [document for document, exists in zip(documents, self.docs_exist(documents)) if not exists]
+        Document.embed_batch(new_documents, embedder=self.embedder)
 
+        for document in new_documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -278,17 +322,17 @@ class LanceDb(VectorDb):
         data = []
 
         # Prepare documents for insertion
-        for document in documents:
-            if await self.async_doc_exists(document):
-                continue
+        existing = await self.async_docs_exist(documents)
+        new_documents = [document for document, exists in zip(documents, existing) if not exists]
+        await Document.async_embed_batch(new_documents, embedder=self.embedder)
 
+        for document in new_documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -336,7 +380,13 @@ class LanceDb(VectorDb):
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         await self.async_insert(documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Search for documents matching the query.
 
@@ -344,6 +394,7 @@ class LanceDb(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            include_embeddings (bool): Whether to read the stored vectors of the results
 
         Returns:
             List[Document]: List of matching documents
@@ -354,11 +405,11 @@ class LanceDb(VectorDb):
         results = None
 
         if self.search_type == SearchType.vector:
-            results = self.vector_search(query, limit)
+            results = self.vector_search(query, limit, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            results = self.keyword_search(query, limit)
+            results = self.keyword_search(query, limit, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            results = self.hybrid_search(query, limit)
+            results = self.hybrid_search(query, limit, include_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
@@ -394,7 +445,11 @@ class LanceDb(VectorDb):
         return search_results
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Asynchronously search for documents matching the query.
@@ -403,6 +458,7 @@ class LanceDb(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            include_embeddings (bool): Whether to read the stored vectors of the results
 
         Returns:
             List[Document]: List of matching documents
@@ -414,11 +470,11 @@ class LanceDb(VectorDb):
         results = None
 
         if self.search_type == SearchType.vector:
-            results = self.vector_search(query, limit)
+            results = self.vector_search(query, limit, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            results = self.keyword_search(query, limit)
+            results = self.keyword_search(query, limit, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            results = self.hybrid_search(query, limit)
+            results = self.hybrid_search(query, limit, include_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
@@ -453,8 +509,8 @@ class LanceDb(VectorDb):
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+    def vector_search(self, query: str, limit: int = 5, include_embeddings: bool = False) -> List[Document]:
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return None
@@ -463,18 +519,22 @@ class LanceDb(VectorDb):
             logger.error("Table not initialized. Please create the table first")
             return None  # type: ignore
 
-        results = self.table.search(
-            query=query_embedding,
-            vector_column_name=self._vector_col,
-        ).limit(limit)
+        results = (
+            self.table.search(
+                query=query_embedding,
+                vector_column_name=self._vector_col,
+            )
+            .select(self._search_columns(include_embeddings))
+            .limit(limit)
+        )
 
         if self.nprobes:
             results.nprobes(self.nprobes)
 
         return results.to_pandas()
 
-    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+    def hybrid_search(self, query: str, limit: int = 5, include_embeddings: bool = False) -> List[Document]:
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -494,6 +554,7 @@ class LanceDb(VectorDb):
             )
             .vector(query_embedding)
             .text(query)
+            .select(self._search_columns(include_embeddings))
             .limit(limit)
         )
 
@@ -502,7 +563,7 @@ class LanceDb(VectorDb):
 
         return results.to_pandas()
 
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def keyword_search(self, query: str, limit: int = 5, include_embeddings: bool = False) -> List[Document]:
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
             return []
@@ -511,25 +572,58 @@ class LanceDb(VectorDb):
             self.table.create_fts_index("payload", use_tantivy=self.use_tantivy, replace=True)
             self.fts_index_exists = True
 
-        results = self.table.search(
-            query=query,
-            query_type="fts",
-        ).limit(limit)
+        results = (
+            self.table.search(
+                query=query,
+                query_type="fts",
+            )
+            .select(self._search_columns(include_embeddings))
+            .limit(limit)
+        )
 
         return results.to_pandas()
 
+    def _search_columns(self, include_embeddings: bool) -> List[str]:
+        """Columns read by searches. The vector column is only read when requested."""
+        columns = [self._id, "payload"]
+        if include_embeddings:
+            columns.append(self._vector_col)
+        return columns
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Return the stored vectors of the given ids, using one IN filter per chunk of ids
+
+        Args:
+            ids (List[str]): Ids of the documents
+        """
+        embeddings: Dict[str, List[float]] = {}
+        unique_ids = list(dict.fromkeys(ids))
+        if self.table is None:
+            return embeddings
+        for i in range(0, len(unique_ids), 1000):
+            chunk = unique_ids[i : i + 1000]
+            id_list = ", ".join("'" + id.replace("'", "''") + "'" for id in chunk)
+            query = self.table.search().where(f"{self._id} IN ({id_list})").select([self._id, self._vector_col])
+            result = query.limit(len(chunk)).to_arrow()
+            for id, vector in zip(result.column(self._id).to_pylist(), result.column(self._vector_col).to_pylist()):
+                embeddings[id] = vector
+        return embeddings
+
     def _build_search_results(self, results) -> List[Document]:  # TODO: typehint pandas?
         search_results: List[Document] = []
         try:
             for _, item in results.iterrows():
                 payload = json.loads(item["payload"])
+                embedding = item.get(self._vector_col)
                 search_results.append(
                     Document(
+                        id=item.get(self._id),
                         name=payload["name"],
                         meta_data=payload["meta_data"],
                         content=payload["content"],
                         embedder=self.embedder,
-                        embedding=item["vector"],
+                        embedding=list(embedding) if embedding is not None else None,
                         usage=payload["usage"],
                     )
                 )
@@ -580,6 +674,24 @@ class LanceDb(VectorDb):
     def delete(self) -> bool:
         return False
 
+    def delete_by_content_hash(self, content_hashes: List[str]) -> bool:
+        """
+        Delete the rows with the given content hashes, which LanceDB uses as row ids
+
+        Args:
+            content_hashes (List[str]): Content hashes of the rows to delete
+        """
+        if self.table is None:
+            return False
+        try:
+            for i in range(0, len(content_hashes), 1000):
+                id_list = ", ".join("'" + id.replace("'", "''") + "'" for id in content_hashes[i : i + 1000])
+                self.table.delete(f"{self._id} IN ({id_list})")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting rows: {e}")
+            return False
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with the given name exists in the database"""
         if self.table is None:
@@ -11,6 +11,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -381,12 +382,12 @@ class Milvus(VectorDb):
         """Insert documents based on search type."""
         log_debug(f"Inserting {len(documents)} documents")
 
+        Document.embed_batch(documents, embedder=self.embedder)
         if self.search_type == SearchType.hybrid:
             for document in documents:
                 self._insert_hybrid_document(document)
         else:
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -414,12 +415,12 @@ class Milvus(VectorDb):
         """Insert documents asynchronously based on search type."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
 
+        await Document.async_embed_batch(documents, embedder=self.embedder)
         if self.search_type == SearchType.hybrid:
             await asyncio.gather(*[self._async_insert_hybrid_document(doc) for doc in documents])
         else:
 
             async def process_document(document):
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -464,8 +465,8 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         log_debug(f"Upserting {len(documents)} documents")
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -485,8 +486,9 @@ class Milvus(VectorDb):
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_debug(f"Upserting {len(documents)} documents asynchronously")
 
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+
         async def process_document(document):
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -518,7 +520,36 @@ class Milvus(VectorDb):
         """
         return MILVUS_DISTANCE_MAP.get(self.distance, "COSINE")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def _search_output_fields(self, include_embeddings: bool) -> List[str]:
+        """Fields returned by searches. The vector field is only returned when requested."""
+        vector_field = "dense_vector" if self.search_type == SearchType.hybrid else "vector"
+        return ["name", "meta_data", "content", "usage"] + ([vector_field] if include_embeddings else [])
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Return the stored vectors of the given ids, with a single query.
+
+        Args:
+            ids (List[str]): Ids of the documents
+
+        Returns:
+            Dict[str, List[float]]: Vectors by id. Missing ids are not included.
+        """
+        if not ids:
+            return {}
+        vector_field = "dense_vector" if self.search_type == SearchType.hybrid else "vector"
+        rows = self.client.get(
+            collection_name=self.collection, ids=list(dict.fromkeys(ids)), output_fields=[vector_field]
+        )
+        return {row["id"]: list(row[vector_field]) for row in rows if row.get(vector_field) is not None}
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Search for documents matching the query.
 
@@ -526,14 +557,15 @@ class Milvus(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            include_embeddings (bool): Whether to return the stored vectors of the results
 
         Returns:
             List[Document]: List of matching documents
         """
         if self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit)
+            return self.hybrid_search(query, limit, include_embeddings=include_embeddings)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -542,7 +574,7 @@ class Milvus(VectorDb):
             collection_name=self.collection,
             data=[query_embedding],
             filter=self._build_expr(filters),
-            output_fields=["*"],
+            output_fields=self._search_output_fields(include_embeddings),
             limit=limit,
         )
 
@@ -565,12 +597,16 @@ class Milvus(VectorDb):
         return search_results
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         if self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit, filters)
+            return self.hybrid_search(query, limit, filters, include_embeddings=include_embeddings)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -579,7 +615,7 @@ class Milvus(VectorDb):
             collection_name=self.collection,
             data=[query_embedding],
             filter=self._build_expr(filters),
-            output_fields=["*"],
+            output_fields=self._search_output_fields(include_embeddings),
             limit=limit,
         )
 
@@ -601,7 +637,13 @@ class Milvus(VectorDb):
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
-    def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Perform a hybrid search combining dense and sparse vector similarity.
 
@@ -609,6 +651,7 @@ class Milvus(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            include_embeddings (bool): Whether to return the stored dense vectors of the results
 
         Returns:
             List[Document]: List of matching documents
@@ -616,7 +659,7 @@ class Milvus(VectorDb):
         from pymilvus import AnnSearchRequest, RRFRanker
 
         # Get query embeddings
-        dense_vector = self.embedder.get_embedding(query)
+        dense_vector = embed_query(self.embedder, query)
         sparse_vector = self._get_sparse_vector(query)
 
         if dense_vector is None:
@@ -657,7 +700,11 @@ class Milvus(VectorDb):
 
             log_info("Performing hybrid search")
             results = self._client.hybrid_search(
-                collection_name=self.collection, reqs=reqs, ranker=ranker, limit=limit, output_fields=["*"]
+                collection_name=self.collection,
+                reqs=reqs,
+                ranker=ranker,
+                limit=limit,
+                output_fields=self._search_output_fields(include_embeddings),
             )
 
             # Build search results
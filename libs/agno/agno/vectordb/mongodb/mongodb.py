@@ -1,9 +1,10 @@
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.utils.log import log_debug, log_info, log_warning, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
@@ -483,11 +484,30 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document ID existence: {e}")
             return False
 
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of the given IDs that exist in the collection, using a single query."""
+        if not ids:
+            return set()
+        try:
+            collection = self._get_collection()
+            cursor = collection.find({"_id": {"$in": list(dict.fromkeys(ids))}}, {"_id": 1})
+            return {result["_id"] for result in cursor}
+        except Exception as e:
+            logger.error(f"Error checking document ID existence: {e}")
+            return set()
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist in the MongoDB collection based on their content, using a single query."""
+        doc_ids = [md5(document.content.encode("utf-8")).hexdigest() for document in documents]
+        existing = self.existing_ids(doc_ids)
+        return [doc_id in existing for doc_id in doc_ids]
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents into the MongoDB collection."""
         log_debug(f"Inserting {len(documents)} documents")
         collection = self._get_collection()
 
+        Document.embed_batch([doc for doc in documents if doc.embedding is None], embedder=self.embedder)
         prepared_docs = []
         for document in documents:
             try:
@@ -512,6 +532,7 @@ class MongoDb(VectorDb):
         log_info(f"Upserting {len(documents)} documents")
         collection = self._get_collection()
 
+        Document.embed_batch([doc for doc in documents if doc.embedding is None], embedder=self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -529,13 +550,18 @@ class MongoDb(VectorDb):
         return True
 
     def search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, min_score: float = 0.0
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: float = 0.0,
+        include_embeddings: bool = False,
     ) -> List[Document]:
-        """Search for documents using vector similarity."""
+        """Search for documents using vector similarity. Stored embeddings are only returned if requested."""
         if self.search_type == SearchType.hybrid:
             return self.hybrid_search(query, limit=limit)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -562,6 +588,7 @@ class MongoDb(VectorDb):
                             "name": 1,
                             "content": 1,
                             "meta_data": 1,
+                            **({"embedding": 1} if include_embeddings else {}),
                         }
                     },
                 ]
@@ -573,6 +600,7 @@ class MongoDb(VectorDb):
                         name=doc.get("name"),
                         content=doc["content"],
                         meta_data={**doc.get("meta_data", {}), "score": doc.get("similarityScore", 0.0)},
+                        embedding=doc.get("embedding"),
                     )
                     for doc in results
                 ]
@@ -620,7 +648,8 @@ class MongoDb(VectorDb):
                 if match_filters:
                     pipeline.append({"$match": match_filters})  # type: ignore
 
-                pipeline.append({"$project": {"embedding": 0}})
+                if not include_embeddings:
+                    pipeline.append({"$project": {"embedding": 0}})
 
                 results = list(collection.aggregate(pipeline))  # type: ignore
 
@@ -630,6 +659,7 @@ class MongoDb(VectorDb):
                         name=doc.get("name"),
                         content=doc["content"],
                         meta_data={**doc.get("meta_data", {}), "score": doc.get("score", 0.0)},
+                        embedding=doc.get("embedding"),
                     )
                     for doc in results
                 ]
@@ -641,6 +671,14 @@ class MongoDb(VectorDb):
                 logger.error(f"Error during search: {e}")
                 raise
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Return the stored embeddings of the documents with the given ids, with a single query."""
+        if not ids:
+            return {}
+        collection = self._get_collection()
+        cursor = collection.find({"_id": {"$in": list(dict.fromkeys(ids))}}, {"_id": 1, "embedding": 1})
+        return {str(doc["_id"]): doc["embedding"] for doc in cursor if doc.get("embedding") is not None}
+
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         """Perform a vector-based search."""
         log_debug("Performing vector search.")
@@ -689,7 +727,7 @@ class MongoDb(VectorDb):
 
         log_debug(f"Performing hybrid search for query: '{query}' with limit: {limit}")
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -892,9 +930,21 @@ class MongoDb(VectorDb):
         # Return True if collection doesn't exist (nothing to delete)
         return True
 
+    def delete_by_content_hash(self, content_hashes: List[str]) -> bool:
+        """Delete the documents with the given content hashes, which MongoDB uses as document IDs."""
+        try:
+            collection = self._get_collection()
+            result = collection.delete_many({"_id": {"$in": list(content_hashes)}})
+            log_info(f"Deleted {result.deleted_count} documents from collection.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
+
     def prepare_doc(self, document: Document, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
@@ -940,11 +990,26 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document existence asynchronously: {e}")
             return False
 
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist asynchronously, using a single query."""
+        doc_ids = [md5(document.content.encode("utf-8")).hexdigest() for document in documents]
+        if not doc_ids:
+            return []
+        try:
+            collection = await self._get_async_collection()
+            cursor = collection.find({"_id": {"$in": list(dict.fromkeys(doc_ids))}}, {"_id": 1})
+            existing = {result["_id"] async for result in cursor}
+        except Exception as e:
+            logger.error(f"Error checking document existence asynchronously: {e}")
+            existing = set()
+        return [doc_id in existing for doc_id in doc_ids]
+
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents asynchronously."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
 
+        await Document.async_embed_batch([doc for doc in documents if doc.embedding is None], embedder=self.embedder)
         prepared_docs = []
         for document in documents:
             try:
@@ -969,6 +1034,7 @@ class MongoDb(VectorDb):
         log_info(f"Upserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
 
+        await Document.async_embed_batch([doc for doc in documents if doc.embedding is None], embedder=self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -982,10 +1048,14 @@ class MongoDb(VectorDb):
                 logger.error(f"Error upserting document '{document.name}' asynchronously: {e}")
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
-        """Search for documents asynchronously."""
-        query_embedding = self.embedder.get_embedding(query)
+        """Search for documents asynchronously. Stored embeddings are only returned if requested."""
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -1018,7 +1088,8 @@ class MongoDb(VectorDb):
 
                 pipeline.append({"$match": mongo_filters})
 
-            pipeline.append({"$project": {"embedding": 0}})
+            if not include_embeddings:
+                pipeline.append({"$project": {"embedding": 0}})
 
             # With AsyncMongoClient, aggregate() returns a coroutine that resolves to a cursor
             # We need to await it first to get the cursor
@@ -1037,6 +1108,7 @@ class MongoDb(VectorDb):
                     name=doc.get("name"),
                     content=doc["content"],
                     meta_data={**doc.get("meta_data", {}), "score": doc.get("score", 0.0)},
+                    embedding=doc.get("embedding"),
                 )
                 for doc in results
             ]
@@ -0,0 +1,7 @@
+from agno.vectordb.numpydb.index import Ivf
+from agno.vectordb.numpydb.numpydb import NumpyDb
+
+__all__ = [
+    "Ivf",
+    "NumpyDb",
+]
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class Ivf(BaseModel):
+    """Inverted file index: vectors are partitioned in clusters and a search only scores the closest clusters.
+
+    With `pq_subvectors`, candidates are first scored with product quantization codes and only the best
+    `rerank_factor * limit` candidates are scored with the full vectors.
+    """
+
+    # Number of clusters the vectors are partitioned into
+    lists: int = 256
+    # Number of clusters searched for each query
+    probes: int = 8
+    # Number of sub-vectors of the product quantization codes, must divide the dimensions.
+    # None to score the candidates with the full vectors only.
+    pq_subvectors: Optional[int] = None
+    # Candidates kept after scoring with the product quantization codes, as a multiple of the search limit
+    rerank_factor: int = 4
+    # Minimum number of documents to build the index. Smaller collections are searched exactly.
+    min_rows: int = 10000
+    # Number of vectors sampled to train the clusters and codebooks
+    train_size: int = 50000
+    # Number of k-means iterations to train the clusters and codebooks
+    iterations: int = 10
@@ -0,0 +1,763 @@
+import asyncio
+import json
+import os
+import shutil
+import sqlite3
+import threading
+from hashlib import md5
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.vectordb.base import VectorDb
+from agno.vectordb.numpydb.index import Ivf
+
+# Maximum bytes of vectors scored at once, to bound the memory used by a search
+SCORE_CHUNK_BYTES = 64 * 1024 * 1024
+# Rows allocated when a file is created. Files grow by doubling their capacity.
+INITIAL_CAPACITY = 1024
+# Maximum number of parameters of a SQLite query
+SQLITE_BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    row INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT,
+    content TEXT NOT NULL,
+    meta_data TEXT NOT NULL,
+    usage TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_name ON documents (name);
+CREATE TABLE IF NOT EXISTS info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class _MappedArray:
+    """A growable array stored in a memory-mapped file. Rows are read through the page cache, never loaded."""
+
+    def __init__(self, path: str, dtype: Any, row_shape: Tuple[int, ...] = ()):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.row_shape = row_shape
+        self.array: Optional[np.ndarray] = None
+        self._map()
+
+    @property
+    def row_bytes(self) -> int:
+        size = self.dtype.itemsize
+        for dim in self.row_shape:
+            size *= dim
+        return size
+
+    @property
+    def capacity(self) -> int:
+        return 0 if self.array is None else len(self.array)
+
+    def _map(self) -> None:
+        rows = os.path.getsize(self.path) // self.row_bytes if os.path.exists(self.path) else 0
+        self.array = None
+        if rows > 0:
+            self.array = np.memmap(self.path, dtype=self.dtype, mode="r+", shape=(rows,) + self.row_shape)
+
+    def reserve(self, rows: int) -> None:
+        """Grow the file to hold at least `rows` rows"""
+        if rows <= self.capacity:
+            return
+        capacity = max(INITIAL_CAPACITY, self.capacity)
+        while capacity < rows:
+            capacity *= 2
+        self.flush()
+        with open(self.path, "ab") as f:
+            f.truncate(capacity * self.row_bytes)
+        self._map()
+
+    def flush(self) -> None:
+        if isinstance(self.array, np.memmap):
+            self.array.flush()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    return (vectors / norms).astype(np.float32)
+
+
+def _top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the `k` highest scores, highest first"""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def _chunk_rows(row_bytes: int) -> int:
+    return max(1, SCORE_CHUNK_BYTES // max(1, row_bytes))
+
+
+def _assign(data: np.ndarray, centroids: np.ndarray, spherical: bool) -> np.ndarray:
+    """Closest centroid of each vector: highest cosine similarity if spherical, else lowest L2 distance"""
+    offsets = None if spherical else (centroids**2).sum(axis=1) / 2
+    assignments = np.empty(len(data), dtype=np.int32)
+    chunk = _chunk_rows(4 * max(len(centroids), data.shape[1]))
+    for start in range(0, len(data), chunk):
+        scores = np.asarray(data[start : start + chunk], dtype=np.float32) @ centroids.T
+        if offsets is not None:
+            scores -= offsets
+        assignments[start : start + chunk] = scores.argmax(axis=1)
+    return assignments
+
+
+def _kmeans(data: np.ndarray, k: int, iterations: int, rng: Any, spherical: bool) -> np.ndarray:
+    """Train `k` centroids with Lloyd's algorithm. Spherical k-means keeps the centroids normalized."""
+    centroids = np.array(data[rng.choice(len(data), size=k, replace=False)], dtype=np.float32)
+    for _ in range(iterations):
+        assignments = _assign(data, centroids, spherical)
+        counts = np.bincount(assignments, minlength=k)
+        nonempty = np.flatnonzero(counts)
+        starts = (np.cumsum(counts) - counts)[nonempty]
+        sums = np.add.reduceat(data[np.argsort(assignments, kind="stable")], starts, axis=0)
+        centroids[nonempty] = sums / counts[nonempty, None]
+        empty = np.flatnonzero(counts == 0)
+        if len(empty) > 0:
+            centroids[empty] = data[rng.choice(len(data), size=len(empty), replace=False)]
+        if spherical:
+            centroids = _normalize(centroids)
+    return centroids
+
+
+def _scores(vector: np.ndarray, rows: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Cosine similarity of `vector` with the vectors of `rows`, in chunks"""
+    scores = np.empty(len(rows), dtype=np.float32)
+    chunk = _chunk_rows(vectors.shape[1] * vectors.itemsize)
+    for start in range(0, len(rows), chunk):
+        part = rows[start : start + chunk]
+        if part[-1] - part[0] == len(part) - 1:
+            # Contiguous rows are sliced, without copying them
+            block = vectors[part[0] : part[-1] + 1]
+        else:
+            block = vectors[part]
+        scores[start : start + len(part)] = block @ vector
+    return scores
+
+
+def _pq_scores(vector: np.ndarray, rows: np.ndarray, codebooks: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Approximate similarity of `vector` with the vectors of `rows`, from their product quantization codes"""
+    num_subvectors = codebooks.shape[0]
+    tables = np.einsum("jkd,jd->jk", codebooks, vector.reshape(num_subvectors, -1))
+    scores = np.empty(len(rows), dtype=np.float32)
+    chunk = _chunk_rows(num_subvectors * 4)
+    for start in range(0, len(rows), chunk):
+        part_codes = codes[rows[start : start + chunk]]
+        scores[start : start + len(part_codes)] = tables[np.arange(num_subvectors), part_codes].sum(axis=1)
+    return scores
+
+
+class _SearchSnapshot(NamedTuple):
+    """Arrays a search scores against, taken under the lock"""
+
+    vectors: np.ndarray
+    centroids: Optional[np.ndarray]
+    lists: Optional[np.ndarray]
+    codebooks: Optional[np.ndarray]
+    codes: Optional[np.ndarray]
+
+
+def _filter_terms(values: Dict[str, Any]) -> Set[Tuple[str, str]]:
+    """Terms of the metadata inverted index. Each item of a list value is a term."""
+    terms: Set[Tuple[str, str]] = set()
+    for key, value in values.items():
+        for item in value if isinstance(value, list) else [value]:
+            terms.add((key, json.dumps(item, sort_keys=True, default=str)))
+    return terms
+
+
+class NumpyDb(VectorDb):
+    """In-process vector db for single-node deployments, without an external service.
+
+    Vectors are normalized and stored as float32 in a memory-mapped file, so opening a db maps the vectors
+    without reading them. Documents and their metadata are stored in a SQLite file next to the vectors.
+    Searches rank documents by cosine similarity: exactly with NumPy, or with an IVF index for large collections.
+    Filters match documents whose metadata values are equal to, or lists containing, the filter values.
+    """
+
+    def __init__(
+        self,
+        path: str = "tmp/numpydb",
+        embedder: Optional[Embedder] = None,
+        index: Optional[Ivf] = None,
+        reranker: Optional[Reranker] = None,
+    ):
+        # Directory of the vector db files
+        self.path: str = path
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+
+        # IVF index, built once the collection has `index.min_rows` documents. None to always search exactly.
+        self.index: Optional[Ivf] = index
+
+        # Reranker instance
+        self.reranker: Optional[Reranker] = reranker
+
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._dimensions: Optional[int] = None
+        self._vectors: Optional[_MappedArray] = None
+        # Number of rows of the vectors file in use, including rows of deleted documents
+        self._num_rows: int = 0
+        # Whether each row of the vectors file holds a document
+        self._live: np.ndarray = np.zeros(0, dtype=bool)
+        # Rows of deleted documents, reused by inserts
+        self._free_rows: List[int] = []
+        # Inverted index of the metadata: (key, value) -> rows. Built on the first filtered search.
+        self._postings: Optional[Dict[Tuple[str, str], Set[int]]] = None
+        # IVF index: cluster centroids, cluster of each row, and product quantization codebooks and codes
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: Optional[_MappedArray] = None
+        self._codebooks: Optional[np.ndarray] = None
+        self._codes: Optional[_MappedArray] = None
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _open(self, create: bool = False) -> bool:
+        """Open the db files. Returns False if the db does not exist and `create` is False."""
+        with self._lock:
+            if self._conn is not None:
+                return True
+            if not create and not os.path.exists(self._file("documents.db")):
+                return False
+
+            os.makedirs(self.path, exist_ok=True)
+            conn = sqlite3.connect(self._file("documents.db"), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+
+            dimensions = self._get_info("dimensions")
+            if dimensions is None and getattr(self.embedder, "dimensions", None):
+                dimensions = str(self.embedder.dimensions)
+                self._set_info("dimensions", dimensions)
+            if dimensions is not None:
+                self._set_dimensions(int(dimensions))
+
+            rows = np.fromiter((row for (row,) in conn.execute("SELECT row FROM documents")), dtype=np.int64)
+            self._num_rows = int(rows.max()) + 1 if len(rows) > 0 else 0
+            self._live = np.zeros(max(self._num_rows, self._vectors.capacity if self._vectors else 0), dtype=bool)
+            self._live[rows] = True
+            self._free_rows = np.flatnonzero(~self._live[: self._num_rows]).tolist()
+            self._load_index()
+            log_debug(f"Opened vector db at {self.path} with {len(rows)} documents")
+            return True
+
+    def _close(self) -> None:
+        with self._lock:
+            for mapped in (self._vectors, self._lists, self._codes):
+                if mapped is not None:
+                    mapped.flush()
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+            self._dimensions = None
+            self._vectors = self._lists = self._codes = None
+            self._centroids = self._codebooks = None
+            self._num_rows = 0
+            self._live = np.zeros(0, dtype=bool)
+            self._free_rows = []
+            self._postings = None
+
+    def _get_info(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM info WHERE key = ?", (key,)).fetchone()  # type: ignore
+        return row[0] if row is not None else None
+
+    def _set_info(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO info (key, value) VALUES (?, ?)", (key, value))  # type: ignore
+        self._conn.commit()  # type: ignore
+
+    def _set_dimensions(self, dimensions: int) -> None:
+        self._dimensions = dimensions
+        self._vectors = _MappedArray(self._file("vectors.f32"), np.float32, (dimensions,))
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the vectors and index files to hold at least `rows` rows"""
+        for mapped in (self._vectors, self._lists, self._codes):
+            if mapped is not None:
+                mapped.reserve(rows)
+        if len(self._live) < rows:
+            live = np.zeros(self._vectors.capacity if self._vectors else rows, dtype=bool)
+            live[: len(self._live)] = self._live
+            self._live = live
+
+    def create(self) -> None:
+        """Create the db files, if they don't exist."""
+        self._open(create=True)
+
+    async def async_create(self) -> None:
+        """Create the db files asynchronously by running in a thread."""
+        await asyncio.to_thread(self.create)
+
+    def exists(self) -> bool:
+        return self._conn is not None or os.path.exists(self._file("documents.db"))
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def _clean_content(self, content: str) -> str:
+        return content.replace("\x00", "\ufffd")
+
+    def _document_id(self, document: Document) -> str:
+        """Documents are identified by the md5 hash of their content"""
+        return md5(self._clean_content(document.content).encode()).hexdigest()
+
+    def _rows_by_id(self, ids: Iterable[str]) -> Dict[str, int]:
+        unique_ids = list(dict.fromkeys(ids))
+        rows: Dict[str, int] = {}
+        for i in range(0, len(unique_ids), SQLITE_BATCH_SIZE):
+            batch = unique_ids[i : i + SQLITE_BATCH_SIZE]
+            query = f"SELECT id, row FROM documents WHERE id IN ({','.join('?' * len(batch))})"
+            rows.update(self._conn.execute(query, batch).fetchall())  # type: ignore
+        return rows
+
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of the given ids that exist in the db, with a single query per batch of ids"""
+        with self._lock:
+            if not ids or not self._open():
+                return set()
+            return set(self._rows_by_id(ids))
+
+    def id_exists(self, id: str) -> bool:
+        return id in self.existing_ids([id])
+
+    def doc_exists(self, document: Document) -> bool:
+        return self.id_exists(self._document_id(document))
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return await asyncio.to_thread(self.doc_exists, document)
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        doc_ids = [self._document_id(document) for document in documents]
+        existing = self.existing_ids(doc_ids)
+        return [doc_id in existing for doc_id in doc_ids]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        return await asyncio.to_thread(self.docs_exist, documents)
+
+    def name_exists(self, name: str) -> bool:
+        with self._lock:
+            if not self._open():
+                return False
+            return self._conn.execute("SELECT 1 FROM documents WHERE name = ? LIMIT 1", (name,)).fetchone() is not None  # type: ignore
+
+    async def async_name_exists(self, name: str) -> bool:
+        return await asyncio.to_thread(self.name_exists, name)
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents. Documents that already exist are skipped.
+
+        Args:
+            documents (List[Document]): Documents to insert.
+            filters (Optional[Dict[str, Any]]): Metadata added to the metadata of each document.
+        """
+        Document.embed_batch([doc for doc in documents if doc.embedding is None], embedder=self.embedder)
+        self._write(documents, filters, upsert=False)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await Document.async_embed_batch([doc for doc in documents if doc.embedding is None], embedder=self.embedder)
+        await asyncio.to_thread(self._write, documents, filters, False)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents, replacing the documents with the same content.
+
+        Args:
+            documents (List[Document]): Documents to upsert.
+            filters (Optional[Dict[str, Any]]): Metadata added to the metadata of each document.
+        """
+        Document.embed_batch([doc for doc in documents if doc.embedding is None], embedder=self.embedder)
+        self._write(documents, filters, upsert=True)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await Document.async_embed_batch([doc for doc in documents if doc.embedding is None], embedder=self.embedder)
+        await asyncio.to_thread(self._write, documents, filters, True)
+
+    def _write(self, documents: List[Document], filters: Optional[Dict[str, Any]], upsert: bool) -> None:
+        """Write embedded documents: vectors to the vectors file, then documents to SQLite"""
+        records: Dict[str, Tuple[Document, Dict[str, Any]]] = {}
+        for document in documents:
+            if document.embedding is None:
+                logger.error(f"Document {document.name} has no embedding, skipping it")
+                continue
+            meta_data = dict(document.meta_data or {})
+            if filters:
+                meta_data.update(filters)
+            records[self._document_id(document)] = (document, meta_data)
+        if not records:
+            return
+
+        with self._lock:
+            self._open(create=True)
+            existing = self._rows_by_id(records)
+            if not upsert and existing:
+                log_debug(f"Skipping {len(existing)} documents that already exist")
+                records = {doc_id: record for doc_id, record in records.items() if doc_id not in existing}
+                existing = {}
+            if not records:
+                return
+
+            vectors = _normalize(np.asarray([document.embedding for document, _ in records.values()], dtype=np.float32))
+            if self._dimensions is None:
+                self._set_info("dimensions", str(vectors.shape[1]))
+                self._set_dimensions(vectors.shape[1])
+            if vectors.shape[1] != self._dimensions:
+                raise ValueError(f"Embeddings have {vectors.shape[1]} dimensions, the db has {self._dimensions}")
+
+            rows = np.empty(len(records), dtype=np.int64)
+            for i, doc_id in enumerate(records):
+                if doc_id in existing:
+                    rows[i] = existing[doc_id]
+                elif self._free_rows:
+                    rows[i] = self._free_rows.pop()
+                else:
+                    rows[i] = self._num_rows
+                    self._num_rows += 1
+            self._reserve(self._num_rows)
+
+            # Vectors are written first, so committed documents always have their vector
+            self._vectors.array[rows] = vectors  # type: ignore
+            self._vectors.flush()  # type: ignore
+            if self._centroids is not None:
+                self._index_rows(rows, vectors)
+
+            if self._postings is not None and existing:
+                self._remove_postings(list(existing.values()))
+            self._conn.executemany(  # type: ignore
+                "INSERT OR REPLACE INTO documents (row, id, name, content, meta_data, usage) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        int(row),
+                        doc_id,
+                        document.name,
+                        self._clean_content(document.content),
+                        json.dumps(meta_data, default=str),
+                        json.dumps(document.usage) if document.usage is not None else None,
+                    )
+                    for row, (doc_id, (document, meta_data)) in zip(rows, records.items())
+                ],
+            )
+            self._conn.commit()  # type: ignore
+            self._live[rows] = True
+            if self._postings is not None:
+                for row, (_, meta_data) in zip(rows, records.values()):
+                    for term in _filter_terms(meta_data):
+                        self._postings.setdefault(term, set()).add(int(row))
+            log_debug(f"Wrote {len(records)} documents")
+
+            if self.index is not None and self._centroids is None and self.get_count() >= self.index.min_rows:
+                self._build_index()
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Search for the documents most similar to a query.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata the documents must match.
+            include_embeddings (bool): Whether to return the stored (normalized) embeddings of the results.
+        Returns:
+            List[Document]: The documents, most similar first.
+        """
+        query_embedding = embed_query(self.embedder, query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        with self._lock:
+            if not self._open() or self._num_rows == 0 or limit <= 0:
+                return []
+            vector = _normalize(np.asarray(query_embedding, dtype=np.float32))
+            if vector.shape[0] != self._dimensions:
+                logger.error(f"Query embedding has {vector.shape[0]} dimensions, the db has {self._dimensions}")
+                return []
+
+            # Only take references to the current arrays under the lock, and score without holding it, so searches
+            # do not block each other or writes. Writes grow the files by mapping them again, so the arrays
+            # referenced here stay valid.
+            mask = self._live[: self._num_rows].copy()
+            if filters:
+                mask &= self._filter_mask(filters)
+            snapshot = _SearchSnapshot(
+                vectors=self._vectors.array,  # type: ignore
+                centroids=self._centroids if self.index is not None else None,
+                lists=self._lists.array if self._lists is not None else None,
+                codebooks=self._codebooks if self.index is not None else None,
+                codes=self._codes.array if self._codes is not None else None,
+            )
+
+        rows = self._top_rows(vector, limit, mask, snapshot)
+        with self._lock:
+            if not self._open():
+                return []
+            search_results = self._read_documents(rows, include_embeddings)
+
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        return search_results
+
+    async def async_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        return await asyncio.to_thread(self.search, query, limit, filters, include_embeddings)
+
+    def _filter_mask(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Rows whose metadata matches all the filters, from the inverted index"""
+        postings = self._get_postings()
+        mask = np.zeros(self._num_rows, dtype=bool)
+        matches: Optional[Set[int]] = None
+        # Intersect the smallest posting lists first
+        for term in sorted(_filter_terms(filters), key=lambda term: len(postings.get(term, ()))):
+            rows = postings.get(term)
+            if not rows:
+                return mask
+            matches = set(rows) if matches is None else matches & rows
+        if matches is None:
+            mask[:] = True
+        elif matches:
+            mask[np.fromiter(matches, dtype=np.int64, count=len(matches))] = True
+        return mask
+
+    def _get_postings(self) -> Dict[Tuple[str, str], Set[int]]:
+        if self._postings is None:
+            postings: Dict[Tuple[str, str], Set[int]] = {}
+            for row, meta_data in self._conn.execute("SELECT row, meta_data FROM documents"):  # type: ignore
+                for term in _filter_terms(json.loads(meta_data)):
+                    postings.setdefault(term, set()).add(row)
+            self._postings = postings
+        return self._postings
+
+    def _remove_postings(self, rows: List[int]) -> None:
+        for i in range(0, len(rows), SQLITE_BATCH_SIZE):
+            batch = rows[i : i + SQLITE_BATCH_SIZE]
+            query = f"SELECT row, meta_data FROM documents WHERE row IN ({','.join('?' * len(batch))})"
+            for row, meta_data in self._conn.execute(query, batch):  # type: ignore
+                for term in _filter_terms(json.loads(meta_data)):
+                    term_rows = self._postings.get(term)  # type: ignore
+                    if term_rows is not None:
+                        term_rows.discard(row)
+                        if not term_rows:
+                            del self._postings[term]  # type: ignore
+
+    def _top_rows(self, vector: np.ndarray, limit: int, mask: np.ndarray, snapshot: "_SearchSnapshot") -> np.ndarray:
+        """Rows of the `limit` vectors most similar to `vector`, among the rows in `mask`"""
+        if snapshot.centroids is not None and snapshot.lists is not None and self.index is not None:
+            probes = _top_indices(snapshot.centroids @ vector, self.index.probes)
+            mask = mask & np.isin(snapshot.lists[: len(mask)], probes)
+        rows = np.flatnonzero(mask)
+        if len(rows) == 0:
+            return rows
+
+        if (
+            snapshot.codebooks is not None
+            and snapshot.codes is not None
+            and self.index is not None
+            and len(rows) > limit * self.index.rerank_factor
+        ):
+            scores = _pq_scores(vector, rows, snapshot.codebooks, snapshot.codes)
+            rows = np.sort(rows[_top_indices(scores, limit * self.index.rerank_factor)])
+        scores = _scores(vector, rows, snapshot.vectors)
+        return rows[_top_indices(scores, limit)]
+
+    def _read_documents(self, rows: np.ndarray, include_embeddings: bool) -> List[Document]:
+        records: Dict[int, Tuple[Any, ...]] = {}
+        row_list = [int(row) for row in rows]
+        for i in range(0, len(row_list), SQLITE_BATCH_SIZE):
+            batch = row_list[i : i + SQLITE_BATCH_SIZE]
+            query = (
+                "SELECT row, id, name, content, meta_data, usage FROM documents "
+                f"WHERE row IN ({','.join('?' * len(batch))})"
+            )
+            for record in self._conn.execute(query, batch):  # type: ignore
+                records[record[0]] = record
+
+        documents: List[Document] = []
+        for row in row_list:
+            record = records.get(row)
+            if record is None:
+                continue
+            _, doc_id, name, content, meta_data, usage = record
+            documents.append(
+                Document(
+                    id=doc_id,
+                    name=name,
+                    content=content,
+                    meta_data=json.loads(meta_data),
+                    usage=json.loads(usage) if usage is not None else None,
+                    embedder=self.embedder,
+                    embedding=self._vectors.array[row].tolist() if include_embeddings else None,  # type: ignore
+                )
+            )
+        return documents
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Get the stored embeddings of the documents with the given ids. Embeddings are stored normalized."""
+        with self._lock:
+            if not ids or not self._open():
+                return {}
+            return {doc_id: self._vectors.array[row].tolist() for doc_id, row in self._rows_by_id(ids).items()}  # type: ignore
+
+    def get_count(self) -> int:
+        with self._lock:
+            if not self._open():
+                return 0
+            return int(self._live[: self._num_rows].sum())
+
+    def optimize(self) -> None:
+        """Build the IVF index from the stored vectors, if an index is configured"""
+        if self.index is None:
+            log_debug("No index configured, vectors are searched exactly")
+            return
+        with self._lock:
+            if self._open():
+                self._build_index()
+
+    def _index_config(self) -> str:
+        return json.dumps({"lists": self.index.lists, "pq_subvectors": self.index.pq_subvectors})  # type: ignore
+
+    def _load_index(self) -> None:
+        """Map the saved IVF index, if it was built with the configured index"""
+        if self.index is None or self._vectors is None or self._get_info("index") != self._index_config():
+            return
+        try:
+            centroids = np.load(self._file("ivf_centroids.npy"), mmap_mode="r")
+            codebooks = np.load(self._file("pq_codebooks.npy"), mmap_mode="r") if self.index.pq_subvectors else None
+        except OSError as e:
+            logger.warning(f"Could not load the index, vectors are searched exactly until it is rebuilt: {e}")
+            return
+        self._centroids, self._codebooks = centroids, codebooks
+        self._lists = _MappedArray(self._file("ivf_lists.i32"), np.int32)
+        self._lists.reserve(self._vectors.capacity)
+        if codebooks is not None:
+            self._codes = _MappedArray(self._file("pq_codes.u8"), np.uint8, (len(codebooks),))
+            self._codes.reserve(self._vectors.capacity)
+
+    def _build_index(self) -> None:
+        """Train the clusters (and codebooks) on a sample of the vectors, then index every row"""
+        index: Ivf = self.index  # type: ignore
+        live_rows = np.flatnonzero(self._live[: self._num_rows])
+        if len(live_rows) < index.lists:
+            log_debug(f"Not enough documents to build the index: {len(live_rows)}")
+            return
+        if index.pq_subvectors and self._dimensions % index.pq_subvectors != 0:  # type: ignore
+            raise ValueError(f"pq_subvectors must divide the dimensions of the embeddings: {self._dimensions}")
+
+        log_info(f"Building IVF index of {len(live_rows)} documents")
+        rng = np.random.default_rng(0)
+        sample = np.sort(rng.choice(live_rows, size=min(index.train_size, len(live_rows)), replace=False))
+        train = np.asarray(self._vectors.array[sample])  # type: ignore
+        centroids = _kmeans(train, index.lists, index.iterations, rng, spherical=True)
+        np.save(self._file("ivf_centroids.npy"), centroids)
+        self._lists = _MappedArray(self._file("ivf_lists.i32"), np.int32)
+        self._lists.reserve(self._vectors.capacity)  # type: ignore
+
+        self._codebooks = self._codes = None
+        if index.pq_subvectors:
+            codebooks = np.stack(
+                [
+                    _kmeans(np.ascontiguousarray(part), min(256, len(train)), index.iterations, rng, spherical=False)
+                    for part in np.split(train, index.pq_subvectors, axis=1)
+                ]
+            )
+            np.save(self._file("pq_codebooks.npy"), codebooks)
+            self._codebooks = codebooks
+            self._codes = _MappedArray(self._file("pq_codes.u8"), np.uint8, (index.pq_subvectors,))
+            self._codes.reserve(self._vectors.capacity)  # type: ignore
+
+        self._centroids = centroids
+        chunk = _chunk_rows(self._vectors.row_bytes)  # type: ignore
+        for start in range(0, self._num_rows, chunk):
+            rows = np.arange(start, min(start + chunk, self._num_rows))
+            self._index_rows(rows, np.asarray(self._vectors.array[rows]))  # type: ignore
+        self._set_info("index", self._index_config())
+
+    def _index_rows(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        """Assign rows to their cluster and encode them with the product quantization codebooks"""
+        self._lists.array[rows] = _assign(vectors, self._centroids, spherical=True)  # type: ignore
+        self._lists.flush()  # type: ignore
+        if self._codebooks is not None:
+            codes = np.empty((len(rows), len(self._codebooks)), dtype=np.uint8)
+            for j, part in enumerate(np.split(vectors, len(self._codebooks), axis=1)):
+                codes[:, j] = _assign(part, self._codebooks[j], spherical=False)
+            self._codes.array[rows] = codes  # type: ignore
+            self._codes.flush()  # type: ignore
+
+    def _delete_rows(self, rows: List[int]) -> None:
+        if not rows:
+            return
+        if self._postings is not None:
+            self._remove_postings(rows)
+        for i in range(0, len(rows), SQLITE_BATCH_SIZE):
+            batch = rows[i : i + SQLITE_BATCH_SIZE]
+            self._conn.execute(f"DELETE FROM documents WHERE row IN ({','.join('?' * len(batch))})", batch)  # type: ignore
+        self._conn.commit()  # type: ignore
+        self._live[rows] = False
+        self._free_rows.extend(rows)
+
+    def delete_by_content_hash(self, content_hashes: List[str]) -> bool:
+        """Delete the documents with the given content hashes (md5 of the document content)"""
+        with self._lock:
+            if not self._open():
+                return False
+            rows = list(self._rows_by_id(content_hashes).values())
+            self._delete_rows(rows)
+            log_info(f"Deleted {len(rows)} documents from {self.path}")
+            return True
+
+    def delete(self) -> bool:
+        """Delete all documents. The db files are created again, empty."""
+        with self._lock:
+            self.drop()
+            self.create()
+            return True
+
+    def drop(self) -> None:
+        """Delete the db files"""
+        with self._lock:
+            self._close()
+            if os.path.exists(self.path):
+                log_debug(f"Deleting vector db at {self.path}")
+                shutil.rmtree(self.path)
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def __deepcopy__(self, memo):
+        # Copies share the open files, as they must not write to the same files independently
+        return self
@@ -1,7 +1,7 @@
 import asyncio
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Set, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -21,6 +21,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -247,6 +248,47 @@ class PgVector(VectorDb):
         """Check if document exists asynchronously by running in a thread."""
         return await asyncio.to_thread(self.doc_exists, document)
 
+    def _existing_values(self, column, values: List[str], chunk_size: int = 1000) -> Set[str]:
+        """
+        Return the subset of values present in the given column, using one IN query per chunk of values.
+
+        Args:
+            column: The column to check.
+            values (List[str]): The values to search for.
+            chunk_size (int): Maximum number of values in a single query.
+
+        Returns:
+            Set[str]: The values that exist in the table.
+        """
+        existing: Set[str] = set()
+        unique_values = list(dict.fromkeys(values))
+        try:
+            with self.Session() as sess, sess.begin():
+                for i in range(0, len(unique_values), chunk_size):
+                    stmt = select(column).where(column.in_(unique_values[i : i + chunk_size]))
+                    existing.update(row[0] for row in sess.execute(stmt))
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+        return existing
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Check which documents have a content hash that already exists in the table.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            List[bool]: For each document, True if it exists, False otherwise.
+        """
+        content_hashes = [md5(self._clean_content(document.content).encode()).hexdigest() for document in documents]
+        existing = self._existing_values(self.table.c.content_hash, content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.docs_exist, documents)
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -275,6 +317,18 @@ class PgVector(VectorDb):
         """
         return self._record_exists(self.table.c.id, id)
 
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """
+        Return the subset of the given IDs that exist in the table.
+
+        Args:
+            ids (List[str]): The IDs to check.
+
+        Returns:
+            Set[str]: The IDs that exist.
+        """
+        return self._existing_values(self.table.c.id, ids)
+
     def _clean_content(self, content: str) -> str:
         """
         Clean the content by replacing null characters.
@@ -301,17 +355,38 @@ class PgVector(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
             batch_size (int): Number of documents to insert in each batch.
         """
+        self._insert_documents(documents, filters=filters, batch_size=batch_size, embed_documents=True)
+
+    def _insert_documents(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+        embed_documents: bool = True,
+    ) -> None:
+        """
+        Insert documents in batches, optionally embedding each batch before writing it.
+
+        Args:
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to insert in each batch.
+            embed_documents (bool): Embed the documents before writing them. Set to False if already embedded.
+        """
         try:
             with self.Session() as sess:
                 for i in range(0, len(documents), batch_size):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch at once
+                        if embed_documents:
+                            Document.embed_batch(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -348,8 +423,9 @@ class PgVector(VectorDb):
             raise
 
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+        """Embed documents with the async embedder, then insert them by running in a thread."""
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+        await asyncio.to_thread(self._insert_documents, documents, filters, 100, False)
 
     def upsert_available(self) -> bool:
         """
@@ -374,17 +450,38 @@ class PgVector(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
             batch_size (int): Number of documents to upsert in each batch.
         """
+        self._upsert_documents(documents, filters=filters, batch_size=batch_size, embed_documents=True)
+
+    def _upsert_documents(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+        embed_documents: bool = True,
+    ) -> None:
+        """
+        Upsert documents in batches, optionally embedding each batch before writing it.
+
+        Args:
+            documents (List[Document]): List of documents to upsert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to upsert in each batch.
+            embed_documents (bool): Embed the documents before writing them. Set to False if already embedded.
+        """
         try:
             with self.Session() as sess:
                 for i in range(0, len(documents), batch_size):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch at once
+                        if embed_documents:
+                            Document.embed_batch(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for upserting
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
 
@@ -432,10 +529,17 @@ class PgVector(VectorDb):
             raise
 
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+        """Embed documents with the async embedder, then upsert them by running in a thread."""
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+        await asyncio.to_thread(self._upsert_documents, documents, filters, 100, False)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Perform a search based on the configured search type.
 
@@ -443,27 +547,81 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to read the stored embedding and usage of each result.
 
         Returns:
             List[Document]: List of matching documents.
         """
         if self.search_type == SearchType.vector:
-            return self.vector_search(query=query, limit=limit, filters=filters)
+            return self.vector_search(query=query, limit=limit, filters=filters, include_embeddings=include_embeddings)
         elif self.search_type == SearchType.keyword:
-            return self.keyword_search(query=query, limit=limit, filters=filters)
+            return self.keyword_search(query=query, limit=limit, filters=filters, include_embeddings=include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query=query, limit=limit, filters=filters)
+            return self.hybrid_search(query=query, limit=limit, filters=filters, include_embeddings=include_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        return await asyncio.to_thread(self.search, query, limit, filters, include_embeddings)
+
+    def _search_columns(self, include_embeddings: bool) -> List[Any]:
+        """Columns selected by searches. The embedding and usage columns are only read when requested."""
+        columns = [self.table.c.id, self.table.c.name, self.table.c.meta_data, self.table.c.content]
+        if include_embeddings:
+            columns.extend([self.table.c.embedding, self.table.c.usage])
+        return columns
+
+    def _search_result_to_document(self, result: Any, include_embeddings: bool) -> Document:
+        return Document(
+            id=result.id,
+            name=result.name,
+            meta_data=result.meta_data,
+            content=result.content,
+            embedder=self.embedder,
+            embedding=result.embedding if include_embeddings else None,
+            usage=result.usage if include_embeddings else None,
+        )
 
-    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Return the stored embeddings of the documents with the given IDs.
+
+        Args:
+            ids (List[str]): The IDs of the documents.
+
+        Returns:
+            Dict[str, List[float]]: The embeddings by document ID. Missing IDs are not included.
+        """
+        embeddings: Dict[str, List[float]] = {}
+        unique_ids = list(dict.fromkeys(ids))
+        try:
+            with self.Session() as sess, sess.begin():
+                for i in range(0, len(unique_ids), 1000):
+                    stmt = select(self.table.c.id, self.table.c.embedding).where(
+                        self.table.c.id.in_(unique_ids[i : i + 1000])
+                    )
+                    for row in sess.execute(stmt):
+                        if row.embedding is not None:
+                            embeddings[row.id] = list(row.embedding)
+        except Exception as e:
+            logger.error(f"Error getting embeddings: {e}")
+        return embeddings
+
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Perform a vector similarity search.
 
@@ -471,26 +629,20 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to read the stored embedding and usage of each result.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = embed_query(self.embedder, query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            columns = self._search_columns(include_embeddings)
 
             # Build the base statement
             stmt = select(*columns)
@@ -534,17 +686,7 @@ class PgVector(VectorDb):
             # Process the results and convert to Document objects
             search_results: List[Document] = []
             for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+                search_results.append(self._search_result_to_document(result, include_embeddings))
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -570,7 +712,13 @@ class PgVector(VectorDb):
         processed_words = [word + "*" for word in words]
         return " ".join(processed_words)
 
-    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Perform a keyword search on the 'content' column.
 
@@ -578,20 +726,14 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to read the stored embedding and usage of each result.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            columns = self._search_columns(include_embeddings)
 
             # Build the base statement
             stmt = select(*columns)
@@ -631,17 +773,7 @@ class PgVector(VectorDb):
             # Process the results and convert to Document objects
             search_results: List[Document] = []
             for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+                search_results.append(self._search_result_to_document(result, include_embeddings))
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -654,6 +786,7 @@ class PgVector(VectorDb):
         query: str,
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector similarity and full-text search.
@@ -662,26 +795,20 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to read the stored embedding and usage of each result.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = embed_query(self.embedder, query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            columns = self._search_columns(include_embeddings)
 
             # Build the text search vector
             ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
@@ -755,17 +882,7 @@ class PgVector(VectorDb):
             # Process the results and convert to Document objects
             search_results: List[Document] = []
             for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+                search_results.append(self._search_result_to_document(result, include_embeddings))
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -1039,6 +1156,28 @@ class PgVector(VectorDb):
             sess.rollback()
             return False
 
+    def delete_by_content_hash(self, content_hashes: List[str]) -> bool:
+        """
+        Delete the records with the given content hashes.
+
+        Args:
+            content_hashes (List[str]): Content hashes of the records to delete.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        from sqlalchemy import delete
+
+        try:
+            with self.Session() as sess, sess.begin():
+                for i in range(0, len(content_hashes), 1000):
+                    sess.execute(delete(self.table).where(self.table.c.content_hash.in_(content_hashes[i : i + 1000])))
+            log_info(f"Deleted {len(content_hashes)} content hashes from table '{self.table.fullname}'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting rows from table '{self.table.fullname}': {e}")
+            return False
+
     def __deepcopy__(self, memo):
         """
         Create a deep copy of the PgVector instance, handling unpickleable attributes.
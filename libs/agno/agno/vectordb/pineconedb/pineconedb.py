@@ -24,6 +24,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -252,8 +253,8 @@ class PineconeDb(VectorDb):
         """
 
         vectors = []
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             data_to_upsert = {
                 "id": document.id,
@@ -283,23 +284,10 @@ class PineconeDb(VectorDb):
         if not documents:
             return
 
-        # Pinecone has its own batching mechanism, but we'll add an additional layer
-        # to process document embedding in parallel
-        _batch_size = batch_size or 100
-
-        # Split documents into batches
-        batches = [documents[i : i + _batch_size] for i in range(0, len(documents), _batch_size)]
-        log_debug(f"Processing {len(documents)} documents in {len(batches)} batches for upsert")
-
-        # Process each batch in parallel
-        async def process_batch(batch_docs):
-            return await asyncio.to_thread(self._prepare_vectors, batch_docs)
-
-        # Run all batches in parallel
-        batch_vectors = await asyncio.gather(*[process_batch(batch) for batch in batches])
-
-        # Flatten vectors
-        all_vectors = [vector for batch in batch_vectors for vector in batch]
+        # Pinecone has its own batching mechanism for the upsert, the embedder embeds batches concurrently
+        log_debug(f"Processing {len(documents)} documents for upsert")
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+        all_vectors = self._prepare_vectors(documents)
 
         # Upsert all vectors
         await asyncio.to_thread(
@@ -309,10 +297,9 @@ class PineconeDb(VectorDb):
         log_debug(f"Finished async upsert of {len(documents)} documents")
 
     def _prepare_vectors(self, documents):
-        """Prepare vectors for upsert."""
+        """Prepare vectors for upsert from already embedded documents."""
         vectors = []
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             doc.meta_data["text"] = doc.content
             data_to_upsert = {
                 "id": doc.id,
@@ -386,6 +373,7 @@ class PineconeDb(VectorDb):
         filters: Optional[Dict[str, Union[str, float, int, bool, List, dict]]] = None,
         namespace: Optional[str] = None,
         include_values: Optional[bool] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search for similar documents in the index.
 
@@ -396,12 +384,15 @@ class PineconeDb(VectorDb):
             namespace (Optional[str], optional): The namespace to search in. Defaults to None.
             include_values (Optional[bool], optional): Whether to include values in the search results. Defaults to None.
             include_metadata (Optional[bool], optional): Whether to include metadata in the search results. Defaults to None.
+            include_embeddings (bool, optional): Whether to include the stored vectors in the search results,
+                same as `include_values`. Defaults to False.
 
         Returns:
             List[Document]: The list of matching documents.
 
         """
-        dense_embedding = self.embedder.get_embedding(query)
+        include_values = include_values or include_embeddings or None
+        dense_embedding = embed_query(self.embedder, query)
 
         if self.use_hybrid_search:
             sparse_embedding = self.sparse_encoder.encode_queries(query)
@@ -435,7 +426,7 @@ class PineconeDb(VectorDb):
             Document(
                 content=(result.metadata.get("text", "") if result.metadata is not None else ""),
                 id=result.id,
-                embedding=result.values,
+                embedding=result.values or None,
                 meta_data=result.metadata,
             )
             for result in response.matches
@@ -452,9 +443,19 @@ class PineconeDb(VectorDb):
         filters: Optional[Dict[str, Union[str, float, int, bool, List, dict]]] = None,
         namespace: Optional[str] = None,
         include_values: Optional[bool] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search for similar documents in the index asynchronously."""
-        return await asyncio.to_thread(self.search, query, limit, filters, namespace, include_values)
+        return await asyncio.to_thread(
+            self.search, query, limit, filters, namespace, include_values, include_embeddings
+        )
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Get the stored vectors of the documents with the given ids, with a single fetch request"""
+        if not ids:
+            return {}
+        response = self.index.fetch(ids=list(dict.fromkeys(ids)), namespace=self.namespace)
+        return {id: vector.values for id, vector in response.vectors.items() if vector.values}
 
     def optimize(self) -> None:
         """Optimize the index.
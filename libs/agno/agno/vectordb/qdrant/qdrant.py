@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
@@ -11,8 +11,9 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.reranker.base import Reranker
-from agno.utils.log import log_debug, log_info
+from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
 from agno.vectordb.search import SearchType
@@ -260,6 +261,57 @@ class Qdrant(VectorDb):
         )
         return len(collection_points) > 0
 
+    def _document_id(self, document: Document) -> str:
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        return md5(cleaned_content.encode()).hexdigest()
+
+    @staticmethod
+    def _point_ids(points: List[Any]) -> Set[str]:
+        # Qdrant returns UUID ids in their dashed form, while documents are stored under the plain md5 hex digest
+        return {str(point.id).replace("-", "") for point in points}
+
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """
+        Return the subset of the given point ids that exist in the collection, using a single retrieve request.
+
+        Args:
+            ids (List[str]): Point ids to check
+        """
+        if not self.client or not ids:
+            return set()
+        points = self.client.retrieve(
+            collection_name=self.collection,
+            ids=list(dict.fromkeys(ids)),
+            with_payload=False,
+            with_vectors=False,
+        )
+        return self._point_ids(points)
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Check which documents exist, using a single retrieve request
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        doc_ids = [self._document_id(document) for document in documents]
+        existing = self.existing_ids(doc_ids)
+        return [doc_id in existing for doc_id in doc_ids]
+
+    async def async_docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist asynchronously, using a single retrieve request."""
+        doc_ids = [self._document_id(document) for document in documents]
+        if not doc_ids:
+            return []
+        points = await self.async_client.retrieve(
+            collection_name=self.collection,
+            ids=list(dict.fromkeys(doc_ids)),
+            with_payload=False,
+            with_vectors=False,
+        )
+        existing = self._point_ids(points)
+        return [doc_id in existing for doc_id in doc_ids]
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -312,8 +364,19 @@ class Qdrant(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents")
+
+        # Embed all documents at once, for both dense and sparse vectors
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            Document.embed_batch(documents, embedder=self.embedder)
+        sparse_embeddings: List[Any] = []
+        if self.search_type in [SearchType.keyword, SearchType.hybrid]:
+            sparse_embeddings = [
+                sparse_embedding.as_object()
+                for sparse_embedding in self.sparse_encoder.embed([document.content for document in documents])
+            ]
+
         points = []
-        for document in documents:
+        for i, document in enumerate(documents):
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -325,17 +388,15 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding  # type: ignore
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
-                    vector[self.sparse_vector_name] = next(self.sparse_encoder.embed([document.content])).as_object()
+                    vector[self.sparse_vector_name] = sparse_embeddings[i]
 
             # Create payload with document properties
             payload = {
@@ -374,19 +435,21 @@ class Qdrant(VectorDb):
         """
         log_debug(f"Inserting {len(documents)} documents asynchronously")
 
+        # Embed all documents at once, embedding batches concurrently
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            await Document.async_embed_batch(documents, embedder=self.embedder)
+
         async def process_document(document):
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
@@ -442,7 +505,13 @@ class Qdrant(VectorDb):
         log_debug("Redirecting the async request to async_insert")
         await self.async_insert(documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Search for documents in the collection.
 
@@ -450,41 +519,75 @@ class Qdrant(VectorDb):
             query (str): Query to search for
             limit (int): Number of search results to return
             filters (Optional[Dict[str, Any]]): Filters to apply while searching
+            include_embeddings (bool): Whether to return the stored vectors of the results
         """
         filters = self._format_filters(filters or {})
         if self.search_type == SearchType.vector:
-            results = self._run_vector_search_sync(query, limit, filters)
+            results = self._run_vector_search_sync(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            results = self._run_keyword_search_sync(query, limit, filters)
+            results = self._run_keyword_search_sync(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            results = self._run_hybrid_search_sync(query, limit, filters)
+            results = self._run_hybrid_search_sync(query, limit, filters, include_embeddings)
         else:
             raise ValueError(f"Unsupported search type: {self.search_type}")
 
         return self._build_search_results(results, query)
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         filters = self._format_filters(filters or {})
         if self.search_type == SearchType.vector:
-            results = await self._run_vector_search_async(query, limit, filters)
+            results = await self._run_vector_search_async(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            results = await self._run_keyword_search_async(query, limit, filters)
+            results = await self._run_keyword_search_async(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            results = await self._run_hybrid_search_async(query, limit, filters)
+            results = await self._run_hybrid_search_async(query, limit, filters, include_embeddings)
         else:
             raise ValueError(f"Unsupported search type: {self.search_type}")
 
         return self._build_search_results(results, query)
 
+    def _dense_vector(self, vector: Any) -> Optional[List[float]]:
+        """The dense vector of a point, which is one of its named vectors when named vectors are used"""
+        if isinstance(vector, dict):
+            vector = vector.get(self.dense_vector_name)
+        return vector if isinstance(vector, list) else None
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Return the stored dense vectors of the given point ids, using a single retrieve request.
+
+        Args:
+            ids (List[str]): Point ids of the documents
+        """
+        if not self.client or not ids:
+            return {}
+        points = self.client.retrieve(
+            collection_name=self.collection,
+            ids=list(dict.fromkeys(ids)),
+            with_payload=False,
+            with_vectors=[self.dense_vector_name] if self.use_named_vectors else True,
+        )
+        embeddings: Dict[str, List[float]] = {}
+        for point in points:
+            vector = self._dense_vector(point.vector)
+            if vector is not None:
+                embeddings[str(point.id).replace("-", "")] = vector
+        return embeddings
+
     def _run_hybrid_search_sync(
         self,
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        include_embeddings: bool = False,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = embed_query(self.embedder, query)
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = self.client.query_points(
             collection_name=self.collection,
@@ -497,7 +600,7 @@ class Qdrant(VectorDb):
                 models.Prefetch(query=dense_embedding, limit=limit, using=self.dense_vector_name),
             ],
             query=models.FusionQuery(fusion=self.hybrid_fusion_strategy),
-            with_vectors=True,
+            with_vectors=include_embeddings,
             with_payload=True,
             limit=limit,
             query_filter=filters,
@@ -509,15 +612,16 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        include_embeddings: bool = False,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = embed_query(self.embedder, query)
 
         # TODO(v2.0.0): Remove this conditional and always use named vectors
         if self.use_named_vectors:
             call = self.client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=include_embeddings,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -528,7 +632,7 @@ class Qdrant(VectorDb):
             call = self.client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=include_embeddings,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -540,12 +644,13 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        include_embeddings: bool = False,
     ) -> List[models.ScoredPoint]:
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = self.client.query_points(
             collection_name=self.collection,
             query=models.SparseVector(**sparse_embedding),
-            with_vectors=True,
+            with_vectors=include_embeddings,
             with_payload=True,
             limit=limit,
             using=self.sparse_vector_name,
@@ -558,15 +663,16 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        include_embeddings: bool = False,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = embed_query(self.embedder, query)
 
         # TODO(v2.0.0): Remove this conditional and always use named vectors
         if self.use_named_vectors:
             call = await self.async_client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=include_embeddings,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -577,7 +683,7 @@ class Qdrant(VectorDb):
             call = await self.async_client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=include_embeddings,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -589,12 +695,13 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        include_embeddings: bool = False,
     ) -> List[models.ScoredPoint]:
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = await self.async_client.query_points(
             collection_name=self.collection,
             query=models.SparseVector(**sparse_embedding),
-            with_vectors=True,
+            with_vectors=include_embeddings,
             with_payload=True,
             limit=limit,
             using=self.sparse_vector_name,
@@ -607,8 +714,9 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        include_embeddings: bool = False,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = embed_query(self.embedder, query)
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = await self.async_client.query_points(
             collection_name=self.collection,
@@ -621,7 +729,7 @@ class Qdrant(VectorDb):
                 models.Prefetch(query=dense_embedding, limit=limit, using=self.dense_vector_name),
             ],
             query=models.FusionQuery(fusion=self.hybrid_fusion_strategy),
-            with_vectors=True,
+            with_vectors=include_embeddings,
             with_payload=True,
             limit=limit,
             query_filter=filters,
@@ -636,11 +744,12 @@ class Qdrant(VectorDb):
                 continue
             search_results.append(
                 Document(
+                    id=str(result.id).replace("-", ""),
                     name=result.payload["name"],
                     meta_data=result.payload["meta_data"],
                     content=result.payload["content"],
                     embedder=self.embedder,
-                    embedding=result.vector,  # type: ignore
+                    embedding=self._dense_vector(result.vector),
                     usage=result.payload["usage"],
                 )
             )
@@ -704,3 +813,20 @@ class Qdrant(VectorDb):
 
     def delete(self) -> bool:
         return self.client.delete_collection(collection_name=self.collection)
+
+    def delete_by_content_hash(self, content_hashes: List[str]) -> bool:
+        """
+        Delete the points with the given content hashes, which Qdrant uses as point ids
+
+        Args:
+            content_hashes (List[str]): Content hashes of the points to delete
+        """
+        try:
+            self.client.delete(
+                collection_name=self.collection,
+                points_selector=models.PointIdsList(points=list(content_hashes)),
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting points: {e}")
+            return False
@@ -15,6 +15,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.reranker.base import Reranker
 
 # from agno.vectordb.singlestore.index import Ivfflat, HNSWFlat
@@ -170,10 +171,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the insert.
             batch_size (int): Number of documents to insert in each batch.
         """
+        Document.embed_batch(documents, embedder=self.embedder)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -213,10 +214,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the upsert.
             batch_size (int): Number of documents to upsert in each batch.
         """
+        Document.embed_batch(documents, embedder=self.embedder)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -253,7 +254,13 @@ class SingleStore(VectorDb):
             sess.commit()
             log_debug(f"Committed {counter} documents")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Search for documents based on a query and optional filters.
 
@@ -261,22 +268,26 @@ class SingleStore(VectorDb):
             query (str): The search query.
             limit (int): The maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Optional filters for the search.
+            include_embeddings (bool): Whether to return the stored embeddings of the results.
 
         Returns:
             List[Document]: List of documents that match the query.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
 
         columns = [
+            self.table.c.id,
             self.table.c.name,
             self.table.c.meta_data,
             self.table.c.content,
-            self.table.c.embedding,
             self.table.c.usage,
         ]
+        # The stored embeddings are only read when requested
+        if include_embeddings:
+            columns.append(self.table.c.embedding)
 
         stmt = select(*columns)
 
@@ -321,16 +332,16 @@ class SingleStore(VectorDb):
             usage_dict = json.loads(neighbor.usage) if neighbor.usage else {}
 
             # Convert SingleStore VECTOR type to list
-            embedding_list = []
-            if neighbor.embedding:
+            embedding_list = None
+            if include_embeddings and neighbor.embedding:
                 try:
                     embedding_list = json.loads(neighbor.embedding)
                 except Exception as e:
                     logger.error(f"Error extracting vector: {e}")
-                    embedding_list = []
 
             search_results.append(
                 Document(
+                    id=neighbor.id,
                     name=neighbor.name,
                     meta_data=meta_data_dict,
                     content=neighbor.content,
@@ -345,6 +356,19 @@ class SingleStore(VectorDb):
 
         return search_results
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Get the stored embeddings of the documents with the given ids, with a single query"""
+        if not ids:
+            return {}
+        stmt = select(self.table.c.id, self.table.c.embedding).where(self.table.c.id.in_(list(dict.fromkeys(ids))))
+        embeddings: Dict[str, List[float]] = {}
+        with self.Session.begin() as sess:
+            sess.execute(text("SET vector_type_project_format = JSON"))
+            for row in sess.execute(stmt).fetchall():
+                if row.embedding:
+                    embeddings[row.id] = json.loads(row.embedding)
+        return embeddings
+
     def drop(self) -> None:
         """
         Delete the table.
@@ -406,7 +430,11 @@ class SingleStore(VectorDb):
         raise NotImplementedError(f"Async not supported on {self.__class__.__name__}.")
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         raise NotImplementedError(f"Async not supported on {self.__class__.__name__}.")
 
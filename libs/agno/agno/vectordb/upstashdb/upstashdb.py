@@ -10,6 +10,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.reranker.base import Reranker
 from agno.utils.log import log_info, logger
 from agno.vectordb.base import VectorDb
@@ -189,6 +190,11 @@ class UpstashVectorDb(VectorDb):
         _namespace = self.namespace if namespace is None else namespace
         vectors = []
 
+        if not self.use_upstash_embeddings and self.embedder is not None:
+            Document.embed_batch(
+                [document for document in documents if document.id is not None], embedder=self.embedder
+            )
+
         for document in documents:
             if document.id is None:
                 logger.error(f"Document ID must not be None. Skipping document: {document.content[:100]}...")
@@ -201,7 +207,6 @@ class UpstashVectorDb(VectorDb):
                     logger.error("Embedder is None but use_upstash_embeddings is False")
                     continue
 
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Failed to generate embedding for document: {document.id}")
                     continue
@@ -243,6 +248,7 @@ class UpstashVectorDb(VectorDb):
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
         namespace: Optional[str] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search for documents in the index.
         Args:
@@ -250,6 +256,7 @@ class UpstashVectorDb(VectorDb):
             limit (int, optional): Maximum number of results to return. Defaults to 5.
             filters (Optional[Dict[str, Any]], optional): Metadata filters for the search.
             namespace (Optional[str], optional): The namespace to search in. Defaults to None, which uses the instance namespace.
+            include_embeddings (bool, optional): Whether to return the stored vectors of the results. Defaults to False.
         Returns:
             List[Document]: List of matching documents.
         """
@@ -258,7 +265,7 @@ class UpstashVectorDb(VectorDb):
         # filter_str = "" if filters is None else str(filters)
 
         if not self.use_upstash_embeddings and self.embedder is not None:
-            dense_embedding = self.embedder.get_embedding(query)
+            dense_embedding = embed_query(self.embedder, query)
 
             if dense_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
@@ -271,7 +278,7 @@ class UpstashVectorDb(VectorDb):
                 # filter=filter_str,
                 include_data=True,
                 include_metadata=True,
-                include_vectors=True,
+                include_vectors=include_embeddings,
             )
         else:
             response = self.index.query(
@@ -281,7 +288,7 @@ class UpstashVectorDb(VectorDb):
                 # filter=filter_str,
                 include_data=True,
                 include_metadata=True,
-                include_vectors=True,
+                include_vectors=include_embeddings,
             )
 
         if response is None:
@@ -290,7 +297,11 @@ class UpstashVectorDb(VectorDb):
 
         search_results = []
         for result in response:
-            if result.data is not None and result.id is not None and result.vector is not None:
+            if (
+                result.data is not None
+                and result.id is not None
+                and (result.vector is not None or not include_embeddings)
+            ):
                 search_results.append(
                     Document(
                         content=result.data,
@@ -305,6 +316,18 @@ class UpstashVectorDb(VectorDb):
 
         return search_results
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Get the stored vectors of the given ids in the instance namespace, with a single fetch.
+        Args:
+            ids (List[str]): The ids of the documents.
+        Returns:
+            Dict[str, List[float]]: Vectors by id. Missing ids are not included.
+        """
+        if not ids:
+            return {}
+        response = self.index.fetch(ids=list(dict.fromkeys(ids)), include_vectors=True, namespace=self.namespace)
+        return {result.id: result.vector for result in response if result is not None and result.vector is not None}
+
     def delete(self, namespace: Optional[str] = None, delete_all: bool = False) -> bool:
         """Clear the index.
         Args:
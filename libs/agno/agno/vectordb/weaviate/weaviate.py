@@ -19,6 +19,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.query_cache import embed_query
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -248,8 +249,8 @@ class Weaviate(VectorDb):
         log_debug(f"Inserting {len(documents)} documents into Weaviate.")
         collection = self.get_client().collections.get(self.collection)
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             if document.embedding is None:
                 logger.error(f"Document embedding is None: {document.name}")
                 continue
@@ -293,11 +294,10 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
-            # Process documents first
+            # Embed all documents first
+            await Document.async_embed_batch(documents, embedder=self.embedder)
             for document in documents:
                 try:
-                    # Embed document
-                    document.embed(embedder=self.embedder)
                     if document.embedding is None:
                         logger.error(f"Document embedding is None: {document.name}")
                         continue
@@ -357,8 +357,8 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
+            await Document.async_embed_batch(documents, embedder=self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Document embedding is None: {document.name}")
                     continue
@@ -382,7 +382,13 @@ class Weaviate(VectorDb):
         finally:
             await client.close()
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Perform a search based on the configured search type.
 
@@ -390,22 +396,27 @@ class Weaviate(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to return the stored vectors of the results.
 
         Returns:
             List[Document]: List of matching documents.
         """
         if self.search_type == SearchType.vector:
-            return self.vector_search(query, limit, filters)
+            return self.vector_search(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            return self.keyword_search(query, limit, filters)
+            return self.keyword_search(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit, filters)
+            return self.hybrid_search(query, limit, filters, include_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a search based on the configured search type asynchronously.
@@ -414,23 +425,30 @@ class Weaviate(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to return the stored vectors of the results.
 
         Returns:
             List[Document]: List of matching documents.
         """
         if self.search_type == SearchType.vector:
-            return await self.async_vector_search(query, limit, filters)
+            return await self.async_vector_search(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            return await self.async_keyword_search(query, limit, filters)
+            return await self.async_keyword_search(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            return await self.async_hybrid_search(query, limit, filters)
+            return await self.async_hybrid_search(query, limit, filters, include_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
-    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         try:
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = embed_query(self.embedder, query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for query: {query}")
                 return []
@@ -442,7 +460,7 @@ class Weaviate(VectorDb):
                 near_vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 filters=filter_expr,
             )
 
@@ -461,7 +479,11 @@ class Weaviate(VectorDb):
             return []
 
     async def async_vector_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a vector search in Weaviate asynchronously.
@@ -473,7 +495,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -488,7 +510,7 @@ class Weaviate(VectorDb):
                 near_vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 filters=filter_expr,
             )
 
@@ -506,7 +528,13 @@ class Weaviate(VectorDb):
             logger.error(f"Error searching for documents: {e}")
             return []
 
-    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         try:
             collection = self.get_client().collections.get(self.collection)
             filter_expr = self._build_filter_expression(filters)
@@ -516,7 +544,7 @@ class Weaviate(VectorDb):
                 query_properties=["content"],
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 filters=filter_expr,
             )
 
@@ -535,7 +563,11 @@ class Weaviate(VectorDb):
             return []
 
     async def async_keyword_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a keyword search in Weaviate asynchronously.
@@ -558,7 +590,7 @@ class Weaviate(VectorDb):
                 query_properties=["content"],
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 filters=filter_expr,
             )
 
@@ -576,9 +608,15 @@ class Weaviate(VectorDb):
             logger.error(f"Error searching for documents: {e}")
             return []
 
-    def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         try:
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = embed_query(self.embedder, query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for query: {query}")
                 return []
@@ -591,7 +629,7 @@ class Weaviate(VectorDb):
                 vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 query_properties=["content"],
                 alpha=self.hybrid_search_alpha,
                 filters=filter_expr,
@@ -612,7 +650,11 @@ class Weaviate(VectorDb):
             return []
 
     async def async_hybrid_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector and keyword search in Weaviate asynchronously.
@@ -624,7 +666,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = embed_query(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -640,7 +682,7 @@ class Weaviate(VectorDb):
                 vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 query_properties=["content"],
                 alpha=self.hybrid_search_alpha,
                 filters=filter_expr,
@@ -720,6 +762,36 @@ class Weaviate(VectorDb):
 
         return configs[index_type]
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Get the stored vectors of the documents with the given ids, with a single query.
+
+        Args:
+            ids (List[str]): The ids of the documents, as returned by search.
+
+        Returns:
+            Dict[str, List[float]]: Vectors by id. Missing ids are not included.
+        """
+        uuids = []
+        for id in dict.fromkeys(ids):
+            try:
+                uuids.append(uuid.UUID(hex=id))
+            except ValueError:
+                continue
+        if not uuids:
+            return {}
+
+        collection = self.get_client().collections.get(self.collection)
+        response = collection.query.fetch_objects(
+            filters=Filter.by_id().contains_any(uuids), include_vector=True, limit=len(uuids)
+        )
+        embeddings: Dict[str, List[float]] = {}
+        for obj in response.objects:
+            vector = obj.vector.get("default") if isinstance(obj.vector, dict) else obj.vector
+            if vector:
+                embeddings[obj.uuid.hex] = vector
+        return embeddings
+
     def get_search_results(self, response: Any) -> List[Document]:
         """
         Create search results from the Weaviate response.
@@ -734,10 +806,11 @@ class Weaviate(VectorDb):
         for obj in response.objects:
             properties = obj.properties
             meta_data = json.loads(properties["meta_data"]) if properties.get("meta_data") else None
-            embedding = obj.vector["default"] if isinstance(obj.vector, dict) else obj.vector
+            embedding = obj.vector.get("default") if isinstance(obj.vector, dict) else obj.vector
 
             search_results.append(
                 Document(
+                    id=obj.uuid.hex if isinstance(obj.uuid, uuid.UUID) else None,
                     name=properties["name"],
                     meta_data=meta_data if meta_data else {},
                     content=properties["content"],
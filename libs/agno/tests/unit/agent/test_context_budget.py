@@ -0,0 +1,100 @@
+from typing import List
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory, AgentRun
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.run.context import ContextBudget
+from agno.run.messages import RunMessages
+from agno.run.response import RunResponse
+from agno.utils.tokens import ApproximateTokenizer
+
+
+@pytest.fixture
+def runs() -> List[AgentRun]:
+    runs = []
+    for index in range(5):
+        messages = [
+            Message(role="user", content=f"question {index}"),
+            Message(role="assistant", tool_calls=[{"id": f"call-{index}", "type": "function"}]),
+            Message(role="tool", tool_call_id=f"call-{index}", content="ok"),
+            Message(role="assistant", content=f"answer {index}"),
+        ]
+        runs.append(AgentRun(response=RunResponse(run_id=f"run-{index}", messages=messages)))
+    return runs
+
+
+@pytest.fixture
+def agent(runs) -> Agent:
+    memory = AgentMemory()
+    for run in runs:
+        memory.add_run(run)
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o"),
+        memory=memory,
+        add_history_to_messages=True,
+        num_history_runs=10,
+    )
+    agent.run_response = RunResponse()
+    return agent
+
+
+def test_approximate_tokenizer_counts_and_truncates():
+    tokenizer = ApproximateTokenizer(chars_per_token=4)
+
+    assert tokenizer.count("a" * 10) == 3
+    assert tokenizer.truncate("a" * 100, 5) == "a" * 20
+
+
+def test_history_is_selected_from_the_most_recent_runs(agent):
+    agent.context_budget = ContextBudget(max_tokens=60)
+
+    run_messages = agent.get_run_messages(message="new question", session_id="session-1")
+
+    history = [m for m in run_messages.messages if m.from_history]
+    # Whole runs are kept, so each tool call stays with its result
+    assert len(history) % 4 == 0 and 0 < len(history) < 20
+    assert history[-1].content == "answer 4"
+    assert run_messages.messages[-1].content == "new question"
+
+    usage = agent.run_response.extra_data.context_usage
+    assert usage["total_tokens"] <= 60
+    assert usage["history_messages"] == len(history)
+    assert usage["dropped_history_messages"] == 20 - len(history)
+
+
+def test_history_tool_results_are_truncated_on_copies(agent, runs):
+    runs[0].response.messages[2].content = "x" * 4000
+    agent.context_budget = ContextBudget(max_tool_result_tokens=10)
+
+    run_messages = agent.get_run_messages(message="new question", session_id="session-1")
+
+    tool_message = next(m for m in run_messages.messages if m.role == "tool")
+    assert tool_message.content.endswith("[truncated]")
+    assert len(tool_message.content) < 100
+    # The stored run is unchanged
+    assert runs[0].response.messages[2].content == "x" * 4000
+    assert runs[0].response.messages[2].from_history is False
+    assert agent.run_response.extra_data.context_usage["truncated_messages"] == 1
+
+
+def test_fit_keeps_messages_within_budget():
+    run_messages = RunMessages(
+        messages=[
+            Message(role="system", content="s" * 40),
+            Message(role="user", content="old", from_history=True),
+            Message(role="assistant", content="o" * 400, from_history=True),
+            Message(role="user", content="new"),
+        ]
+    )
+    run_messages.system_message = run_messages.messages[0]
+
+    usage = ContextBudget(max_tokens=50).fit(run_messages)
+
+    assert [m.content for m in run_messages.messages] == ["s" * 40, "new"]
+    assert usage.system_tokens == 14
+    assert usage.input_tokens == 5
+    assert usage.history_tokens == 0
+    assert usage.dropped_history_messages == 2
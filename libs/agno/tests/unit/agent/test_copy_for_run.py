@@ -0,0 +1,109 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, List
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.v2.memory import Memory
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.tools.toolkit import Toolkit
+
+
+@dataclass
+class ToolCallingModel(Model):
+    """Calls the `remember` tool with the user message, then answers with the session state"""
+
+    id: str = "tool-calling-model"
+
+    def _next(self, messages: List[Message]) -> Any:
+        last = messages[-1]
+        if last.role == "user":
+            arguments = json.dumps({"value": last.content})
+            return {
+                "tool_calls": [
+                    {"id": "call-1", "type": "function", "function": {"name": "remember", "arguments": arguments}}
+                ]
+            }
+        return {"content": "done"}
+
+    def invoke(self, messages: List[Message], **kwargs) -> Any:
+        return self._next(messages)
+
+    async def ainvoke(self, messages: List[Message], **kwargs) -> Any:
+        # Let the other runs make progress between model calls
+        await asyncio.sleep(0.01)
+        return self._next(messages)
+
+    def invoke_stream(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(
+            role="assistant", content=response.get("content"), tool_calls=response.get("tool_calls", [])
+        )
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        raise NotImplementedError
+
+
+class RememberTools(Toolkit):
+    def __init__(self):
+        super().__init__(name="remember_tools", tools=[self.remember])
+
+    def remember(self, agent: Agent, value: str) -> str:
+        """Remember a value in the session state.
+
+        Args:
+            value: The value to remember.
+        """
+        agent.session_state.setdefault("values", []).append(value)  # type: ignore
+        return f"remembered {value}"
+
+
+@pytest.fixture
+def agent() -> Agent:
+    return Agent(
+        model=ToolCallingModel(),
+        memory=Memory(),
+        tools=[RememberTools()],
+        telemetry=False,
+    )
+
+
+def test_copy_shares_resources_and_resets_state(agent):
+    agent.run("first", session_id="session-1")
+
+    run_agent = agent.copy_for_run(update={"user_id": "user-2"})
+
+    assert run_agent.memory is agent.memory
+    assert run_agent.run_response is None and run_agent.session_id == agent.session_id
+    assert run_agent.session_state == agent.session_state and run_agent.session_state is not agent.session_state
+    assert run_agent.user_id == "user-2"
+    assert run_agent.tools[0].functions["remember"] is not agent.tools[0].functions["remember"]  # type: ignore
+    # The configured agent is unchanged
+    assert agent.run_response is not None and agent.run_response.content == "done"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_on_copies_are_isolated(agent):
+    async def run(session_id: str, value: str):
+        run_agent = agent.copy_for_run()
+        response = await run_agent.arun(value, session_id=session_id)
+        return run_agent, response
+
+    results = await asyncio.gather(*(run(f"session-{i}", f"value-{i}") for i in range(5)))
+
+    for i, (run_agent, response) in enumerate(results):
+        assert response.session_id == f"session-{i}"
+        assert run_agent.session_state["values"] == [f"value-{i}"]  # type: ignore
+        assert run_agent.run_response is response
+    # The configured agent is not modified by the runs
+    assert agent.session_state is None
+    assert agent.run_response is None
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from agno.agent import Agent, RunResponseDelta
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
+from agno.run.messages import RunMessages
+from agno.run.response import RunEvent, RunResponse
+
+CHUNKS = [
+    ModelResponse(content="The answer"),
+    ModelResponse(
+        event=ModelResponseEvent.tool_call_started.value,
+        tool_executions=[ToolExecution(tool_call_id="call-1", tool_name="lookup")],
+    ),
+    ModelResponse(content=" is", thinking="Looked it up"),
+    ModelResponse(content=" 42"),
+]
+
+
+def stream_run(agent: Agent):
+    run_response = RunResponse(run_id="run-1")
+    agent.run_id = "run-1"
+    run_messages = RunMessages(messages=[Message(role="user", content="What is the answer?")])
+    with patch.object(agent.model, "response_stream", return_value=iter(CHUNKS)):
+        events = list(
+            agent._handle_model_response_stream(
+                run_response=run_response, run_messages=run_messages, session_id="session-1"
+            )
+        )
+    return run_response, events
+
+
+def test_stream_yields_deltas_and_updates_run_response_at_the_end():
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), agent_id="agent-1")
+    run_response, events = stream_run(agent)
+
+    deltas = [event for event in events if event.event == RunEvent.run_response.value]
+    assert all(isinstance(delta, RunResponseDelta) for delta in deltas)
+    assert [delta.content for delta in deltas] == ["The answer", " is", " 42"]
+    assert deltas[1].thinking == "Looked it up"
+    assert deltas[0].to_dict() == {
+        "content": "The answer",
+        "content_type": "str",
+        "event": "RunResponse",
+        "run_id": "run-1",
+        "agent_id": "agent-1",
+        "session_id": "session-1",
+        "created_at": deltas[0].created_at,
+    }
+
+    # The tool call event carries the content streamed before it
+    tool_call_started = [event for event in events if event.event == RunEvent.tool_call_started.value]
+    assert tool_call_started[0].content == "The answer"
+
+    assert run_response.content == "The answer is 42"
+    assert run_response.thinking == "Looked it up"
+
+
+def test_stream_snapshots():
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), stream_snapshots=True)
+    run_response, events = stream_run(agent)
+
+    chunks = [event for event in events if event.event == RunEvent.run_response.value]
+    assert not any(isinstance(chunk, RunResponseDelta) for chunk in chunks)
+    assert [chunk.content for chunk in chunks] == ["The answer", " is", " 42"]
+    assert run_response.content == "The answer is 42"
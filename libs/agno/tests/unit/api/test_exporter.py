@@ -0,0 +1,86 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.api.exporter import ApiExporter
+
+
+@pytest.fixture
+def exporter(request) -> ApiExporter:
+    # Tests set the exporter settings with indirect parametrization
+    exporter = ApiExporter(**getattr(request, "param", {}))
+    exporter._client = MagicMock()
+    return exporter
+
+
+@pytest.mark.parametrize("exporter", [{"batch_size": 10, "flush_interval": 0.2}], indirect=True)
+def test_events_are_sent_in_batches_over_one_client(exporter):
+    for i in range(25):
+        assert exporter.submit("/route", {"index": i})
+    assert exporter.flush(timeout=2)
+
+    client = exporter._client
+    assert [call.kwargs["json"]["index"] for call in client.post.call_args_list] == list(range(25))
+    assert exporter.sent_events == 25
+    assert exporter.dropped_events == 0
+
+
+@pytest.mark.parametrize("exporter", [{"batch_size": 100, "flush_interval": 0.05}], indirect=True)
+def test_events_are_sent_after_the_flush_interval(exporter):
+    exporter.submit("/route", {"index": 0})
+    time.sleep(0.3)
+
+    exporter._client.post.assert_called_once_with("/route", json={"index": 0})
+
+
+@pytest.mark.parametrize("exporter", [{"max_queue_size": 2, "batch_size": 1, "flush_interval": 0.01}], indirect=True)
+def test_events_are_dropped_when_the_queue_is_full(exporter):
+    sending = threading.Event()
+    release = threading.Event()
+
+    def slow_post(route, json):
+        sending.set()
+        release.wait(2)
+
+    exporter._client.post.side_effect = slow_post
+    exporter.submit("/route", {"index": 0})
+    assert sending.wait(2)
+
+    results = [exporter.submit("/route", {"index": i}) for i in range(1, 5)]
+    release.set()
+
+    assert results == [True, True, False, False]
+    assert exporter.dropped_events == 2
+    assert exporter.flush(timeout=2)
+    assert exporter._client.post.call_count == 3
+
+
+def test_submit_reuses_one_worker_thread(exporter):
+    exporter.submit("/route", {})
+    worker = exporter._worker
+    threads = threading.active_count()
+    for _ in range(20):
+        exporter.submit("/route", {})
+
+    assert exporter._worker is worker
+    assert threading.active_count() == threads
+
+
+def test_send_errors_are_not_raised(exporter):
+    exporter._client.post.side_effect = RuntimeError("unavailable")
+
+    exporter.submit("/route", {})
+
+    assert exporter.flush(timeout=2)
+    assert exporter.sent_events == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("exporter", [{"flush_interval": 10}], indirect=True)
+async def test_aflush_waits_for_queued_events(exporter):
+    exporter.submit("/route", {"index": 0})
+
+    assert await exporter.aflush(timeout=2)
+    exporter._client.post.assert_called_once_with("/route", json={"index": 0})
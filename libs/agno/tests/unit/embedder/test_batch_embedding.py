@@ -0,0 +1,112 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder, batch_usage
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    dimensions: int = 3
+    requests: List[List[str]] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.requests.append([text])
+        return [float(len(text))] * 3, {"total_tokens": 1}
+
+
+@dataclass
+class BatchCountingEmbedder(CountingEmbedder):
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.requests.append(list(texts))
+        usage = {"total_tokens": len(texts)}
+        return [[float(len(text))] * 3 for text in texts], batch_usage(usage, len(texts))
+
+
+def test_default_batch_falls_back_to_single_requests():
+    embedder = CountingEmbedder()
+    embeddings, usage = embedder.get_embeddings_batch_and_usage(["a", "bb", "ccc"])
+
+    assert embeddings == [[1.0] * 3, [2.0] * 3, [3.0] * 3]
+    assert usage == [{"total_tokens": 1}] * 3
+    assert embedder.requests == [["a"], ["bb"], ["ccc"]]
+
+
+def test_batch_size_limits_texts_per_request():
+    embedder = BatchCountingEmbedder(batch_size=2)
+    embeddings = embedder.get_embeddings_batch(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert [embedding[0] for embedding in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert embedder.requests == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+
+def test_batch_max_tokens_limits_request_size():
+    embedder = BatchCountingEmbedder(batch_size=100, batch_max_tokens=6)
+    texts = ["x" * 8, "y" * 8, "z" * 40]
+
+    assert embedder.split_batches(texts) == [["x" * 8, "y" * 8], ["z" * 40]]
+
+
+def test_embed_batch_sets_embedding_and_usage_on_documents():
+    embedder = BatchCountingEmbedder()
+    documents = [Document(content="first"), Document(content="second")]
+
+    Document.embed_batch(documents, embedder=embedder)
+
+    assert len(embedder.requests) == 1
+    assert documents[0].embedding == [5.0] * 3
+    assert documents[1].embedding == [6.0] * 3
+    # The usage of the request is only counted once
+    assert documents[0].usage == {"total_tokens": 2}
+    assert documents[1].usage is None
+
+
+def test_batch_usage_is_returned_for_the_first_text_of_each_batch():
+    embedder = BatchCountingEmbedder(batch_size=2)
+    _, usage = embedder.get_embeddings_batch_and_usage(["a", "b", "c"])
+
+    assert usage == [{"total_tokens": 2}, None, {"total_tokens": 1}]
+
+
+@dataclass
+class AsyncBatchCountingEmbedder(BatchCountingEmbedder):
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self._get_batch_embeddings_and_usage(texts)
+
+
+@pytest.mark.asyncio
+async def test_async_batches_run_concurrently_with_a_bound():
+    embedder = AsyncBatchCountingEmbedder(batch_size=1, max_concurrent_batches=2)
+    texts = ["a" * i for i in range(1, 7)]
+
+    embeddings = await embedder.async_get_embeddings_batch(texts)
+
+    assert [embedding[0] for embedding in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert len(embedder.requests) == 6
+    assert embedder.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_async_embed_batch_falls_back_to_sync_embedder_in_thread():
+    embedder = CountingEmbedder()
+    documents = [Document(content="first"), Document(content="second")]
+
+    await Document.async_embed_batch(documents, embedder=embedder)
+
+    assert documents[0].embedding == [5.0] * 3
+    assert documents[1].usage == {"total_tokens": 1}
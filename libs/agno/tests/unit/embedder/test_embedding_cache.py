@@ -0,0 +1,135 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.embedder.cache import CachedEmbedder, EmbeddingCache
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    id: str = "counting-model"
+    dimensions: int = 3
+    requests: List[List[str]] = field(default_factory=list, compare=False)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self._get_batch_embeddings_and_usage([text])[0][0], {"total_tokens": 1}
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.requests.append(list(texts))
+        return [[float(len(text)), 0.5, 1.0] for text in texts], [{"total_tokens": 1}] * len(texts)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(db_file=tmp_path / "embeddings.db")
+    yield cache
+    cache.close()
+
+
+def test_only_misses_are_sent_to_the_embedder(cache):
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner, cache=cache)
+
+    first, first_usage = embedder.get_embeddings_batch_and_usage(["a", "bb"])
+    second, second_usage = embedder.get_embeddings_batch_and_usage(["bb", "ccc", "a"])
+
+    assert first == [[1.0, 0.5, 1.0], [2.0, 0.5, 1.0]]
+    assert second == [[2.0, 0.5, 1.0], [3.0, 0.5, 1.0], [1.0, 0.5, 1.0]]
+    assert inner.requests == [["a", "bb"], ["ccc"]]
+    assert first_usage == [{"total_tokens": 1}] * 2
+    assert second_usage == [None, {"total_tokens": 1}, None]
+    assert embedder.dimensions == 3
+
+
+def test_cache_is_persisted_and_scoped_to_the_model(cache, tmp_path):
+    CachedEmbedder(embedder=CountingEmbedder(), cache=cache).get_embedding("hello")
+    cache.close()
+
+    reopened = EmbeddingCache(db_file=tmp_path / "embeddings.db")
+    same_model = CountingEmbedder()
+    other_model = CountingEmbedder(id="other-model")
+    CachedEmbedder(embedder=same_model, cache=reopened).get_embedding("hello")
+    CachedEmbedder(embedder=other_model, cache=reopened).get_embedding("hello")
+    reopened.close()
+
+    assert same_model.requests == []
+    assert other_model.requests == [["hello"]]
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    # Each 3-dimensional float32 embedding takes 12 bytes
+    cache = EmbeddingCache(
+        db_file=tmp_path / "embeddings.db", max_size_mb=30 / (1024 * 1024), evict_to_ratio=1.0, touch_interval=-1
+    )
+    cache.set_many({"a": [1.0, 2.0, 3.0], "b": [1.0, 2.0, 3.0]})
+    cache.get_many(["a"])
+    cache.set_many({"c": [1.0, 2.0, 3.0]})
+
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+    cache.close()
+
+
+def test_recently_accessed_entries_are_not_touched(cache):
+    cache.set_many({"a": [1.0, 2.0, 3.0]})
+    accessed_at = cache.connection.execute("SELECT accessed_at FROM embeddings").fetchone()[0]
+    total_changes = cache.connection.total_changes
+
+    cache.get_many(["a"])
+
+    assert cache.connection.total_changes == total_changes
+    assert cache.connection.execute("SELECT accessed_at FROM embeddings").fetchone()[0] == accessed_at
+
+
+def test_misses_are_rounded_like_hits(cache):
+    @dataclass
+    class FractionEmbedder(CountingEmbedder):
+        def _get_batch_embeddings_and_usage(self, texts):
+            return [[0.1, 0.2, 0.3] for _ in texts], [None] * len(texts)
+
+    embedder = CachedEmbedder(embedder=FractionEmbedder(), cache=cache)
+
+    miss = embedder.get_embedding("hello")
+    hit = embedder.get_embedding("hello")
+
+    assert miss == hit
+    assert miss != [0.1, 0.2, 0.3]
+
+
+def test_replaced_entries_do_not_count_twice(tmp_path):
+    cache = EmbeddingCache(db_file=tmp_path / "embeddings.db", max_size_mb=30 / (1024 * 1024), evict_to_ratio=1.0)
+    cache.set_many({"a": [1.0, 2.0, 3.0], "b": [1.0, 2.0, 3.0]})
+    cache.set_many({"a": [4.0, 5.0, 6.0]})
+
+    assert cache.get_many(["a", "b"]) == {"a": [4.0, 5.0, 6.0], "b": [1.0, 2.0, 3.0]}
+    assert cache._total_size == 24
+    cache.close()
+
+
+def test_documents_are_embedded_through_the_cache(cache):
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner, cache=cache)
+    documents = [Document(content="first"), Document(content="second")]
+
+    Document.embed_batch(documents, embedder=embedder)
+    Document.embed_batch([Document(content="first")], embedder=embedder)
+
+    assert documents[1].embedding == [6.0, 0.5, 1.0]
+    assert inner.requests == [["first", "second"]]
+
+
+@pytest.mark.asyncio
+async def test_async_embeddings_use_the_cache(cache):
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner, cache=cache)
+
+    await embedder.async_get_embeddings_batch(["a", "bb"])
+    embedding = await embedder.async_get_embedding("bb")
+
+    assert embedding == [2.0, 0.5, 1.0]
+    assert inner.requests == [["a", "bb"]]
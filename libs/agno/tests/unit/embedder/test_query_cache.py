@@ -0,0 +1,118 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.embedder.base import Embedder
+from agno.embedder.cache import CachedEmbedder, EmbeddingCache
+from agno.embedder.query_cache import QueryEmbeddingCache, embed_query, query_cache_key
+
+
+@dataclass
+class SlowEmbedder(Embedder):
+    id: str = "slow-model"
+    dimensions: int = 2
+    delay: float = 0.0
+    queries: List[str] = field(default_factory=list, compare=False)
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.queries.append(text)
+        time.sleep(self.delay)
+        return [float(len(text)), 1.0]
+
+
+def test_repeated_queries_are_embedded_once():
+    embedder = SlowEmbedder(query_cache=QueryEmbeddingCache())
+
+    assert embed_query(embedder, "what is agno") == [12.0, 1.0]
+    assert embed_query(embedder, "what is agno") == [12.0, 1.0]
+    embed_query(embedder, "other")
+
+    assert embedder.queries == ["what is agno", "other"]
+    assert embedder.query_cache.get_stats()["hits"] == 1
+
+
+def test_concurrent_identical_queries_are_coalesced():
+    embedder = SlowEmbedder(query_cache=QueryEmbeddingCache(), delay=0.2)
+
+    results: List[List[float]] = []
+    threads = [threading.Thread(target=lambda: results.append(embed_query(embedder, "query"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert embedder.queries == ["query"]
+    assert results == [[5.0, 1.0]] * 5
+    assert embedder.query_cache.coalesced == 4
+
+
+def test_expired_and_evicted_queries_are_embedded_again():
+    embedder = SlowEmbedder(query_cache=QueryEmbeddingCache(max_size=1, ttl=0.05))
+
+    embed_query(embedder, "a")
+    time.sleep(0.1)
+    embed_query(embedder, "a")
+    embed_query(embedder, "b")
+    embed_query(embedder, "a")
+
+    assert embedder.queries == ["a", "a", "b", "a"]
+
+
+def test_errors_are_not_cached():
+    embedder = SlowEmbedder(query_cache=QueryEmbeddingCache())
+    embedder.get_embedding = MagicMock(side_effect=[RuntimeError("rate limited"), [1.0, 1.0]])
+
+    with pytest.raises(RuntimeError):
+        embed_query(embedder, "query")
+
+    assert embed_query(embedder, "query") == [1.0, 1.0]
+
+
+def test_cache_can_be_disabled():
+    embedder = SlowEmbedder(cache_query_embeddings=False)
+
+    embed_query(embedder, "query")
+    embed_query(embedder, "query")
+
+    assert embedder.queries == ["query", "query"]
+
+
+def test_keys_are_scoped_to_the_model(tmp_path):
+    cache = EmbeddingCache(db_file=tmp_path / "embeddings.db")
+    wrapped = CachedEmbedder(embedder=SlowEmbedder(id="model-a"), cache=cache)
+
+    assert query_cache_key(wrapped, "query") == query_cache_key(SlowEmbedder(id="model-a"), "query")
+    assert query_cache_key(wrapped, "query") != query_cache_key(SlowEmbedder(id="model-b"), "query")
+    cache.close()
+
+
+@dataclass
+class TaskEmbedder(Embedder):
+    id: str = "task-model"
+    task_type: str = "RETRIEVAL_QUERY"
+    api_key: str = "key-1"
+    request_params: dict = field(default_factory=dict)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [1.0]
+
+
+def test_keys_are_scoped_to_the_settings_that_change_embeddings():
+    query = TaskEmbedder()
+
+    assert query_cache_key(query, "text") != query_cache_key(TaskEmbedder(task_type="RETRIEVAL_DOCUMENT"), "text")
+    assert query_cache_key(query, "text") != query_cache_key(TaskEmbedder(request_params={"truncate": "END"}), "text")
+    # Credentials and batching don't change the embeddings
+    assert query_cache_key(query, "text") == query_cache_key(TaskEmbedder(api_key="key-2", batch_size=10), "text")
+
+
+def test_query_embeddings_are_stored_as_float32():
+    cache = QueryEmbeddingCache()
+    cache.get_or_embed("key", lambda: [0.5, 1.5])
+
+    assert cache.get_or_embed("key", lambda: [0.0]) == [0.5, 1.5]
+    assert cache._entries["key"][1].itemsize == 4
@@ -0,0 +1,117 @@
+from typing import Iterator, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.text import TextKnowledgeBase
+from agno.vectordb.base import VectorDb
+
+
+class ListKnowledge(AgentKnowledge):
+    lists: List[List[Document]] = []
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        yield from self.lists
+
+    @property
+    async def async_document_lists(self):
+        async def _iterate():
+            for document_list in self.lists:
+                yield document_list
+
+        return _iterate()
+
+
+@pytest.fixture
+def vector_db():
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.exists.return_value = True
+    vector_db.async_exists = AsyncMock(return_value=True)
+    vector_db.docs_exist.side_effect = lambda documents: [document.content == "existing" for document in documents]
+    vector_db.upsert_available.return_value = True
+    vector_db.async_insert = AsyncMock()
+    vector_db.async_upsert = AsyncMock()
+    return vector_db
+
+
+@pytest.fixture
+def document_lists() -> List[List[Document]]:
+    return [
+        [Document(content=f"a{i}", meta_data={"source": "a"}) for i in range(3)]
+        + [Document(content="existing", meta_data={"source": "a"})],
+        [Document(content=f"b{i}", meta_data={"source": "b"}) for i in range(2)]
+        + [Document(content="a0", meta_data={"source": "a"})],
+        [Document(content=f"a{i}", meta_data={"source": "a"}) for i in range(3, 5)],
+    ]
+
+
+def test_load_inserts_full_batches_across_document_metadata(vector_db, document_lists):
+    knowledge = ListKnowledge(vector_db=vector_db, lists=document_lists, load_batch_size=4)
+
+    knowledge.load()
+
+    calls = [
+        (call.kwargs["filters"], [doc.content for doc in call.kwargs["documents"]])
+        for call in vector_db.insert.call_args_list
+    ]
+    assert calls == [
+        (None, ["a0", "a1", "a2", "b0"]),
+        (None, ["b1", "a3", "a4"]),
+    ]
+    assert knowledge.valid_metadata_filters == {"source"}
+    vector_db.doc_exists.assert_not_called()
+
+
+def test_load_batches_the_chunks_of_a_source(vector_db, tmp_path):
+    vector_db.docs_exist.side_effect = lambda documents: [False] * len(documents)
+    text_file = tmp_path / "notes.txt"
+    text_file.write_text(" ".join(f"word{i}" for i in range(5000)))
+    knowledge = TextKnowledgeBase(
+        path=[{"path": str(text_file), "metadata": {"team": "docs"}}],
+        vector_db=vector_db,
+        chunking_strategy=FixedSizeChunking(chunk_size=100),
+        load_batch_size=100,
+        read_workers=2,
+    )
+
+    knowledge.load()
+
+    calls = vector_db.insert.call_args_list
+    num_chunks = sum(len(call.kwargs["documents"]) for call in calls)
+    assert num_chunks > 200
+    # Every chunk has its own metadata, but only the last batch is partial
+    assert [len(call.kwargs["documents"]) for call in calls] == [100] * (num_chunks // 100) + [num_chunks % 100]
+    assert all(call.kwargs["filters"] == {"team": "docs"} for call in calls)
+
+
+def test_load_upserts_batches(vector_db, document_lists):
+    knowledge = ListKnowledge(vector_db=vector_db, lists=document_lists, load_batch_size=100)
+
+    knowledge.load(upsert=True)
+
+    vector_db.insert.assert_not_called()
+    assert [len(call.kwargs["documents"]) for call in vector_db.upsert.call_args_list] == [8]
+
+
+@pytest.mark.asyncio
+async def test_aload_inserts_batches(vector_db, document_lists):
+    knowledge = ListKnowledge(vector_db=vector_db, lists=document_lists, load_batch_size=4)
+
+    await knowledge.aload()
+
+    assert [len(call.kwargs["documents"]) for call in vector_db.async_insert.call_args_list] == [4, 3]
+
+
+def test_load_documents_checks_existence_in_bulk(vector_db):
+    knowledge = ListKnowledge(vector_db=vector_db)
+    documents = [Document(content="new"), Document(content="existing")]
+
+    knowledge.load_documents(documents)
+
+    vector_db.docs_exist.assert_called_once_with(documents)
+    vector_db.doc_exists.assert_not_called()
+    assert vector_db.insert.call_args.kwargs["documents"] == [documents[0]]
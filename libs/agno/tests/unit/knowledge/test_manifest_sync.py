@@ -0,0 +1,86 @@
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agno.document import Document
+from agno.document.reader.text_reader import TextReader
+from agno.knowledge.manifest import SourceManifest, document_content_hash
+from agno.knowledge.text import TextKnowledgeBase
+from agno.vectordb.base import VectorDb
+
+
+@pytest.fixture
+def vector_db():
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.exists.return_value = True
+    vector_db.async_exists = AsyncMock(return_value=True)
+    vector_db.docs_exist.side_effect = lambda documents: [False] * len(documents)
+    vector_db.async_insert = AsyncMock()
+    return vector_db
+
+
+@pytest.fixture
+def files(tmp_path):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "a.txt").write_text("alpha")
+    (docs_dir / "b.txt").write_text("beta")
+    return docs_dir
+
+
+def md5_of(content):
+    return document_content_hash(Document(content=content))
+
+
+def inserted_contents(vector_db):
+    return sorted(doc.content for call in vector_db.insert.call_args_list for doc in call.kwargs["documents"])
+
+
+def test_sync_reads_only_new_or_changed_files(vector_db, files, tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    knowledge = TextKnowledgeBase(path=files, vector_db=vector_db, manifest_path=manifest_path)
+
+    knowledge.load()
+    assert inserted_contents(vector_db) == ["alpha", "beta"]
+    assert len(SourceManifest.load(manifest_path).entries) == 2
+
+    # Nothing changed: no file is read
+    vector_db.reset_mock()
+    with patch.object(TextReader, "read", autospec=True, side_effect=TextReader.read) as mock_read:
+        knowledge.load()
+    mock_read.assert_not_called()
+    vector_db.insert.assert_not_called()
+
+    # Touching a file without changing its content does not re-read it
+    stat = (files / "b.txt").stat()
+    os.utime(files / "b.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (files / "a.txt").write_text("alpha, updated")
+    knowledge.load()
+    assert inserted_contents(vector_db) == ["alpha, updated"]
+    vector_db.delete_by_content_hash.assert_called_once()
+    assert vector_db.delete_by_content_hash.call_args.args[0] == [md5_of("alpha")]
+
+
+def test_sync_deletes_documents_of_removed_files(vector_db, files, tmp_path):
+    knowledge = TextKnowledgeBase(path=files, vector_db=vector_db, manifest_path=tmp_path / "manifest.json")
+    knowledge.load()
+
+    (files / "b.txt").unlink()
+    vector_db.reset_mock()
+    knowledge.load()
+
+    vector_db.insert.assert_not_called()
+    assert vector_db.delete_by_content_hash.call_args.args[0] == [md5_of("beta")]
+
+
+@pytest.mark.asyncio
+async def test_async_sync_skips_unchanged_files(vector_db, files, tmp_path):
+    knowledge = TextKnowledgeBase(path=files, vector_db=vector_db, manifest_path=tmp_path / "manifest.json")
+
+    await knowledge.aload()
+    assert sum(len(call.kwargs["documents"]) for call in vector_db.async_insert.call_args_list) == 2
+
+    vector_db.reset_mock()
+    await knowledge.aload()
+    vector_db.async_insert.assert_not_called()
@@ -0,0 +1,85 @@
+from functools import partial
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.knowledge.manifest import KnowledgeSource
+from agno.knowledge.pipeline import async_read_sources, read_sources
+from agno.knowledge.text import TextKnowledgeBase
+from agno.vectordb.base import VectorDb
+
+
+def read_text(text: str) -> List[Document]:
+    return [Document(content=text.upper())]
+
+
+def read_corrupt(text: str) -> List[Document]:
+    raise ValueError(f"corrupt source: {text}")
+
+
+@pytest.fixture
+def sources() -> List[KnowledgeSource]:
+    return [
+        KnowledgeSource(key=f"source-{i}", size=None, modified=None, read=partial(read_text, f"text {i}"))
+        for i in range(6)
+    ]
+
+
+def test_read_sources_in_worker_processes_keeps_order(sources):
+    results = list(read_sources(sources, workers=2, queue_size=2))
+
+    assert [source.key for source, _ in results] == [f"source-{i}" for i in range(6)]
+    assert [documents[0].content for _, documents in results] == [f"TEXT {i}" for i in range(6)]
+
+
+def test_unpicklable_sources_are_read_in_the_main_process():
+    sources = [
+        KnowledgeSource(key=f"source-{i}", size=None, modified=None, read=lambda i=i: [Document(content=str(i))])
+        for i in range(2)
+    ]
+
+    results = list(read_sources(sources, workers=2))
+
+    assert [documents[0].content for _, documents in results] == ["0", "1"]
+
+
+def test_reader_errors_in_worker_processes_are_raised(sources):
+    sources = sources[:2]
+    sources[1].read = partial(read_corrupt, "text 1")
+
+    with pytest.raises(ValueError, match="corrupt source"):
+        list(read_sources(sources, workers=2))
+
+
+@pytest.mark.asyncio
+async def test_async_reader_errors_in_worker_processes_are_raised(sources):
+    sources = sources[:2]
+    sources[0].read = partial(read_corrupt, "text 0")
+
+    with pytest.raises(ValueError, match="corrupt source"):
+        async for _ in async_read_sources(sources, workers=2):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_async_read_sources_in_worker_processes(sources):
+    results = [documents async for _, documents in async_read_sources(sources[:4], workers=2)]
+
+    assert [documents[0].content for documents in results] == [f"TEXT {i}" for i in range(4)]
+
+
+def test_knowledge_base_loads_with_read_workers(tmp_path):
+    for i in range(4):
+        (tmp_path / f"{i}.txt").write_text(f"file {i}")
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.exists.return_value = True
+    vector_db.async_exists = AsyncMock(return_value=True)
+    vector_db.docs_exist.side_effect = lambda documents: [False] * len(documents)
+
+    knowledge = TextKnowledgeBase(path=tmp_path, vector_db=vector_db, read_workers=2)
+    knowledge.load()
+
+    contents = sorted(doc.content for call in vector_db.insert.call_args_list for doc in call.kwargs["documents"])
+    assert contents == [f"file {i}" for i in range(4)]
@@ -0,0 +1,84 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.knowledge.agent import AgentKnowledge
+from agno.tools.cache import InMemoryToolCache
+from agno.vectordb.base import VectorDb
+
+
+@pytest.fixture
+def vector_db():
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.search.return_value = [Document(content="result", name="doc", meta_data={"page": 1}, embedding=[1.0])]
+    vector_db.async_search = AsyncMock(return_value=[Document(content="async result")])
+    return vector_db
+
+
+@pytest.fixture
+def knowledge(vector_db):
+    return AgentKnowledge(vector_db=vector_db, search_cache=InMemoryToolCache())
+
+
+def test_search_results_are_cached_by_query_filters_and_limit(knowledge, vector_db):
+
+    first = knowledge.search("query", filters={"page": 1})
+    second = knowledge.search("query", filters={"page": 1})
+    knowledge.search("query", filters={"page": 2})
+    knowledge.search("query", num_documents=2, filters={"page": 1})
+
+    assert vector_db.search.call_count == 3
+    assert second[0].content == "result" and second[0].meta_data == {"page": 1}
+    assert second[0] is not first[0]
+    assert knowledge.search_cache.hits == 1
+
+
+def test_loading_documents_clears_cached_search_results(knowledge, vector_db):
+    vector_db.docs_exist.return_value = [False]
+
+    knowledge.search("query")
+    knowledge.load_documents([Document(content="new")])
+    knowledge.search("query")
+
+    assert vector_db.search.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_search_results_are_cached(knowledge, vector_db):
+
+    await knowledge.async_search("query")
+    results = await knowledge.async_search("query")
+
+    assert vector_db.async_search.await_count == 1
+    assert [document.content for document in results] == ["async result"]
+
+
+def test_knowledge_bases_sharing_a_cache_keep_their_own_results(knowledge, vector_db):
+    cache = InMemoryToolCache()
+    cache.set("get_weather:abc", "sunny", ttl=60)
+    vector_db.collection = "recipes"
+    other_db = MagicMock(spec=VectorDb)
+    other_db.collection = "manuals"
+    other_db.search.return_value = [Document(content="other result")]
+    other_db.docs_exist.return_value = [False]
+    knowledge.search_cache = cache
+    other = AgentKnowledge(vector_db=other_db, search_cache=cache)
+
+    assert knowledge.search("query")[0].content == "result"
+    assert other.search("query")[0].content == "other result"
+
+    # Loading documents into one knowledge base only clears its own results
+    other.load_documents([Document(content="new")])
+    assert knowledge.search("query")[0].content == "result"
+    assert vector_db.search.call_count == 1
+    assert cache.get("get_weather:abc") == "sunny"
+
+
+def test_empty_search_results_are_not_cached(knowledge, vector_db):
+    vector_db.search.return_value = []
+
+    knowledge.search("query")
+    knowledge.search("query")
+
+    assert vector_db.search.call_count == 2
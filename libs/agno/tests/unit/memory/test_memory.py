@@ -322,6 +322,77 @@ def test_create_session_summary(memory_with_managers):
     assert memory_with_managers.summaries[user_id][session_id] == summary
 
 
+def _add_session_run(memory, session_id, user_content, assistant_content):
+    memory.add_run(
+        session_id,
+        RunResponse(
+            content=assistant_content,
+            messages=[Message(role="user", content=user_content), Message(role="assistant", content=assistant_content)],
+        ),
+    )
+
+
+def test_create_session_summary_incremental(mock_model, mock_db):
+    summarizer = SessionSummarizer(model=mock_model, incremental=True)
+    memory = Memory(model=mock_model, db=mock_db, summarizer=summarizer)
+    session_id = "test_session"
+    user_id = "test_user"
+
+    with patch.object(summarizer, "run") as mock_run:
+        mock_run.return_value = MagicMock(summary="The user said hello", topics=["greeting"])
+        _add_session_run(memory, session_id, "Hello", "Hi there!")
+        summary = memory.create_session_summary(session_id, user_id)
+        assert summary.num_runs == 1
+        # The first summary covers the whole conversation
+        assert [m.content for m in mock_run.call_args.kwargs["conversation"]] == ["Hello", "Hi there!"]
+        assert mock_run.call_args.kwargs["previous_summary"] is None
+
+        mock_run.return_value = MagicMock(summary="The user said hello and asked about stocks", topics=["stocks"])
+        _add_session_run(memory, session_id, "How are stocks?", "Stocks are up.")
+        summary = memory.create_session_summary(session_id, user_id)
+
+        # Only the new run is sent, with the previous summary
+        assert [m.content for m in mock_run.call_args.kwargs["conversation"]] == ["How are stocks?", "Stocks are up."]
+        assert mock_run.call_args.kwargs["previous_summary"].summary == "The user said hello"
+        assert summary.summary == "The user said hello and asked about stocks"
+        assert summary.num_runs == 2
+        assert memory.summaries[user_id][session_id].to_dict()["num_runs"] == 2
+
+
+def test_create_session_summary_every_n_runs(mock_model, mock_db):
+    summarizer = SessionSummarizer(model=mock_model, incremental=True, update_every_n_runs=2)
+    memory = Memory(model=mock_model, db=mock_db, summarizer=summarizer)
+    session_id = "test_session"
+    user_id = "test_user"
+
+    with patch.object(summarizer, "run") as mock_run:
+        mock_run.return_value = MagicMock(summary="Summary", topics=None)
+        _add_session_run(memory, session_id, "Hello", "Hi there!")
+        first_summary = memory.create_session_summary(session_id, user_id)
+        assert mock_run.call_count == 1
+
+        # The summary is not updated until two runs were added since the last summary
+        _add_session_run(memory, session_id, "How are stocks?", "Stocks are up.")
+        assert memory.create_session_summary(session_id, user_id) is first_summary
+        assert mock_run.call_count == 1
+
+        _add_session_run(memory, session_id, "And bonds?", "Bonds are down.")
+        summary = memory.create_session_summary(session_id, user_id)
+        assert mock_run.call_count == 2
+        assert summary.num_runs == 3
+        assert len(mock_run.call_args.kwargs["conversation"]) == 4
+
+
+def test_session_summary_update_every_n_tokens(mock_model):
+    summarizer = SessionSummarizer(model=mock_model, update_every_n_tokens=50)
+    short_run = [Message(role="user", content="Hi"), Message(role="assistant", content="Hello")]
+    long_run = [Message(role="user", content="Tell me about stocks " * 20), Message(role="assistant", content="Ok")]
+
+    assert not summarizer.is_update_due([])
+    assert not summarizer.is_update_due([short_run])
+    assert summarizer.is_update_due([short_run, long_run])
+
+
 def test_get_session_summary(memory_with_model, sample_session_summary):
     # Add a summary
     session_id = "test_session"
@@ -0,0 +1,220 @@
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, List
+from unittest.mock import Mock
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.v2.jobs import MemoryJobQueue
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.summarizer import SessionSummarizer, SessionSummaryResponse
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.run.response import RunResponse
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+
+
+@dataclass
+class EchoModel(Model):
+    id: str = "echo-model"
+
+    def invoke(self, messages: List[Message], **kwargs) -> Any:
+        return f"You said: {messages[-1].content}"
+
+    async def ainvoke(self, messages: List[Message], **kwargs) -> Any:
+        return self.invoke(messages)
+
+    def invoke_stream(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        raise NotImplementedError
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    queue = MemoryJobQueue(db_file=tmp_path / "memory_jobs.db", retry_backoff=0.01, poll_interval=0.05)
+    yield queue
+    queue.shutdown()
+
+
+def test_user_memory_jobs_are_coalesced_per_user(job_queue):
+    # Jobs are queued before the queue is attached to a memory, so they are all pending when the workers start
+    job_queue.enqueue_user_memories([Message(role="user", content="My name is John")], user_id="john")
+    job_queue.enqueue_user_memories([Message(role="user", content="I live in Paris")], user_id="john")
+    job_queue.enqueue_user_memories([Message(role="user", content="I like tea")], user_id="jane")
+    assert job_queue.pending_count() == 3
+
+    memory = Mock()
+    job_queue.memory = memory
+    assert job_queue.flush(timeout=5)
+
+    assert memory.create_user_memories.call_count == 2
+    calls = {call.kwargs["user_id"]: call.kwargs["messages"] for call in memory.create_user_memories.call_args_list}
+    assert [m.content for m in calls["john"]] == ["My name is John", "I live in Paris"]
+    assert [m.content for m in calls["jane"]] == ["I like tea"]
+
+
+def test_session_summary_jobs_summarize_the_latest_runs(job_queue):
+    first = [[Message(role="user", content="Hi"), Message(role="assistant", content="Hello")]]
+    second = first + [[Message(role="user", content="Bye"), Message(role="assistant", content="Goodbye")]]
+    job_queue.enqueue_session_summary("session-1", first, user_id="john")
+    job_queue.enqueue_session_summary("session-1", second, user_id="john")
+
+    memory = Mock()
+    job_queue.memory = memory
+    assert job_queue.flush(timeout=5)
+
+    memory.create_session_summary.assert_called_once()
+    kwargs = memory.create_session_summary.call_args.kwargs
+    assert kwargs["session_id"] == "session-1" and kwargs["user_id"] == "john"
+    assert [[m.content for m in run] for run in kwargs["runs"]] == [["Hi", "Hello"], ["Bye", "Goodbye"]]
+
+
+def test_failed_jobs_are_retried(job_queue):
+    memory = Mock()
+    memory.create_user_memories.side_effect = [RuntimeError("model unavailable"), "ok"]
+    job_queue.memory = memory
+
+    job_queue.enqueue_user_memories([Message(role="user", content="My name is John")], user_id="john")
+    assert job_queue.flush(timeout=5)
+    assert memory.create_user_memories.call_count == 2
+    assert job_queue.failed_jobs() == []
+
+
+def test_jobs_fail_after_max_attempts(job_queue):
+    job_queue.max_attempts = 2
+    memory = Mock()
+    memory.create_user_memories.side_effect = RuntimeError("model unavailable")
+    job_queue.memory = memory
+
+    job_queue.enqueue_user_memories([Message(role="user", content="My name is John")], user_id="john")
+    assert job_queue.flush(timeout=5)
+
+    assert memory.create_user_memories.call_count == 2
+    failed = job_queue.failed_jobs()
+    assert len(failed) == 1 and failed[0].attempts == 2
+
+
+def test_pending_jobs_survive_a_restart(tmp_path):
+    db_file = tmp_path / "memory_jobs.db"
+    queue = MemoryJobQueue(db_file=db_file, poll_interval=0.05)
+    queue.enqueue_user_memories([Message(role="user", content="My name is John")], user_id="john")
+    queue.shutdown()
+
+    memory = Mock()
+    restarted_queue = MemoryJobQueue(db_file=db_file, poll_interval=0.05, memory=memory)
+    try:
+        assert restarted_queue.flush(timeout=5)
+        memory.create_user_memories.assert_called_once()
+    finally:
+        restarted_queue.shutdown()
+
+
+def test_memory_defers_updates_to_the_job_queue(job_queue):
+    summarizer = Mock(incremental=False)
+    summarizer.run.return_value = Mock(summary="The user greeted the assistant", topics=["greeting"])
+    db = Mock()
+    db.read_memories.return_value = []
+    memory = Memory(db=db, memory_manager=Mock(), summarizer=summarizer, job_queue=job_queue)
+    assert job_queue.memory is memory
+
+    memory.add_run(
+        "session-1",
+        RunResponse(
+            run_id="run-1",
+            messages=[Message(role="user", content="Hi"), Message(role="assistant", content="Hello")],
+        ),
+    )
+    memory.defer_session_summary(session_id="session-1", user_id="john")
+    memory.defer_user_memories(message="My name is John", user_id="john")
+
+    assert job_queue.flush(timeout=5)
+    summarizer.run.assert_called_once()
+    conversation = summarizer.run.call_args.kwargs["conversation"]
+    assert [m.content for m in conversation] == ["Hi", "Hello"]
+    memory.memory_manager.create_or_update_memories.assert_called_once()
+    assert memory.get_session_summary("session-1", user_id="john").summary == "The user greeted the assistant"
+
+
+def test_running_jobs_are_only_reclaimed_after_their_lease(tmp_path):
+    db_file = tmp_path / "memory_jobs.db"
+    MemoryJobQueue(db_file=db_file).enqueue_user_memories([Message(role="user", content="Hi")], user_id="john")
+    # Another live process claimed the job
+    with sqlite3.connect(db_file) as connection:
+        connection.execute("UPDATE memory_jobs SET status = 'running', owner = 'other', claimed_at = ?", (time.time(),))
+
+    memory = Mock()
+    queue = MemoryJobQueue(db_file=db_file, poll_interval=0.05, lease_timeout=0.5, memory=memory)
+    try:
+        assert not queue.flush(timeout=0.2)
+        memory.create_user_memories.assert_not_called()
+
+        # The lease expires, e.g. because the other process stopped
+        assert queue.flush(timeout=5)
+        memory.create_user_memories.assert_called_once()
+    finally:
+        queue.shutdown()
+
+
+def test_deferred_summaries_are_kept_across_runs_with_storage(tmp_path, job_queue):
+    summarizer = SessionSummarizer(model=Mock(), incremental=True)
+    summaries = iter(["The user said hi", "The user said hi and bye"])
+    summarizer.run = Mock(side_effect=lambda **kwargs: SessionSummaryResponse(summary=next(summaries)))
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "agent.db"))
+    agent = Agent(
+        model=EchoModel(),
+        memory=Memory(summarizer=summarizer, job_queue=job_queue),
+        storage=storage,
+        enable_session_summaries=True,
+        telemetry=False,
+    )
+
+    agent.run("Hi", session_id="session-1")
+    assert job_queue.flush(timeout=5)
+    agent.run("Bye", session_id="session-1")
+    assert job_queue.flush(timeout=5)
+
+    # The second update folds the second run into the summary of the first, instead of starting over
+    assert summarizer.run.call_count == 2
+    assert summarizer.run.call_args.kwargs["previous_summary"].summary == "The user said hi"
+    # The job queue saves the summary to the session in storage
+    stored = storage.read("session-1")
+    assert stored.memory["summaries"]["default"]["session-1"]["summary"] == "The user said hi and bye"
+
+    # Reading an older stored copy does not replace the summary made since
+    stored.memory["summaries"]["default"]["session-1"]["summary"] = "The user said hi"
+    stored.memory["summaries"]["default"]["session-1"]["num_runs"] = 1
+    storage.upsert(stored)
+    agent.read_from_storage(session_id="session-1")
+    assert agent.memory.get_session_summary("session-1").summary == "The user said hi and bye"
+
+
+def test_summaries_of_jobs_claimed_by_another_process_are_saved_to_storage(tmp_path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "agent.db"))
+    storage.upsert(AgentSession(session_id="session-1", user_id="john", memory={}))
+    runs = [[Message(role="user", content="Hi"), Message(role="assistant", content="Hello")]]
+    MemoryJobQueue(db_file=tmp_path / "memory_jobs.db").enqueue_session_summary("session-1", runs, user_id="john")
+
+    # A process that is not serving the session claims the job
+    summarizer = SessionSummarizer(model=Mock())
+    summarizer.run = Mock(return_value=SessionSummaryResponse(summary="The user said hi"))
+    queue = MemoryJobQueue(db_file=tmp_path / "memory_jobs.db", storage=storage, poll_interval=0.05)
+    Memory(summarizer=summarizer, job_queue=queue)
+    try:
+        assert queue.flush(timeout=5)
+    finally:
+        queue.shutdown()
+
+    stored = storage.read("session-1")
+    assert stored.memory["summaries"]["john"]["session-1"]["summary"] == "The user said hi"
@@ -0,0 +1,222 @@
+from dataclasses import dataclass, field
+from typing import List
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from sqlalchemy import text
+
+from agno.embedder.base import Embedder
+from agno.memory.v2.db.schema import MemoryRow
+from agno.memory.v2.db.sqlite import SqliteMemoryDb
+from agno.memory.v2.db.vector_index import MemoryVectorIndex
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.schema import UserMemory
+
+VOCABULARY = ["tea", "coffee", "paris", "dog"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds a text by the keywords of the vocabulary it contains"""
+
+    id: str = "keyword-model"
+    dimensions: int = len(VOCABULARY)
+    cache_query_embeddings: bool = False
+    texts: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.texts.append(text)
+        return [1.0 if word in text.lower() else 0.0 for word in VOCABULARY]
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        return [self.get_embedding(text) for text in texts]
+
+
+def memory_row(memory_id: str, text: str, user_id: str = "john") -> MemoryRow:
+    return MemoryRow(id=memory_id, user_id=user_id, memory=UserMemory(memory=text, memory_id=memory_id).to_dict())
+
+
+@pytest.fixture
+def embedder():
+    return KeywordEmbedder()
+
+
+@pytest.fixture
+def memory_db(tmp_path, embedder):
+    return SqliteMemoryDb(db_file=str(tmp_path / "memory.db"), embedder=embedder)
+
+
+def test_memories_are_embedded_when_written(memory_db, embedder):
+    memory_db.upsert_memory(memory_row("m1", "Likes green tea"))
+    memory_db.upsert_memory(memory_row("m2", "Lives in Paris"))
+    memory_db.upsert_memory(memory_row("m3", "Has a dog named Rex"))
+    assert embedder.texts == ["Likes green tea", "Lives in Paris", "Has a dog named Rex"]
+
+    results = memory_db.search_memories(embedder.get_embedding("where in paris"), user_id="john", limit=2)
+    assert [row.id for row in results][0] == "m2"
+    assert len(results) == 2
+    assert results[0].memory["memory"] == "Lives in Paris"
+
+
+def test_search_is_scoped_to_the_user(memory_db, embedder):
+    memory_db.upsert_memory(memory_row("m1", "Likes tea", user_id="john"))
+    memory_db.upsert_memory(memory_row("m2", "Likes tea too", user_id="jane"))
+
+    results = memory_db.search_memories(embedder.get_embedding("tea"), user_id="jane")
+    assert [row.id for row in results] == ["m2"]
+
+
+def test_index_follows_updates_and_deletes(memory_db, embedder):
+    memory_db.upsert_memory(memory_row("m1", "Likes tea"))
+    memory_db.upsert_memory(memory_row("m2", "Lives in Paris"))
+    assert memory_db.search_memories(embedder.get_embedding("tea"), user_id="john", limit=1)[0].id == "m1"
+
+    memory_db.upsert_memory(memory_row("m1", "Likes coffee"))
+    memory_db.delete_memory("m2")
+
+    results = memory_db.search_memories(embedder.get_embedding("coffee"), user_id="john")
+    assert [row.id for row in results] == ["m1"]
+    assert results[0].memory["memory"] == "Likes coffee"
+
+
+def test_memories_written_without_an_embedder_are_embedded_on_search(tmp_path, embedder):
+    db_file = str(tmp_path / "memory.db")
+    SqliteMemoryDb(db_file=db_file).upsert_memory(memory_row("m1", "Likes tea"))
+
+    memory_db = SqliteMemoryDb(db_file=db_file, embedder=embedder)
+    results = memory_db.search_memories(embedder.get_embedding("tea"), user_id="john")
+    assert [row.id for row in results] == ["m1"]
+
+    # The embeddings are stored, so a new db object does not embed the memories again
+    embedder.texts.clear()
+    SqliteMemoryDb(db_file=db_file, embedder=embedder).search_memories([1.0, 0.0, 0.0, 0.0], user_id="john")
+    assert embedder.texts == []
+
+
+def test_search_needs_an_embedder(tmp_path):
+    with pytest.raises(ValueError):
+        SqliteMemoryDb(db_file=str(tmp_path / "memory.db")).search_memories([1.0], user_id="john")
+
+
+def test_semantic_search_of_user_memories(memory_db):
+    memory = Memory(db=memory_db)
+    memory.add_user_memory(UserMemory(memory="Likes green tea"), user_id="john")
+    paris_id = memory.add_user_memory(UserMemory(memory="Lives in Paris"), user_id="john")
+
+    results = memory.search_user_memories(query="paris trip", limit=1, retrieval_method="semantic", user_id="john")
+    assert [m.memory_id for m in results] == [paris_id]
+
+
+def test_hybrid_search_sends_the_semantic_results_to_the_model(memory_db):
+    model = Mock(supports_native_structured_outputs=False, supports_json_schema_outputs=False)
+    memory = Memory(db=memory_db, model=model)
+    tea_id = memory.add_user_memory(UserMemory(memory="Likes green tea"), user_id="john")
+    memory.add_user_memory(UserMemory(memory="Lives in Paris"), user_id="john")
+    model.response.return_value = Mock(content=f'{{"memory_ids": ["{tea_id}", "unknown"]}}')
+
+    results = memory.search_user_memories(query="tea", limit=1, retrieval_method="hybrid", user_id="john")
+    assert [m.memory_id for m in results] == [tea_id]
+
+
+def test_vector_index_ranks_by_cosine_similarity():
+    index = MemoryVectorIndex()
+    index.load("john", {"a": [1.0, 0.0], "b": [1.0, 1.0], "c": [0.0, 3.0]})
+
+    assert [memory_id for memory_id, _ in index.search("john", [0.0, 1.0], limit=2)] == ["c", "b"]
+    index.upsert("john", "c", [1.0, 0.0])
+    index.delete("a")
+    hits = index.search("john", [1.0, 0.0], limit=5)
+    assert [memory_id for memory_id, _ in hits] == ["c", "b"]
+    assert hits[0][1] == pytest.approx(1.0)
+    assert index.search("jane", [1.0, 0.0], limit=5) == []
+
+
+def test_vector_index_keeps_the_most_recently_searched_users():
+    index = MemoryVectorIndex(max_users=2)
+    index.load("john", {"a": [1.0, 0.0]})
+    index.load("jane", {"b": [1.0, 0.0]})
+    index.search("john", [1.0, 0.0], limit=1)
+    index.load("jim", {"c": [1.0, 0.0]})
+
+    assert index.is_loaded("john") and index.is_loaded("jim")
+    assert not index.is_loaded("jane")
+
+
+def test_index_is_reloaded_after_writes_of_another_process(tmp_path, embedder):
+    db_file = str(tmp_path / "memory.db")
+    memory_db = SqliteMemoryDb(db_file=db_file, embedder=embedder)
+    other_db = SqliteMemoryDb(db_file=db_file, embedder=embedder)
+    memory_db.upsert_memory(memory_row("m1", "Likes tea"))
+    assert [row.id for row in memory_db.search_memories(embedder.get_embedding("tea"), user_id="john")] == ["m1"]
+
+    other_db.upsert_memory(memory_row("m2", "Likes tea and coffee"))
+    results = memory_db.search_memories(embedder.get_embedding("coffee"), user_id="john")
+    assert [row.id for row in results] == ["m2", "m1"]
+
+    other_db.delete_memory("m2")
+    assert [row.id for row in memory_db.search_memories(embedder.get_embedding("coffee"), user_id="john")] == ["m1"]
+
+
+def test_index_is_not_reloaded_after_its_own_writes(memory_db, embedder):
+    memory_db.upsert_memory(memory_row("m1", "Likes tea"))
+    memory_db.search_memories(embedder.get_embedding("tea"), user_id="john")
+
+    memory_db._load_vector_index = MagicMock(wraps=memory_db._load_vector_index)
+    memory_db.upsert_memory(memory_row("m2", "Lives in Paris"))
+    memory_db.upsert_memory(memory_row("m1", "Likes coffee"))
+    memory_db.delete_memory("m2")
+    results = memory_db.search_memories(embedder.get_embedding("coffee"), user_id="john")
+    assert [row.id for row in results] == ["m1"]
+    memory_db._load_vector_index.assert_not_called()
+
+
+def test_postgres_embeds_missing_memories_once_per_user(embedder):
+    from agno.memory.v2.db.postgres import PostgresMemoryDb
+
+    with patch("agno.memory.v2.db.postgres.scoped_session"), patch("agno.memory.v2.db.postgres.inspect"):
+        with patch.object(PostgresMemoryDb, "get_table"), patch.object(PostgresMemoryDb, "add_embedding_column"):
+            memory_db = PostgresMemoryDb(table_name="memory", db_engine=MagicMock(), embedder=embedder)
+    memory_db._embed_missing_memories = MagicMock()
+
+    memory_db.search_memories([1.0, 0.0, 0.0, 0.0], user_id="john")
+    memory_db.search_memories([1.0, 0.0, 0.0, 0.0], user_id="john")
+    memory_db.search_memories([1.0, 0.0, 0.0, 0.0], user_id="jane")
+    assert [c.args for c in memory_db._embed_missing_memories.call_args_list] == [("john",), ("jane",)]
+
+    # A memory that failed to embed when written is embedded on the next search
+    with patch.object(embedder, "get_embedding", side_effect=RuntimeError("rate limited")):
+        memory_db.upsert_memory(memory_row("m1", "Likes tea"))
+    memory_db.search_memories([1.0, 0.0, 0.0, 0.0], user_id="john")
+    assert memory_db._embed_missing_memories.call_count == 3
+
+
+def test_vector_index_skips_empty_embeddings():
+    index = MemoryVectorIndex()
+    index.load("john", {"a": [1.0, 0.0], "b": []})
+    index.upsert("john", "c", [])
+
+    assert [memory_id for memory_id, _ in index.search("john", [1.0, 0.0], limit=5)] == ["a"]
+    assert index.search("john", [], limit=5) == []
+
+
+def test_failed_embeddings_are_stored_as_missing(memory_db, embedder):
+    memory_db.upsert_memory(memory_row("m1", "Likes tea"))
+    memory_db.search_memories(embedder.get_embedding("tea"), user_id="john")
+
+    # Embedders like OpenAIEmbedder return an empty embedding when the request fails
+    embedder.get_embedding = lambda text: []
+    memory_db.upsert_memory(memory_row("m2", "Likes tea too"))
+    embedder.get_embeddings_batch = lambda texts: [[] for _ in texts]
+
+    assert [row.id for row in memory_db.search_memories([1.0, 0.0, 0.0, 0.0], user_id="john")] == ["m1"]
+    assert memory_db.search_memories([], user_id="john") == []
+    with memory_db.Session() as session:
+        assert session.execute(text("SELECT embedding FROM memory WHERE id = 'm2'")).scalar() is None
+
+
+def test_semantic_search_of_a_query_that_failed_to_embed(memory_db, embedder):
+    memory = Memory(db=memory_db)
+    memory.add_user_memory(UserMemory(memory="Likes green tea"), user_id="john")
+
+    embedder.get_embedding = lambda text: []
+    assert memory.search_user_memories(query="tea", retrieval_method="semantic", user_id="john") == []
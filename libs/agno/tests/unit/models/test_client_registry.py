@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from agno.models.client_registry import ClientRegistry, client_registry
+from agno.models.openai import OpenAIChat
+
+
+class FakeClient:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+def test_clients_are_shared_per_key():
+    registry = ClientRegistry()
+
+    first = registry.get_client("a", FakeClient)
+    assert registry.get_client("a", FakeClient) is first
+    assert registry.get_client("b", FakeClient) is not first
+
+    # A closed client is replaced
+    first.close()
+    assert registry.get_client("a", FakeClient) is not first
+
+
+def test_close_closes_sync_clients():
+    registry = ClientRegistry()
+    client = registry.get_client("a", FakeClient)
+    http_client = registry.get_http_client("provider:url")
+
+    registry.close()
+
+    assert client.closed
+    assert http_client.is_closed
+    assert registry.get_client("a", FakeClient) is not client
+
+
+def test_least_recently_used_clients_are_evicted_and_closed():
+    registry = ClientRegistry(max_clients=2)
+    first = registry.get_client("a", FakeClient)
+    second = registry.get_client("b", FakeClient)
+    shared = registry.get_client("c", FakeClient, close_on_evict=False)
+    registry.get_client("b", FakeClient)
+
+    registry.get_client("d", FakeClient)
+
+    assert first.closed
+    assert not second.closed
+    assert not shared.closed
+    assert list(registry._clients) == ["b", "d"]
+
+
+def test_async_clients_are_kept_per_event_loop():
+    registry = ClientRegistry()
+
+    async def get():
+        return registry.get_async_http_client("provider:url"), registry.get_async_http_client("provider:url")
+
+    first, same = asyncio.run(get())
+    second, _ = asyncio.run(get())
+
+    assert first is same
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_the_clients_of_the_running_loop():
+    registry = ClientRegistry()
+    http_client = registry.get_async_http_client("provider:url")
+
+    await registry.aclose()
+
+    assert http_client.is_closed
+
+
+def test_openai_models_share_clients_by_credentials():
+    first = OpenAIChat(id="gpt-4o", api_key="key-1")
+    same_credentials = OpenAIChat(id="gpt-4o-mini", api_key="key-1")
+    other_credentials = OpenAIChat(id="gpt-4o", api_key="key-2")
+
+    client = first.get_client()
+    assert same_credentials.get_client() is client
+    assert other_credentials.get_client() is not client
+    # Clients with different credentials share the connection pool of the base URL
+    assert other_credentials.get_client()._client is client._client
+
+
+@pytest.mark.asyncio
+async def test_openai_async_client_is_reused():
+    model = OpenAIChat(id="gpt-4o", api_key="key-1")
+
+    assert model.get_async_client() is model.get_async_client()
+    await client_registry.aclose()
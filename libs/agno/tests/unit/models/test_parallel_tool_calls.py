@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+def slow_tool(seconds: float, index: int) -> str:
+    """Sleep and return the index"""
+    # Later calls finish first
+    time.sleep(seconds - index * 0.02)
+    return f"result-{index}"
+
+
+@pytest.fixture
+def function_calls() -> List[FunctionCall]:
+    function = Function.from_callable(slow_tool)
+    return [
+        FunctionCall(function=function, arguments={"seconds": 0.2, "index": i}, call_id=f"call-{i}") for i in range(5)
+    ]
+
+
+def test_sync_tool_calls_run_in_parallel_in_order(function_calls):
+    model = OpenAIChat(id="gpt-4o")
+    function_call_results: List[Message] = []
+
+    start = time.perf_counter()
+    responses = list(
+        model.run_function_calls(
+            function_calls=function_calls,
+            function_call_results=function_call_results,
+            function_call_concurrency=5,
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+    assert [result.content for result in function_call_results] == [f"result-{i}" for i in range(5)]
+    completed = [r for r in responses if r.event == ModelResponseEvent.tool_call_completed.value]
+    assert [r.tool_executions[0].tool_call_id for r in completed] == [f"call-{i}" for i in range(5)]
+
+
+def test_sync_tool_calls_respect_concurrency_limit():
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def counting_tool(seconds: float, index: int) -> str:
+        """Count the calls running at the same time"""
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return str(index)
+
+    function = Function.from_callable(counting_tool)
+    model = OpenAIChat(id="gpt-4o")
+    function_call_results: List[Message] = []
+    list(
+        model.run_function_calls(
+            function_calls=[
+                FunctionCall(function=function, arguments={"seconds": 0.05, "index": i}, call_id=f"call-{i}")
+                for i in range(6)
+            ],
+            function_call_results=function_call_results,
+            function_call_concurrency=2,
+        )
+    )
+
+    assert max_running == 2
+    assert [result.content for result in function_call_results] == [str(i) for i in range(6)]
+
+
+def test_tool_call_limit_applies_to_parallel_tool_calls(function_calls):
+    model = OpenAIChat(id="gpt-4o")
+    function_call_results: List[Message] = []
+    list(
+        model.run_function_calls(
+            function_calls=function_calls[:3],
+            function_call_results=function_call_results,
+            function_call_limit=2,
+            function_call_concurrency=4,
+        )
+    )
+
+    assert len(function_call_results) == 3
+    assert [result.tool_call_error for result in function_call_results].count(True) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_tool_calls_respect_concurrency_limit(function_calls):
+    model = OpenAIChat(id="gpt-4o")
+    function_call_results: List[Message] = []
+
+    start = time.perf_counter()
+    async for _ in model.arun_function_calls(
+        function_calls=function_calls[:4],
+        function_call_results=function_call_results,
+        function_call_concurrency=2,
+    ):
+        # The event loop is not blocked by the sync tools
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    assert 0.3 < elapsed < 0.7
+    assert [result.content for result in function_call_results] == [f"result-{i}" for i in range(4)]
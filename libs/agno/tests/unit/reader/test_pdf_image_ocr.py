@@ -0,0 +1,82 @@
+import sys
+import types
+from typing import List
+
+import pytest
+
+from agno.document.reader import pdf_reader
+
+
+class FakeImage:
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+class FakePage:
+    def __init__(self, text: str, images: List[bytes]):
+        self.text = text
+        self.images = [FakeImage(image) for image in images]
+
+    def extract_text(self) -> str:
+        return self.text
+
+
+class FakeRapidOCR:
+    instances = 0
+
+    def __init__(self):
+        FakeRapidOCR.instances += 1
+
+    def __call__(self, image_data: bytes):
+        return [[None, image_data.decode()]], 0.0
+
+
+@pytest.fixture(autouse=True)
+def fake_rapidocr(monkeypatch):
+    module = types.ModuleType("rapidocr_onnxruntime")
+    module.RapidOCR = FakeRapidOCR  # type: ignore
+    monkeypatch.setitem(sys.modules, "rapidocr_onnxruntime", module)
+    monkeypatch.setattr(pdf_reader, "_ocr_engine", None)
+    FakeRapidOCR.instances = 0
+    yield
+    pdf_reader.shutdown_ocr_pool()
+
+
+@pytest.fixture
+def pages() -> List[FakePage]:
+    return [FakePage(f"page {i}", [f"image {i}a".encode(), f"image {i}b".encode()]) for i in range(1, 6)]
+
+
+def test_ocr_engine_is_loaded_once_for_all_pages(pages):
+    documents = list(pdf_reader.process_image_pages("doc", pages[:3]))
+
+    assert FakeRapidOCR.instances == 1
+    assert [doc.meta_data["page"] for doc in documents] == [1, 2, 3]
+    assert documents[1].content == "page 2\nimage 2a\nimage 2b"
+
+
+def test_ocr_in_worker_processes_keeps_page_order(pages):
+    documents = list(pdf_reader.process_image_pages("doc", pages, ocr_workers=2))
+
+    assert [doc.content for doc in documents] == [f"page {i}\nimage {i}a\nimage {i}b" for i in range(1, 6)]
+    # The engine is loaded in the worker processes, not in this one
+    assert FakeRapidOCR.instances == 0
+
+
+@pytest.mark.asyncio
+async def test_async_ocr_in_worker_processes(pages):
+    documents = await pdf_reader.async_process_image_pages("doc", pages[:4], ocr_workers=2)
+
+    assert [doc.meta_data["page"] for doc in documents] == [1, 2, 3, 4]
+    assert documents[3].content == "page 4\nimage 4a\nimage 4b"
+
+
+def test_ocr_pool_is_shared_and_shut_down():
+    pool = pdf_reader.get_ocr_pool(2)
+
+    assert pdf_reader.get_ocr_pool(3) is pool
+    pdf_reader.shutdown_ocr_pool()
+    assert pdf_reader._ocr_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(pdf_reader.ocr_images, [])
+    assert pdf_reader.get_ocr_pool(2) is not pool
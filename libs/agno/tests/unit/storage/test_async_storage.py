@@ -0,0 +1,117 @@
+import asyncio
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.v2.memory import Memory
+from agno.storage.json import JsonStorage
+from agno.storage.session import Session
+from agno.storage.session.agent import AgentSession
+
+
+class SlowJsonStorage(JsonStorage):
+    """JsonStorage that records the order of its writes and makes them slow"""
+
+    def __init__(self, dir_path: Path):
+        super().__init__(dir_path=dir_path)
+        self.written: List[Optional[dict]] = []
+
+    def upsert(self, session: Session) -> Optional[Session]:
+        import time
+
+        time.sleep(0.02)
+        self.written.append(session.session_data)
+        return super().upsert(session)
+
+
+@pytest.fixture
+def session() -> AgentSession:
+    return AgentSession(session_id="session-1", agent_id="agent-1", user_id="user-1", session_data={"state": "active"})
+
+
+@pytest.mark.asyncio
+async def test_async_methods_default_to_the_sync_methods(tmp_path, session):
+    storage = JsonStorage(dir_path=tmp_path)
+
+    await storage.aupsert(session)
+
+    session = await storage.aread("session-1")
+    assert session is not None and session.session_data == {"state": "active"}
+    assert await storage.aget_all_session_ids() == ["session-1"]
+    assert len(await storage.aget_all_sessions(user_id="user-1")) == 1
+    await storage.adelete_session("session-1")
+    assert await storage.aread("session-1") is None
+
+
+@pytest.mark.asyncio
+async def test_background_writes_are_ordered_and_flushed(tmp_path, session):
+    storage = SlowJsonStorage(dir_path=tmp_path)
+    session.session_data = {"state": "first"}
+
+    storage.upsert_in_background(session)
+    # Later changes to the session are not part of the scheduled write
+    session.session_data = {"state": "second"}
+    storage.upsert_in_background(session)
+    assert storage.written == []
+
+    await storage.aflush()
+
+    assert storage.written == [{"state": "first"}, {"state": "second"}]
+    stored = await storage.aread("session-1")
+    assert stored is not None and stored.session_data == {"state": "second"}
+
+
+@pytest.mark.asyncio
+async def test_background_writes_snapshot_without_deepcopy(tmp_path, session):
+    storage = SlowJsonStorage(dir_path=tmp_path)
+    session.memory = {"runs": [{"content": "hello"}]}
+
+    with patch("agno.storage.base.deepcopy", side_effect=AssertionError("deepcopy called")):
+        storage.upsert_in_background(session)
+    session.memory["runs"].append({"content": "later"})
+    await storage.aflush()
+
+    stored = storage.read("session-1")
+    assert stored is not None and stored.memory == {"runs": [{"content": "hello"}]}
+
+
+@pytest.mark.asyncio
+async def test_agent_reads_its_pending_writes(tmp_path):
+    storage = SlowJsonStorage(dir_path=tmp_path)
+    agent = Agent(agent_id="agent-1", memory=Memory(), storage=storage, storage_write_behind=True)
+    agent.session_name = "renamed"
+
+    await agent.awrite_to_storage(session_id="session-1", user_id="user-1")
+    assert storage.written == []
+
+    agent.session_name = None
+    session = await agent.aread_from_storage(session_id="session-1")
+
+    assert session is not None
+    assert len(storage.written) == 1
+    assert agent.session_name == "renamed"
+
+
+@pytest.mark.asyncio
+async def test_failed_background_write_does_not_block_later_writes(tmp_path, session):
+    storage = JsonStorage(dir_path=tmp_path)
+    calls = []
+
+    async def flaky_aupsert(session: Session) -> Optional[Session]:
+        calls.append(session.session_data)
+        if len(calls) == 1:
+            raise RuntimeError("connection lost")
+        return await asyncio.to_thread(storage.upsert, session)
+
+    storage.aupsert = flaky_aupsert  # type: ignore
+    first = storage.upsert_in_background(replace(session, session_data={"state": "first"}))
+    storage.upsert_in_background(replace(session, session_data={"state": "second"}))
+    await storage.aflush()
+
+    assert first.result() is None
+    stored = storage.read("session-1")
+    assert stored is not None and stored.session_data == {"state": "second"}
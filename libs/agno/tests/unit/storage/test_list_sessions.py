@@ -0,0 +1,153 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from agno.storage.base import Storage
+from agno.storage.json import JsonStorage
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+from agno.storage.yaml import YamlStorage
+
+
+@pytest.fixture
+def sessions() -> List[AgentSession]:
+    return [
+        AgentSession(
+            session_id=f"session-{i}",
+            agent_id="agent-1" if i % 2 == 0 else "agent-2",
+            user_id="user-1",
+            memory={"runs": [{"run_id": f"run-{i}-0", "content": f"first {i}"}, {"run_id": f"run-{i}-1"}]},
+            session_data={"session_name": f"Session {i}"},
+            created_at=1000 + i // 2,
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.fixture(params=["sqlite-v1", "sqlite-v2", "json", "yaml"])
+def storage(request, tmp_path) -> Storage:
+    if request.param == "json":
+        return JsonStorage(dir_path=tmp_path)
+    if request.param == "yaml":
+        return YamlStorage(dir_path=tmp_path)
+    schema_version = 1 if request.param == "sqlite-v1" else 2
+    storage = SqliteStorage(table_name="sessions", db_file=str(tmp_path / "sessions.db"), schema_version=schema_version)
+    storage.create()
+    return storage
+
+
+def test_list_sessions_pages_newest_first(storage: Storage, sessions):
+    for session in sessions:
+        storage.upsert(session)
+
+    listed: List[str] = []
+    cursor = None
+    while True:
+        page = storage.list_sessions(user_id="user-1", limit=2, cursor=cursor)
+        listed.extend(session["session_id"] for session in page.sessions)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    # Sessions created in the same second are ordered by session_id
+    assert listed == ["session-4", "session-3", "session-2", "session-1", "session-0"]
+    assert set(page.sessions[0].keys()) == {"session_id", "user_id", "agent_id", "created_at", "updated_at"}
+
+
+def test_list_sessions_filters_and_lists_requested_fields(storage: Storage, sessions):
+    for session in sessions:
+        storage.upsert(session)
+
+    page = storage.list_sessions(entity_id="agent-2", fields=["session_data", "first_run"])
+
+    assert [session["session_id"] for session in page.sessions] == ["session-3", "session-1"]
+    assert page.next_cursor is None
+    assert page.sessions[0]["session_data"] == {"session_name": "Session 3"}
+    assert page.sessions[0]["first_run"] == {"run_id": "run-3-0", "content": "first 3"}
+    assert storage.list_sessions(user_id="user-2").sessions == []
+
+
+def test_list_sessions_skips_deleted_sessions(storage: Storage, sessions):
+    for session in sessions[:3]:
+        storage.upsert(session)
+    storage.delete_session("session-1")
+
+    page = storage.list_sessions()
+
+    assert [session["session_id"] for session in page.sessions] == ["session-2", "session-0"]
+
+
+def test_list_sessions_rejects_invalid_cursor(storage: Storage):
+    with pytest.raises(ValueError):
+        storage.list_sessions(cursor="not-a-cursor")
+
+
+def test_json_storage_indexes_existing_session_files(tmp_path, sessions):
+    storage = JsonStorage(dir_path=tmp_path)
+    for session in sessions[:3]:
+        storage.upsert(session)
+    # Sessions saved before the index existed
+    (tmp_path / ".sessions_index").unlink(missing_ok=True)
+    (tmp_path / ".sessions_index.log").unlink(missing_ok=True)
+
+    page = JsonStorage(dir_path=tmp_path).list_sessions(limit=2)
+
+    assert [session["session_id"] for session in page.sessions] == ["session-2", "session-1"]
+    assert (tmp_path / ".sessions_index").exists()
+    assert len(storage.get_all_sessions()) == 3
+
+
+def test_json_storage_keeps_created_at_on_update(tmp_path):
+    storage = JsonStorage(dir_path=tmp_path)
+    saved = storage.upsert(AgentSession(session_id="session-1", agent_id="agent-1", created_at=None))
+    assert saved.created_at is not None and saved.updated_at is not None
+
+    # Agents save a new session object on every run, without its creation time
+    storage._index.deserialize = Mock(wraps=storage._index.deserialize)
+    updated = storage.upsert(AgentSession(session_id="session-1", agent_id="agent-1", created_at=None))
+
+    assert updated.created_at == saved.created_at
+    assert storage.list_sessions().sessions[0]["created_at"] == saved.created_at
+    # The creation time comes from the index, the session file is not read
+    storage._index.deserialize.assert_not_called()
+
+
+def test_json_storage_keeps_created_at_of_sessions_saved_by_another_process(tmp_path):
+    storage = JsonStorage(dir_path=tmp_path)
+    storage.list_sessions()
+    JsonStorage(dir_path=tmp_path).upsert(AgentSession(session_id="session-1", agent_id="agent-1", created_at=1000))
+
+    updated = storage.upsert(AgentSession(session_id="session-1", agent_id="agent-1", created_at=None))
+
+    assert updated.created_at == 1000
+
+
+def test_json_storage_writes_append_to_the_index_log(tmp_path, sessions):
+    storage = JsonStorage(dir_path=tmp_path)
+    for session in sessions[:3]:
+        storage.upsert(session)
+    storage.delete_session("session-1")
+
+    # Writes don't rewrite the index, they are compacted into it when sessions are listed
+    assert not (tmp_path / ".sessions_index").exists()
+    assert len((tmp_path / ".sessions_index.log").read_text().splitlines()) == 4
+    page = storage.list_sessions()
+    assert [session["session_id"] for session in page.sessions] == ["session-2", "session-0"]
+    assert (tmp_path / ".sessions_index").exists()
+    assert not (tmp_path / ".sessions_index.log").exists()
+
+
+def test_json_storage_index_keeps_concurrent_writes(tmp_path):
+    # Each storage has its own in-process lock, like storages in different processes
+    storages = [JsonStorage(dir_path=tmp_path) for _ in range(4)]
+    sessions = [AgentSession(session_id=f"session-{i}", agent_id="agent-1", created_at=1000 + i) for i in range(40)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda i: storages[i % 4].upsert(sessions[i]), range(40)))
+    # Empty the session files, so only the sessions recorded in the index are listed
+    for file in tmp_path.glob("*.json"):
+        file.write_text("{}")
+
+    page = JsonStorage(dir_path=tmp_path).list_sessions()
+    assert sorted(session["session_id"] for session in page.sessions) == sorted(s.session_id for s in sessions)
@@ -429,3 +429,22 @@ def test_error_handling_with_uuid(agent_storage, mock_redis_client):
     mock_redis_client.get.return_value = "invalid json"
     result = agent_storage.read(str(uuid4()))
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_async_read_and_upsert_use_the_async_client(agent_storage, mock_redis_client):
+    from unittest.mock import AsyncMock
+
+    async_data: Dict[str, str] = {}
+    async_client = MagicMock()
+    async_client.get = AsyncMock(side_effect=lambda key: async_data.get(key))
+    async_client.set = AsyncMock(side_effect=lambda key, value: async_data.update({key: value}))
+    agent_storage._async_redis_client = async_client
+
+    session = AgentSession(session_id=str(uuid4()), agent_id="test-agent", user_id="test-user")
+    assert await agent_storage.aupsert(session) is session
+    read_session = await agent_storage.aread(session.session_id)
+
+    assert read_session is not None and read_session.agent_id == "test-agent"
+    assert await agent_storage.aread(session.session_id, user_id="other-user") is None
+    mock_redis_client.set.assert_not_called()
@@ -193,3 +193,81 @@ def test_workflow_storage_filtering(workflow_storage: SqliteStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_runs_are_stored_in_their_own_rows(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), schema_version=2)
+    storage.create()
+    session = AgentSession(
+        session_id="test-session",
+        agent_id="test-agent",
+        memory={"runs": [{"run_id": "run-1", "content": "first"}], "memories": []},
+    )
+
+    saved_session = storage.upsert(session)
+    assert saved_session is session
+    assert session.created_at is not None
+
+    session.memory["runs"].append({"run_id": "run-2", "content": "second"})  # type: ignore
+    storage.upsert(session)
+
+    with storage.SqlSession() as sess:
+        memory = sess.execute(storage.table.select()).fetchone().memory
+        run_rows = sess.execute(storage.runs_table.select()).fetchall()  # type: ignore
+    assert memory == {"memories": []}
+    assert [row.run_key for row in run_rows] == ["run-1", "run-2"]
+
+    # A new storage instance does not know which runs are stored
+    reopened = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), schema_version=2)
+    read_session = reopened.read("test-session")
+    assert read_session is not None
+    assert read_session.memory == {
+        "memories": [],
+        "runs": [{"run_id": "run-1", "content": "first"}, {"run_id": "run-2", "content": "second"}],
+    }
+
+
+def test_only_new_and_changed_runs_are_written(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), schema_version=2)
+    storage.create()
+    runs = [{"run_id": f"run-{i}", "content": str(i)} for i in range(3)]
+    session = AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs})
+    storage.upsert(session)
+
+    # Change the first run, drop the second and add a new one
+    session.memory = {"runs": [{"run_id": "run-0", "content": "changed"}, runs[2], {"run_id": "run-3"}]}
+    storage.upsert(session)
+
+    with storage.SqlSession() as sess:
+        rows = sess.execute(storage.runs_table.select().order_by(storage.runs_table.c.position)).fetchall()  # type: ignore
+    assert [(row.run_key, row.position) for row in rows] == [("run-0", 0), ("run-2", 2), ("run-3", 3)]
+
+    read_session = storage.read("test-session")
+    assert read_session is not None
+    assert read_session.memory == session.memory
+
+    storage.delete_session("test-session")
+    with storage.SqlSession() as sess:
+        assert sess.execute(storage.runs_table.select()).fetchall() == []  # type: ignore
+
+
+def test_stored_runs_are_cached_for_recent_sessions_only(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), schema_version=2)
+    storage.create()
+    storage._stored_runs.max_sessions = 2
+    sessions = [
+        AgentSession(session_id=f"session-{i}", agent_id="test-agent", memory={"runs": [{"run_id": f"run-{i}"}]})
+        for i in range(3)
+    ]
+    for session in sessions:
+        storage.upsert(session)
+    assert len(storage._stored_runs) == 2
+    assert storage._stored_runs.get("session-0") is None
+
+    # The runs of a session that is no longer cached are read back from the runs table
+    sessions[0].memory["runs"].append({"run_id": "run-0b"})  # type: ignore
+    storage.upsert(sessions[0])
+    read_session = storage.read("session-0")
+    assert read_session is not None
+    assert read_session.memory["runs"] == [{"run_id": "run-0"}, {"run_id": "run-0b"}]  # type: ignore
+    assert storage._stored_runs.get("session-0") is not None
@@ -228,47 +228,30 @@ def test_function_cache_key_generation():
     assert cache_key == "12cfb4e42ec8561012d976e2dca0e0c1"
 
 
-def test_function_cache_file_path():
-    """Test generation of cache file paths."""
-    func = Function(name="test_func", cache_results=True, cache_dir="/tmp")
+def test_function_cache_file_path(tmp_path):
+    """Test the default cache stores results under the function's cache directory."""
+    func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
 
-    cache_key = "test_key"
-    cache_file = func._get_cache_file_path(cache_key)
-    assert cache_file.startswith("/tmp/")
-    assert "test_func" in cache_file
-    assert "test_key" in cache_file
+    func._get_cache().set("test_func:test_key", {"result": "test_data"}, ttl=60)
+    assert (tmp_path / "functions" / "test_func" / "test_key.json").exists()
 
 
 def test_function_cache_operations(tmp_path):
     """Test caching operations (save and retrieve)."""
-    import json
-    import os
-
     func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    cache = func._get_cache()
 
-    # Test saving to cache
+    # Test saving to and retrieving from cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
-
-    # Verify cache file exists and contains correct data
-    assert os.path.exists(cache_file)
-    with open(cache_file, "r") as f:
-        cached_data = json.load(f)
-    assert cached_data["result"] == {"result": "test_data"}
-
-    # Test retrieving from cache
-    retrieved_result = func._get_cached_result(cache_file)
-    assert retrieved_result == test_result
+    cache.set("test_func:test_key", test_result, ttl=60)
+    assert cache.get("test_func:test_key") == test_result
 
     # Test retrieving non-existent cache
-    non_existent_file = os.path.join(str(tmp_path), "non_existent.json")
-    assert func._get_cached_result(non_existent_file) is None
+    assert cache.get("test_func:non_existent") is None
 
 
 def test_function_cache_ttl(tmp_path):
     """Test cache TTL functionality."""
-    import os
     import time
 
     func = Function(
@@ -277,20 +260,20 @@ def test_function_cache_ttl(tmp_path):
         cache_dir=str(tmp_path),
         cache_ttl=1,  # 1 second TTL
     )
+    cache = func._get_cache()
 
     # Save test data to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
+    cache.set("test_func:test_key", test_result, ttl=func.cache_ttl)
 
     # Verify cache is valid immediately
-    assert func._get_cached_result(cache_file) == test_result
+    assert cache.get("test_func:test_key") == test_result
 
     # Wait for cache to expire
     time.sleep(1.1)
 
     # Verify cache is no longer valid
-    assert func._get_cached_result(cache_file) is None
+    assert cache.get("test_func:test_key") is None
 
 
 def test_function_call_initialization():
@@ -0,0 +1,173 @@
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.tools.cache import FileToolCache, InMemoryToolCache
+from agno.tools.cache.sqlite import SqliteToolCache
+from agno.tools.decorator import tool
+from agno.tools.function import Function, FunctionCall
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryToolCache(max_size=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_in_memory_cache_expires_results():
+    cache = InMemoryToolCache()
+    cache.set("a", "result", ttl=0)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("make_cache", [FileToolCache, SqliteToolCache], ids=["file", "sqlite"])
+def test_persistent_caches(tmp_path, make_cache):
+    cache = FileToolCache(cache_dir=str(tmp_path)) if make_cache is FileToolCache else SqliteToolCache()
+    cache.set("search:abc", {"results": [1, 2]}, ttl=60)
+    cache.set("search:expired", "old", ttl=-1)
+
+    assert cache.get("search:abc") == {"results": [1, 2]}
+    assert cache.get("search:expired") is None
+    assert cache.get("search:missing") is None
+
+    cache.delete("search:abc")
+    assert cache.get("search:abc") is None
+
+
+def test_sqlite_cache_prunes_expired_results(tmp_path):
+    cache = SqliteToolCache(db_file=str(tmp_path / "cache.db"), prune_every=0)
+    cache.set("a", "expired", ttl=-1)
+    cache.set("b", "valid", ttl=60)
+
+    assert cache.prune() == 1
+    # A second cache on the same file sees the results
+    assert SqliteToolCache(db_file=str(tmp_path / "cache.db")).get("b") == "valid"
+
+
+def test_function_call_uses_cache_and_counts_hits():
+    calls = []
+
+    @tool(cache_results=True, cache=InMemoryToolCache())
+    def search(query: str) -> str:
+        """Search"""
+        calls.append(query)
+        return f"results for {query}"
+
+    def run(query: str) -> FunctionCall:
+        function_call = FunctionCall(function=search, arguments={"query": query})
+        assert function_call.execute().status == "success"
+        return function_call
+
+    first = run("agno")
+    second = run("agno")
+    other = run("python")
+
+    assert calls == ["agno", "python"]
+    assert (first.cache_hit, second.cache_hit, other.cache_hit) == (False, True, False)
+    assert second.result == "results for agno"
+    assert search.cache.get_stats() == {"hits": 1, "misses": 2, "hit_rate": 1 / 3}
+
+
+@pytest.mark.asyncio
+async def test_async_function_call_uses_cache():
+    calls = []
+
+    async def lookup(key: str) -> str:
+        calls.append(key)
+        return key.upper()
+
+    function = Function.from_callable(lookup)
+    function.cache_results = True
+    function.cache = InMemoryToolCache()
+
+    for _ in range(3):
+        await FunctionCall(function=function, arguments={"key": "k"}).aexecute()
+
+    assert calls == ["k"]
+    assert function.cache.hits == 2
+
+
+def test_tool_cache_metrics_are_added_to_tool_results():
+    function = Function.from_callable(lambda: "value")
+    function.cache_results = True
+    function.cache = InMemoryToolCache()
+    model = OpenAIChat(id="gpt-4o")
+
+    results = []
+    for _ in range(2):
+        function_call_results: List[Message] = []
+        list(model.run_function_calls([FunctionCall(function=function)], function_call_results))
+        results.extend(function_call_results)
+
+    assert [r.metrics.additional_metrics for r in results] == [
+        {"tool_cache_hits": 0, "tool_cache_misses": 1},
+        {"tool_cache_hits": 1, "tool_cache_misses": 0},
+    ]
+
+
+def test_cache_is_shared_by_copies():
+    from copy import deepcopy
+
+    cache = InMemoryToolCache()
+    function = Function(name="search", cache_results=True, cache=cache)
+
+    assert deepcopy(cache) is cache
+    assert function.model_copy(deep=True).cache is cache
+
+
+def test_redis_cache_stores_json_with_expiry():
+    from agno.tools.cache.redis import RedisToolCache
+
+    client = MagicMock()
+    client.get.return_value = '{"results": [1]}'
+    cache = RedisToolCache(prefix="test", redis_client=client)
+
+    cache.set("search:abc", {"results": [1]}, ttl=30)
+    client.set.assert_called_once_with("test:search:abc", '{"results": [1]}', ex=30)
+    assert cache.get("search:abc") == {"results": [1]}
+    client.get.assert_called_once_with("test:search:abc")
+
+
+def test_team_tool_cache_metrics_skip_history_messages():
+    from agno.models.message import MessageMetrics
+    from agno.team.team import Team
+
+    def tool_message(hits: int, from_history: bool) -> Message:
+        metrics = MessageMetrics(additional_metrics={"tool_cache_hits": hits, "tool_cache_misses": 1 - hits})
+        return Message(role="tool", content="value", metrics=metrics, from_history=from_history)
+
+    aggregated = Team(members=[])._aggregate_metrics_from_messages(
+        [tool_message(1, from_history=True), tool_message(0, from_history=False)]
+    )
+    assert aggregated["tool_cache_hits"] == [0]
+    assert aggregated["tool_cache_misses"] == [1]
+
+
+@pytest.mark.parametrize("cache_type", ["memory", "file", "sqlite"])
+def test_clear_namespace_only_deletes_its_keys(tmp_path, cache_type):
+    if cache_type == "memory":
+        cache = InMemoryToolCache()
+    elif cache_type == "file":
+        cache = FileToolCache(cache_dir=str(tmp_path))
+    else:
+        cache = SqliteToolCache(db_file=str(tmp_path / "cache.db"))
+    cache.set("search:a", 1, ttl=60)
+    cache.set("search_other:b", 2, ttl=60)
+    cache.set("get_weather:c", 3, ttl=60)
+
+    cache.clear_namespace("search")
+
+    assert cache.get("search:a") is None
+    assert cache.get("search_other:b") == 2
+    assert cache.get("get_weather:c") == 3
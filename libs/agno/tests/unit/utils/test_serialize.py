@@ -0,0 +1,83 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from agno.models.message import Message, MessageMetrics
+from agno.run.response import RunResponse
+from agno.run.team import TeamRunResponse
+from agno.storage.session.agent import AgentSession
+from agno.utils.serialize import shallow_asdict, to_json, to_msgpack
+
+
+@dataclass
+class Point:
+    x: int
+    y: int = 0
+    label: str = None  # type: ignore
+
+
+def test_shallow_asdict_does_not_copy_values():
+    session = AgentSession(session_id="session-1", memory={"runs": [{"content": "hi"}]})
+
+    session_dict = session.to_dict()
+    assert session_dict["memory"] is session.memory
+    assert session_dict["session_id"] == "session-1"
+
+    # The monitoring data is a copy that can be sent later
+    assert session.monitoring_data()["memory"] is not session.memory
+    assert session.monitoring_data() == session_dict
+
+    assert shallow_asdict(Point(1), exclude_none=True) == {"x": 1, "y": 0}
+    assert shallow_asdict(Point(1, 2, "a"), include={"x", "label"}, exclude=("label",)) == {"x": 1}
+
+
+def test_to_json():
+    data = {"point": Point(1, 2), "at": datetime(2025, 1, 1), 1: "one"}
+
+    assert to_json(data) == '{"point":{"x":1,"y":2,"label":null},"at":"2025-01-01T00:00:00","1":"one"}'
+    assert json.loads(to_json(data, indent=2)) == json.loads(to_json(data))
+
+    with pytest.raises(TypeError):
+        to_json({"value": object()})
+
+
+def test_run_response_to_dict():
+    metrics = MessageMetrics(input_tokens=10)
+    metrics.start_timer()
+    response = RunResponse(
+        content=Point(1, 2),
+        messages=[Message(role="user", content="hi", metrics=metrics)],
+        metrics={"input_tokens": [10]},
+        run_id="run-1",
+    )
+
+    response_dict = response.to_dict()
+    assert response_dict["content"] == {"x": 1, "y": 2, "label": None}
+    assert response_dict["messages"][0]["metrics"] == {"input_tokens": 10}
+    assert response_dict["metrics"] == {"input_tokens": [10]}
+    assert "tools" not in response_dict and "thinking" not in response_dict
+    assert json.loads(response.to_json()) == json.loads(response.to_json(indent=None)) == response_dict
+
+    # Only the included fields are serialized
+    assert response.to_dict(include=("content", "run_id", "messages", "thinking")) == {
+        "content": {"x": 1, "y": 2, "label": None},
+        "run_id": "run-1",
+        "messages": response_dict["messages"],
+    }
+
+
+def test_team_run_response_to_dict():
+    team_response = TeamRunResponse(content="done", member_responses=[RunResponse(content="hi", run_id="run-1")])
+
+    team_dict = team_response.to_dict()
+    assert team_dict["member_responses"][0]["content"] == "hi"
+    assert team_response.to_dict(include={"content"}) == {"content": "done"}
+    assert json.loads(team_response.to_json(indent=None)) == team_dict
+
+
+def test_to_msgpack():
+    msgpack = pytest.importorskip("msgpack")
+
+    assert msgpack.unpackb(to_msgpack({"point": Point(1, 2)})) == {"point": {"x": 1, "y": 2, "label": None}}
@@ -0,0 +1,45 @@
+from agno.media import AudioResponse
+from agno.models.response import ModelResponse
+from agno.utils.stream import StreamAccumulator, TextBuffer
+
+
+def test_text_buffer_joins_fragments():
+    buffer = TextBuffer()
+    assert not buffer
+    assert buffer.getvalue() == ""
+
+    buffer += "Hello"
+    buffer.append(None)
+    buffer.append(", ")
+    buffer += "world"
+
+    assert buffer
+    assert len(buffer) == 12
+    assert buffer == "Hello, world"
+    assert str(buffer) == "Hello, world"
+
+    buffer += "!"
+    assert buffer.getvalue() == "Hello, world!"
+
+
+def test_stream_accumulator_collects_chunks():
+    stream = StreamAccumulator()
+
+    assert stream.add(ModelResponse(content="The answer", thinking="Let me think"))
+    assert stream.add(
+        ModelResponse(content=" is 42", audio=AudioResponse(id="audio-1", content="AAA", transcript="The"))
+    )
+    assert stream.add(ModelResponse(audio=AudioResponse(content="BBB", transcript=" answer", mime_type="audio/wav")))
+    assert not stream.add(ModelResponse())
+
+    assert stream.content == "The answer is 42"
+    assert stream.thinking == "Let me think"
+    assert not stream.redacted_thinking
+    audio = stream.get_audio()
+    assert audio is not None
+    assert (audio.id, audio.content, audio.transcript, audio.mime_type) == (
+        "audio-1",
+        "AAABBB",
+        "The answer",
+        "audio/wav",
+    )
@@ -74,6 +74,32 @@ def test_search_documents(chroma_db, sample_documents):
     assert any("coconut" in doc.content.lower() for doc in results)
 
 
+def test_search_skips_embeddings_unless_requested(chroma_db, sample_documents):
+    """Test that stored embeddings are only returned when requested"""
+    chroma_db.insert(sample_documents)
+
+    results = chroma_db.search("coconut dishes", limit=2)
+    assert all(doc.embedding is None for doc in results)
+
+    results = chroma_db.search("coconut dishes", limit=2, include_embeddings=True)
+    assert all(len(doc.embedding) == 1024 for doc in results)
+
+
+def test_fetch_embeddings(chroma_db, sample_documents, mock_embedder):
+    """Test reading the embeddings of search results later, re-embedding unknown documents"""
+    chroma_db.insert(sample_documents)
+    results = chroma_db.search("coconut dishes", limit=2)
+    unknown = Document(id="unknown", content="Mango sticky rice")
+
+    mock_embedder.get_embeddings_batch_and_usage.reset_mock()
+    chroma_db.fetch_embeddings(results + [unknown])
+
+    assert all(len(doc.embedding) == 1024 for doc in results)
+    assert unknown.embedding == [0.1] * 1024
+    # Only the unknown document is embedded again
+    mock_embedder.get_embeddings_batch_and_usage.assert_called_once_with(["Mango sticky rice"])
+
+
 def test_upsert_documents(chroma_db, sample_documents):
     """Test upserting documents"""
     # Initial insert
@@ -0,0 +1,187 @@
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from agno.document import Document
+from agno.vectordb.numpydb import Ivf, NumpyDb
+
+QUERIES: Dict[str, List[float]] = {
+    "soup": [1.0, 0.0, 0.0, 0.0],
+    "noodles": [0.0, 1.0, 0.0, 0.0],
+    "curry": [0.0, 0.0, 1.0, 0.0],
+}
+
+
+@pytest.fixture
+def embedder():
+    embedder = MagicMock()
+    embedder.dimensions = 4
+    embedder.get_embedding.side_effect = lambda query: QUERIES[query]
+    return embedder
+
+
+@pytest.fixture
+def numpy_db(tmp_path, embedder):
+    db = NumpyDb(path=str(tmp_path / "numpydb"), embedder=embedder)
+    db.create()
+    yield db
+    db.drop()
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    return [
+        Document(
+            content="Tom Kha Gai is a Thai coconut soup with chicken",
+            name="tom_kha_gai",
+            meta_data={"cuisine": "Thai", "tags": ["soup", "coconut"]},
+            embedding=[0.9, 0.1, 0.0, 0.0],
+        ),
+        Document(
+            content="Pad Thai is a stir-fried rice noodle dish",
+            name="pad_thai",
+            meta_data={"cuisine": "Thai", "tags": ["noodles"]},
+            embedding=[0.1, 0.9, 0.0, 0.0],
+        ),
+        Document(
+            content="Ramen is a Japanese noodle soup",
+            name="ramen",
+            meta_data={"cuisine": "Japanese", "tags": ["soup", "noodles"]},
+            embedding=[0.6, 0.6, 0.0, 0.0],
+        ),
+    ]
+
+
+def test_insert_and_search(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+
+    assert numpy_db.get_count() == 3
+    assert numpy_db.doc_exists(sample_documents[0])
+    assert numpy_db.name_exists("pad_thai")
+    assert not numpy_db.name_exists("green_curry")
+
+    results = numpy_db.search("soup", limit=2)
+    assert [doc.name for doc in results] == ["tom_kha_gai", "ramen"]
+    assert results[0].meta_data == {"cuisine": "Thai", "tags": ["soup", "coconut"]}
+    assert results[0].embedding is None
+
+    results = numpy_db.search("noodles", limit=1, include_embeddings=True)
+    assert results[0].name == "pad_thai"
+    assert np.isclose(np.linalg.norm(results[0].embedding), 1.0)
+
+
+def test_search_with_filters(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents[:2])
+    numpy_db.insert(sample_documents[2:], filters={"source": "japan"})
+
+    assert [doc.name for doc in numpy_db.search("soup", filters={"cuisine": "Thai"})] == ["tom_kha_gai", "pad_thai"]
+    assert [doc.name for doc in numpy_db.search("soup", filters={"tags": "noodles"})] == ["ramen", "pad_thai"]
+    assert [doc.name for doc in numpy_db.search("soup", filters={"tags": ["soup", "noodles"]})] == ["ramen"]
+    assert [doc.name for doc in numpy_db.search("soup", filters={"source": "japan"})] == ["ramen"]
+    assert numpy_db.search("soup", filters={"cuisine": "Italian"}) == []
+
+
+def test_search_scores_without_holding_the_lock(numpy_db, sample_documents, monkeypatch):
+    from agno.vectordb.numpydb import numpydb as numpydb_module
+
+    numpy_db.insert(sample_documents)
+    scores = numpydb_module._scores
+    lock_held = []
+
+    def check_lock(*args):
+        lock_held.append(numpy_db._lock._is_owned())
+        return scores(*args)
+
+    monkeypatch.setattr(numpydb_module, "_scores", check_lock)
+    results = numpy_db.search("soup", limit=1)
+
+    assert [doc.name for doc in results] == ["tom_kha_gai"]
+    assert lock_held == [False]
+
+
+def test_insert_skips_existing_and_upsert_replaces(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+    numpy_db.search("soup", filters={"cuisine": "Thai"})
+
+    updated = Document(
+        content=sample_documents[0].content,
+        name="tom_kha_gai",
+        meta_data={"cuisine": "Laotian"},
+        embedding=[0.0, 0.0, 1.0, 0.0],
+    )
+    numpy_db.insert([updated])
+    assert numpy_db.search("curry", limit=1)[0].meta_data["cuisine"] == "Thai"
+
+    numpy_db.upsert([updated])
+    assert numpy_db.get_count() == 3
+    assert numpy_db.search("curry", limit=1)[0].meta_data == {"cuisine": "Laotian"}
+    # The inverted index is updated with the new metadata
+    assert [doc.name for doc in numpy_db.search("soup", filters={"cuisine": "Thai"})] == ["pad_thai"]
+
+
+def test_delete_by_content_hash_reuses_rows(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+    content_hash = numpy_db.search("soup", limit=1)[0].id
+
+    assert numpy_db.delete_by_content_hash([content_hash])
+    assert numpy_db.get_count() == 2
+    assert "tom_kha_gai" not in [doc.name for doc in numpy_db.search("soup")]
+
+    numpy_db.insert([Document(content="Green curry", name="green_curry", embedding=[0.0, 0.0, 1.0, 0.0])])
+    assert numpy_db.get_count() == 3
+    assert numpy_db._num_rows == 3
+    assert numpy_db.search("curry", limit=1)[0].name == "green_curry"
+
+    assert numpy_db.delete()
+    assert numpy_db.exists()
+    assert numpy_db.get_count() == 0
+
+
+def test_reopen_maps_stored_vectors(tmp_path, embedder, sample_documents):
+    path = str(tmp_path / "numpydb")
+    NumpyDb(path=path, embedder=embedder).insert(sample_documents)
+
+    db = NumpyDb(path=path, embedder=embedder)
+    results = db.search("noodles", limit=1)
+
+    assert results[0].name == "pad_thai"
+    assert isinstance(db._vectors.array, np.memmap)
+    assert db.get_embeddings([results[0].id])[results[0].id] == pytest.approx(
+        (np.array([0.1, 0.9, 0.0, 0.0]) / np.linalg.norm([0.1, 0.9, 0.0, 0.0])).tolist(), abs=1e-6
+    )
+
+
+def test_ivf_pq_index(tmp_path):
+    rng = np.random.default_rng(42)
+    vectors = rng.normal(size=(2000, 16)).astype(np.float32)
+    embedder = MagicMock()
+    embedder.dimensions = 16
+    embedder.get_embedding.side_effect = lambda query: vectors[int(query)].tolist()
+    index = Ivf(lists=16, probes=4, pq_subvectors=4, min_rows=1000, iterations=5)
+    path = str(tmp_path / "numpydb")
+
+    db = NumpyDb(path=path, embedder=embedder, index=index)
+    db.insert([Document(content=f"document {i}", embedding=vector.tolist()) for i, vector in enumerate(vectors)])
+
+    # The index is built once the collection reaches min_rows
+    assert db._centroids is not None and db._codebooks is not None
+    hits = sum(db.search(str(i), limit=1)[0].content == f"document {i}" for i in range(0, 2000, 20))
+    assert hits >= 95
+
+    # The index is mapped again on reopen, and documents inserted later are indexed
+    db = NumpyDb(path=path, embedder=embedder, index=index)
+    assert db.get_count() == 2000
+    assert db._centroids is not None
+    db.upsert([Document(content="document 0", meta_data={"updated": True}, embedding=vectors[0].tolist())])
+    assert db.search("0", limit=1)[0].meta_data == {"updated": True}
+
+
+@pytest.mark.asyncio
+async def test_async_insert_and_search(numpy_db, sample_documents):
+    await numpy_db.async_upsert(sample_documents)
+
+    assert await numpy_db.async_doc_exists(sample_documents[1])
+    results = await numpy_db.async_search("noodles", limit=2)
+    assert [doc.name for doc in results] == ["pad_thai", "ramen"]
@@ -1,4 +1,5 @@
 import uuid
+from hashlib import md5
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -157,6 +158,17 @@ def test_doc_exists(mock_pgvector):
         assert mock_pgvector.doc_exists(doc) is False
 
 
+def test_docs_exist(mock_pgvector):
+    """Test docs_exist looks up all content hashes at once."""
+    docs = create_test_documents(3)
+    existing_hash = md5(docs[2].content.encode()).hexdigest()
+
+    with patch.object(mock_pgvector, "_existing_values", return_value={existing_hash}) as mock_existing_values:
+        assert mock_pgvector.docs_exist(docs) == [False, False, True]
+        mock_existing_values.assert_called_once()
+        assert len(mock_existing_values.call_args.args[1]) == 3
+
+
 def test_name_exists(mock_pgvector):
     """Test name_exists method."""
     with patch.object(mock_pgvector, "_record_exists") as mock_record_exists:
@@ -205,19 +217,19 @@ def test_search(mock_pgvector):
     with patch.object(mock_pgvector, "vector_search") as mock_vector_search:
         mock_pgvector.search_type = SearchType.vector
         mock_pgvector.search("test query")
-        mock_vector_search.assert_called_with(query="test query", limit=5, filters=None)
+        mock_vector_search.assert_called_with(query="test query", limit=5, filters=None, include_embeddings=False)
 
     # Test keyword search
     with patch.object(mock_pgvector, "keyword_search") as mock_keyword_search:
         mock_pgvector.search_type = SearchType.keyword
         mock_pgvector.search("test query")
-        mock_keyword_search.assert_called_with(query="test query", limit=5, filters=None)
+        mock_keyword_search.assert_called_with(query="test query", limit=5, filters=None, include_embeddings=False)
 
     # Test hybrid search
     with patch.object(mock_pgvector, "hybrid_search") as mock_hybrid_search:
         mock_pgvector.search_type = SearchType.hybrid
         mock_pgvector.search("test query")
-        mock_hybrid_search.assert_called_with(query="test query", limit=5, filters=None)
+        mock_hybrid_search.assert_called_with(query="test query", limit=5, filters=None, include_embeddings=False)
 
 
 def test_vector_search(mock_pgvector, mock_embedder):
@@ -317,13 +329,17 @@ async def test_async_insert(mock_pgvector):
     """Test async_insert method."""
     docs = create_test_documents()
 
-    with patch.object(mock_pgvector, "insert"), patch("asyncio.to_thread") as mock_to_thread:
+    with patch.object(mock_pgvector, "_insert_documents"), patch("asyncio.to_thread") as mock_to_thread:
         mock_to_thread.return_value = None
 
         await mock_pgvector.async_insert(docs)
 
-        # Check that insert was called via to_thread
-        mock_to_thread.assert_called_once_with(mock_pgvector.insert, docs, None)
+        # Check that documents were embedded with the async embedder
+        mock_pgvector.embedder.async_get_embeddings_batch_and_usage.assert_awaited_with([doc.content for doc in docs])
+        assert all(doc.embedding is not None for doc in docs)
+
+        # Check that the already embedded documents were written via to_thread
+        mock_to_thread.assert_called_once_with(mock_pgvector._insert_documents, docs, None, 100, False)
 
 
 @pytest.mark.asyncio
@@ -331,13 +347,17 @@ async def test_async_upsert(mock_pgvector):
     """Test async_upsert method."""
     docs = create_test_documents()
 
-    with patch.object(mock_pgvector, "upsert"), patch("asyncio.to_thread") as mock_to_thread:
+    with patch.object(mock_pgvector, "_upsert_documents"), patch("asyncio.to_thread") as mock_to_thread:
         mock_to_thread.return_value = None
 
         await mock_pgvector.async_upsert(docs)
 
-        # Check that upsert was called via to_thread
-        mock_to_thread.assert_called_once_with(mock_pgvector.upsert, docs, None)
+        # Check that documents were embedded with the async embedder
+        mock_pgvector.embedder.async_get_embeddings_batch_and_usage.assert_awaited_with([doc.content for doc in docs])
+        assert all(doc.embedding is not None for doc in docs)
+
+        # Check that the already embedded documents were written via to_thread
+        mock_to_thread.assert_called_once_with(mock_pgvector._upsert_documents, docs, None, 100, False)
 
 
 @pytest.mark.asyncio
@@ -354,7 +374,7 @@ async def test_async_search(mock_pgvector):
 
         # Check results and that search was called via to_thread
         assert results == expected_results
-        mock_to_thread.assert_called_once_with(mock_pgvector.search, "test query", 5, None)
+        mock_to_thread.assert_called_once_with(mock_pgvector.search, "test query", 5, None, False)
 
 
 @pytest.mark.asyncio
@@ -352,10 +352,6 @@ async def test_async_upsert(mock_pinecone_db, mock_embedder):
         {"id": docs[1].id, "values": [0.1] * 1024, "metadata": {"text": docs[1].content, "type": "test", "index": 1}},
     ]
 
-    # Create an async mock for asyncio.gather
-    gather_mock = AsyncMock()
-    gather_mock.return_value = [prepared_vectors_batch]
-
     # Create an async mock for to_thread
     to_thread_mock = AsyncMock()
     to_thread_mock.return_value = prepared_vectors_batch
@@ -363,12 +359,14 @@ async def test_async_upsert(mock_pinecone_db, mock_embedder):
     # Mock async functions
     with patch.object(mock_pinecone_db, "_prepare_vectors", return_value=prepared_vectors_batch), patch.object(
         mock_pinecone_db, "_upsert_vectors"
-    ), patch("asyncio.to_thread", to_thread_mock), patch("asyncio.gather", gather_mock):
+    ), patch("asyncio.to_thread", to_thread_mock):
         # Call the method
         await mock_pinecone_db.async_upsert(docs)
 
-        # Verify gather was called
-        gather_mock.assert_called_once()
+        # Verify the documents were embedded with the async embedder
+        mock_pinecone_db.embedder.async_get_embeddings_batch_and_usage.assert_awaited_with(
+            [doc.content for doc in docs]
+        )
 
         # Verify to_thread was called for upsert_vectors
         to_thread_mock.assert_any_call(
@@ -401,7 +399,7 @@ async def test_async_search(mock_pinecone_db):
         results = await mock_pinecone_db.async_search(query)
 
         assert results == expected_results
-        mock_to_thread.assert_called_once_with(mock_pinecone_db.search, query, 5, None, None, None)
+        mock_to_thread.assert_called_once_with(mock_pinecone_db.search, query, 5, None, None, None, False)
 
 
 @pytest.mark.asyncio
@@ -1,3 +1,5 @@
+import uuid
+from hashlib import md5
 from typing import List
 from unittest.mock import Mock, patch
 
@@ -144,6 +146,17 @@ def test_doc_exists(qdrant_db, sample_documents, mock_qdrant_client):
     assert qdrant_db.doc_exists(sample_documents[0]) is False
 
 
+def test_docs_exist(qdrant_db, sample_documents, mock_qdrant_client):
+    """Test bulk document existence check uses a single request"""
+    existing_id = md5(sample_documents[1].content.encode()).hexdigest()
+    # Qdrant returns UUID ids in their dashed form
+    mock_qdrant_client.retrieve.return_value = [Mock(id=str(uuid.UUID(existing_id)))]
+
+    assert qdrant_db.docs_exist(sample_documents) == [False, True, False]
+    mock_qdrant_client.retrieve.assert_called_once()
+    assert len(mock_qdrant_client.retrieve.call_args.kwargs["ids"]) == 3
+
+
 def test_name_exists(qdrant_db, mock_qdrant_client):
     """Test name existence check"""
     # Test when name exists